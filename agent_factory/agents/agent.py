@@ -3,17 +3,31 @@ Agent class - Core primitive for creating and running AI agents.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any
 from enum import Enum
 
 from agent_factory.tools.base import Tool
-from agent_factory.runtime.memory import MemoryStore
+from agent_factory.runtime.memory import Interaction, MemoryStore
+from agent_factory.runtime.semantic_memory import SemanticMemoryStore
 from agent_factory.core.guardrails import Guardrails
 from agent_factory.promptlog import Run, SQLiteStorage
 from agent_factory.knowledge import KnowledgePack
+from agent_factory.runtime.cancellation import check_cancelled
+from agent_factory.runtime.preparation import AsyncPreparationLoads, PreparationLoads
+from agent_factory.runtime.profiling import StageTimer, stage, use_timer
+from agent_factory.runtime.write_behind import get_write_behind
+from agent_factory.runtime.retry import RetryPolicy, is_retryable
+from agent_factory.core.exceptions import ExecutionCancelledError
+import asyncio
+import re
 import uuid
 import time
 
+# Output guardrails check the whole text so far, so streams run them at
+# sentence ends or once this many characters are buffered, not on every delta
+STREAM_VALIDATION_CHARS = 256
+_SENTENCE_END = re.compile(r"[.!?\n]\s*$")
+
 
 class AgentStatus(str, Enum):
     """Agent execution status."""
@@ -29,10 +43,24 @@ class AgentConfig:
     model: str = "gpt-4o"
     temperature: float = 0.7
     max_tokens: int = 2000
-    timeout: int = 30  # seconds
-    retry_attempts: int = 3
+    timeout: int = 30  # seconds, deadline for the model call including retries
+    retry_attempts: int = 3  # Retries per completion for transient errors (429, 5xx, timeouts)
     enable_memory: bool = True
     enable_guardrails: bool = True
+    enable_response_cache: bool = False  # Serve identical LLM requests from cache
+    enable_request_coalescing: bool = False  # Share identical in-flight LLM requests
+    context_max_tokens: int = 4000  # Token budget for history, knowledge and tool context
+    context_quotas: Optional[Dict[str, float]] = None  # Per-source share of the budget
+    context_history_turns: int = 20  # Memory turns considered for the budget
+    enable_memory_compaction: bool = False  # Fold old session turns into a running summary
+    compaction_max_turns: int = 40  # Unsummarized turns that trigger compaction
+    compaction_max_tokens: int = 6000  # Tokens of unsummarized turns that trigger compaction
+    compaction_keep_turns: int = 10  # Newest turns kept verbatim
+    compaction_summary_tokens: int = 500  # Upper bound for the running summary
+    max_tool_iterations: int = 5  # Model/tool round trips before giving up
+    tool_timeout: float = 30.0  # seconds, per tool call
+    enable_provider_routing: bool = False  # Route across providers by latency and health
+    hedge_requests: bool = False  # Duplicate slow requests to the next-best provider
 
 
 @dataclass
@@ -145,132 +173,577 @@ class Agent:
             input_text: User input/question
             session_id: Optional session ID for memory
             context: Optional context dictionary
+        
+        Returns:
+            AgentResult with output and metadata
+        
+        Raises:
+            ExecutionCancelledError: If the current run is cancelled
+        """
+        start_time = time.time()
+        run_id = str(uuid.uuid4())
+        timer = StageTimer("agent", self.id)
+        
+        loads = None
+        with use_timer(timer):
+            try:
+                self._status = AgentStatus.RUNNING
+                
+                # Load memory and knowledge while the input guardrails run
+                loads = self._start_loads(input_text, session_id)
+                
+                # Apply guardrails if enabled
+                if self.guardrails:
+                    with timer.stage("input_guardrails"):
+                        guardrail_result = self.guardrails.validate_input(input_text)
+                    if not guardrail_result.allowed:
+                        loads.cancel()
+                        result = AgentResult(
+                            output="",
+                            status=AgentStatus.ERROR,
+                            error=f"Input blocked by guardrails: {guardrail_result.reason}",
+                            run_id=run_id,
+                        )
+                        self._log_run(run_id, input_text, result, start_time, timer)
+                        return result
+                
+                # Pack memory and knowledge into the token budget
+                full_context = self._prepare_context(context, loads)
+                check_cancelled()
+                
+                # Execute agent (this would integrate with OpenAI SDK)
+                with timer.stage("llm_call"):
+                    output = self._execute_agent(input_text, full_context)
+                
+                # Apply output guardrails
+                if self.guardrails:
+                    with timer.stage("output_guardrails"):
+                        guardrail_result = self.guardrails.validate_output(output)
+                    if not guardrail_result.allowed:
+                        output = f"[Output modified by guardrails: {guardrail_result.reason}]"
+                
+                # Save to memory in the background
+                if self.memory and session_id:
+                    with timer.stage("memory_save"):
+                        self._save_memory(session_id, input_text, output)
+                
+                execution_time = time.time() - start_time
+                
+                self._status = AgentStatus.COMPLETED
+                
+                result = AgentResult(
+                    output=output,
+                    status=AgentStatus.COMPLETED,
+                    execution_time=execution_time,
+                    metadata={"model": self.model},
+                    run_id=run_id,
+                )
+                
+                # Log to prompt log
+                self._log_run(run_id, input_text, result, start_time, timer)
+                
+                return result
             
+            except Exception as e:
+                if loads:
+                    loads.cancel()
+                self._status = AgentStatus.ERROR
+                result = AgentResult(
+                    output="",
+                    status=AgentStatus.ERROR,
+                    error=str(e),
+                    # Lets callers such as workflow steps decide whether to retry
+                    metadata={"retryable": is_retryable(e)},
+                    run_id=run_id,
+                )
+                self._log_run(run_id, input_text, result, start_time, timer)
+                if isinstance(e, ExecutionCancelledError):
+                    raise
+                return result
+    
+    async def arun(
+        self,
+        input_text: str,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AgentResult:
+        """
+        Run the agent asynchronously.
+        
+        Mirrors ``run`` but awaits the async provider client and the async
+        guardrail, memory and prompt-log hooks, so no thread is held while the
+        model call is in flight.
+        
+        Args:
+            input_text: User input/question
+            session_id: Optional session ID for memory
+            context: Optional context dictionary
+        
         Returns:
             AgentResult with output and metadata
+        
+        Raises:
+            ExecutionCancelledError: If the current run is cancelled
         """
         start_time = time.time()
         run_id = str(uuid.uuid4())
+        timer = StageTimer("agent", self.id)
+        
+        loads = None
+        with use_timer(timer):
+            try:
+                self._status = AgentStatus.RUNNING
+                
+                # Load memory and knowledge while the input guardrails run
+                loads = self._astart_loads(input_text, session_id)
+                
+                # Apply guardrails if enabled
+                if self.guardrails:
+                    with timer.stage("input_guardrails"):
+                        guardrail_result = await self.guardrails.avalidate_input(input_text)
+                    if not guardrail_result.allowed:
+                        loads.cancel()
+                        result = AgentResult(
+                            output="",
+                            status=AgentStatus.ERROR,
+                            error=f"Input blocked by guardrails: {guardrail_result.reason}",
+                            run_id=run_id,
+                        )
+                        self._log_run(run_id, input_text, result, start_time, timer)
+                        return result
+                
+                # Pack memory and knowledge into the token budget
+                full_context = await self._aprepare_context(context, loads)
+                check_cancelled()
+                
+                with timer.stage("llm_call"):
+                    output = await self._aexecute_agent(input_text, full_context)
+                
+                # Apply output guardrails
+                if self.guardrails:
+                    with timer.stage("output_guardrails"):
+                        guardrail_result = await self.guardrails.avalidate_output(output)
+                    if not guardrail_result.allowed:
+                        output = f"[Output modified by guardrails: {guardrail_result.reason}]"
+                
+                # Save to memory in the background
+                if self.memory and session_id:
+                    with timer.stage("memory_save"):
+                        self._save_memory(session_id, input_text, output)
+                
+                execution_time = time.time() - start_time
+                
+                self._status = AgentStatus.COMPLETED
+                
+                result = AgentResult(
+                    output=output,
+                    status=AgentStatus.COMPLETED,
+                    execution_time=execution_time,
+                    metadata={"model": self.model},
+                    run_id=run_id,
+                )
+                
+                self._log_run(run_id, input_text, result, start_time, timer)
+                
+                return result
+            
+            except Exception as e:
+                if loads:
+                    loads.cancel()
+                self._status = AgentStatus.ERROR
+                result = AgentResult(
+                    output="",
+                    status=AgentStatus.ERROR,
+                    error=str(e),
+                    # Lets callers such as workflow steps decide whether to retry
+                    metadata={"retryable": is_retryable(e)},
+                    run_id=run_id,
+                )
+                self._log_run(run_id, input_text, result, start_time, timer)
+                if isinstance(e, ExecutionCancelledError):
+                    raise
+                return result
+    
+    def stream(
+        self,
+        input_text: str,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Run the agent and stream its output as text deltas.
+        
+        Output guardrails check the accumulated text before deltas are
+        released; with guardrails, deltas are held until a sentence ends or
+        ``STREAM_VALIDATION_CHARS`` characters are buffered. Memory and the
+        prompt log are written once the stream completes; a stream abandoned
+        by the consumer is not persisted.
+        
+        Args:
+            input_text: User input/question
+            session_id: Optional session ID for memory
+            context: Optional context dictionary
+        
+        Yields:
+            Output text deltas
+        
+        Raises:
+            AgentExecutionError: If input or output is blocked, or execution fails
+        """
+        from agent_factory.core.exceptions import AgentExecutionError
+        
+        start_time = time.time()
+        run_id = str(uuid.uuid4())
+        chunks: List[str] = []
         
         try:
             self._status = AgentStatus.RUNNING
             
-            # Apply guardrails if enabled
             if self.guardrails:
                 guardrail_result = self.guardrails.validate_input(input_text)
                 if not guardrail_result.allowed:
-                    result = AgentResult(
-                        output="",
-                        status=AgentStatus.ERROR,
-                        error=f"Input blocked by guardrails: {guardrail_result.reason}",
-                        run_id=run_id,
+                    raise AgentExecutionError(
+                        f"Input blocked by guardrails: {guardrail_result.reason}"
                     )
-                    self._log_run(run_id, input_text, result, start_time)
-                    return result
             
-            # Load memory if available
-            memory_context = {}
-            if self.memory and session_id:
-                memory_context = self.memory.get_context(session_id)
+            full_context = self._prepare_context(context, self._start_loads(input_text, session_id))
+            client = self._get_client()
             
-            # Load knowledge pack context if available
-            knowledge_context = {}
-            if self.knowledge_packs:
-                knowledge_context = self._get_knowledge_context(input_text)
+            pending: List[str] = []
+            for delta in client.stream_agent(**self._stream_request(input_text, full_context)):
+                check_cancelled()
+                pending.append(delta)
+                if self.guardrails:
+                    if not _validation_due(pending):
+                        continue
+                    text = "".join(chunks + pending)
+                    self._check_streamed_output(self.guardrails.validate_output(text))
+                for chunk in pending:
+                    chunks.append(chunk)
+                    yield chunk
+                pending = []
+            if pending:
+                text = "".join(chunks + pending)
+                self._check_streamed_output(self.guardrails.validate_output(text))
+                for chunk in pending:
+                    chunks.append(chunk)
+                    yield chunk
             
-            # Prepare context
-            full_context = {
-                **(context or {}),
-                **memory_context,
-                **knowledge_context,
-            }
+            output = "".join(chunks)
+            if self.memory and session_id:
+                self.memory.save_interaction(session_id, input_text, output)
+                self._schedule_compaction(session_id)
             
-            # Execute agent (this would integrate with OpenAI SDK)
-            output = self._execute_agent(input_text, full_context)
+            self._status = AgentStatus.COMPLETED
+            self._log_run(run_id, input_text, AgentResult(
+                output=output,
+                status=AgentStatus.COMPLETED,
+                execution_time=time.time() - start_time,
+                metadata={"model": self.model, "streamed": True},
+                run_id=run_id,
+            ), start_time)
+        
+        except Exception as e:
+            self._status = AgentStatus.ERROR
+            self._log_run(run_id, input_text, AgentResult(
+                output="".join(chunks),
+                status=AgentStatus.ERROR,
+                error=str(e),
+                metadata={"streamed": True},
+                run_id=run_id,
+            ), start_time)
+            if isinstance(e, (AgentExecutionError, ExecutionCancelledError)):
+                raise
+            raise AgentExecutionError(f"Agent execution failed: {str(e)}") from e
+    
+    async def astream(
+        self,
+        input_text: str,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream``.
+        
+        Args:
+            input_text: User input/question
+            session_id: Optional session ID for memory
+            context: Optional context dictionary
+        
+        Yields:
+            Output text deltas
+        
+        Raises:
+            AgentExecutionError: If input or output is blocked, or execution fails
+        """
+        from agent_factory.core.exceptions import AgentExecutionError
+        
+        start_time = time.time()
+        run_id = str(uuid.uuid4())
+        chunks: List[str] = []
+        
+        try:
+            self._status = AgentStatus.RUNNING
             
-            # Apply output guardrails
             if self.guardrails:
-                guardrail_result = self.guardrails.validate_output(output)
+                guardrail_result = await self.guardrails.avalidate_input(input_text)
                 if not guardrail_result.allowed:
-                    output = f"[Output modified by guardrails: {guardrail_result.reason}]"
+                    raise AgentExecutionError(
+                        f"Input blocked by guardrails: {guardrail_result.reason}"
+                    )
             
-            # Save to memory
-            if self.memory and session_id:
-                self.memory.save_interaction(session_id, input_text, output)
+            loads = self._astart_loads(input_text, session_id)
+            full_context = await self._aprepare_context(context, loads)
+            client = self._get_client()
             
-            execution_time = time.time() - start_time
+            pending: List[str] = []
+            request = self._stream_request(input_text, full_context)
+            async for delta in client.astream_agent(**request):
+                check_cancelled()
+                pending.append(delta)
+                if self.guardrails:
+                    if not _validation_due(pending):
+                        continue
+                    text = "".join(chunks + pending)
+                    self._check_streamed_output(await self.guardrails.avalidate_output(text))
+                for chunk in pending:
+                    chunks.append(chunk)
+                    yield chunk
+                pending = []
+            if pending:
+                text = "".join(chunks + pending)
+                self._check_streamed_output(await self.guardrails.avalidate_output(text))
+                for chunk in pending:
+                    chunks.append(chunk)
+                    yield chunk
             
-            self._status = AgentStatus.COMPLETED
+            output = "".join(chunks)
+            if self.memory and session_id:
+                await self.memory.asave_interaction(session_id, input_text, output)
+                self._schedule_compaction(session_id)
             
-            result = AgentResult(
+            self._status = AgentStatus.COMPLETED
+            self._log_run(run_id, input_text, AgentResult(
                 output=output,
                 status=AgentStatus.COMPLETED,
-                execution_time=execution_time,
-                metadata={"model": self.model},
+                execution_time=time.time() - start_time,
+                metadata={"model": self.model, "streamed": True},
                 run_id=run_id,
-            )
-            
-            # Log to prompt log
-            self._log_run(run_id, input_text, result, start_time)
-            
-            return result
-            
+            ), start_time)
+        
         except Exception as e:
             self._status = AgentStatus.ERROR
-            result = AgentResult(
-                output="",
+            self._log_run(run_id, input_text, AgentResult(
+                output="".join(chunks),
                 status=AgentStatus.ERROR,
                 error=str(e),
+                metadata={"streamed": True},
                 run_id=run_id,
+            ), start_time)
+            if isinstance(e, (AgentExecutionError, ExecutionCancelledError)):
+                raise
+            raise AgentExecutionError(f"Agent execution failed: {str(e)}") from e
+    
+    @staticmethod
+    def _check_streamed_output(guardrail_result: Any) -> None:
+        """Stop a stream whose output the guardrails blocked."""
+        from agent_factory.core.exceptions import AgentExecutionError
+        
+        if not guardrail_result.allowed:
+            raise AgentExecutionError(f"Output blocked by guardrails: {guardrail_result.reason}")
+    
+    def _start_loads(self, input_text: str, session_id: Optional[str]) -> PreparationLoads:
+        """
+        Start memory load and per-pack knowledge retrieval.
+        
+        They run concurrently on the preparation pool when there are at least
+        two independent stages (counting input guardrails), else inline.
+        """
+        packs = self._retrieval_packs()
+        load_memory = bool(self.memory and session_id)
+        loads = PreparationLoads(concurrent=bool(self.guardrails) + load_memory + len(packs) > 1)
+        if load_memory:
+            loads.start("memory", "memory_load", self._load_memory, session_id, input_text)
+        for index, pack in enumerate(packs):
+            loads.start(
+                f"knowledge:{index}", "knowledge_retrieval", self._retrieve_pack, pack, input_text
             )
-            self._log_run(run_id, input_text, result, start_time)
-            return result
+        return loads
+    
+    def _astart_loads(self, input_text: str, session_id: Optional[str]) -> AsyncPreparationLoads:
+        """Async variant of ``_start_loads`` using asyncio tasks."""
+        packs = self._retrieval_packs()
+        load_memory = bool(self.memory and session_id)
+        loads = AsyncPreparationLoads(
+            concurrent=bool(self.guardrails) + load_memory + len(packs) > 1
+        )
+        if load_memory:
+            loads.start("memory", "memory_load", self._aload_memory, session_id, input_text)
+        for index, pack in enumerate(packs):
+            # Retrievers are synchronous, keep them off the event loop
+            loads.start(
+                f"knowledge:{index}",
+                "knowledge_retrieval",
+                asyncio.to_thread,
+                self._retrieve_pack,
+                pack,
+                input_text,
+            )
+        return loads
+    
+    def _load_memory(self, session_id: str, input_text: str) -> Dict[str, Any]:
+        """Load session memory once the session's queued saves have landed."""
+        get_write_behind().wait(key=_memory_key(session_id))
+        return self.memory.get_context(
+            session_id, self.config.context_history_turns, **self._recall_query(input_text)
+        )
+    
+    async def _aload_memory(self, session_id: str, input_text: str) -> Dict[str, Any]:
+        """Async variant of ``_load_memory``."""
+        writer = get_write_behind()
+        if writer.pending(key=_memory_key(session_id)):
+            await asyncio.to_thread(writer.wait, None, _memory_key(session_id))
+        return await self.memory.aget_context(
+            session_id, self.config.context_history_turns, **self._recall_query(input_text)
+        )
+    
+    def _recall_query(self, input_text: str) -> Dict[str, Any]:
+        """``query`` argument for memory stores with semantic recall."""
+        return {"query": input_text} if isinstance(self.memory, SemanticMemoryStore) else {}
     
-    def _get_knowledge_context(self, query: str) -> Dict[str, Any]:
-        """Get context from knowledge packs using RAG retrieval."""
-        context = {}
+    def _save_memory(self, session_id: str, input_text: str, output: str) -> None:
+        """Queue the interaction for the session's memory."""
+        get_write_behind().submit(
+            "memory", self.memory.save_interaction, session_id, input_text, output,
+            key=_memory_key(session_id),
+        )
+        self._schedule_compaction(session_id)
+    
+    def _schedule_compaction(self, session_id: str) -> None:
+        """Fold the session's older turns into its summary in the background, if enabled."""
+        if not self.config.enable_memory_compaction:
+            return
+        from agent_factory.runtime.compaction import CompactionPolicy, get_compactor
         
-        for pack in self.knowledge_packs:
-            try:
-                # Get retriever from knowledge pack
-                if hasattr(pack, 'retriever') and pack.retriever:
-                    # Retrieve relevant documents/chunks
-                    results = pack.retriever.retrieve(query, top_k=pack.retriever_config.get('top_k', 5))
-                    
-                    # Format results as context
-                    if results:
-                        # Combine retrieved text into context
-                        retrieved_texts = []
-                        for result in results:
-                            if isinstance(result, dict):
-                                text = result.get('text', result.get('content', ''))
-                                score = result.get('score', result.get('similarity', 0.0))
-                                if text:
-                                    retrieved_texts.append({
-                                        'text': text,
-                                        'score': score,
-                                    })
-                            elif isinstance(result, str):
-                                retrieved_texts.append({'text': result, 'score': 1.0})
-                        
-                        if retrieved_texts:
-                            # Format as context string
-                            context_text = "\n\n".join([
-                                f"[Relevance: {r['score']:.2f}]\n{r['text']}"
-                                for r in retrieved_texts[:pack.retriever_config.get('top_k', 5)]
-                            ])
-                            context[f"{pack.id}_context"] = context_text
-                            context[f"{pack.id}_sources"] = len(retrieved_texts)
+        policy = CompactionPolicy(
+            max_turns=self.config.compaction_max_turns,
+            max_tokens=self.config.compaction_max_tokens,
+            keep_turns=self.config.compaction_keep_turns,
+            summary_max_tokens=self.config.compaction_summary_tokens,
+            model=self.model,
+        )
+        get_compactor().schedule(
+            self.memory, session_id, policy, self._summarize, wait_key=_memory_key(session_id),
+        )
+    
+    def _summarize(self, previous_summary: Optional[str], interactions: List[Interaction]) -> str:
+        """
+        Summarize folded turns with this agent's model.
+        
+        Args:
+            previous_summary: Current running summary, if any
+            interactions: Turns being folded, oldest first
+        
+        Returns:
+            Updated running summary
+        """
+        from agent_factory.runtime.compaction import SUMMARY_INSTRUCTIONS, format_transcript
+        
+        client = self._get_client()
+        request = self._client_request(format_transcript(previous_summary, interactions), {})
+        request.update(
+            instructions=SUMMARY_INSTRUCTIONS,
+            tools=[],
+            temperature=0.0,
+            max_tokens=self.config.compaction_summary_tokens,
+            use_cache=False,
+            coalesce=False,
+        )
+        result = client.run_agent(**request)
+        return result.get("output", "")
+    
+    def _prepare_context(
+        self,
+        context: Optional[Dict[str, Any]],
+        loads: PreparationLoads,
+    ) -> Dict[str, Any]:
+        """Collect memory and knowledge loads and pack them into the token budget."""
+        memory_context = loads.result("memory", {})
+        knowledge = []
+        for key in [key for key in loads.keys() if key.startswith("knowledge:")]:
+            knowledge.extend(loads.result(key))
+        
+        with stage("context_build"):
+            return self._build_context(context, memory_context, knowledge)
+    
+    async def _aprepare_context(
+        self,
+        context: Optional[Dict[str, Any]],
+        loads: AsyncPreparationLoads,
+    ) -> Dict[str, Any]:
+        """Async variant of ``_prepare_context``."""
+        memory_context = await loads.result("memory", {})
+        knowledge = []
+        for key in [key for key in loads.keys() if key.startswith("knowledge:")]:
+            knowledge.extend(await loads.result(key))
+        
+        with stage("context_build"):
+            return self._build_context(context, memory_context, knowledge)
+    
+    def _retrieval_packs(self) -> List[KnowledgePack]:
+        """Knowledge packs that have a retriever."""
+        # Packs without one would only spend prompt tokens on a placeholder
+        return [pack for pack in self.knowledge_packs if getattr(pack, "retriever", None)]
+    
+    def _retrieve_pack(self, pack: KnowledgePack, query: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve relevant chunks from one knowledge pack.
+        
+        Args:
+            pack: Knowledge pack with a retriever
+            query: Retrieval query (the user input)
+        
+        Returns:
+            Chunks with ``text``, ``score`` and ``source`` (pack ID)
+        """
+        chunks = []
+        try:
+            top_k = getattr(pack.retriever_config, "top_k", 5)
+            for result in pack.retriever.retrieve(query, top_k=top_k) or []:
+                if isinstance(result, dict):
+                    text = result.get('text', result.get('content', ''))
+                    score = result.get('score', result.get('similarity', 0.0))
+                elif isinstance(result, str):
+                    text, score = result, 1.0
                 else:
-                    # Fallback: return pack metadata
-                    context[f"{pack.id}_context"] = f"Knowledge pack '{pack.name}' loaded but retriever not configured"
-            except Exception as e:
-                # Log error but don't fail
-                import logging
-                logging.warning(f"Failed to retrieve from knowledge pack {pack.id}: {e}")
-                context[f"{pack.id}_context"] = f"Error retrieving from {pack.name}: {str(e)}"
+                    continue
+                if text:
+                    chunks.append({'text': text, 'score': score, 'source': pack.id})
+        except Exception as e:
+            # Log error but don't fail
+            import logging
+            logging.warning(f"Failed to retrieve from knowledge pack {pack.id}: {e}")
+        
+        return chunks
+    
+    def _build_context(
+        self,
+        context: Optional[Dict[str, Any]],
+        memory_context: Dict[str, Any],
+        knowledge: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Pack caller context, memory and knowledge into the token budget."""
+        from agent_factory.runtime.context import ContextBudget, ContextBuilder
+        
+        budget = ContextBudget(max_tokens=self.config.context_max_tokens)
+        if self.config.context_quotas is not None:
+            budget.quotas = dict(self.config.context_quotas)
         
-        return context
+        return ContextBuilder(budget, model=self.model).build(
+            context=context,
+            memory_context=memory_context,
+            knowledge=knowledge,
+        )
     
     def _log_run(
         self,
@@ -278,28 +751,45 @@ class Agent:
         input_text: str,
         result: AgentResult,
         start_time: float,
+        timer: Optional[StageTimer] = None,
     ) -> None:
-        """Log run to prompt log storage."""
-        if not self.prompt_log_storage:
-            return
-        
-        try:
-            from agent_factory.promptlog.model import Run as RunModel
-            
-            run = RunModel(
-                run_id=run_id,
-                agent_id=self.id,
-                inputs={"input": input_text},
-                outputs={"output": result.output},
-                status="success" if result.status == AgentStatus.COMPLETED else "error",
-                execution_time=result.execution_time,
-                tokens_used=result.tokens_used,
-                cost_estimate=0.0,  # Would calculate from tokens
-            )
-            self.prompt_log_storage.save_run(run)
-        except Exception:
-            # Silently fail if logging fails
-            pass
+        """Queue the run for the prompt log, with its stage spans if timed."""
+        self._attach_stages(result, timer)
+        if self.prompt_log_storage:
+            try:
+                with stage("prompt_log"):
+                    get_write_behind().submit(
+                        "prompt_log", self.prompt_log_storage.save_run,
+                        self._build_run_record(run_id, input_text, result),
+                    )
+            except Exception:
+                # Silently fail if logging fails
+                pass
+        if timer:
+            timer.export()
+    
+    @staticmethod
+    def _attach_stages(result: AgentResult, timer: Optional[StageTimer]) -> None:
+        """Expose a timed run's spans in the result metadata."""
+        if timer and timer.enabled:
+            # The shared list also picks up the prompt-log span recorded after this
+            result.metadata["stages"] = timer.spans
+    
+    def _build_run_record(self, run_id: str, input_text: str, result: AgentResult) -> Run:
+        """Build the prompt log record for a run."""
+        return Run(
+            run_id=run_id,
+            agent_id=self.id,
+            inputs={"input": input_text},
+            outputs={"output": result.output},
+            status="success" if result.status == AgentStatus.COMPLETED else "error",
+            execution_time=result.execution_time,
+            tokens_used=result.tokens_used,
+            cost_estimate=0.0,  # Would calculate from tokens
+            metadata=(
+                {"stages": list(result.metadata["stages"])} if "stages" in result.metadata else {}
+            ),
+        )
     
     def _execute_agent(self, input_text: str, context: Dict[str, Any]) -> str:
         """
@@ -316,27 +806,104 @@ class Agent:
             RuntimeError: If execution fails
         """
         try:
-            from agent_factory.integrations.openai_client import OpenAIAgentClient
+            client = self._get_client()
+            request = self._client_request(input_text, context)
+            result = client.run_agent(**request)
             
-            client = OpenAIAgentClient()
-            result = client.run_agent(
-                instructions=self.instructions,
-                input_text=input_text,
-                model=self.model,
-                tools=self.tools,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                context=context,
-            )
+            return result.get("output", "")
+        except ImportError:
+            # Fallback if OpenAI SDK not available
+            return f"[Agent {self.name} would process: {input_text}]"
+        except ExecutionCancelledError:
+            raise
+        except Exception as e:
+            from agent_factory.core.exceptions import AgentExecutionError
+            raise AgentExecutionError(f"Agent execution failed: {str(e)}") from e
+    
+    async def _aexecute_agent(self, input_text: str, context: Dict[str, Any]) -> str:
+        """
+        Execute the agent using the async LLM SDK client.
+        
+        Args:
+            input_text: User input text
+            context: Context dictionary
+        
+        Returns:
+            Agent output text
+        
+        Raises:
+            AgentExecutionError: If execution fails
+        """
+        try:
+            client = self._get_client()
+            request = self._client_request(input_text, context)
+            result = await client.arun_agent(**request)
             
             return result.get("output", "")
         except ImportError:
             # Fallback if OpenAI SDK not available
             return f"[Agent {self.name} would process: {input_text}]"
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             from agent_factory.core.exceptions import AgentExecutionError
             raise AgentExecutionError(f"Agent execution failed: {str(e)}") from e
     
+    def _get_client(self) -> Any:
+        """Provider client for this agent's model (simulated, routed or OpenAI)."""
+        from agent_factory.integrations.simulated_client import (
+            get_simulated_client,
+            is_simulated_model,
+        )
+        
+        if is_simulated_model(self.model):
+            return get_simulated_client()
+        
+        if self.config.enable_provider_routing:
+            from agent_factory.integrations.router import get_provider_router
+            return get_provider_router()
+        
+        from agent_factory.integrations.openai_client import OpenAIAgentClient
+        return OpenAIAgentClient()
+    
+    def _retry_policy(self) -> RetryPolicy:
+        """Retry policy for provider calls from this agent's config."""
+        return RetryPolicy(
+            max_retries=self.config.retry_attempts,
+            timeout=self.config.timeout or None,
+        )
+    
+    def _client_request(self, input_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword arguments for the provider client's run call."""
+        from agent_factory.integrations.simulated_client import is_simulated_model
+        
+        request = {
+            "instructions": self.instructions,
+            "input_text": input_text,
+            "model": self.model,
+            "tools": self.tools,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "context": context,
+            "use_cache": self.config.enable_response_cache,
+            "coalesce": self.config.enable_request_coalescing,
+            "max_tool_iterations": self.config.max_tool_iterations,
+            "tool_timeout": self.config.tool_timeout,
+        }
+        if not is_simulated_model(self.model):
+            # Clients retry each completion, so a retry never re-runs tools
+            request["retry_policy"] = self._retry_policy()
+            if self.config.enable_provider_routing:
+                request["hedge"] = self.config.hedge_requests
+        return request
+    
+    def _stream_request(self, input_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Keyword arguments for the provider client's stream call (streams are not cached)."""
+        request = self._client_request(input_text, context)
+        request.pop("use_cache")
+        request.pop("coalesce")
+        return request
+    
     def handoff(
         self,
         to: "Agent",
@@ -394,3 +961,15 @@ class Agent:
             config=config,
             metadata=data.get("metadata", {}),
         )
+
+
+def _validation_due(pending: List[str]) -> bool:
+    """Whether buffered stream deltas end a sentence or reached the validation stride."""
+    if _SENTENCE_END.search(pending[-1]):
+        return True
+    return sum(len(delta) for delta in pending) >= STREAM_VALIDATION_CHARS
+
+
+def _memory_key(session_id: str) -> str:
+    """Write-behind key for a session's memory saves."""
+    return f"memory:{session_id}"
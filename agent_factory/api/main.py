@@ -2,6 +2,7 @@
 FastAPI REST API main application.
 """
 
+import asyncio
 import os
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -83,6 +84,20 @@ async def startup_event():
         raise
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush queued post-run writes and close pooled provider clients before exit."""
+    from agent_factory.integrations.client_pool import get_client_pool
+    from agent_factory.runtime.write_behind import get_write_behind
+    
+    if not await asyncio.to_thread(get_write_behind().shutdown):
+        logger.warning("Write-behind queue not fully flushed at shutdown")
+    
+    pool = get_client_pool()
+    await pool.aclose_async_clients()
+    pool.close()
+
+
 # Include routers
 app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
 app.include_router(tools.router, prefix="/api/v1/tools", tags=["tools"])
@@ -1,17 +1,24 @@
 """Agent API routes."""
 
+import json
+
 from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
 from pydantic import BaseModel
 
 from agent_factory.agents.agent import Agent
 from agent_factory.registry.local_registry import LocalRegistry
+from agent_factory.runtime.batch import BatchStats
 from agent_factory.runtime.engine import RuntimeEngine
 
 router = APIRouter()
 registry = LocalRegistry()
 runtime = RuntimeEngine()
 
+# Upper bound on client-requested batch concurrency
+MAX_BATCH_CONCURRENCY = 64
+
 
 class AgentCreate(BaseModel):
     id: str
@@ -26,6 +33,14 @@ class AgentRun(BaseModel):
     context: Optional[dict] = None
 
 
+class AgentBatchRun(BaseModel):
+    inputs: List[str]
+    concurrency: int = 8
+    ordered: bool = False
+    session_id: Optional[str] = None
+    context: Optional[dict] = None
+
+
 @router.post("/", response_model=dict)
 def create_agent(agent_data: AgentCreate):
     """Create a new agent."""
@@ -68,14 +83,14 @@ def get_agent(agent_id: str):
 
 
 @router.post("/{agent_id}/run", response_model=dict)
-def run_agent(agent_id: str, run_data: AgentRun):
-    """Run an agent."""
+async def run_agent(agent_id: str, run_data: AgentRun):
+    """Run an agent on the async path, without holding a threadpool worker."""
     agent = registry.get_agent(agent_id)
     
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
     
-    result = agent.run(
+    result = await agent.arun(
         run_data.input_text,
         session_id=run_data.session_id,
         context=run_data.context,
@@ -89,6 +104,105 @@ def run_agent(agent_id: str, run_data: AgentRun):
     }
 
 
+@router.post("/{agent_id}/run/stream")
+async def stream_agent(agent_id: str, run_data: AgentRun):
+    """
+    Run an agent and stream its output as Server-Sent Events.
+    
+    Emits ``delta`` events with ``{"text": ...}`` as output is produced,
+    then a final ``done`` event (or ``error`` event) with the run summary.
+    """
+    agent = registry.get_agent(agent_id)
+    
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    
+    return StreamingResponse(
+        _sse_events(agent, run_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _sse_events(agent: Agent, run_data: AgentRun) -> AsyncIterator[str]:
+    """Format an agent stream as Server-Sent Events."""
+    import time
+    start_time = time.time()
+    chunks = []
+    
+    try:
+        async for delta in agent.astream(
+            run_data.input_text,
+            session_id=run_data.session_id,
+            context=run_data.context,
+        ):
+            chunks.append(delta)
+            yield _sse("delta", {"text": delta})
+    except Exception as e:
+        yield _sse("error", {"status": "error", "error": str(e)})
+        return
+    
+    yield _sse("done", {
+        "output": "".join(chunks),
+        "status": "completed",
+        "execution_time": time.time() - start_time,
+        "error": None,
+    })
+
+
+@router.post("/{agent_id}/run-batch")
+async def run_agent_batch(agent_id: str, batch_data: AgentBatchRun):
+    """
+    Run an agent over many inputs and stream results as Server-Sent Events.
+    
+    Emits a ``result`` event per input as it completes (in input order if
+    ``ordered`` is set), each carrying its ``index`` and any per-item error,
+    then a ``done`` event with aggregate stats. Concurrency adapts down when
+    the provider rate limits.
+    """
+    agent = registry.get_agent(agent_id)
+    
+    if not agent:
+        raise HTTPException(status_code=404, detail="Agent not found")
+    
+    if agent_id not in runtime.agents_registry:
+        runtime.register_agent(agent)
+    
+    return StreamingResponse(
+        _batch_events(agent_id, batch_data),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _batch_events(agent_id: str, batch_data: AgentBatchRun) -> AsyncIterator[str]:
+    """Format batch items and final stats as Server-Sent Events."""
+    stats = BatchStats(total=len(batch_data.inputs))
+    concurrency = max(1, min(batch_data.concurrency, MAX_BATCH_CONCURRENCY))
+    
+    try:
+        async for item in runtime.arun_agent_batch(
+            agent_id,
+            batch_data.inputs,
+            concurrency=concurrency,
+            ordered=batch_data.ordered,
+            session_id=batch_data.session_id,
+            context=batch_data.context,
+        ):
+            stats.add(item)
+            yield _sse("result", item.to_dict())
+    except Exception as e:
+        yield _sse("error", {"status": "error", "error": str(e), "stats": stats.to_dict()})
+        return
+    
+    yield _sse("done", stats.to_dict())
+
+
+def _sse(event: str, data: dict) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.delete("/{agent_id}")
 def delete_agent(agent_id: str):
     """Delete an agent."""
@@ -1,6 +1,6 @@
 """Execution API routes."""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from typing import List, Optional, Dict, Any
 
 from agent_factory.runtime.engine import RuntimeEngine
@@ -13,19 +13,33 @@ runtime = RuntimeEngine()
 
 @router.get("/", response_model=List[Dict[str, Any]])
 def list_executions(
+    response: Response,
     entity_id: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 100,
+    cursor: Optional[str] = None,
     user=Depends(get_current_user)
 ):
-    """List executions with optional filters."""
+    """
+    List executions with optional filters, newest first.
+    
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch
+    the next page; it is absent on the last page.
+    """
     require_permission(Permission.READ_AGENTS)(lambda: None)()
     
-    executions = runtime.list_executions(
-        entity_id=entity_id,
-        status=status,
-        limit=limit
-    )
+    try:
+        executions, next_cursor = runtime.list_executions_page(
+            entity_id=entity_id,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return [
         {
@@ -148,16 +162,11 @@ async def cancel_execution(
     require_permission(Permission.WRITE_AGENTS)(lambda: None)()
     
     execution = runtime.get_execution(execution_id)
-    if not execution:
-        raise HTTPException(status_code=404, detail="Execution not found")
-    
-    if execution.status not in ["running", "pending"]:
+    if execution and execution.status not in ["running", "pending"]:
         raise HTTPException(status_code=400, detail="Can only cancel running or pending executions")
     
-    # Update execution status
-    execution.status = "cancelled"
-    from datetime import datetime
-    execution.completed_at = datetime.now()
-    execution.error = "Cancelled by user"
+    # Stops the run itself, releasing its worker and model calls
+    if not runtime.cancel_execution(execution_id):
+        raise HTTPException(status_code=404, detail="Execution not found")
     
     return {"execution_id": execution_id, "status": "cancelled"}
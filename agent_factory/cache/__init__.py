@@ -1,5 +1,24 @@
 """Caching utilities."""
 
 from agent_factory.cache.redis_cache import RedisCache, get_cache
+from agent_factory.cache.response_cache import (
+    ResponseCache,
+    CacheTier,
+    MemoryCacheTier,
+    DiskCacheTier,
+    RedisCacheTier,
+    get_response_cache,
+    set_response_cache,
+)
 
-__all__ = ["RedisCache", "get_cache"]
+__all__ = [
+    "RedisCache",
+    "get_cache",
+    "ResponseCache",
+    "CacheTier",
+    "MemoryCacheTier",
+    "DiskCacheTier",
+    "RedisCacheTier",
+    "get_response_cache",
+    "set_response_cache",
+]
@@ -0,0 +1,414 @@
+"""
+Exact-match LLM response cache.
+
+Caches provider responses keyed by a stable hash of the full request (model,
+messages, tool schemas and sampling parameters), so byte-identical requests
+are served without another LLM round trip. Entries live in one or more tiers
+(in-process LRU, on-disk SQLite, Redis); reads check tiers in order and
+promote hits into the faster tiers.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from agent_factory.monitoring.metrics import MetricsCollector
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
+
+
+class CacheTier(ABC):
+    """Abstract storage tier for cached responses."""
+    
+    name: str = "tier"
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        pass
+    
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store a response for ``ttl`` seconds."""
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        pass
+
+
+class MemoryCacheTier(CacheTier):
+    """In-process LRU tier bounded by entry count."""
+    
+    name = "memory"
+    
+    def __init__(self, max_entries: int = 1000):
+        """
+        Initialize memory tier.
+        
+        Args:
+            max_entries: Maximum number of cached responses
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store a response, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheTier(CacheTier):
+    """SQLite-backed tier that survives restarts, bounded by entry count."""
+    
+    name = "disk"
+    
+    def __init__(self, db_path: str = "./llm_cache.db", max_entries: int = 10000):
+        """
+        Initialize disk tier.
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_entries: Maximum number of cached responses
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = SQLiteConnectionManager(self.db_path)
+        self._init_db()
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)"
+            )
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        now = time.time()
+        with self._db.transaction() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, expires_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            
+            conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store a response, evicting the least recently used entries."""
+        now = time.time()
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now + ttl, now),
+            )
+            conn.execute("""
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM llm_cache")
+
+
+class RedisCacheTier(CacheTier):
+    """
+    Redis tier shared across processes.
+    
+    Entries expire via Redis TTLs; overall size is bounded by the server's
+    ``maxmemory`` / ``allkeys-lru`` policy rather than by this class.
+    """
+    
+    name = "redis"
+    
+    def __init__(self, cache: Optional[Any] = None, key_prefix: str = "llm_cache"):
+        """
+        Initialize Redis tier.
+        
+        Args:
+            cache: RedisCache instance (defaults to the global cache)
+            key_prefix: Prefix for Redis keys
+        """
+        if cache is None:
+            from agent_factory.cache.redis_cache import get_cache
+            cache = get_cache()
+        self.cache = cache
+        self.key_prefix = key_prefix
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached response, or None if missing or expired."""
+        if not self.cache.client:
+            return None
+        try:
+            value = self.cache.client.get(f"{self.key_prefix}:{key}")
+        except Exception:
+            return None
+        return json.loads(value) if value else None
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        """Store a response for ``ttl`` seconds."""
+        self.cache.set(f"{self.key_prefix}:{key}", value, ttl=ttl)
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self.cache.clear(f"{self.key_prefix}:*")
+
+
+class ResponseCache:
+    """
+    Multi-tier exact-match cache for LLM responses.
+    
+    Example:
+        >>> cache = ResponseCache([MemoryCacheTier(), DiskCacheTier("./llm_cache.db")])
+        >>> key = ResponseCache.make_key("openai", request)
+        >>> result = cache.get_or_compute(key, lambda: call_llm(request))
+    """
+    
+    def __init__(self, tiers: Optional[List[CacheTier]] = None, ttl: int = 3600):
+        """
+        Initialize response cache.
+        
+        Args:
+            tiers: Storage tiers, fastest first (default: in-memory LRU)
+            ttl: Time to live for cached responses in seconds
+        """
+        self.tiers = tiers if tiers is not None else [MemoryCacheTier()]
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(provider: str, request: Dict[str, Any]) -> str:
+        """
+        Build a stable cache key for a provider request.
+        
+        Args:
+            provider: Provider name
+            request: Full request parameters (model, messages, tools, sampling params)
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {"provider": provider, "request": request},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a response, promoting hits into faster tiers.
+        
+        Each tier consulted records a hit or a miss under its own
+        ``llm_<tier>`` metrics label, so hit ratios can be read per tier.
+        
+        Args:
+            key: Cache key from ``make_key``
+        
+        Returns:
+            Cached response or None
+        """
+        for index, tier in enumerate(self.tiers):
+            try:
+                value = tier.get(key)
+            except Exception:
+                value = None
+            if value is not None:
+                for faster in self.tiers[:index]:
+                    self._safe_set(faster, key, value)
+                self.hits += 1
+                MetricsCollector.record_cache_hit(f"llm_{tier.name}")
+                return value
+            MetricsCollector.record_cache_miss(f"llm_{tier.name}")
+        
+        self.misses += 1
+        return None
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response in every tier.
+        
+        Args:
+            key: Cache key from ``make_key``
+            value: Response dictionary (must be JSON-serializable)
+        """
+        for tier in self.tiers:
+            self._safe_set(tier, key, value)
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the cached response for ``key``, computing and storing it on a miss.
+        
+        Args:
+            key: Cache key from ``make_key``
+            compute: Callable producing the response
+        
+        Returns:
+            Response dictionary (with ``cached=True`` when served from cache)
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+        
+        result = compute()
+        self.set(key, result)
+        return result
+    
+    async def aget_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``get_or_compute``.
+        
+        Args:
+            key: Cache key from ``make_key``
+            compute: Coroutine function producing the response
+        
+        Returns:
+            Response dictionary (with ``cached=True`` when served from cache)
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return {**cached, "cached": True}
+        
+        result = await compute()
+        self.set(key, result)
+        return result
+    
+    def clear(self) -> None:
+        """Remove all cached responses from every tier."""
+        for tier in self.tiers:
+            tier.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "tiers": [tier.name for tier in self.tiers],
+            "ttl": self.ttl,
+        }
+    
+    def _safe_set(self, tier: CacheTier, key: str, value: Dict[str, Any]) -> None:
+        """Write to a tier; a failing tier never fails the LLM call."""
+        try:
+            tier.set(key, value, self.ttl)
+        except Exception:
+            pass
+
+
+def _tiers_from_env() -> List[CacheTier]:
+    """Build cache tiers from ``LLM_CACHE_TIERS`` (e.g. "memory,disk,redis")."""
+    tiers: List[CacheTier] = []
+    for name in os.getenv("LLM_CACHE_TIERS", "memory").split(","):
+        name = name.strip().lower()
+        if name == "memory":
+            tiers.append(MemoryCacheTier(int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))))
+        elif name == "disk":
+            tiers.append(DiskCacheTier(
+                os.getenv("LLM_CACHE_PATH", "./llm_cache.db"),
+                int(os.getenv("LLM_CACHE_DISK_MAX_ENTRIES", "10000")),
+            ))
+        elif name == "redis":
+            tiers.append(RedisCacheTier())
+        elif name:
+            raise ValueError(f"Unknown LLM cache tier: {name}")
+    return tiers
+
+
+# Global response cache
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Get global response cache.
+    
+    Tiers and TTL come from ``LLM_CACHE_TIERS``, ``LLM_CACHE_TTL``,
+    ``LLM_CACHE_MAX_ENTRIES``, ``LLM_CACHE_PATH`` and
+    ``LLM_CACHE_DISK_MAX_ENTRIES``.
+    
+    Returns:
+        Response cache
+    """
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache(
+                    tiers=_tiers_from_env(),
+                    ttl=int(os.getenv("LLM_CACHE_TTL", "3600")),
+                )
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """
+    Replace the global response cache (None resets to env defaults).
+    
+    Args:
+        cache: Response cache to install
+    """
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = cache
@@ -29,6 +29,8 @@ class AgentConfig:
     retry_attempts: int = 3
     enable_memory: bool = True
     enable_guardrails: bool = True
+    enable_response_cache: bool = False  # Serve identical LLM requests from cache
+    enable_request_coalescing: bool = False  # Share identical in-flight LLM requests
 
 
 @dataclass
@@ -219,6 +221,8 @@ class Agent:
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
                 context=context,
+                use_cache=self.config.enable_response_cache,
+                coalesce=self.config.enable_request_coalescing,
             )
             
             return result.get("output", "")
@@ -21,6 +21,21 @@ class AgentExecutionError(AgentError):
     pass
 
 
+class CircuitBreakerOpenError(AgentFactoryError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    pass
+
+
+class DeadlineExceededError(AgentFactoryError, TimeoutError):
+    """Raised when an operation runs past its deadline."""
+    pass
+
+
+class ExecutionCancelledError(AgentFactoryError):
+    """Raised inside a run once its cancellation token has been cancelled."""
+    pass
+
+
 class ToolError(AgentFactoryError):
     """Base exception for tool-related errors."""
     pass
@@ -24,6 +24,15 @@ class Guardrail(ABC):
     def check(self, text: str) -> GuardrailResult:
         """Check if text passes the guardrail."""
         pass
+    
+    async def acheck(self, text: str) -> GuardrailResult:
+        """
+        Async variant of ``check``.
+        
+        Local checks are cheap, so the default simply calls ``check``.
+        Guardrails that call out to a moderation service should override this.
+        """
+        return self.check(text)
 
 
 class Guardrails:
@@ -95,6 +104,36 @@ class Guardrails:
             )
         
         return GuardrailResult(allowed=True)
+    
+    async def avalidate_input(self, text: str) -> GuardrailResult:
+        """Async variant of ``validate_input`` using each guardrail's ``acheck``."""
+        for guardrail in self.input_guardrails:
+            result = await guardrail.acheck(text)
+            if not result.allowed:
+                return result
+        
+        return GuardrailResult(allowed=True)
+    
+    async def avalidate_output(self, text: str) -> GuardrailResult:
+        """Async variant of ``validate_output`` using each guardrail's ``acheck``."""
+        modified_text = text
+        
+        for guardrail in self.output_guardrails:
+            result = await guardrail.acheck(modified_text)
+            if not result.allowed:
+                if result.modified_output:
+                    modified_text = result.modified_output
+                else:
+                    return result
+        
+        if modified_text != text:
+            return GuardrailResult(
+                allowed=True,
+                modified_output=modified_text,
+                reason="Output was modified by guardrails",
+            )
+        
+        return GuardrailResult(allowed=True)
 
 
 class ProfanityGuardrail(Guardrail):
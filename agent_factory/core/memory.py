@@ -3,12 +3,14 @@ Memory and session management for agents.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import sqlite3
 import json
 from datetime import datetime
 
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
+
 
 @dataclass
 class Interaction:
@@ -48,6 +50,27 @@ class MemoryStore(ABC):
     def clear_session(self, session_id: str) -> None:
         """Clear all interactions for a session."""
         pass
+    
+    async def asave_interaction(
+        self,
+        session_id: str,
+        input_text: str,
+        output_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Async variant of ``save_interaction``.
+        
+        Runs the blocking implementation in a worker thread by default;
+        stores with a native async driver can override it.
+        """
+        await asyncio.to_thread(
+            self.save_interaction, session_id, input_text, output_text, metadata
+        )
+    
+    async def aget_context(self, session_id: str, limit: int = 10) -> Dict[str, Any]:
+        """Async variant of ``get_context`` (worker thread by default)."""
+        return await asyncio.to_thread(self.get_context, session_id, limit)
 
 
 class SQLiteMemoryStore(MemoryStore):
@@ -68,28 +91,26 @@ class SQLiteMemoryStore(MemoryStore):
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._db = SQLiteConnectionManager(db_path)
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                input_text TEXT NOT NULL,
-                output_text TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                metadata TEXT,
-                INDEX idx_session_id (session_id),
-                INDEX idx_timestamp (timestamp)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT NOT NULL,
+                    input_text TEXT NOT NULL,
+                    output_text TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    metadata TEXT
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_id ON interactions(session_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON interactions(timestamp)")
     
     def save_interaction(
         self,
@@ -99,22 +120,17 @@ class SQLiteMemoryStore(MemoryStore):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Save an interaction to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO interactions (session_id, input_text, output_text, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            session_id,
-            input_text,
-            output_text,
-            datetime.now().isoformat(),
-            json.dumps(metadata or {}),
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            conn.execute("""
+                INSERT INTO interactions (session_id, input_text, output_text, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                session_id,
+                input_text,
+                output_text,
+                datetime.now().isoformat(),
+                json.dumps(metadata or {}),
+            ))
     
     def get_context(self, session_id: str, limit: int = 10) -> Dict[str, Any]:
         """Get conversation context for a session."""
@@ -137,19 +153,14 @@ class SQLiteMemoryStore(MemoryStore):
     
     def get_history(self, session_id: str, limit: int = 50) -> List[Interaction]:
         """Get interaction history for a session."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT input_text, output_text, timestamp, metadata
-            FROM interactions
-            WHERE session_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (session_id, limit))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._db.connection() as conn:
+            rows = conn.execute("""
+                SELECT input_text, output_text, timestamp, metadata
+                FROM interactions
+                WHERE session_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (session_id, limit)).fetchall()
         
         interactions = []
         for row in rows:
@@ -167,10 +178,5 @@ class SQLiteMemoryStore(MemoryStore):
     
     def clear_session(self, session_id: str) -> None:
         """Clear all interactions for a session."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM interactions WHERE session_id = ?", (session_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM interactions WHERE session_id = ?", (session_id,))
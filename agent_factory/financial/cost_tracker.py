@@ -20,16 +20,16 @@ class CostType(str, Enum):
     TOOL_USAGE = "tool_usage"
 
 
-@dataclass
+@dataclass(slots=True)
 class CostRecord:
     """Record of a cost event."""
     id: str
     timestamp: datetime
     cost_type: CostType
     amount: Decimal
-    currency: str = "USD"
     entity_type: str  # "agent", "workflow", "user", "tenant"
     entity_id: str
+    currency: str = "USD"
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -1,5 +1,38 @@
 """Integrations for Agent Factory Platform."""
 
 from agent_factory.integrations.openai_client import OpenAIAgentClient
+from agent_factory.integrations.client_pool import (
+    ProviderClientPool,
+    ProviderPoolConfig,
+    get_client_pool,
+)
+from agent_factory.integrations.coalescing import RequestCoalescer, get_request_coalescer
+from agent_factory.integrations.router import (
+    ProviderRoute,
+    ProviderRouter,
+    RouterConfig,
+    get_provider_router,
+)
+from agent_factory.integrations.simulated_client import (
+    SimulatedAgentClient,
+    SimulatedProviderConfig,
+    get_simulated_client,
+    is_simulated_model,
+)
 
-__all__ = ["OpenAIAgentClient"]
+__all__ = [
+    "OpenAIAgentClient",
+    "ProviderClientPool",
+    "ProviderPoolConfig",
+    "get_client_pool",
+    "RequestCoalescer",
+    "get_request_coalescer",
+    "ProviderRoute",
+    "ProviderRouter",
+    "RouterConfig",
+    "get_provider_router",
+    "SimulatedAgentClient",
+    "SimulatedProviderConfig",
+    "get_simulated_client",
+    "is_simulated_model",
+]
@@ -3,9 +3,14 @@ Anthropic Claude SDK integration for Agent Factory Platform.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from anthropic import Anthropic
+from typing import AsyncIterator, List, Dict, Any, Optional
+from anthropic import Anthropic, AsyncAnthropic
 from agent_factory.tools.base import Tool
+from agent_factory.integrations.client_pool import get_client_pool
+from agent_factory.integrations.coalescing import execute_request, aexecute_request
+from agent_factory.runtime.cancellation import deadline_kwargs
+from agent_factory.runtime.context import format_context_sections, is_packed
+from agent_factory.runtime.retry import RetryPolicy, acall_with_retry, call_with_retry
 
 
 class AnthropicAgentClient:
@@ -26,7 +31,8 @@ class AnthropicAgentClient:
         if not self.api_key:
             raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY environment variable.")
         
-        self.client = Anthropic(api_key=self.api_key)
+        # Shared keep-alive client from the process-wide pool
+        self.client: Anthropic = get_client_pool().get_client("anthropic", self.api_key)
     
     def run_agent(
         self,
@@ -37,6 +43,9 @@ class AnthropicAgentClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Dict[str, Any]:
         """
         Run an agent using Anthropic Claude API.
@@ -49,10 +58,96 @@ class AnthropicAgentClient:
             temperature: Temperature setting
             max_tokens: Maximum tokens
             context: Additional context
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            retry_policy: Retries for transient errors (default: a single attempt)
             
         Returns:
             Agent execution result
         """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        def call() -> Dict[str, Any]:
+            try:
+                response = call_with_retry(
+                    lambda: self.client.messages.create(**request, **deadline_kwargs()),
+                    retry_policy or RetryPolicy(max_retries=0),
+                    operation="completion",
+                )
+                return self._parse_response(response, model)
+            except Exception as e:
+                raise RuntimeError(f"Anthropic API error: {str(e)}") from e
+        
+        return execute_request("anthropic", request, call, use_cache=use_cache, coalesce=coalesce)
+    
+    async def arun_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``run_agent`` built on ``AsyncAnthropic``.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model to use
+            tools: List of tools available to the agent
+            temperature: Temperature setting
+            max_tokens: Maximum tokens
+            context: Additional context
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            retry_policy: Retries for transient errors (default: a single attempt)
+        
+        Returns:
+            Agent execution result
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        async def call() -> Dict[str, Any]:
+            try:
+                response = await acall_with_retry(
+                    lambda: self.async_client.messages.create(**request, **deadline_kwargs()),
+                    retry_policy or RetryPolicy(max_retries=0),
+                    operation="completion",
+                )
+                return self._parse_response(response, model)
+            except Exception as e:
+                raise RuntimeError(f"Anthropic API error: {str(e)}") from e
+        
+        return await aexecute_request(
+            "anthropic", request, call, use_cache=use_cache, coalesce=coalesce
+        )
+    
+    @property
+    def async_client(self) -> AsyncAnthropic:
+        """Pooled async SDK client for the running event loop."""
+        return get_client_pool().get_async_client("anthropic", self.api_key)
+    
+    def _build_request(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str,
+        tools: Optional[List[Tool]],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build Messages API request parameters."""
         # Build messages
         messages = [
             {
@@ -60,6 +155,11 @@ class AnthropicAgentClient:
                 "content": input_text
             }
         ]
+        if is_packed(context):
+            # Budgeted history turns go before the new input
+            messages = [
+                m for m in context["messages"] if m.get("role") in ("user", "assistant")
+            ] + messages
         
         # Convert tools to Anthropic format
         anthropic_tools = []
@@ -74,41 +174,44 @@ class AnthropicAgentClient:
         
         # Build system message with instructions
         system_message = instructions
-        if context:
+        if is_packed(context):
+            sections = format_context_sections(context)
+            if sections:
+                system_message += f"\n\n{sections}"
+        elif context:
             system_message += f"\n\nContext: {context}"
         
-        try:
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_message,
-                messages=messages,
-                tools=anthropic_tools if anthropic_tools else None,
-            )
-            
-            # Extract content
-            output = ""
-            tool_calls = []
-            
-            for content_block in response.content:
-                if content_block.type == "text":
-                    output += content_block.text
-                elif content_block.type == "tool_use":
-                    tool_calls.append({
-                        "id": content_block.id,
-                        "name": content_block.name,
-                        "input": content_block.input
-                    })
-            
-            return {
-                "output": output,
-                "tool_calls": tool_calls,
-                "tokens_used": response.usage.input_tokens + response.usage.output_tokens,
-                "model": model,
-            }
-        except Exception as e:
-            raise RuntimeError(f"Anthropic API error: {str(e)}") from e
+        return {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system_message,
+            "messages": messages,
+            "tools": anthropic_tools if anthropic_tools else None,
+        }
+    
+    def _parse_response(self, response: Any, model: str) -> Dict[str, Any]:
+        """Convert a Messages API response into the agent result dict."""
+        # Extract content
+        output = ""
+        tool_calls = []
+        
+        for content_block in response.content:
+            if content_block.type == "text":
+                output += content_block.text
+            elif content_block.type == "tool_use":
+                tool_calls.append({
+                    "id": content_block.id,
+                    "name": content_block.name,
+                    "input": content_block.input
+                })
+        
+        return {
+            "output": output,
+            "tool_calls": tool_calls,
+            "tokens_used": response.usage.input_tokens + response.usage.output_tokens,
+            "model": model,
+        }
     
     def stream_agent(
         self,
@@ -119,6 +222,7 @@ class AnthropicAgentClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         context: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         """
         Stream agent execution using Anthropic Claude API.
@@ -131,41 +235,74 @@ class AnthropicAgentClient:
             temperature: Temperature setting
             max_tokens: Maximum tokens
             context: Additional context
+            retry_policy: Retries for transient errors while opening the stream
+                (default: a single attempt)
             
         Yields:
             Chunks of agent output
         """
-        messages = [
-            {
-                "role": "user",
-                "content": input_text
-            }
-        ]
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
         
-        anthropic_tools = []
-        if tools:
-            for tool in tools:
-                tool_schema = tool.get_schema()
-                anthropic_tools.append({
-                    "name": tool.id,
-                    "description": tool.description,
-                    "input_schema": tool_schema.get("parameters", {})
-                })
+        try:
+            # Nothing has been yielded until the stream opens, so opening it can be retried
+            stream = call_with_retry(
+                lambda: self.client.messages.create(**request, stream=True, **deadline_kwargs()),
+                retry_policy or RetryPolicy(max_retries=0),
+                operation="stream",
+            )
+            with stream:
+                for event in stream:
+                    if event.type == "content_block_delta":
+                        if hasattr(event.delta, "text"):
+                            yield event.delta.text
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API streaming error: {str(e)}") from e
+    
+    async def astream_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = "claude-3-5-sonnet-20241022",
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream_agent`` built on ``AsyncAnthropic``.
         
-        system_message = instructions
-        if context:
-            system_message += f"\n\nContext: {context}"
+        Args:
+            instructions: System instructions
+            input_text: User input
+            model: Model to use
+            tools: Available tools
+            temperature: Temperature setting
+            max_tokens: Maximum tokens
+            context: Additional context
+            retry_policy: Retries for transient errors while opening the stream
+                (default: a single attempt)
+        
+        Yields:
+            Chunks of agent output
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
         
         try:
-            with self.client.messages.stream(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system=system_message,
-                messages=messages,
-                tools=anthropic_tools if anthropic_tools else None,
-            ) as stream:
-                for event in stream:
+            # Nothing has been yielded until the stream opens, so opening it can be retried
+            stream = await acall_with_retry(
+                lambda: self.async_client.messages.create(
+                    **request, stream=True, **deadline_kwargs()
+                ),
+                retry_policy or RetryPolicy(max_retries=0),
+                operation="stream",
+            )
+            async with stream:
+                async for event in stream:
                     if event.type == "content_block_delta":
                         if hasattr(event.delta, "text"):
                             yield event.delta.text
@@ -0,0 +1,256 @@
+"""
+Process-wide pool of LLM provider SDK clients.
+
+Building an ``OpenAI``/``Anthropic`` client creates a fresh HTTP connection
+pool, so constructing one per run pays a new TCP + TLS handshake on every
+request. The pool hands out one long-lived, keep-alive SDK client per
+provider and API key instead.
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class ProviderPoolConfig:
+    """HTTP connection settings for a provider's pooled client."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0  # seconds
+    http2: bool = True  # Only used when the h2 package is installed
+    timeout: float = 600.0  # seconds, matches the SDK defaults
+    max_retries: int = 0  # Retries are handled by agent_factory.runtime.retry
+    
+    @classmethod
+    def from_env(cls, provider: str) -> "ProviderPoolConfig":
+        """
+        Load settings from ``<PROVIDER>_MAX_CONNECTIONS``,
+        ``<PROVIDER>_MAX_KEEPALIVE_CONNECTIONS``, ``<PROVIDER>_KEEPALIVE_EXPIRY``
+        and ``<PROVIDER>_HTTP2`` environment variables.
+        """
+        prefix = provider.upper()
+        defaults = cls()
+        return cls(
+            max_connections=int(os.getenv(f"{prefix}_MAX_CONNECTIONS", defaults.max_connections)),
+            max_keepalive_connections=int(
+                os.getenv(f"{prefix}_MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections)
+            ),
+            keepalive_expiry=float(
+                os.getenv(f"{prefix}_KEEPALIVE_EXPIRY", defaults.keepalive_expiry)
+            ),
+            http2=os.getenv(f"{prefix}_HTTP2", "true").lower() in ("true", "1", "yes", "on"),
+        )
+
+
+# provider -> (sdk module, sync client class, async client class)
+_PROVIDERS: Dict[str, Tuple[str, str, str]] = {
+    "openai": ("openai", "OpenAI", "AsyncOpenAI"),
+    "anthropic": ("anthropic", "Anthropic", "AsyncAnthropic"),
+}
+
+
+class ProviderClientPool:
+    """
+    Shared, thread-safe cache of provider SDK clients.
+    
+    Sync clients are shared process-wide. Async clients are bound to the
+    event loop they were created on (their connections cannot be reused
+    across loops), so one is kept per running loop. Code that owns a loop
+    awaits ``aclose_async_clients`` before the loop ends.
+    
+    Example:
+        >>> pool = get_client_pool()
+        >>> client = pool.get_client("openai", api_key)
+        >>> client.chat.completions.create(...)
+    """
+    
+    def __init__(self, configs: Optional[Dict[str, ProviderPoolConfig]] = None):
+        """
+        Initialize client pool.
+        
+        Args:
+            configs: Optional per-provider settings (defaults loaded from env)
+        """
+        self.configs: Dict[str, ProviderPoolConfig] = dict(configs or {})
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._async_clients: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, str], Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+    
+    def get_config(self, provider: str) -> ProviderPoolConfig:
+        """Get connection settings for a provider."""
+        if provider not in self.configs:
+            self.configs[provider] = ProviderPoolConfig.from_env(provider)
+        return self.configs[provider]
+    
+    def configure(self, provider: str, config: ProviderPoolConfig) -> None:
+        """
+        Set connection settings for a provider.
+        
+        Clients already handed out keep their settings; new ones use the
+        new configuration.
+        """
+        with self._lock:
+            self.configs[provider] = config
+            for key in [k for k in self._clients if k[0] == provider]:
+                self._clients.pop(key)
+    
+    def get_client(self, provider: str, api_key: str) -> Any:
+        """
+        Get the shared sync SDK client for a provider and API key.
+        
+        Args:
+            provider: Provider name ("openai" or "anthropic")
+            api_key: Provider API key
+        
+        Returns:
+            SDK client instance
+        """
+        key = (provider, api_key)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._build_client(provider, api_key, is_async=False)
+                    self._clients[key] = client
+        return client
+    
+    def get_async_client(self, provider: str, api_key: str) -> Any:
+        """
+        Get the async SDK client for a provider and API key on the running loop.
+        
+        Args:
+            provider: Provider name ("openai" or "anthropic")
+            api_key: Provider API key
+        
+        Returns:
+            Async SDK client instance
+        
+        Raises:
+            RuntimeError: If called outside a running event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError("Async clients must be requested on a running event loop") from None
+        
+        key = (provider, api_key)
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = self._build_client(provider, api_key, is_async=True)
+                clients[key] = client
+        return client
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            return {
+                "sync_clients": len(self._clients),
+                "event_loops": len(self._async_clients),
+                "async_clients": sum(len(c) for c in self._async_clients.values()),
+                "providers": {
+                    provider: {
+                        "max_connections": config.max_connections,
+                        "max_keepalive_connections": config.max_keepalive_connections,
+                        "http2": config.http2 and _http2_available(),
+                    }
+                    for provider, config in self.configs.items()
+                },
+            }
+    
+    async def aclose_async_clients(self) -> None:
+        """Close the async clients of the running event loop."""
+        with self._lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            try:
+                await client.close()
+            except Exception:
+                pass
+    
+    def close(self) -> None:
+        """Close all pooled sync clients and drop async ones."""
+        with self._lock:
+            for client in self._clients.values():
+                try:
+                    client.close()
+                except Exception:
+                    pass
+            self._clients.clear()
+            self._async_clients = weakref.WeakKeyDictionary()
+    
+    def _build_client(self, provider: str, api_key: str, is_async: bool) -> Any:
+        """Construct an SDK client with a tuned, keep-alive HTTP client."""
+        if provider not in _PROVIDERS:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+        
+        module_name, sync_name, async_name = _PROVIDERS[provider]
+        sdk = importlib.import_module(module_name)
+        config = self.get_config(provider)
+        
+        http_client_cls = getattr(
+            sdk, "DefaultAsyncHttpxClient" if is_async else "DefaultHttpxClient"
+        )
+        http_client = http_client_cls(
+            limits=_limits_for(http_client_cls, config),
+            http2=config.http2 and _http2_available(),
+            timeout=config.timeout,
+        )
+        
+        client_cls = getattr(sdk, async_name if is_async else sync_name)
+        return client_cls(
+            api_key=api_key,
+            http_client=http_client,
+            max_retries=config.max_retries,
+        )
+
+
+def _limits_for(http_client_cls: type, config: ProviderPoolConfig) -> Any:
+    """
+    Build connection limits for an SDK's HTTP client class.
+    
+    The SDKs may ship against their own httpx build, so the ``Limits`` class is
+    taken from the module that defines the client's base class.
+    """
+    base = next(c for c in http_client_cls.__mro__[1:] if c.__name__ in ("Client", "AsyncClient"))
+    httpx_module = importlib.import_module(base.__module__.split(".")[0])
+    return httpx_module.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def _http2_available() -> bool:
+    """HTTP/2 support needs the optional ``h2`` package."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# Global client pool
+_pool: Optional[ProviderClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ProviderClientPool:
+    """
+    Get global provider client pool.
+    
+    Returns:
+        Provider client pool
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProviderClientPool()
+    return _pool
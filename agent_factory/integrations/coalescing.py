@@ -0,0 +1,268 @@
+"""
+Single-flight coalescing of identical concurrent LLM requests.
+
+While one request is in flight, identical requests (same provider and
+request key) wait for its result instead of issuing duplicate provider calls.
+Also hosts the shared cache/coalescing dispatch used by the provider clients.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    """A sync request in flight and its eventual outcome."""
+    __slots__ = ("event", "result", "error")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Collapses identical concurrent requests onto a single provider call.
+    
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight share its result or exception. Sync callers wait on
+    a thread event; async callers await a future on their event loop.
+    
+    Example:
+        >>> coalescer = get_request_coalescer()
+        >>> result = coalescer.run("openai", key, lambda: client.run(request))
+    """
+    
+    def __init__(self):
+        """Initialize request coalescer."""
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+    
+    def run(self, provider: str, key: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run ``call`` unless an identical request is already in flight.
+        
+        Args:
+            provider: Provider name (metrics label)
+            key: Request key; identical requests must share it
+            call: Callable performing the provider request
+        
+        Returns:
+            Response dictionary (with ``coalesced=True`` for followers)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        
+        if not is_leader:
+            self._record(provider)
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return {**flight.result, "coalesced": True}
+        
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.event.set()
+    
+    async def arun(
+        self,
+        provider: str,
+        key: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``run``; requests are coalesced per event loop.
+        
+        Args:
+            provider: Provider name (metrics label)
+            key: Request key; identical requests must share it
+            call: Coroutine function performing the provider request
+        
+        Returns:
+            Response dictionary (with ``coalesced=True`` for followers)
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            flights = self._async_flights.setdefault(loop, {})
+            future = flights.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = loop.create_future()
+                flights[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        
+        if not is_leader:
+            self._record(provider)
+            # Shield so a cancelled follower does not cancel the shared call
+            result = await asyncio.shield(future)
+            return {**result, "coalesced": True}
+        
+        try:
+            result = await call()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when there are no followers
+            raise
+        finally:
+            with self._lock:
+                flights.pop(key, None)
+    
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing statistics."""
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._flights) + sum(len(f) for f in self._async_flights.values()),
+            }
+    
+    def _record(self, provider: str) -> None:
+        """Report a collapsed call to metrics."""
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            MetricsCollector.record_coalesced_request(provider)
+        except ImportError:
+            pass
+
+
+# Global request coalescer
+_coalescer: Optional[RequestCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """
+    Get global request coalescer.
+    
+    Returns:
+        Request coalescer
+    """
+    global _coalescer
+    if _coalescer is None:
+        with _coalescer_lock:
+            if _coalescer is None:
+                _coalescer = RequestCoalescer()
+    return _coalescer
+
+
+def execute_request(
+    provider: str,
+    request: Dict[str, Any],
+    call: Callable[[], Dict[str, Any]],
+    use_cache: bool = False,
+    coalesce: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run a provider call through the response cache and/or coalescer.
+    
+    Args:
+        provider: Provider name
+        request: Full request parameters (used to derive the key)
+        call: Callable performing the provider request
+        use_cache: Serve identical requests from the response cache
+        coalesce: Share the result of an identical in-flight request
+    
+    Returns:
+        Response dictionary
+    """
+    if not (use_cache or coalesce):
+        return call()
+    
+    from agent_factory.cache.response_cache import ResponseCache, get_response_cache
+    key = ResponseCache.make_key(provider, request)
+    
+    def fetch() -> Dict[str, Any]:
+        if coalesce:
+            return get_request_coalescer().run(provider, key, call)
+        return call()
+    
+    if use_cache:
+        followed = []
+        
+        def compute() -> Dict[str, Any]:
+            result, coalesced = _split_coalesced(fetch())
+            followed.append(coalesced)
+            return result
+        
+        result = get_response_cache().get_or_compute(key, compute)
+        return {**result, "coalesced": True} if any(followed) else result
+    return fetch()
+
+
+async def aexecute_request(
+    provider: str,
+    request: Dict[str, Any],
+    call: Callable[[], Awaitable[Dict[str, Any]]],
+    use_cache: bool = False,
+    coalesce: bool = False,
+) -> Dict[str, Any]:
+    """
+    Async variant of ``execute_request``.
+    
+    Args:
+        provider: Provider name
+        request: Full request parameters (used to derive the key)
+        call: Coroutine function performing the provider request
+        use_cache: Serve identical requests from the response cache
+        coalesce: Share the result of an identical in-flight request
+    
+    Returns:
+        Response dictionary
+    """
+    if not (use_cache or coalesce):
+        return await call()
+    
+    from agent_factory.cache.response_cache import ResponseCache, get_response_cache
+    key = ResponseCache.make_key(provider, request)
+    
+    async def fetch() -> Dict[str, Any]:
+        if coalesce:
+            return await get_request_coalescer().arun(provider, key, call)
+        return await call()
+    
+    if use_cache:
+        followed = []
+        
+        async def compute() -> Dict[str, Any]:
+            result, coalesced = _split_coalesced(await fetch())
+            followed.append(coalesced)
+            return result
+        
+        result = await get_response_cache().aget_or_compute(key, compute)
+        return {**result, "coalesced": True} if any(followed) else result
+    return await fetch()
+
+
+def _split_coalesced(result: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """Split off a follower's ``coalesced`` flag, which describes the call, not the response."""
+    if not result.get("coalesced"):
+        return result, False
+    return {k: v for k, v in result.items() if k != "coalesced"}, True
@@ -3,9 +3,15 @@ OpenAI Agents SDK integration for Agent Factory Platform.
 """
 
 import os
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import AsyncIterator, Iterator, List, Dict, Any, Optional
+from openai import OpenAI, AsyncOpenAI
 from agent_factory.tools.base import Tool
+from agent_factory.tools.executor import ToolCallResult, get_tool_executor
+from agent_factory.integrations.client_pool import get_client_pool
+from agent_factory.integrations.coalescing import execute_request, aexecute_request
+from agent_factory.runtime.cancellation import deadline_kwargs
+from agent_factory.runtime.context import format_context_sections, is_packed
+from agent_factory.runtime.retry import RetryPolicy, acall_with_retry, call_with_retry
 
 
 class OpenAIAgentClient:
@@ -26,7 +32,8 @@ class OpenAIAgentClient:
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        # Shared keep-alive client from the process-wide pool
+        self.client: OpenAI = get_client_pool().get_client("openai", self.api_key)
     
     def run_agent(
         self,
@@ -37,6 +44,11 @@ class OpenAIAgentClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Dict[str, Any]:
         """
         Run an agent using OpenAI API with circuit breaker protection.
@@ -49,14 +61,365 @@ class OpenAIAgentClient:
             temperature: Temperature setting (default: 0.7)
             max_tokens: Maximum tokens (default: 2000)
             context: Optional conversation context (optional)
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            max_tool_iterations: Rounds of executing requested tool calls and
+                feeding results back (0 returns tool calls unexecuted)
+            tool_timeout: Per-tool-call timeout in seconds
+            retry_policy: Retries for transient errors, applied to each completion
+                so a retry never re-runs tools (default: a single attempt)
             
         Returns:
-            Dictionary with output, tool_calls, tokens_used, and model
+            Dictionary with output, tool_calls, tool_results, tokens_used, and model
             
         Raises:
             ValueError: If API key is not configured
             Exception: If API call fails (wrapped by circuit breaker)
         """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        deadline = retry_policy.deadline()
+        
+        def complete(request: Dict[str, Any]) -> Dict[str, Any]:
+            return self._complete(request, model, use_cache, coalesce, retry_policy, deadline)
+        
+        result = complete(request)
+        tool_results: List[ToolCallResult] = []
+        
+        for _ in range(max_tool_iterations):
+            if not (result["tool_calls"] and tools):
+                break
+            # Run every call from this turn concurrently, then feed results back
+            turn_results = get_tool_executor().execute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            tool_results.extend(turn_results)
+            request = self._continue_request(request, result, turn_results)
+            result = self._merge_turn(result, complete(request))
+        
+        return self._finish(result, tool_results, max_tool_iterations, tools)
+    
+    async def arun_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = "gpt-4o",
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``run_agent`` built on ``AsyncOpenAI``.
+        
+        The request does not hold a thread while waiting on the API, so a
+        single event loop can keep many agent runs in flight.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model to use (default: "gpt-4o")
+            tools: List of tools available to the agent (optional)
+            temperature: Temperature setting (default: 0.7)
+            max_tokens: Maximum tokens (default: 2000)
+            context: Optional conversation context (optional)
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            max_tool_iterations: Rounds of executing requested tool calls and
+                feeding results back (0 returns tool calls unexecuted)
+            tool_timeout: Per-tool-call timeout in seconds
+            retry_policy: Retries for transient errors, applied to each completion
+                so a retry never re-runs tools (default: a single attempt)
+        
+        Returns:
+            Dictionary with output, tool_calls, tool_results, tokens_used, and model
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        deadline = retry_policy.deadline()
+        
+        async def complete(request: Dict[str, Any]) -> Dict[str, Any]:
+            return await self._acomplete(
+                request, model, use_cache, coalesce, retry_policy, deadline
+            )
+        
+        result = await complete(request)
+        tool_results: List[ToolCallResult] = []
+        
+        for _ in range(max_tool_iterations):
+            if not (result["tool_calls"] and tools):
+                break
+            turn_results = await get_tool_executor().aexecute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            tool_results.extend(turn_results)
+            request = self._continue_request(request, result, turn_results)
+            result = self._merge_turn(result, await complete(request))
+        
+        return self._finish(result, tool_results, max_tool_iterations, tools)
+    
+    def stream_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = "gpt-4o",
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> Iterator[str]:
+        """
+        Stream an agent's answer as text deltas.
+        
+        Tool calls requested mid-stream are executed between turns and the
+        follow-up turn is streamed as well.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model to use (default: "gpt-4o")
+            tools: List of tools available to the agent (optional)
+            temperature: Temperature setting (default: 0.7)
+            max_tokens: Maximum tokens (default: 2000)
+            context: Optional conversation context (optional)
+            max_tool_iterations: Rounds of executing requested tool calls
+            tool_timeout: Per-tool-call timeout in seconds
+            retry_policy: Retries for transient errors while opening each turn's
+                stream (default: a single attempt)
+        
+        Yields:
+            Output text deltas
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        deadline = retry_policy.deadline()
+        
+        for iteration in range(max_tool_iterations + 1):
+            turn = _StreamedTurn()
+            # Nothing has been yielded until the stream opens, so opening it can be retried
+            stream = call_with_retry(
+                lambda: self._get_breaker().call(
+                    self.client.chat.completions.create,
+                    **self._stream_request(request),
+                    **deadline_kwargs(),
+                ),
+                retry_policy,
+                operation="stream",
+                deadline=deadline,
+            )
+            for chunk in stream:
+                delta = turn.add(chunk)
+                if delta:
+                    yield delta
+            
+            result = turn.result(model)
+            if not (result["tool_calls"] and tools) or iteration == max_tool_iterations:
+                return
+            turn_results = get_tool_executor().execute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            request = self._continue_request(request, result, turn_results)
+    
+    async def astream_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = "gpt-4o",
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream_agent`` built on ``AsyncOpenAI``.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model to use (default: "gpt-4o")
+            tools: List of tools available to the agent (optional)
+            temperature: Temperature setting (default: 0.7)
+            max_tokens: Maximum tokens (default: 2000)
+            context: Optional conversation context (optional)
+            max_tool_iterations: Rounds of executing requested tool calls
+            tool_timeout: Per-tool-call timeout in seconds
+            retry_policy: Retries for transient errors while opening each turn's
+                stream (default: a single attempt)
+        
+        Yields:
+            Output text deltas
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        retry_policy = retry_policy or RetryPolicy(max_retries=0)
+        deadline = retry_policy.deadline()
+        
+        for iteration in range(max_tool_iterations + 1):
+            turn = _StreamedTurn()
+            # Nothing has been yielded until the stream opens, so opening it can be retried
+            stream = await acall_with_retry(
+                lambda: self._get_breaker().acall(
+                    self.async_client.chat.completions.create,
+                    **self._stream_request(request),
+                    **deadline_kwargs(),
+                ),
+                retry_policy,
+                operation="stream",
+                deadline=deadline,
+            )
+            async for chunk in stream:
+                delta = turn.add(chunk)
+                if delta:
+                    yield delta
+            
+            result = turn.result(model)
+            if not (result["tool_calls"] and tools) or iteration == max_tool_iterations:
+                return
+            turn_results = await get_tool_executor().aexecute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            request = self._continue_request(request, result, turn_results)
+    
+    @staticmethod
+    def _stream_request(request: Dict[str, Any]) -> Dict[str, Any]:
+        """Request parameters for a streamed completion with usage reporting."""
+        return {**request, "stream": True, "stream_options": {"include_usage": True}}
+    
+    def _complete(
+        self,
+        request: Dict[str, Any],
+        model: str,
+        use_cache: bool,
+        coalesce: bool,
+        retry_policy: RetryPolicy,
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Make one chat completion call, retrying transient errors."""
+        def call() -> Dict[str, Any]:
+            # Call OpenAI API with circuit breaker protection
+            # The deadline is not part of the request, which keys the cache
+            response = call_with_retry(
+                lambda: self._get_breaker().call(
+                    self.client.chat.completions.create,
+                    **request,
+                    **deadline_kwargs(),
+                ),
+                retry_policy,
+                operation="completion",
+                deadline=deadline,
+            )
+            return self._parse_response(response, model)
+        
+        return execute_request("openai", request, call, use_cache=use_cache, coalesce=coalesce)
+    
+    async def _acomplete(
+        self,
+        request: Dict[str, Any],
+        model: str,
+        use_cache: bool,
+        coalesce: bool,
+        retry_policy: RetryPolicy,
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """Make one chat completion call on the async client, retrying transient errors."""
+        async def call() -> Dict[str, Any]:
+            response = await acall_with_retry(
+                lambda: self._get_breaker().acall(
+                    self.async_client.chat.completions.create,
+                    **request,
+                    **deadline_kwargs(),
+                ),
+                retry_policy,
+                operation="completion",
+                deadline=deadline,
+            )
+            return self._parse_response(response, model)
+        
+        return await aexecute_request(
+            "openai", request, call, use_cache=use_cache, coalesce=coalesce
+        )
+    
+    @staticmethod
+    def _continue_request(
+        request: Dict[str, Any],
+        result: Dict[str, Any],
+        tool_results: List[ToolCallResult],
+    ) -> Dict[str, Any]:
+        """Append the assistant's tool calls and their results to the conversation."""
+        assistant_message = {
+            "role": "assistant",
+            "content": result["output"] or None,
+            "tool_calls": [
+                {
+                    "id": call["id"],
+                    "type": "function",
+                    "function": {"name": call["name"], "arguments": call["arguments"]},
+                }
+                for call in result["tool_calls"]
+            ],
+        }
+        tool_messages = [
+            {"role": "tool", "tool_call_id": r.id, "content": r.content()}
+            for r in tool_results
+        ]
+        return {**request, "messages": request["messages"] + [assistant_message] + tool_messages}
+    
+    @staticmethod
+    def _merge_turn(previous: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Carry token usage across loop iterations."""
+        return {**result, "tokens_used": previous["tokens_used"] + result["tokens_used"]}
+    
+    @staticmethod
+    def _finish(
+        result: Dict[str, Any],
+        tool_results: List[ToolCallResult],
+        max_tool_iterations: int,
+        tools: Optional[List[Tool]],
+    ) -> Dict[str, Any]:
+        """Attach executed tool results and flag a loop cut short by the guard."""
+        result = {**result, "tool_results": [r.to_dict() for r in tool_results]}
+        if max_tool_iterations and result["tool_calls"] and tools:
+            result["max_tool_iterations_reached"] = True
+        return result
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Pooled async SDK client for the running event loop."""
+        return get_client_pool().get_async_client("openai", self.api_key)
+    
+    def _build_request(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str,
+        tools: Optional[List[Tool]],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build chat completion request parameters."""
         # Convert tools to OpenAI format
         openai_tools = []
         if tools:
@@ -76,17 +439,31 @@ class OpenAIAgentClient:
             {"role": "system", "content": instructions}
         ]
         
-        # Add context if provided
-        if context and "messages" in context:
+        if is_packed(context):
+            # Already fitted to the token budget by ContextBuilder
+            sections = format_context_sections(context)
+            if sections:
+                messages.append({"role": "system", "content": sections})
+            messages.extend(context["messages"])
+        elif context and "messages" in context:
             messages.extend(context["messages"][-10:])  # Last 10 messages
         
         # Add user input
         messages.append({"role": "user", "content": input_text})
         
-        # Call OpenAI API with circuit breaker protection
+        return {
+            "model": model,
+            "messages": messages,
+            "tools": openai_tools if openai_tools else None,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    
+    def _get_breaker(self):
+        """Get the shared OpenAI circuit breaker."""
         from agent_factory.security.circuit_breaker import get_circuit_breaker, CircuitBreakerConfig
         
-        breaker = get_circuit_breaker(
+        return get_circuit_breaker(
             "openai_api",
             config=CircuitBreakerConfig(
                 failure_threshold=5,
@@ -94,16 +471,9 @@ class OpenAIAgentClient:
                 timeout=60.0,
             )
         )
-        
-        response = breaker.call(
-            self.client.chat.completions.create,
-            model=model,
-            messages=messages,
-            tools=openai_tools if openai_tools else None,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
-        
+    
+    def _parse_response(self, response: Any, model: str) -> Dict[str, Any]:
+        """Convert a chat completion response into the agent result dict."""
         # Extract response
         message = response.choices[0].message
         output = message.content or ""
@@ -141,3 +511,50 @@ class OpenAIAgentClient:
             Tool execution result
         """
         return tool.execute(**arguments)
+
+
+class _StreamedTurn:
+    """Reassembles one streamed completion turn from its chunks."""
+    
+    def __init__(self):
+        self.output: List[str] = []
+        self.tool_calls: Dict[int, Dict[str, str]] = {}
+        self.tokens_used = 0
+    
+    def add(self, chunk: Any) -> Optional[str]:
+        """
+        Fold a chunk into the turn.
+        
+        Returns:
+            The chunk's text delta, if any
+        """
+        if getattr(chunk, "usage", None):
+            self.tokens_used = chunk.usage.total_tokens
+        if not chunk.choices:
+            return None
+        
+        delta = chunk.choices[0].delta
+        # Tool call names and arguments arrive in fragments keyed by index
+        for fragment in getattr(delta, "tool_calls", None) or []:
+            call = self.tool_calls.setdefault(
+                fragment.index, {"id": "", "name": "", "arguments": ""}
+            )
+            if fragment.id:
+                call["id"] = fragment.id
+            if fragment.function is not None:
+                call["name"] += fragment.function.name or ""
+                call["arguments"] += fragment.function.arguments or ""
+        
+        if delta.content:
+            self.output.append(delta.content)
+            return delta.content
+        return None
+    
+    def result(self, model: str) -> Dict[str, Any]:
+        """The turn as an agent result dict."""
+        return {
+            "output": "".join(self.output),
+            "tool_calls": [self.tool_calls[index] for index in sorted(self.tool_calls)],
+            "tokens_used": self.tokens_used,
+            "model": model,
+        }
@@ -0,0 +1,710 @@
+"""
+Latency-aware multi-provider routing.
+
+Tracks rolling latency percentiles and error rates per provider and model,
+sends each request to the best healthy provider and can hedge slow requests
+with a duplicate on the next-best provider, returning whichever answers
+first. Provider health comes from the shared circuit breakers, so a breaker
+opened by any caller takes that provider out of rotation.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agent_factory.runtime.retry import classify_error
+
+# Cross-provider equivalents used when no route is configured explicitly
+DEFAULT_FALLBACK_MODELS = {
+    "gpt-4o": "claude-3-5-sonnet-20241022",
+    "gpt-4o-mini": "claude-3-5-haiku-20241022",
+    "claude-3-5-sonnet-20241022": "gpt-4o",
+    "claude-3-5-haiku-20241022": "gpt-4o-mini",
+}
+
+PROVIDER_API_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
+
+def provider_for_model(model: str) -> str:
+    """
+    Infer the provider serving a model.
+    
+    Args:
+        model: Model name
+    
+    Returns:
+        Provider name (``openai``, ``anthropic`` or ``simulated``)
+    """
+    if model.startswith("claude"):
+        return "anthropic"
+    if model.startswith("simulated"):
+        return "simulated"
+    return "openai"
+
+
+def should_fail_over(error: BaseException) -> bool:
+    """
+    Whether another provider may succeed where one failed.
+    
+    Transient errors and open circuit breakers fail over; cancellation,
+    deadlines and permanent errors (e.g. a 400 for a bad request) do not.
+    
+    Args:
+        error: Error raised by a route
+    
+    Returns:
+        True if the request should be sent to the next route
+    """
+    classification = classify_error(error)
+    return classification.retryable or classification.reason == "circuit_open"
+
+
+@dataclass
+class ProviderRoute:
+    """A provider/model pair the router can send requests to."""
+    provider: str
+    model: str
+    breaker: Optional[str] = None  # Circuit breaker name (default: "<provider>_api")
+    # Whether the provider client already reports calls to the breaker itself
+    client_reports_breaker: bool = False
+    
+    def __post_init__(self):
+        if self.breaker is None:
+            self.breaker = f"{self.provider}_api"
+    
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Key for latency statistics."""
+        return (self.provider, self.model)
+
+
+@dataclass
+class RouterConfig:
+    """Configuration for the provider router."""
+    window_size: int = 100  # Recent calls kept per route
+    min_samples: int = 5  # Calls needed before a route's latency is trusted
+    hedge: bool = False  # Send a duplicate request when the primary is slow
+    hedge_percentile: float = 95.0  # Primary latency percentile that triggers the hedge
+    hedge_min_delay: float = 0.05  # seconds
+    hedge_max_delay: float = 10.0  # seconds, also used before enough samples exist
+    error_penalty: float = 4.0  # Score multiplier per unit of error rate
+    explore_every: int = 20  # Send every Nth request to an under-sampled fallback (0: never)
+    fallback_models: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_FALLBACK_MODELS))
+    
+    @classmethod
+    def from_env(cls) -> "RouterConfig":
+        """
+        Build configuration from ``LLM_ROUTER_*`` environment variables.
+        
+        ``LLM_ROUTER_FALLBACKS`` takes comma-separated ``model=fallback`` pairs
+        that extend the default mapping.
+        
+        Returns:
+            Router configuration
+        """
+        config = cls(
+            window_size=int(os.getenv("LLM_ROUTER_WINDOW_SIZE", "100")),
+            min_samples=int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "5")),
+            hedge=os.getenv("LLM_ROUTER_HEDGE", "false").lower() in ("1", "true", "yes"),
+            hedge_percentile=float(os.getenv("LLM_ROUTER_HEDGE_PERCENTILE", "95")),
+            hedge_min_delay=float(os.getenv("LLM_ROUTER_HEDGE_MIN_DELAY", "0.05")),
+            hedge_max_delay=float(os.getenv("LLM_ROUTER_HEDGE_MAX_DELAY", "10")),
+            explore_every=int(os.getenv("LLM_ROUTER_EXPLORE_EVERY", "20")),
+        )
+        for pair in os.getenv("LLM_ROUTER_FALLBACKS", "").split(","):
+            if "=" in pair:
+                model, fallback = pair.split("=", 1)
+                config.fallback_models[model.strip()] = fallback.strip()
+        return config
+
+
+class LatencyWindow:
+    """Rolling window of call latencies and outcomes for one route."""
+    
+    def __init__(self, size: int = 100):
+        """
+        Initialize latency window.
+        
+        Args:
+            size: Number of recent calls kept
+        """
+        self._samples: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+    
+    def record(self, latency: float, success: bool) -> None:
+        """Record one call."""
+        with self._lock:
+            self._samples.append((latency, success))
+    
+    @property
+    def count(self) -> int:
+        """Number of calls in the window."""
+        return len(self._samples)
+    
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the window."""
+        with self._lock:
+            if not self._samples:
+                return 0.0
+            return sum(1 for _, success in self._samples if not success) / len(self._samples)
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Latency percentile over successful calls.
+        
+        Args:
+            q: Percentile between 0 and 100
+        
+        Returns:
+            Latency in seconds, or None without successful calls
+        """
+        with self._lock:
+            latencies = sorted(latency for latency, success in self._samples if success)
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, max(0, int(round(q / 100 * (len(latencies) - 1)))))
+        return latencies[index]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary statistics for the window."""
+        return {
+            "calls": self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "error_rate": self.error_rate,
+        }
+
+
+class ProviderRouter:
+    """
+    Routes agent requests across providers by observed latency and health.
+    
+    A request for a model is eligible for that model's own provider plus the
+    configured cross-provider fallback, if its API key is set. Routes whose
+    circuit breaker is open are skipped; the rest are ranked by median latency
+    weighted by error rate, and fallbacks without enough samples are tried
+    periodically. Failed calls fail over to the next route. With
+    hedging enabled, a duplicate request goes to the second route once the
+    primary has been running longer than its p95 latency.
+    
+    Hedged requests may run tool calls twice, so only enable hedging for agents
+    whose tools are safe to repeat.
+    
+    Example:
+        >>> router = get_provider_router()
+        >>> result = router.run_agent(
+        ...     instructions="You are helpful",
+        ...     input_text="Hello",
+        ...     model="gpt-4o",
+        ...     hedge=True,
+        ... )
+        >>> result["provider"]
+        'openai'
+    """
+    
+    def __init__(
+        self,
+        config: Optional[RouterConfig] = None,
+        client_factory: Optional[Callable[[str], Any]] = None,
+        breaker_factory: Optional[Callable[[str], Any]] = None,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize provider router.
+        
+        Args:
+            config: Router configuration
+            client_factory: Returns the agent client for a provider name
+            breaker_factory: Returns the circuit breaker for a breaker name
+            max_workers: Threads available for hedged sync requests
+        """
+        self.config = config or RouterConfig()
+        self._client_factory = client_factory or self._default_client
+        self._breaker_factory = breaker_factory or self._default_breaker
+        self._windows: Dict[Tuple[str, str], LatencyWindow] = {}
+        self._lock = threading.Lock()
+        self._unsampled_ranks = 0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+    
+    def routes_for(self, model: str) -> List[ProviderRoute]:
+        """
+        Candidate routes for a model, primary first.
+        
+        Args:
+            model: Requested model
+        
+        Returns:
+            The model's own route plus a keyed cross-provider fallback
+        """
+        routes = [self._route(model)]
+        fallback = self.config.fallback_models.get(model)
+        if fallback:
+            route = self._route(fallback)
+            env_var = PROVIDER_API_KEYS.get(route.provider)
+            if route.provider != routes[0].provider and (env_var is None or os.getenv(env_var)):
+                routes.append(route)
+        return routes
+    
+    def rank(self, routes: List[ProviderRoute]) -> List[ProviderRoute]:
+        """
+        Order healthy routes from best to worst.
+        
+        Routes without enough samples keep their configured position behind
+        the primary, except that every ``explore_every``-th ranking puts an
+        under-sampled fallback first so it gathers samples even while the
+        primary stays healthy. If every breaker is open the primary is
+        returned alone so the caller gets the breaker's error.
+        
+        Args:
+            routes: Candidate routes, primary first
+        
+        Returns:
+            Healthy routes, best first
+        """
+        healthy = [route for route in routes if self._is_available(route)]
+        if not healthy:
+            return routes[:1]
+        
+        explore = any(
+            index > 0 and self._window(route).count < self.config.min_samples
+            for index, route in enumerate(healthy)
+        ) and self._explore_due()
+        
+        def score(item: Tuple[int, ProviderRoute]) -> Tuple[float, int]:
+            index, route = item
+            window = self._window(route)
+            median = window.percentile(50)
+            if window.count < self.config.min_samples:
+                if index == 0:
+                    return (0.0, index)
+                return (-1.0 if explore else float("inf"), index)
+            if median is None:
+                return (float("inf"), index)
+            return (median * (1 + self.config.error_penalty * window.error_rate), index)
+        
+        return [route for _, route in sorted(enumerate(healthy), key=score)]
+    
+    def hedge_delay(self, route: ProviderRoute) -> float:
+        """
+        Seconds to wait on a route before sending a hedged duplicate.
+        
+        Args:
+            route: Primary route
+        
+        Returns:
+            The route's hedge percentile latency, clamped to the configured bounds
+        """
+        window = self._window(route)
+        delay = None
+        if window.count >= self.config.min_samples:
+            delay = window.percentile(self.config.hedge_percentile)
+        if delay is None:
+            return self.config.hedge_max_delay
+        return min(self.config.hedge_max_delay, max(self.config.hedge_min_delay, delay))
+    
+    def run_agent(
+        self,
+        model: str = "gpt-4o",
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Run an agent request on the best available provider.
+        
+        Args:
+            model: Requested model
+            hedge: Hedge slow requests (default: router config)
+            **kwargs: Arguments for the provider client's ``run_agent``
+        
+        Returns:
+            Agent execution result with the serving ``provider`` and ``model``
+        """
+        ranked = self.rank(self.routes_for(model))
+        hedge = self.config.hedge if hedge is None else hedge
+        if not hedge or len(ranked) < 2:
+            return self._run_failover(ranked, kwargs)
+        
+        primary, backup = ranked[0], ranked[1]
+        # Pool threads see the run's context (cancellation token, retry observer, timer)
+        first = self._pool.submit(contextvars.copy_context().run, self._call, primary, kwargs)
+        try:
+            return first.result(timeout=self.hedge_delay(primary))
+        except FutureTimeoutError:
+            pass
+        except Exception as e:
+            if not should_fail_over(e):
+                raise
+            return self._run_failover(ranked[1:], kwargs)
+        
+        self._record_hedge(backup)
+        second = self._pool.submit(contextvars.copy_context().run, self._call, backup, kwargs)
+        error: Optional[Exception] = None
+        # The slower call cannot be interrupted; it finishes in the background
+        # and still contributes its latency to the window
+        for future in as_completed([first, second]):
+            try:
+                return future.result()
+            except Exception as e:
+                if not should_fail_over(e):
+                    raise
+                error = e
+        if len(ranked) > 2:
+            return self._run_failover(ranked[2:], kwargs)
+        raise error
+    
+    async def arun_agent(
+        self,
+        model: str = "gpt-4o",
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Run an agent request on the best available provider (async).
+        
+        The losing request of a hedged pair is cancelled.
+        
+        Args:
+            model: Requested model
+            hedge: Hedge slow requests (default: router config)
+            **kwargs: Arguments for the provider client's ``arun_agent``
+        
+        Returns:
+            Agent execution result with the serving ``provider`` and ``model``
+        """
+        ranked = self.rank(self.routes_for(model))
+        hedge = self.config.hedge if hedge is None else hedge
+        if not hedge or len(ranked) < 2:
+            return await self._arun_failover(ranked, kwargs)
+        
+        primary, backup = ranked[0], ranked[1]
+        first = asyncio.ensure_future(self._acall(primary, kwargs))
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay(primary))
+            if done:
+                if first.exception() is None:
+                    return first.result()
+                if not should_fail_over(first.exception()):
+                    raise first.exception()
+                return await self._arun_failover(ranked[1:], kwargs)
+            
+            self._record_hedge(backup)
+            pending.add(asyncio.ensure_future(self._acall(backup, kwargs)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    if not should_fail_over(task.exception()):
+                        raise task.exception()
+                    error = task.exception()
+            if len(ranked) > 2:
+                return await self._arun_failover(ranked[2:], kwargs)
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def stream_agent(
+        self,
+        model: str = "gpt-4o",
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Stream an agent request from the best available provider.
+        
+        Streams are not hedged. A route that fails before its first delta
+        fails over to the next one; after that, errors reach the caller.
+        
+        Args:
+            model: Requested model
+            hedge: Ignored for streams
+            **kwargs: Arguments for the provider client's ``stream_agent``
+        
+        Yields:
+            Output text deltas
+        """
+        error: Optional[Exception] = None
+        for route in self.rank(self.routes_for(model)):
+            client = self._client_factory(route.provider)
+            request = self._accepted(client.stream_agent, {**kwargs, "model": route.model})
+            started = time.time()
+            started_output = False
+            try:
+                for delta in client.stream_agent(**request):
+                    started_output = True
+                    yield delta
+            except Exception as e:
+                self._record(route, time.time() - started, success=False)
+                if started_output:
+                    raise
+                error = e
+                continue
+            self._record(route, time.time() - started, success=True)
+            return
+        raise error
+    
+    async def astream_agent(
+        self,
+        model: str = "gpt-4o",
+        hedge: Optional[bool] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream_agent``.
+        
+        Args:
+            model: Requested model
+            hedge: Ignored for streams
+            **kwargs: Arguments for the provider client's ``astream_agent``
+        
+        Yields:
+            Output text deltas
+        """
+        error: Optional[Exception] = None
+        for route in self.rank(self.routes_for(model)):
+            client = self._client_factory(route.provider)
+            request = self._accepted(client.astream_agent, {**kwargs, "model": route.model})
+            started = time.time()
+            started_output = False
+            try:
+                async for delta in client.astream_agent(**request):
+                    started_output = True
+                    yield delta
+            except Exception as e:
+                self._record(route, time.time() - started, success=False)
+                if started_output:
+                    raise
+                error = e
+                continue
+            self._record(route, time.time() - started, success=True)
+            return
+        raise error
+    
+    def stats(self) -> Dict[str, Any]:
+        """Latency and error statistics per route."""
+        with self._lock:
+            windows = dict(self._windows)
+        return {
+            f"{provider}:{model}": window.snapshot()
+            for (provider, model), window in windows.items()
+        }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the hedging thread pool."""
+        self._pool.shutdown(wait=wait)
+    
+    def _run_failover(self, routes: List[ProviderRoute], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Try routes in order until one succeeds or fails for good."""
+        error: Optional[Exception] = None
+        for route in routes:
+            try:
+                return self._call(route, kwargs)
+            except Exception as e:
+                if not should_fail_over(e):
+                    raise
+                error = e
+        raise error
+    
+    async def _arun_failover(
+        self,
+        routes: List[ProviderRoute],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Try routes in order until one succeeds or fails for good (async)."""
+        error: Optional[Exception] = None
+        for route in routes:
+            try:
+                return await self._acall(route, kwargs)
+            except Exception as e:
+                if not should_fail_over(e):
+                    raise
+                error = e
+        raise error
+    
+    def _call(self, route: ProviderRoute, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to one route and record its latency."""
+        client = self._client_factory(route.provider)
+        request = self._accepted(client.run_agent, {**kwargs, "model": route.model})
+        breaker = None if route.client_reports_breaker else self._breaker(route)
+        started = time.time()
+        try:
+            if breaker is not None:
+                result = breaker.call(client.run_agent, **request)
+            else:
+                result = client.run_agent(**request)
+        except Exception:
+            self._record(route, time.time() - started, success=False)
+            raise
+        self._record(route, time.time() - started, success=True)
+        return {**result, "provider": route.provider, "model": route.model}
+    
+    async def _acall(self, route: ProviderRoute, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to one route and record its latency (async)."""
+        client = self._client_factory(route.provider)
+        request = self._accepted(client.arun_agent, {**kwargs, "model": route.model})
+        breaker = None if route.client_reports_breaker else self._breaker(route)
+        started = time.time()
+        try:
+            if breaker is not None:
+                result = await breaker.acall(client.arun_agent, **request)
+            else:
+                result = await client.arun_agent(**request)
+        except asyncio.CancelledError:
+            self._report(route, "cancelled")
+            raise
+        except Exception:
+            self._record(route, time.time() - started, success=False)
+            raise
+        self._record(route, time.time() - started, success=True)
+        return {**result, "provider": route.provider, "model": route.model}
+    
+    def _route(self, model: str) -> ProviderRoute:
+        """Route for a model on its own provider."""
+        provider = provider_for_model(model)
+        # The OpenAI client already calls through the "openai_api" breaker
+        return ProviderRoute(
+            provider=provider, model=model, client_reports_breaker=provider == "openai"
+        )
+    
+    def _window(self, route: ProviderRoute) -> LatencyWindow:
+        """Latency window for a route."""
+        window = self._windows.get(route.key)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(route.key, LatencyWindow(self.config.window_size))
+        return window
+    
+    def _explore_due(self) -> bool:
+        """Count a ranking with an under-sampled fallback; True on every Nth one."""
+        if self.config.explore_every <= 0:
+            return False
+        with self._lock:
+            self._unsampled_ranks += 1
+            return self._unsampled_ranks % self.config.explore_every == 0
+    
+    def _record(self, route: ProviderRoute, latency: float, success: bool) -> None:
+        """Record a finished call."""
+        self._window(route).record(latency, success)
+        self._report(route, "success" if success else "error")
+    
+    def _is_available(self, route: ProviderRoute) -> bool:
+        """Whether a route's breaker would let a call through."""
+        breaker = self._breaker(route)
+        if breaker is None:
+            return True
+        state = getattr(breaker.stats.state, "value", breaker.stats.state)
+        if state != "open":
+            return True
+        # An open breaker lets a trial call through once its timeout has passed
+        last_failure = breaker.stats.last_failure_time
+        return last_failure is not None and time.time() - last_failure >= breaker.config.timeout
+    
+    def _breaker(self, route: ProviderRoute) -> Any:
+        """Circuit breaker for a route, or None if unavailable."""
+        try:
+            return self._breaker_factory(route.breaker)
+        except ImportError:
+            return None
+    
+    @staticmethod
+    def _accepted(func: Callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop arguments a provider client does not take."""
+        try:
+            parameters = inspect.signature(func).parameters
+        except (TypeError, ValueError):
+            return kwargs
+        if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+            return kwargs
+        return {key: value for key, value in kwargs.items() if key in parameters}
+    
+    @staticmethod
+    def _default_client(provider: str) -> Any:
+        """Build the agent client for a provider."""
+        if provider == "anthropic":
+            from agent_factory.integrations.anthropic_client import AnthropicAgentClient
+            return AnthropicAgentClient()
+        if provider == "simulated":
+            from agent_factory.integrations.simulated_client import get_simulated_client
+            return get_simulated_client()
+        from agent_factory.integrations.openai_client import OpenAIAgentClient
+        return OpenAIAgentClient()
+    
+    @staticmethod
+    def _default_breaker(name: str) -> Any:
+        """Shared circuit breaker, configured like the OpenAI client's."""
+        from agent_factory.security.circuit_breaker import get_circuit_breaker, CircuitBreakerConfig
+        
+        return get_circuit_breaker(
+            name,
+            config=CircuitBreakerConfig(
+                failure_threshold=5,
+                success_threshold=2,
+                timeout=60.0,
+            )
+        )
+    
+    @staticmethod
+    def _report(route: ProviderRoute, outcome: str) -> None:
+        """Report a routed call to metrics."""
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            MetricsCollector.record_routed_request(route.provider, route.model, outcome)
+        except ImportError:
+            pass
+    
+    @staticmethod
+    def _record_hedge(route: ProviderRoute) -> None:
+        """Report a hedged request to metrics."""
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            MetricsCollector.record_hedged_request(route.provider, route.model)
+        except ImportError:
+            pass
+
+
+# Global provider router
+_router: Optional[ProviderRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_provider_router() -> ProviderRouter:
+    """
+    Get global provider router.
+    
+    Configured from ``LLM_ROUTER_*`` environment variables.
+    
+    Returns:
+        Provider router
+    """
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = ProviderRouter(RouterConfig.from_env())
+    return _router
+
+
+def set_provider_router(router: Optional[ProviderRouter]) -> None:
+    """
+    Replace the global provider router (``None`` resets it).
+    
+    Args:
+        router: Provider router to use
+    """
+    global _router
+    with _router_lock:
+        _router = router
@@ -0,0 +1,504 @@
+"""
+Simulated LLM provider for offline and load testing.
+
+Stands in for a real provider so the platform's own overhead (runtime,
+workflows, API, persistence) can be measured without network access. Outputs
+are deterministic per request, latency follows a configurable distribution,
+and recorded responses can be replayed from the prompt log.
+
+Select it with ``Agent(model="simulated")`` (or ``"simulated:<mode>"``), or
+for every agent with ``AGENT_FACTORY_LLM_PROVIDER=simulated``.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from agent_factory.tools.base import Tool
+from agent_factory.tools.executor import ToolCallResult, get_tool_executor
+from agent_factory.integrations.coalescing import execute_request, aexecute_request
+from agent_factory.runtime.context import format_context_sections, is_packed
+
+
+SIMULATED_MODEL = "simulated"
+SIMULATED_MODES = ("echo", "template", "replay")
+LATENCY_DISTRIBUTIONS = ("none", "fixed", "uniform", "normal", "lognormal", "recorded")
+
+
+def is_simulated_model(model: Optional[str]) -> bool:
+    """
+    Check whether a model name (or the environment) selects the simulated provider.
+    
+    Args:
+        model: Agent model name
+    
+    Returns:
+        True if the simulated provider should be used
+    """
+    if os.getenv("AGENT_FACTORY_LLM_PROVIDER", "").lower() == SIMULATED_MODEL:
+        return True
+    return bool(model) and (model == SIMULATED_MODEL or model.startswith(f"{SIMULATED_MODEL}:"))
+
+
+@dataclass
+class SimulatedProviderConfig:
+    """Behaviour of the simulated provider."""
+    mode: str = "template"  # "echo", "template" or "replay"
+    template: str = "[{model}] Response to: {input}"
+    latency: str = "none"  # Distribution name; "recorded" replays logged execution times
+    latency_ms: float = 0.0  # Mean (or fixed) latency
+    latency_jitter_ms: float = 0.0  # Stddev, or half-width for "uniform"
+    tool_call_rate: float = 0.0  # Probability of emitting a synthetic tool call
+    seed: int = 0
+    replay_db_path: Optional[str] = None
+    replay_agent_id: Optional[str] = None
+    chars_per_token: int = 4
+    
+    @classmethod
+    def from_env(cls) -> "SimulatedProviderConfig":
+        """
+        Load settings from ``SIMULATED_LLM_*`` environment variables.
+        
+        ``SIMULATED_LLM_LATENCY`` takes ``<distribution>:<mean_ms>[,<jitter_ms>]``,
+        e.g. ``normal:200,50``.
+        """
+        config = cls(
+            mode=os.getenv("SIMULATED_LLM_MODE", cls.mode),
+            template=os.getenv("SIMULATED_LLM_TEMPLATE", cls.template),
+            tool_call_rate=float(os.getenv("SIMULATED_LLM_TOOL_CALL_RATE", "0")),
+            seed=int(os.getenv("SIMULATED_LLM_SEED", "0")),
+            replay_db_path=os.getenv("SIMULATED_LLM_REPLAY_DB"),
+            replay_agent_id=os.getenv("SIMULATED_LLM_REPLAY_AGENT"),
+        )
+        
+        latency = os.getenv("SIMULATED_LLM_LATENCY")
+        if latency:
+            name, _, params = latency.partition(":")
+            values = [float(v) for v in params.split(",") if v]
+            config.latency = name
+            config.latency_ms = values[0] if values else 0.0
+            config.latency_jitter_ms = values[1] if len(values) > 1 else 0.0
+        
+        return config
+
+
+class SimulatedAgentClient:
+    """
+    Drop-in replacement for ``OpenAIAgentClient`` that never calls a provider.
+    
+    Example:
+        >>> client = SimulatedAgentClient(SimulatedProviderConfig(latency="normal", latency_ms=200))
+        >>> client.run_agent("You are helpful", "Hello")["output"]
+        '[simulated] Response to: Hello'
+    """
+    
+    def __init__(self, config: Optional[SimulatedProviderConfig] = None):
+        """
+        Initialize simulated client.
+        
+        Args:
+            config: Provider behaviour (defaults loaded from env)
+        """
+        self.config = config or SimulatedProviderConfig.from_env()
+        if self.config.mode not in SIMULATED_MODES:
+            raise ValueError(f"Unknown simulated provider mode: {self.config.mode}")
+        if self.config.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.config.latency}")
+        self._recordings: Optional[Dict[str, Dict[str, Any]]] = None
+    
+    def run_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = SIMULATED_MODEL,
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Produce a simulated response after the configured latency.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model name (``simulated`` or ``simulated:<mode>``)
+            tools: List of tools available to the agent
+            temperature: Temperature setting (part of the request key only)
+            max_tokens: Maximum tokens (caps the reported token count)
+            context: Optional conversation context
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            max_tool_iterations: When non-zero, synthetic tool calls are executed
+                once and the simulated model then answers without tools
+            tool_timeout: Per-tool-call timeout in seconds
+        
+        Returns:
+            Dictionary with output, tool_calls, tokens_used, and model
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        def call() -> Dict[str, Any]:
+            result, latency = self._simulate(request, tools)
+            if latency > 0:
+                time.sleep(latency)
+            return result
+        
+        result = execute_request(
+            SIMULATED_MODEL, request, call, use_cache=use_cache, coalesce=coalesce
+        )
+        if max_tool_iterations and result["tool_calls"] and tools:
+            tool_results = get_tool_executor().execute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            result = self._with_tool_results(result, tool_results)
+        return result
+    
+    async def arun_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = SIMULATED_MODEL,
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = False,
+        coalesce: bool = False,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``run_agent``; latency is awaited, not slept.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model name (``simulated`` or ``simulated:<mode>``)
+            tools: List of tools available to the agent
+            temperature: Temperature setting (part of the request key only)
+            max_tokens: Maximum tokens (caps the reported token count)
+            context: Optional conversation context
+            use_cache: Serve identical requests from the response cache
+            coalesce: Share the result of an identical in-flight request
+            max_tool_iterations: When non-zero, synthetic tool calls are executed
+                once and the simulated model then answers without tools
+            tool_timeout: Per-tool-call timeout in seconds
+        
+        Returns:
+            Dictionary with output, tool_calls, tokens_used, and model
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        
+        async def call() -> Dict[str, Any]:
+            result, latency = self._simulate(request, tools)
+            if latency > 0:
+                await asyncio.sleep(latency)
+            return result
+        
+        result = await aexecute_request(
+            SIMULATED_MODEL, request, call, use_cache=use_cache, coalesce=coalesce
+        )
+        if max_tool_iterations and result["tool_calls"] and tools:
+            tool_results = await get_tool_executor().aexecute(
+                result["tool_calls"], tools, timeout=tool_timeout
+            )
+            result = self._with_tool_results(result, tool_results)
+        return result
+    
+    def stream_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = SIMULATED_MODEL,
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Stream the simulated response word by word.
+        
+        The sampled latency elapses before the first delta (time to first
+        token); the remaining deltas follow immediately.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model name (``simulated`` or ``simulated:<mode>``)
+            tools: List of tools available to the agent
+            temperature: Temperature setting (part of the request key only)
+            max_tokens: Maximum tokens (caps the reported token count)
+            context: Optional conversation context
+            max_tool_iterations: When non-zero, synthetic tool calls are executed
+                before the answer is streamed
+            tool_timeout: Per-tool-call timeout in seconds
+        
+        Yields:
+            Output text deltas
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        result, latency = self._simulate(request, tools)
+        if latency > 0:
+            time.sleep(latency)
+        if max_tool_iterations and result["tool_calls"] and tools:
+            get_tool_executor().execute(result["tool_calls"], tools, timeout=tool_timeout)
+        yield from self._deltas(result["output"])
+    
+    async def astream_agent(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str = SIMULATED_MODEL,
+        tools: Optional[List[Tool]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        context: Optional[Dict[str, Any]] = None,
+        max_tool_iterations: int = 0,
+        tool_timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of ``stream_agent``; latency is awaited, not slept.
+        
+        Args:
+            instructions: System instructions for the agent
+            input_text: User input
+            model: Model name (``simulated`` or ``simulated:<mode>``)
+            tools: List of tools available to the agent
+            temperature: Temperature setting (part of the request key only)
+            max_tokens: Maximum tokens (caps the reported token count)
+            context: Optional conversation context
+            max_tool_iterations: When non-zero, synthetic tool calls are executed
+                before the answer is streamed
+            tool_timeout: Per-tool-call timeout in seconds
+        
+        Yields:
+            Output text deltas
+        """
+        request = self._build_request(
+            instructions, input_text, model, tools, temperature, max_tokens, context
+        )
+        result, latency = self._simulate(request, tools)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if max_tool_iterations and result["tool_calls"] and tools:
+            await get_tool_executor().aexecute(result["tool_calls"], tools, timeout=tool_timeout)
+        for delta in self._deltas(result["output"]):
+            yield delta
+    
+    @staticmethod
+    def _deltas(output: str) -> List[str]:
+        """Split output into word-sized deltas that join back to the output."""
+        return re.findall(r"\s*\S+", output) + re.findall(r"\s+$", output)
+    
+    @staticmethod
+    def _with_tool_results(
+        result: Dict[str, Any],
+        tool_results: List[ToolCallResult],
+    ) -> Dict[str, Any]:
+        """Final simulated answer after the requested tools have run."""
+        return {
+            **result,
+            "tool_calls": [],
+            "tool_results": [r.to_dict() for r in tool_results],
+        }
+    
+    def _build_request(
+        self,
+        instructions: str,
+        input_text: str,
+        model: str,
+        tools: Optional[List[Tool]],
+        temperature: float,
+        max_tokens: int,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the request description used for keys and output."""
+        # Same context as the real clients send, so prompt sizes match
+        if is_packed(context):
+            parts = [format_context_sections(context)]
+            parts.extend(str(message.get("content") or "") for message in context["messages"])
+        elif context and "messages" in context:
+            parts = [str(message.get("content") or "") for message in context["messages"][-10:]]
+        else:
+            parts = []
+        return {
+            "model": model or SIMULATED_MODEL,
+            "instructions": instructions,
+            "context": "\n\n".join(part for part in parts if part),
+            "input": input_text,
+            "tools": [tool.id for tool in tools or []],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    
+    def _simulate(
+        self,
+        request: Dict[str, Any],
+        tools: Optional[List[Tool]],
+    ) -> Tuple[Dict[str, Any], float]:
+        """Build the response and latency (seconds) for a request."""
+        # Seed from the request so identical requests behave identically
+        digest = hashlib.sha256(
+            json.dumps({"seed": self.config.seed, **request}, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        rng = random.Random(int(digest[:16], 16))
+        
+        mode = self._mode_for(request["model"])
+        recorded = self._replay(request["input"]) if mode == "replay" else None
+        
+        if recorded is not None:
+            output = recorded["output"]
+        elif mode == "echo":
+            output = request["input"]
+        else:
+            output = self.config.template.format(
+                model=request["model"],
+                input=request["input"],
+                instructions=request["instructions"],
+            )
+        
+        if recorded is not None and recorded["tokens_used"]:
+            tokens_used = recorded["tokens_used"]
+        else:
+            prompt_tokens = self._count_tokens(
+                request["instructions"] + request["context"] + request["input"]
+            )
+            tokens_used = prompt_tokens + min(self._count_tokens(output), request["max_tokens"])
+        
+        tool_calls = []
+        if tools and rng.random() < self.config.tool_call_rate:
+            tool = tools[rng.randrange(len(tools))]
+            tool_calls.append({
+                "id": f"call_{digest[:24]}",
+                "name": tool.id,
+                "arguments": json.dumps({"input": request["input"]}),
+            })
+        
+        result = {
+            "output": output,
+            "tool_calls": tool_calls,
+            "tokens_used": tokens_used,
+            "model": request["model"],
+        }
+        return result, self._sample_latency(rng, recorded)
+    
+    def _mode_for(self, model: str) -> str:
+        """Mode from ``simulated:<mode>`` model names, else the configured one."""
+        _, _, mode = model.partition(":")
+        if mode in SIMULATED_MODES:
+            return mode
+        return self.config.mode
+    
+    def _count_tokens(self, text: str) -> int:
+        """Approximate a token count from the character count."""
+        return max(1, len(text) // self.config.chars_per_token)
+    
+    def _sample_latency(
+        self,
+        rng: random.Random,
+        recorded: Optional[Dict[str, Any]] = None,
+    ) -> float:
+        """Draw a latency in seconds from the configured distribution."""
+        mean = self.config.latency_ms
+        jitter = self.config.latency_jitter_ms
+        distribution = self.config.latency
+        
+        if distribution == "recorded":
+            if recorded is not None:
+                return recorded["execution_time"]
+            latency_ms = mean
+        elif distribution == "none":
+            latency_ms = 0.0
+        elif distribution == "fixed":
+            latency_ms = mean
+        elif distribution == "uniform":
+            latency_ms = rng.uniform(mean - jitter, mean + jitter)
+        elif distribution == "normal":
+            latency_ms = rng.gauss(mean, jitter)
+        else:  # lognormal, parameterised by the desired mean and stddev
+            if mean <= 0:
+                latency_ms = 0.0
+            else:
+                sigma2 = math.log(1 + (jitter / mean) ** 2)
+                latency_ms = rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        
+        return max(0.0, latency_ms) / 1000.0
+    
+    def _replay(self, input_text: str) -> Optional[Dict[str, Any]]:
+        """Look up a recorded response for an input in the prompt log."""
+        if self._recordings is None:
+            self._recordings = self._load_recordings()
+        return self._recordings.get(input_text)
+    
+    def _load_recordings(self) -> Dict[str, Dict[str, Any]]:
+        """Index successful prompt log runs by their input text."""
+        if not self.config.replay_db_path:
+            raise ValueError("Replay mode requires replay_db_path (SIMULATED_LLM_REPLAY_DB)")
+        
+        from agent_factory.promptlog.storage import SQLiteStorage
+        
+        filters: Dict[str, Any] = {"status": "success"}
+        if self.config.replay_agent_id:
+            filters["agent_id"] = self.config.replay_agent_id
+        
+        recordings: Dict[str, Dict[str, Any]] = {}
+        storage = SQLiteStorage(self.config.replay_db_path)
+        # Runs come newest first; keep the most recent response per input
+        for run in storage.list_runs(filters=filters, limit=1_000_000):
+            input_text = run.inputs.get("input")
+            if input_text is None or input_text in recordings:
+                continue
+            recordings[input_text] = {
+                "output": run.outputs.get("output", ""),
+                "tokens_used": run.tokens_used,
+                "execution_time": run.execution_time,
+            }
+        return recordings
+
+
+# Global simulated client (shares loaded replay recordings across runs)
+_simulated_client: Optional[SimulatedAgentClient] = None
+
+
+def get_simulated_client() -> SimulatedAgentClient:
+    """
+    Get global simulated client configured from the environment.
+    
+    Returns:
+        Simulated agent client
+    """
+    global _simulated_client
+    if _simulated_client is None:
+        _simulated_client = SimulatedAgentClient()
+    return _simulated_client
+
+
+def set_simulated_client(client: Optional[SimulatedAgentClient]) -> None:
+    """
+    Replace the global simulated client (None reloads from env on next use).
+    
+    Args:
+        client: Simulated client to install
+    """
+    global _simulated_client
+    _simulated_client = client
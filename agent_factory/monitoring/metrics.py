@@ -67,6 +67,48 @@ cache_misses_total = Counter(
     ["cache_type"]
 )
 
+llm_requests_coalesced_total = Counter(
+    "llm_requests_coalesced_total",
+    "Total LLM requests served by an identical in-flight request",
+    ["provider"]
+)
+
+llm_routed_requests_total = Counter(
+    "llm_routed_requests_total",
+    "Total LLM requests sent by the provider router",
+    ["provider", "model", "outcome"]
+)
+
+llm_hedged_requests_total = Counter(
+    "llm_hedged_requests_total",
+    "Total hedged duplicate LLM requests",
+    ["provider", "model"]
+)
+
+retries_total = Counter(
+    "retries_total",
+    "Total retry decisions for provider and tool calls",
+    ["operation", "reason"]
+)
+
+stage_duration_seconds = Histogram(
+    "agent_stage_duration_seconds",
+    "Duration of agent and workflow run stages in seconds",
+    ["kind", "stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+write_behind_writes_total = Counter(
+    "write_behind_writes_total",
+    "Total background post-run writes by sink and outcome (written, inline, failed)",
+    ["sink", "outcome"]
+)
+
+write_behind_queue_depth = Gauge(
+    "write_behind_queue_depth",
+    "Writes waiting in the write-behind queue"
+)
+
 
 class MetricsCollector:
     """Metrics collector for Agent Factory Platform."""
@@ -93,6 +135,41 @@ class MetricsCollector:
         """Record cache miss."""
         cache_misses_total.labels(cache_type=cache_type).inc()
     
+    @staticmethod
+    def record_coalesced_request(provider: str):
+        """Record an LLM request collapsed onto an in-flight duplicate."""
+        llm_requests_coalesced_total.labels(provider=provider).inc()
+    
+    @staticmethod
+    def record_routed_request(provider: str, model: str, outcome: str):
+        """Record a routed LLM request outcome (success, error, cancelled)."""
+        llm_routed_requests_total.labels(provider=provider, model=model, outcome=outcome).inc()
+    
+    @staticmethod
+    def record_hedged_request(provider: str, model: str):
+        """Record a hedged duplicate LLM request."""
+        llm_hedged_requests_total.labels(provider=provider, model=model).inc()
+    
+    @staticmethod
+    def record_retry(operation: str, reason: str):
+        """Record a retry, or a retry refused by the budget (reason budget_exhausted)."""
+        retries_total.labels(operation=operation, reason=reason).inc()
+    
+    @staticmethod
+    def record_stage_duration(kind: str, stage: str, duration: float):
+        """Record the duration of one stage of an agent or workflow run."""
+        stage_duration_seconds.labels(kind=kind, stage=stage).observe(duration)
+    
+    @staticmethod
+    def record_write_behind(sink: str, outcome: str):
+        """Record a write-behind write outcome (written, inline, failed)."""
+        write_behind_writes_total.labels(sink=sink, outcome=outcome).inc()
+    
+    @staticmethod
+    def set_write_behind_depth(count: int):
+        """Set the write-behind queue depth."""
+        write_behind_queue_depth.set(count)
+    
     @staticmethod
     def set_active_sessions(count: int):
         """Set active sessions count."""
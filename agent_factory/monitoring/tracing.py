@@ -1,12 +1,75 @@
 """Distributed tracing support."""
 
+import contextvars
+import os
 import uuid
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
 
+# Stage spans recorded while handling the current request
+_request_stages: contextvars.ContextVar[Optional[List[Dict[str, Any]]]] = contextvars.ContextVar(
+    "request_stages", default=None
+)
+
+
+def record_stage_spans(
+    kind: str,
+    entity_id: Optional[str],
+    started_at: float,
+    spans: List[Dict[str, Any]],
+) -> None:
+    """
+    Attach a run's stage spans to the current trace.
+    
+    Spans are reported in the request's ``Server-Timing`` header and, when
+    ``TRACING_ENABLED`` is set and OpenTelemetry is installed, emitted as
+    OpenTelemetry spans.
+    
+    Args:
+        kind: "agent" or "workflow"
+        entity_id: Agent or workflow ID
+        started_at: Run start (epoch seconds)
+        spans: Stage spans from ``agent_factory.runtime.profiling.StageTimer``
+    """
+    collected = _request_stages.get()
+    if collected is not None:
+        collected.extend({"kind": kind, **span} for span in spans)
+    
+    if os.getenv("TRACING_ENABLED", "false").lower() != "true":
+        return
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return
+    
+    tracer = trace.get_tracer("agent_factory")
+    for span in spans:
+        start_ns = int((started_at + span["start"]) * 1e9)
+        otel_span = tracer.start_span(f"{kind}.{span['stage']}", start_time=start_ns)
+        otel_span.set_attribute("agent_factory.kind", kind)
+        otel_span.set_attribute("agent_factory.entity_id", entity_id or "")
+        if "detail" in span:
+            otel_span.set_attribute("agent_factory.detail", span["detail"])
+        otel_span.end(end_time=start_ns + int(span["duration"] * 1e9))
+
+
+def server_timing(stages: List[Dict[str, Any]]) -> str:
+    """
+    ``Server-Timing`` header value with total milliseconds per stage.
+    
+    Args:
+        stages: Spans collected for a request
+    """
+    totals: Dict[str, float] = {}
+    for span in stages:
+        name = f"{span['kind']}_{span['stage']}"
+        totals[name] = totals.get(name, 0.0) + span["duration"]
+    return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items())
+
+
 class TracingMiddleware(BaseHTTPMiddleware):
     """Middleware for distributed tracing."""
     
@@ -21,11 +84,18 @@ class TracingMiddleware(BaseHTTPMiddleware):
         request.state.span_id = span_id
         
         # Process request
-        response = await call_next(request)
+        stages: List[Dict[str, Any]] = []
+        reset = _request_stages.set(stages)
+        try:
+            response = await call_next(request)
+        finally:
+            _request_stages.reset(reset)
         
         # Add tracing headers to response
         response.headers["X-Trace-Id"] = trace_id
         response.headers["X-Span-Id"] = span_id
+        if stages:
+            response.headers["Server-Timing"] = server_timing(stages)
         
         return response
 
@@ -4,9 +4,11 @@ SLA monitoring and tracking for Agent Factory Platform.
 Tracks service level objectives (SLOs) and service level indicators (SLIs).
 """
 
+import bisect
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
-from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Callable
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from decimal import Decimal
 
@@ -41,7 +43,7 @@ class SLO:
     window_days: int = 30  # Compliance window
 
 
-@dataclass
+@dataclass(slots=True)
 class SLIMeasurement:
     """SLI measurement."""
     sli_id: str
@@ -50,6 +52,89 @@ class SLIMeasurement:
     metadata: Dict = field(default_factory=dict)
 
 
+class SLIMeasurementSeries:
+    """
+    Columnar buffer of one SLI's measurements, oldest first.
+    
+    Timestamps (UTC epoch seconds) and values are packed in ``array("d")``
+    columns, and metadata is only kept for measurements that have it, so a
+    measurement costs about 16 bytes instead of an object. Iterating or
+    indexing yields ``SLIMeasurement`` objects built on demand.
+    """
+    
+    __slots__ = ("sli_id", "timestamps", "values", "_metadata", "_offset")
+    
+    def __init__(self, sli_id: str):
+        """
+        Initialize series.
+        
+        Args:
+            sli_id: SLI ID
+        """
+        self.sli_id = sli_id
+        self.timestamps = array("d")
+        self.values = array("d")
+        # Metadata by absolute position; positions shift by _offset on prune
+        self._metadata: Dict[int, Dict] = {}
+        self._offset = 0
+    
+    def append(self, timestamp: datetime, value: float, metadata: Optional[Dict] = None) -> None:
+        """
+        Add a measurement.
+        
+        Args:
+            timestamp: Measurement time (naive UTC)
+            value: Measurement value
+            metadata: Optional metadata
+        """
+        if metadata:
+            self._metadata[self._offset + len(self.values)] = metadata
+        self.timestamps.append(_epoch(timestamp))
+        self.values.append(value)
+    
+    def since(self, start: datetime) -> int:
+        """Index of the first measurement taken after ``start``."""
+        return bisect.bisect_right(self.timestamps, _epoch(start))
+    
+    def prune(self, cutoff: datetime) -> None:
+        """
+        Drop measurements taken at or before ``cutoff``.
+        
+        Args:
+            cutoff: Oldest time to keep (exclusive)
+        """
+        count = self.since(cutoff)
+        if not count:
+            return
+        del self.timestamps[:count]
+        del self.values[:count]
+        self._offset += count
+        self._metadata = {i: m for i, m in self._metadata.items() if i >= self._offset}
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __getitem__(self, index: int) -> SLIMeasurement:
+        if index < 0:
+            index += len(self.values)
+        return SLIMeasurement(
+            sli_id=self.sli_id,
+            timestamp=datetime.fromtimestamp(
+                self.timestamps[index], timezone.utc
+            ).replace(tzinfo=None),
+            value=self.values[index],
+            metadata=self._metadata.get(self._offset + index, {}),
+        )
+    
+    def __iter__(self) -> Iterator[SLIMeasurement]:
+        return (self[i] for i in range(len(self.values)))
+
+
+def _epoch(timestamp: datetime) -> float:
+    """Naive UTC datetime to epoch seconds."""
+    return timestamp.replace(tzinfo=timezone.utc).timestamp()
+
+
 class SLAMonitor:
     """
     Monitors SLAs, SLOs, and SLIs.
@@ -65,7 +150,7 @@ class SLAMonitor:
         """Initialize SLA monitor."""
         self.slis: Dict[str, SLI] = {}
         self.slos: Dict[str, SLO] = {}
-        self.measurements: Dict[str, List[SLIMeasurement]] = {}
+        self.measurements: Dict[str, SLIMeasurementSeries] = {}
     
     def create_sli(
         self,
@@ -101,7 +186,7 @@ class SLAMonitor:
         )
         
         self.slis[sli_id] = sli
-        self.measurements[sli_id] = []
+        self.measurements[sli_id] = SLIMeasurementSeries(sli_id)
         
         return sli
     
@@ -160,20 +245,12 @@ class SLAMonitor:
         if sli_id not in self.slis:
             raise ValueError(f"SLI not found: {sli_id}")
         
-        measurement = SLIMeasurement(
-            sli_id=sli_id,
-            timestamp=datetime.utcnow(),
-            value=value,
-            metadata=metadata or {},
-        )
-        
-        self.measurements[sli_id].append(measurement)
+        now = datetime.utcnow()
+        series = self.measurements[sli_id]
+        series.append(now, value, metadata)
         
         # Keep only recent measurements (last 7 days)
-        cutoff = datetime.utcnow() - timedelta(days=7)
-        self.measurements[sli_id] = [
-            m for m in self.measurements[sli_id] if m.timestamp > cutoff
-        ]
+        series.prune(now - timedelta(days=7))
     
     def get_sli_status(self, sli_id: str) -> Dict[str, any]:
         """
@@ -189,7 +266,7 @@ class SLAMonitor:
         if not sli:
             raise ValueError(f"SLI not found: {sli_id}")
         
-        measurements = self.measurements.get(sli_id, [])
+        measurements = self.measurements.get(sli_id)
         
         if not measurements:
             return {
@@ -203,11 +280,10 @@ class SLAMonitor:
         
         # Calculate current value based on window
         window_start = datetime.utcnow() - timedelta(minutes=sli.window_minutes)
-        recent_measurements = [
-            m for m in measurements if m.timestamp > window_start
-        ]
+        start = measurements.since(window_start)
+        recent_values = measurements.values[start:]
         
-        if not recent_measurements:
+        if not recent_values:
             return {
                 "sli_id": sli_id,
                 "sli_name": sli.name,
@@ -220,21 +296,21 @@ class SLAMonitor:
         # Calculate value based on SLI type
         if sli.sli_type == SLIType.AVAILABILITY:
             # Availability: percentage of successful requests
-            successful = sum(1 for m in recent_measurements if m.value > 0)
-            current_value = successful / len(recent_measurements) if recent_measurements else 0.0
+            successful = sum(1 for value in recent_values if value > 0)
+            current_value = successful / len(recent_values)
         elif sli.sli_type == SLIType.LATENCY:
             # Latency: average latency
-            current_value = sum(m.value for m in recent_measurements) / len(recent_measurements)
+            current_value = sum(recent_values) / len(recent_values)
         elif sli.sli_type == SLIType.ERROR_RATE:
             # Error rate: percentage of errors
-            errors = sum(1 for m in recent_measurements if m.value > 0)
-            current_value = errors / len(recent_measurements) if recent_measurements else 0.0
+            errors = sum(1 for value in recent_values if value > 0)
+            current_value = errors / len(recent_values)
         elif sli.sli_type == SLIType.THROUGHPUT:
             # Throughput: requests per second
-            time_span = (recent_measurements[-1].timestamp - recent_measurements[0].timestamp).total_seconds()
-            current_value = len(recent_measurements) / time_span if time_span > 0 else 0.0
+            time_span = measurements.timestamps[-1] - measurements.timestamps[start]
+            current_value = len(recent_values) / time_span if time_span > 0 else 0.0
         else:
-            current_value = sum(m.value for m in recent_measurements) / len(recent_measurements)
+            current_value = sum(recent_values) / len(recent_values)
         
         is_meeting_target = self._check_target(sli.sli_type, current_value, sli.target)
         
@@ -245,7 +321,7 @@ class SLAMonitor:
             "target": sli.target,
             "current_value": current_value,
             "is_meeting_target": is_meeting_target,
-            "measurement_count": len(recent_measurements),
+            "measurement_count": len(recent_values),
             "window_minutes": sli.window_minutes,
         }
     
@@ -291,14 +367,14 @@ class SLAMonitor:
         meeting_target = 0
         
         for sli in slo.slis:
-            measurements = [
-                m for m in self.measurements.get(sli.id, [])
-                if m.timestamp > window_start
-            ]
-            total_measurements += len(measurements)
+            measurements = self.measurements.get(sli.id)
+            if not measurements:
+                continue
+            values = measurements.values[measurements.since(window_start):]
+            total_measurements += len(values)
             
-            for measurement in measurements:
-                if self._check_target(sli.sli_type, measurement.value, sli.target):
+            for value in values:
+                if self._check_target(sli.sli_type, value, sli.target):
                     meeting_target += 1
         
         compliance_percent = (
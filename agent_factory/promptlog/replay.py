@@ -3,20 +3,20 @@ Replay agent runs with different configurations.
 """
 
 import uuid
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, Optional, Any
 
 from agent_factory.promptlog.model import Run
 from agent_factory.promptlog.storage import PromptLogStorage
-from agent_factory.runtime.engine import RuntimeEngine
-from agent_factory.agents.agent import Agent, AgentConfig
-from agent_factory.registry.local_registry import LocalRegistry
+
+if TYPE_CHECKING:
+    from agent_factory.runtime.engine import RuntimeEngine
 
 
 def replay_run(
     run_id: str,
     storage: PromptLogStorage,
     agent_config_override: Optional[Dict[str, Any]] = None,
-    runtime: Optional[RuntimeEngine] = None,
+    runtime: Optional["RuntimeEngine"] = None,
 ) -> Run:
     """
     Replay a run with optional configuration overrides.
@@ -30,6 +30,11 @@ def replay_run(
     Returns:
         New Run with replayed execution
     """
+    # Imported lazily: the runtime engine and agents import promptlog themselves
+    from agent_factory.runtime.engine import RuntimeEngine
+    from agent_factory.agents.agent import AgentConfig
+    from agent_factory.registry.local_registry import LocalRegistry
+    
     # Get original run
     original_run = storage.get_run(run_id)
     if not original_run:
@@ -2,14 +2,15 @@
 Storage backends for prompt logging.
 """
 
+import asyncio
 import json
-import sqlite3
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from agent_factory.promptlog.model import Run, PromptLogEntry
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
 
 
 class PromptLogStorage(ABC):
@@ -39,6 +40,10 @@ class PromptLogStorage(ABC):
     def get_prompt_entries(self, run_id: str) -> List[PromptLogEntry]:
         """Get all prompt entries for a run."""
         pass
+    
+    async def asave_run(self, run: Run) -> None:
+        """Async variant of ``save_run`` (worker thread by default)."""
+        await asyncio.to_thread(self.save_run, run)
 
 
 class SQLiteStorage(PromptLogStorage):
@@ -53,85 +58,75 @@ class SQLiteStorage(PromptLogStorage):
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = SQLiteConnectionManager(self.db_path)
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize database tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Runs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS runs (
-                run_id TEXT PRIMARY KEY,
-                agent_id TEXT,
-                workflow_id TEXT,
-                step_id TEXT,
-                inputs TEXT,
-                outputs TEXT,
-                status TEXT,
-                execution_time REAL,
-                tokens_used INTEGER,
-                cost_estimate REAL,
-                timestamp TEXT,
-                metadata TEXT
-            )
-        """)
-        
-        # Prompt entries table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS prompt_entries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                run_id TEXT,
-                step INTEGER,
-                prompt TEXT,
-                response TEXT,
-                tool_calls TEXT,
-                timestamp TEXT,
-                metadata TEXT,
-                FOREIGN KEY (run_id) REFERENCES runs(run_id)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Runs table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    agent_id TEXT,
+                    workflow_id TEXT,
+                    step_id TEXT,
+                    inputs TEXT,
+                    outputs TEXT,
+                    status TEXT,
+                    execution_time REAL,
+                    tokens_used INTEGER,
+                    cost_estimate REAL,
+                    timestamp TEXT,
+                    metadata TEXT
+                )
+            """)
+            
+            # Prompt entries table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS prompt_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id TEXT,
+                    step INTEGER,
+                    prompt TEXT,
+                    response TEXT,
+                    tool_calls TEXT,
+                    timestamp TEXT,
+                    metadata TEXT,
+                    FOREIGN KEY (run_id) REFERENCES runs(run_id)
+                )
+            """)
     
     def save_run(self, run: Run) -> None:
         """Save a run record."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO runs
-            (run_id, agent_id, workflow_id, step_id, inputs, outputs, status,
-             execution_time, tokens_used, cost_estimate, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            run.run_id,
-            run.agent_id,
-            run.workflow_id,
-            run.step_id,
-            json.dumps(run.inputs),
-            json.dumps(run.outputs),
-            run.status,
-            run.execution_time,
-            run.tokens_used,
-            run.cost_estimate,
-            run.timestamp.isoformat(),
-            json.dumps(run.metadata),
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO runs
+                (run_id, agent_id, workflow_id, step_id, inputs, outputs, status,
+                 execution_time, tokens_used, cost_estimate, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                run.run_id,
+                run.agent_id,
+                run.workflow_id,
+                run.step_id,
+                json.dumps(run.inputs),
+                json.dumps(run.outputs),
+                run.status,
+                run.execution_time,
+                run.tokens_used,
+                run.cost_estimate,
+                run.timestamp.isoformat(),
+                json.dumps(run.metadata),
+            ))
     
     def get_run(self, run_id: str) -> Optional[Run]:
         """Get a run by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,))
-        row = cursor.fetchone()
-        conn.close()
+        _wait_for_pending_runs()
+        with self._db.connection() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
         
         if not row:
             return None
@@ -153,9 +148,7 @@ class SQLiteStorage(PromptLogStorage):
     
     def list_runs(self, filters: Optional[Dict[str, Any]] = None, limit: int = 100) -> List[Run]:
         """List runs with optional filters."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        _wait_for_pending_runs()
         query = "SELECT * FROM runs WHERE 1=1"
         params = []
         
@@ -173,9 +166,8 @@ class SQLiteStorage(PromptLogStorage):
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
         
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        with self._db.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         runs = []
         for row in rows:
@@ -198,34 +190,27 @@ class SQLiteStorage(PromptLogStorage):
     
     def save_prompt_entry(self, entry: PromptLogEntry) -> None:
         """Save a prompt log entry."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO prompt_entries
-            (run_id, step, prompt, response, tool_calls, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            entry.run_id,
-            entry.step,
-            entry.prompt,
-            entry.response,
-            json.dumps(entry.tool_calls),
-            entry.timestamp.isoformat(),
-            json.dumps(entry.metadata),
-        ))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            conn.execute("""
+                INSERT INTO prompt_entries
+                (run_id, step, prompt, response, tool_calls, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                entry.run_id,
+                entry.step,
+                entry.prompt,
+                entry.response,
+                json.dumps(entry.tool_calls),
+                entry.timestamp.isoformat(),
+                json.dumps(entry.metadata),
+            ))
     
     def get_prompt_entries(self, run_id: str) -> List[PromptLogEntry]:
         """Get all prompt entries for a run."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM prompt_entries WHERE run_id = ? ORDER BY step", (run_id,))
-        rows = cursor.fetchall()
-        conn.close()
+        with self._db.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM prompt_entries WHERE run_id = ? ORDER BY step", (run_id,)
+            ).fetchall()
         
         entries = []
         for row in rows:
@@ -240,3 +225,9 @@ class SQLiteStorage(PromptLogStorage):
             ))
         
         return entries
+
+
+def _wait_for_pending_runs() -> None:
+    """Let reads see runs still queued by the write-behind writer."""
+    from agent_factory.runtime.write_behind import get_write_behind
+    get_write_behind().wait(sink="prompt_log")
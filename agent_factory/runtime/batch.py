@@ -0,0 +1,190 @@
+"""
+Batch execution support: adaptive concurrency and per-item results.
+
+``RuntimeEngine.arun_agent_batch`` runs one agent over many inputs through
+``AdaptiveConcurrencyLimiter``, which halves the number of in-flight runs
+when a provider answers 429 and grows it back by one per round of
+successful runs (AIMD), up to the requested concurrency.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async concurrency limit that backs off on rate limiting.
+    
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(16)
+        >>> await limiter.acquire()
+        >>> try:
+        ...     result = await call()
+        ... finally:
+        ...     limiter.release(success=True)
+    """
+    
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        """
+        Initialize limiter.
+        
+        Args:
+            initial: Starting concurrency
+            minimum: Lowest concurrency after backing off
+            maximum: Highest concurrency when growing (default: initial)
+            backoff: Factor applied to the limit on rate limiting
+            cooldown: Seconds between reductions, so one burst of 429s from
+                requests already in flight counts once
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or initial)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.lowest = self.limit
+        self.rate_limited = 0
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._waiters: deque = deque()
+    
+    @property
+    def in_flight(self) -> int:
+        """Runs currently holding a slot."""
+        return self._in_flight
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        if not self._waiters and self._in_flight < int(self.limit):
+            self._in_flight += 1
+            return
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled
+                self._in_flight -= 1
+                self._wake()
+            raise
+    
+    def release(self, success: bool = True) -> None:
+        """
+        Free a slot.
+        
+        Args:
+            success: Whether the run succeeded (grows the limit)
+        """
+        self._in_flight -= 1
+        if success:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+        self._wake()
+    
+    def on_rate_limited(self) -> None:
+        """Cut the limit after a 429, at most once per cooldown."""
+        self.rate_limited += 1
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.backoff)
+        self.lowest = min(self.lowest, self.limit)
+    
+    def observe(self, classification: Any) -> None:
+        """Retry observer hook (see ``agent_factory.runtime.retry.retry_observer``)."""
+        if classification.reason == "rate_limited":
+            self.on_rate_limited()
+    
+    def _wake(self) -> None:
+        """Hand free slots to waiters in arrival order."""
+        while self._waiters and self._in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+@dataclass
+class BatchItem:
+    """Outcome of one input in a batch."""
+    index: int
+    input_text: str
+    status: str  # "completed" or "error"
+    output: str = ""
+    error: Optional[str] = None
+    execution_id: Optional[str] = None
+    execution_time: float = 0.0
+    tokens_used: int = 0
+    concurrency: int = 0  # Limit in force when the item finished
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "index": self.index,
+            "status": self.status,
+            "output": self.output,
+            "error": self.error,
+            "execution_id": self.execution_id,
+            "execution_time": self.execution_time,
+            "tokens_used": self.tokens_used,
+        }
+
+
+@dataclass
+class BatchStats:
+    """Aggregate statistics for a batch, updated as items complete."""
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    tokens_used: int = 0
+    elapsed: float = 0.0
+    min_concurrency: Optional[int] = None
+    final_concurrency: Optional[int] = None
+    _start: float = field(default_factory=time.time, repr=False)
+    _execution_time: float = field(default=0.0, repr=False)
+    
+    def add(self, item: BatchItem) -> None:
+        """Account for a finished item."""
+        if item.status == "completed":
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.tokens_used += item.tokens_used
+        self._execution_time += item.execution_time
+        self.elapsed = time.time() - self._start
+        if item.concurrency:
+            self.min_concurrency = min(self.min_concurrency or item.concurrency, item.concurrency)
+            self.final_concurrency = item.concurrency
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        finished = self.completed + self.failed
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "tokens_used": self.tokens_used,
+            "elapsed": self.elapsed,
+            "avg_execution_time": self._execution_time / finished if finished else 0.0,
+            "throughput": finished / self.elapsed if self.elapsed else 0.0,
+            "min_concurrency": self.min_concurrency,
+            "final_concurrency": self.final_concurrency,
+        }
+
+
+@dataclass
+class BatchResult:
+    """Items and statistics of a finished batch."""
+    items: List[BatchItem]
+    stats: BatchStats
@@ -0,0 +1,339 @@
+"""
+Cooperative cancellation and deadlines for runs.
+
+A ``CancellationToken`` carries a cancel flag and an optional deadline. The
+engine installs one per execution as the current token; agents, workflows,
+tool calls and ``call_with_retry``/``acall_with_retry`` read it from context,
+so it reaches every provider and tool call without changing their
+signatures:
+
+- Async attempts are cancelled as soon as the token is, aborting the
+  in-flight HTTP request.
+- Blocking attempts stop at the next check and are bounded by the deadline.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from agent_factory.core.exceptions import DeadlineExceededError, ExecutionCancelledError
+
+
+class CancellationToken:
+    """
+    Cancel flag plus deadline for one run.
+    
+    A token with a parent registers a callback on it; ``close`` the token
+    (or use it as a context manager) once its run ends to unregister it.
+    
+    Example:
+        >>> token = CancellationToken(timeout=30)
+        >>> with use_token(token):
+        ...     agent.run("Hello")
+        >>> token.cancel("Cancelled by user")  # from another thread
+    """
+    
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None,
+    ):
+        """
+        Initialize token.
+        
+        Args:
+            timeout: Seconds until the deadline (None for no deadline)
+            parent: Token whose cancellation and deadline also apply
+        """
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        if parent is not None and parent.deadline is not None:
+            self.deadline = (
+                parent.deadline if self.deadline is None
+                else min(self.deadline, parent.deadline)
+            )
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._probe: Optional[Callable[[], Optional[str]]] = None
+        self._probe_interval = 0.0
+        self._next_probe = 0.0
+        self._detach: Optional[Callable[[], None]] = None
+        if parent is not None:
+            self._detach = parent.add_callback(lambda: self.cancel(parent.reason or "Cancelled"))
+    
+    def __enter__(self) -> "CancellationToken":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token has been cancelled (polling its probe, if due)."""
+        if self._probe is not None and not self._event.is_set():
+            self._poll()
+        return self._event.is_set()
+    
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.deadline is not None and time.monotonic() >= self.deadline
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline (None without one)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def cancel(self, reason: str = "Cancelled") -> None:
+        """
+        Cancel the token and run its callbacks (once).
+        
+        Args:
+            reason: Why the run was cancelled
+        """
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+    
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run a callback on cancellation (immediately if already cancelled).
+        
+        Args:
+            callback: Zero-argument callable
+        
+        Returns:
+            Function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                
+                def remove() -> None:
+                    with self._lock:
+                        if callback in self._callbacks:
+                            self._callbacks.remove(callback)
+                
+                return remove
+        callback()
+        return lambda: None
+    
+    def close(self) -> None:
+        """Stop following the parent token, so it no longer holds this one."""
+        detach, self._detach = self._detach, None
+        if detach is not None:
+            detach()
+    
+    def set_probe(
+        self,
+        probe: Optional[Callable[[], Optional[str]]],
+        interval: float = 1.0,
+    ) -> None:
+        """
+        Poll an external cancel signal whenever the token is checked.
+        
+        Used for cancellations that cannot call ``cancel`` directly, such as
+        another worker marking a shared execution cancelled. The probe runs
+        at most once per ``interval`` seconds, so frequent checks stay cheap.
+        
+        Args:
+            probe: Returns a cancel reason, or None to keep running
+            interval: Minimum seconds between probe calls
+        """
+        self._probe = probe
+        self._probe_interval = interval
+        self._next_probe = time.monotonic() + interval
+    
+    def check(self) -> None:
+        """
+        Raise if the run should stop.
+        
+        Raises:
+            ExecutionCancelledError: If cancelled
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.cancelled:
+            raise ExecutionCancelledError(self.reason or "Cancelled")
+        if self.expired:
+            raise DeadlineExceededError("Execution exceeded its deadline")
+    
+    def sleep(self, seconds: float) -> None:
+        """Sleep, waking early if cancelled."""
+        self._event.wait(seconds)
+    
+    def _poll(self) -> None:
+        """Call the probe if its interval has passed, cancelling on a reason."""
+        now = time.monotonic()
+        with self._lock:
+            probe = self._probe
+            if probe is None or now < self._next_probe:
+                return
+            self._next_probe = now + self._probe_interval
+        try:
+            reason = probe()
+        except Exception:
+            # An unreachable signal source must not fail the run
+            return
+        if reason:
+            self.cancel(reason)
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "cancellation_token", default=None
+)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """Token of the run executing in this context, if any."""
+    return _current_token.get()
+
+
+@contextmanager
+def use_token(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """
+    Make a token current for the enclosed code.
+    
+    Args:
+        token: Token to install (None leaves the current token in place)
+    """
+    if token is None:
+        yield current_token()
+        return
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+def check_cancelled() -> None:
+    """Raise if the current run has been cancelled or is past its deadline."""
+    token = current_token()
+    if token is not None:
+        token.check()
+
+
+def deadline_kwargs() -> Dict[str, float]:
+    """
+    ``timeout`` keyword for a blocking SDK call, bounded by the current deadline.
+    
+    Returns:
+        ``{"timeout": seconds}`` when the current run has a deadline, else ``{}``
+    """
+    token = current_token()
+    remaining = token.remaining() if token is not None else None
+    return {"timeout": max(remaining, 0.001)} if remaining is not None else {}
+
+
+async def await_cancellable(
+    awaitable: Awaitable[Any],
+    token: Optional[CancellationToken] = None,
+    timeout: Optional[float] = None,
+) -> Any:
+    """
+    Await something, aborting it if the token is cancelled.
+    
+    Args:
+        awaitable: Coroutine or future to await
+        token: Token to watch (default: the current token)
+        timeout: Optional timeout in seconds
+    
+    Returns:
+        The awaited result
+    
+    Raises:
+        ExecutionCancelledError: If the token is cancelled first
+        asyncio.TimeoutError: If the timeout passes first
+    """
+    token = token if token is not None else current_token()
+    if token is None:
+        if timeout is not None:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        return await awaitable
+    
+    task = asyncio.ensure_future(awaitable)
+    loop = asyncio.get_running_loop()
+    # Tokens may be cancelled from another thread (e.g. an API request)
+    remove = token.add_callback(lambda: loop.call_soon_threadsafe(task.cancel))
+    try:
+        return await (asyncio.wait_for(task, timeout=timeout) if timeout is not None else task)
+    except asyncio.CancelledError:
+        if token.cancelled:
+            raise ExecutionCancelledError(token.reason or "Cancelled") from None
+        raise
+    finally:
+        remove()
+
+
+class CancellationRegistry:
+    """Tokens of running executions, so any engine or route can cancel them."""
+    
+    def __init__(self):
+        """Initialize registry."""
+        self._tokens: Dict[str, CancellationToken] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, execution_id: str, token: CancellationToken) -> None:
+        """Track a running execution's token."""
+        with self._lock:
+            self._tokens[execution_id] = token
+    
+    def unregister(self, execution_id: str) -> None:
+        """Stop tracking a finished execution."""
+        with self._lock:
+            self._tokens.pop(execution_id, None)
+    
+    def get(self, execution_id: str) -> Optional[CancellationToken]:
+        """Token of a running execution, if any."""
+        with self._lock:
+            return self._tokens.get(execution_id)
+    
+    def cancel(self, execution_id: str, reason: str = "Cancelled") -> bool:
+        """
+        Cancel a running execution.
+        
+        Args:
+            execution_id: Execution ID
+            reason: Why the run was cancelled
+        
+        Returns:
+            True if a running execution was found
+        """
+        token = self.get(execution_id)
+        if token is None:
+            return False
+        token.cancel(reason)
+        return True
+
+
+# Global cancellation registry
+_registry: Optional[CancellationRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_cancellation_registry() -> CancellationRegistry:
+    """
+    Get global cancellation registry.
+    
+    Returns:
+        Cancellation registry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CancellationRegistry()
+    return _registry
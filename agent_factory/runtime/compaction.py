@@ -0,0 +1,262 @@
+"""
+Rolling summarization of long sessions.
+
+Without compaction a session's history grows forever and every turn sends
+the raw recent interactions to the model. Once a session passes a turn or
+token threshold (``CompactionPolicy``), ``SessionCompactor`` folds its older
+turns into a stored running summary:
+
+- the previous summary and the turns being folded are summarized by the
+  agent's own model (or the simulated provider, for offline runs);
+- the store replaces those turns with the new summary
+  (``MemoryStore.compact_session``), oldest first, keeping the newest
+  ``keep_turns`` verbatim;
+- ``get_context`` then returns the summary plus the recent turns, so
+  prompt size stays bounded however long the session runs.
+
+Compaction runs on a background thread, at most once at a time per
+session, and never delays the turn that triggered it.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from agent_factory.runtime.context import count_tokens
+from agent_factory.runtime.memory import Interaction, MemoryStore
+from agent_factory.runtime.write_behind import get_write_behind
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain the running summary of a long conversation between a user and an "
+    "assistant. Merge the previous summary with the new turns into one updated summary. "
+    "Keep facts about the user, decisions, open questions and anything the assistant "
+    "promised; drop pleasantries and repetition. Write plain prose, no preamble."
+)
+
+# (previous summary, turns to fold) -> updated summary
+Summarizer = Callable[[Optional[str], List[Interaction]], str]
+
+
+@dataclass
+class CompactionPolicy:
+    """When to compact a session and how much to keep."""
+    max_turns: int = 40  # Unsummarized turns that trigger compaction
+    max_tokens: int = 6000  # Tokens of unsummarized turns that trigger compaction
+    keep_turns: int = 10  # Newest turns kept verbatim after compaction
+    summary_max_tokens: int = 500  # Upper bound for the stored summary
+    model: str = "gpt-4o"  # Model used for token counting
+    
+    def should_compact(self, history: List[Interaction]) -> bool:
+        """Whether a session's unsummarized turns exceed either threshold."""
+        if len(history) <= self.keep_turns:
+            return False
+        if len(history) > self.max_turns:
+            return True
+        return self.history_tokens(history) > self.max_tokens
+    
+    def history_tokens(self, history: List[Interaction]) -> int:
+        """Tokens of a list of turns as they are sent to the model."""
+        return sum(
+            count_tokens(interaction.input_text, self.model)
+            + count_tokens(interaction.output_text, self.model)
+            for interaction in history
+        )
+    
+    def bound_summary(self, summary: str) -> str:
+        """Cut a summary that overran ``summary_max_tokens`` at a word boundary."""
+        summary = summary.strip()
+        if count_tokens(summary, self.model) <= self.summary_max_tokens:
+            return summary
+        # About 4 characters per token
+        cut = summary[: self.summary_max_tokens * 4]
+        return cut.rsplit(" ", 1)[0] if " " in cut else cut
+
+
+def format_transcript(previous_summary: Optional[str], interactions: List[Interaction]) -> str:
+    """
+    Render the summarizer's input.
+    
+    Args:
+        previous_summary: Current running summary, if any
+        interactions: Turns being folded, oldest first
+    
+    Returns:
+        Prompt text
+    """
+    parts = []
+    if previous_summary:
+        parts.append(f"Previous summary:\n{previous_summary}")
+    turns = "\n".join(
+        f"User: {interaction.input_text}\nAssistant: {interaction.output_text}"
+        for interaction in interactions
+    )
+    parts.append(f"New turns:\n{turns}")
+    return "\n\n".join(parts)
+
+
+class SessionCompactor:
+    """
+    Background compaction of session memory.
+    
+    Example:
+        >>> compactor = SessionCompactor()
+        >>> compactor.schedule(memory, "session-1", CompactionPolicy(), summarize)
+        >>> compactor.flush()
+    """
+    
+    def __init__(self, max_workers: int = 1):
+        """
+        Initialize compactor.
+        
+        Args:
+            max_workers: Sessions compacted concurrently
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="memory-compaction"
+        )
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.compacted = 0
+        self.failed = 0
+    
+    def schedule(
+        self,
+        memory: MemoryStore,
+        session_id: str,
+        policy: CompactionPolicy,
+        summarize: Summarizer,
+        wait_key: Optional[str] = None,
+    ) -> bool:
+        """
+        Compact a session in the background if it needs it.
+        
+        Args:
+            memory: Memory store holding the session
+            session_id: Session identifier
+            policy: Compaction thresholds
+            summarize: Summarizer for the folded turns
+            wait_key: Write-behind key of the session's queued saves, applied first
+        
+        Returns:
+            True if a compaction check was queued (False if one is already pending)
+        """
+        with self._lock:
+            if session_id in self._in_flight:
+                return False
+            future = self._executor.submit(
+                self._run, memory, session_id, policy, summarize, wait_key
+            )
+            self._in_flight[session_id] = future
+        future.add_done_callback(lambda _: self._done(session_id))
+        return True
+    
+    def compact(
+        self,
+        memory: MemoryStore,
+        session_id: str,
+        policy: CompactionPolicy,
+        summarize: Summarizer,
+    ) -> bool:
+        """
+        Compact a session now if it passes a threshold.
+        
+        Args:
+            memory: Memory store holding the session
+            session_id: Session identifier
+            policy: Compaction thresholds
+            summarize: Summarizer for the folded turns
+        
+        Returns:
+            True if turns were folded into the summary
+        """
+        # Compaction keeps a session near max_turns, so this window usually
+        # holds all of it
+        window = policy.max_turns + policy.keep_turns + 1
+        compacted = False
+        while True:
+            history = memory.get_history(session_id, limit=window)
+            if not policy.should_compact(history):
+                return compacted
+            
+            if len(history) < window:
+                folded = history[: len(history) - policy.keep_turns]
+            else:
+                # Longer than the window (first compaction of an existing
+                # session, or after failed runs): fold it oldest first, one
+                # batch of max_turns at a time, so no turn skips the summary
+                folded = memory.get_oldest_history(session_id, max(policy.max_turns, 1))
+            summary = policy.bound_summary(summarize(memory.get_summary(session_id), folded))
+            if not summary:
+                return compacted
+            memory.compact_session(session_id, summary, len(folded))
+            compacted = True
+    
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for scheduled compactions to finish."""
+        with self._lock:
+            futures = list(self._in_flight.values())
+        wait_futures(futures, timeout=timeout)
+    
+    def shutdown(self) -> None:
+        """Finish scheduled compactions and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+    
+    def _run(
+        self,
+        memory: MemoryStore,
+        session_id: str,
+        policy: CompactionPolicy,
+        summarize: Summarizer,
+        wait_key: Optional[str],
+    ) -> None:
+        """Worker: apply the session's queued saves, then compact."""
+        try:
+            if wait_key is not None:
+                get_write_behind().wait(key=wait_key)
+            if self.compact(memory, session_id, policy, summarize):
+                self.compacted += 1
+        except Exception as e:
+            # History stays intact; the next turn tries again
+            self.failed += 1
+            logger.warning(f"Compaction of session {session_id} failed: {e}")
+    
+    def _done(self, session_id: str) -> None:
+        """Allow the session to be scheduled again."""
+        with self._lock:
+            self._in_flight.pop(session_id, None)
+
+
+# Global compactor
+_compactor: Optional[SessionCompactor] = None
+_compactor_lock = threading.Lock()
+
+
+def get_compactor() -> SessionCompactor:
+    """
+    Get global session compactor.
+    
+    Returns:
+        Session compactor
+    """
+    global _compactor
+    if _compactor is None:
+        with _compactor_lock:
+            if _compactor is None:
+                _compactor = SessionCompactor()
+    return _compactor
+
+
+def set_compactor(compactor: Optional[SessionCompactor]) -> None:
+    """
+    Replace the global compactor (``None`` resets it).
+    
+    Args:
+        compactor: Compactor to use
+    """
+    global _compactor
+    with _compactor_lock:
+        _compactor = compactor
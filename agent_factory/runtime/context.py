@@ -0,0 +1,349 @@
+"""
+Token-budgeted context assembly.
+
+Collects candidate context items (conversation turns, retrieved knowledge
+chunks, tool results), counts their tokens for the target model, ranks them
+and packs the best ones into a token budget with per-source quotas.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+HISTORY = "history"
+KNOWLEDGE = "knowledge"
+TOOL = "tool"
+
+# Approximate tokens added per chat message for role/formatting
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache(maxsize=32)
+def _get_encoding(model: str) -> Any:
+    """Get a tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Count tokens in text for a model.
+    
+    Uses tiktoken when installed; otherwise estimates from character count
+    (about 4 characters per token, 3.5 for Claude models).
+    
+    Args:
+        text: Text to count
+        model: Model name
+    
+    Returns:
+        Token count
+    """
+    if not text:
+        return 0
+    if not model.startswith("claude"):
+        encoding = _get_encoding(model)
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+    chars_per_token = 3.5 if model.startswith("claude") else 4.0
+    return max(1, int(len(text) / chars_per_token + 0.5))
+
+
+@dataclass
+class ContextItem:
+    """A candidate piece of context."""
+    source: str  # HISTORY, KNOWLEDGE or TOOL
+    content: str
+    score: float = 0.0  # Higher is more useful
+    messages: List[Dict[str, str]] = field(default_factory=list)  # Chat messages for history turns
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    tokens: int = 0
+    order: int = 0  # Original position, used to restore chronological order
+
+
+@dataclass
+class ContextBudget:
+    """Token budget and per-source quotas for assembled context."""
+    max_tokens: int = 4000
+    # Fraction of max_tokens reserved for each source; leftover budget is
+    # shared by the highest-scoring remaining items
+    quotas: Dict[str, float] = field(default_factory=lambda: {
+        HISTORY: 0.4,
+        KNOWLEDGE: 0.4,
+        TOOL: 0.2,
+    })
+
+
+class ContextBuilder:
+    """
+    Packs ranked context items into a token budget.
+    
+    Example:
+        >>> builder = ContextBuilder(ContextBudget(max_tokens=2000), model="gpt-4o")
+        >>> context = builder.build(
+        ...     memory_context=memory.get_context(session_id),
+        ...     knowledge=[{"text": chunk, "score": 0.9}],
+        ... )
+        >>> context["messages"], context["knowledge"]
+    """
+    
+    def __init__(self, budget: Optional[ContextBudget] = None, model: str = "gpt-4o"):
+        """
+        Initialize context builder.
+        
+        Args:
+            budget: Token budget and quotas
+            model: Model used for token counting
+        """
+        self.budget = budget or ContextBudget()
+        self.model = model
+    
+    def build(
+        self,
+        context: Optional[Dict[str, Any]] = None,
+        memory_context: Optional[Dict[str, Any]] = None,
+        knowledge: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Assemble a budgeted context dictionary.
+        
+        Args:
+            context: Caller context; ``messages`` and ``tool_results`` become
+                candidates, other keys pass through unchanged
+            memory_context: Output of ``MemoryStore.get_context``; its
+                ``summary`` of compacted turns is always kept
+            knowledge: Retrieved chunks (``text``, ``score``, optional ``source``)
+        
+        Returns:
+            Context with ``messages``, ``knowledge`` and ``tool_results`` packed
+            to budget, plus ``context_tokens``, ``context_dropped`` and the
+            session ``summary`` if there is one
+        """
+        context = dict(context or {})
+        items: List[ContextItem] = []
+        items.extend(self.history_items(context.pop("messages", None), memory_context))
+        items.extend(self.knowledge_items(knowledge))
+        items.extend(self.tool_items(context.pop("tool_results", None)))
+        context.pop("recent_interactions", None)
+        
+        # The summary stands in for every compacted turn, so it is never dropped
+        summary = (memory_context or {}).get("summary") or ""
+        summary_tokens = (
+            count_tokens(summary, self.model) + MESSAGE_OVERHEAD_TOKENS if summary else 0
+        )
+        selected = self.pack(items, reserved=summary_tokens)
+        
+        history = sorted((i for i in selected if i.source == HISTORY), key=lambda i: i.order)
+        return {
+            **context,
+            "messages": [message for item in history for message in item.messages],
+            "knowledge": [
+                {"text": i.content, **i.metadata}
+                for i in selected if i.source == KNOWLEDGE
+            ],
+            "tool_results": [
+                {"content": i.content, **i.metadata}
+                for i in sorted((i for i in selected if i.source == TOOL), key=lambda i: i.order)
+            ],
+            "context_tokens": summary_tokens + sum(i.tokens for i in selected),
+            "context_dropped": len(items) - len(selected),
+            **({"summary": summary} if summary else {}),
+        }
+    
+    def pack(self, items: List[ContextItem], reserved: int = 0) -> List[ContextItem]:
+        """
+        Select items within the budget.
+        
+        Each source first fills its quota with its best-scoring items; any
+        unused budget then goes to the best remaining items of any source.
+        
+        Args:
+            items: Candidate items
+            reserved: Tokens of the budget already spent elsewhere
+        
+        Returns:
+            Selected items
+        """
+        for item in items:
+            if not item.tokens:
+                item.tokens = self._item_tokens(item)
+        
+        ranked = sorted(items, key=lambda i: (-i.score, i.order))
+        selected: List[ContextItem] = []
+        available = max(0, self.budget.max_tokens - reserved)
+        remaining = available
+        
+        # Pass 1: per-source quotas
+        for source, share in self.budget.quotas.items():
+            quota = int(available * share)
+            for item in ranked:
+                if item.source != source or item.tokens > min(quota, remaining):
+                    continue
+                selected.append(item)
+                quota -= item.tokens
+                remaining -= item.tokens
+        
+        # Pass 2: spill leftover budget to the best remaining items
+        chosen = set(map(id, selected))
+        for item in ranked:
+            if id(item) not in chosen and item.tokens <= remaining:
+                selected.append(item)
+                remaining -= item.tokens
+        
+        return selected
+    
+    def history_items(
+        self,
+        messages: Optional[List[Dict[str, str]]] = None,
+        memory_context: Optional[Dict[str, Any]] = None,
+    ) -> List[ContextItem]:
+        """
+        Build history candidates; more recent turns score higher.
+        
+        Recalled past turns (``relevant_interactions``) come first and score
+        their similarity to the query.
+        
+        Args:
+            messages: Chat messages supplied by the caller
+            memory_context: Memory store context with ``recent_interactions``
+                and optionally ``relevant_interactions``
+        
+        Returns:
+            One item per turn, in chronological order
+        """
+        relevant = (memory_context or {}).get("relevant_interactions", [])
+        recalled = [
+            ContextItem(
+                source=HISTORY,
+                content=f"{interaction.get('input', '')}\n{interaction.get('output', '')}",
+                score=float(interaction.get("score", 0.0)),
+                messages=[
+                    {"role": "user", "content": interaction.get("input", "")},
+                    {"role": "assistant", "content": interaction.get("output", "")},
+                ],
+                order=index,
+            )
+            for index, interaction in enumerate(relevant)
+        ]
+        
+        turns: List[List[Dict[str, str]]] = []
+        for interaction in (memory_context or {}).get("recent_interactions", []):
+            turns.append([
+                {"role": "user", "content": interaction.get("input", "")},
+                {"role": "assistant", "content": interaction.get("output", "")},
+            ])
+        caller_turns: List[List[Dict[str, str]]] = []
+        for message in messages or []:
+            # Group caller messages into turns starting at each user message
+            if message.get("role") == "user" or not caller_turns:
+                caller_turns.append([])
+            caller_turns[-1].append(message)
+        turns.extend(caller_turns)
+        
+        count = len(turns)
+        return recalled + [
+            ContextItem(
+                source=HISTORY,
+                content="\n".join(m.get("content", "") for m in turn),
+                score=(index + 1) / count,
+                messages=turn,
+                order=len(recalled) + index,
+            )
+            for index, turn in enumerate(turns)
+        ]
+    
+    def knowledge_items(self, chunks: Optional[List[Dict[str, Any]]] = None) -> List[ContextItem]:
+        """
+        Build knowledge candidates ranked by retrieval score.
+        
+        Args:
+            chunks: Retrieved chunks with ``text`` and ``score``
+        
+        Returns:
+            One item per non-empty chunk
+        """
+        items = []
+        for index, chunk in enumerate(chunks or []):
+            text = chunk.get("text", "")
+            if not text:
+                continue
+            items.append(ContextItem(
+                source=KNOWLEDGE,
+                content=text,
+                score=float(chunk.get("score", 0.0)),
+                metadata={k: v for k, v in chunk.items() if k != "text"},
+                order=index,
+            ))
+        return items
+    
+    def tool_items(self, results: Optional[List[Any]] = None) -> List[ContextItem]:
+        """
+        Build tool result candidates; later results score higher.
+        
+        Args:
+            results: Tool results (strings or dicts with ``content``)
+        
+        Returns:
+            One item per result
+        """
+        items = []
+        count = len(results or [])
+        for index, result in enumerate(results or []):
+            if isinstance(result, dict):
+                content = str(result.get("content", result.get("output", "")))
+                metadata = {k: v for k, v in result.items() if k not in ("content", "output")}
+            else:
+                content, metadata = str(result), {}
+            items.append(ContextItem(
+                source=TOOL,
+                content=content,
+                score=float(metadata.pop("score", (index + 1) / count)),
+                metadata=metadata,
+                order=index,
+            ))
+        return items
+    
+    def _item_tokens(self, item: ContextItem) -> int:
+        """Token cost of an item as it will be sent to the model."""
+        if item.messages:
+            return sum(
+                count_tokens(m.get("content", ""), self.model) + MESSAGE_OVERHEAD_TOKENS
+                for m in item.messages
+            )
+        return count_tokens(item.content, self.model) + MESSAGE_OVERHEAD_TOKENS
+
+
+def format_context_sections(context: Optional[Dict[str, Any]]) -> str:
+    """
+    Render the session summary, packed knowledge and tool results as prompt text.
+    
+    Args:
+        context: Context produced by ``ContextBuilder.build``
+    
+    Returns:
+        Prompt text (empty if there is nothing to add)
+    """
+    if not context:
+        return ""
+    
+    sections = []
+    if context.get("summary"):
+        sections.append("Summary of the earlier conversation:\n\n" + context["summary"])
+    knowledge = context.get("knowledge") or []
+    if knowledge:
+        sections.append("Relevant knowledge:\n\n" + "\n\n".join(k["text"] for k in knowledge))
+    tool_results = context.get("tool_results") or []
+    if tool_results:
+        sections.append("Tool results:\n\n" + "\n\n".join(t["content"] for t in tool_results))
+    return "\n\n".join(sections)
+
+
+def is_packed(context: Optional[Dict[str, Any]]) -> bool:
+    """Whether a context dict was produced by ``ContextBuilder.build``."""
+    return bool(context) and "context_tokens" in context
@@ -2,19 +2,40 @@
 Runtime engine for executing agents and workflows with prompt logging.
 """
 
-from typing import Dict, Optional, Any, List
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional, Any, List, Sequence, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+import asyncio
+import time
 import uuid
 
 from agent_factory.agents.agent import Agent, AgentResult
 from agent_factory.workflows.model import Workflow, WorkflowResult
+from agent_factory.integrations.client_pool import get_client_pool
 from agent_factory.promptlog import SQLiteStorage, Run as RunModel
+from agent_factory.core.exceptions import ExecutionCancelledError
+from agent_factory.runtime.batch import (
+    AdaptiveConcurrencyLimiter,
+    BatchItem,
+    BatchResult,
+    BatchStats,
+)
+from agent_factory.runtime.cancellation import (
+    CancellationToken,
+    await_cancellable,
+    current_token,
+    get_cancellation_registry,
+    use_token,
+)
+from agent_factory.runtime.execution_store import ACTIVE_STATUSES, ExecutionStore
+from agent_factory.runtime.retry import retry_observer
+from agent_factory.runtime.write_behind import get_write_behind
 from agent_factory.telemetry.collector import get_collector
-from agent_factory.telemetry.model import UserActivatedEvent, UserSignupEvent, UserLoginEvent
+from agent_factory.telemetry.activation import ActivationRegistry, get_activation_registry
 
 
-@dataclass
+@dataclass(slots=True)
 class Execution:
     """Represents an execution instance."""
     id: str
@@ -44,6 +65,8 @@ class RuntimeEngine:
         tenant_id: Optional[str] = None,
         user_id: Optional[str] = None,
         project_id: Optional[str] = None,
+        execution_store: Optional[ExecutionStore] = None,
+        activation_registry: Optional[ActivationRegistry] = None,
     ):
         """
         Initialize runtime engine.
@@ -53,8 +76,12 @@ class RuntimeEngine:
             tenant_id: Optional tenant ID for telemetry
             user_id: Optional user ID for telemetry
             project_id: Optional project ID for telemetry
+            execution_store: Bounded execution store (default: configured from env)
+            activation_registry: Registry of activated users (default: global registry)
         """
-        self.executions: Dict[str, Execution] = {}
+        self.executions = (
+            execution_store if execution_store is not None else ExecutionStore.from_env()
+        )
         self.agents_registry: Dict[str, Agent] = {}
         self.workflows_registry: Dict[str, Workflow] = {}
         self.prompt_log_storage = prompt_log_storage or SQLiteStorage()
@@ -62,6 +89,7 @@ class RuntimeEngine:
         self.user_id = user_id
         self.project_id = project_id
         self.telemetry_collector = get_collector()
+        self.activation_registry = activation_registry
     
     def register_agent(self, agent: Agent) -> None:
         """Register an agent in the runtime."""
@@ -82,87 +110,425 @@ class RuntimeEngine:
         input_text: str,
         session_id: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> str:
         """
         Run an agent and return execution ID.
         
+        The run can be stopped with ``cancel_execution`` (or by cancelling
+        ``cancel_token``) and is bounded by ``timeout``.
+        
         Args:
             agent_id: Agent ID to run
             input_text: Input text
             session_id: Optional session ID
             context: Optional context
+            cancel_token: Optional token whose cancellation stops the run
+            timeout: Optional deadline for the whole run, in seconds
             
         Returns:
             Execution ID
+        
+        Raises:
+            ExecutionCancelledError: If the run was cancelled
         """
-        agent = self.agents_registry.get(agent_id)
-        if not agent:
-            raise ValueError(f"Agent not found: {agent_id}")
+        agent, execution = self._start_agent_execution(
+            agent_id, input_text, session_id, context
+        )
         
-        execution_id = str(uuid.uuid4())
+        try:
+            with self._cancellable(execution, cancel_token, timeout):
+                result = agent.run(input_text, session_id=session_id, context=context)
+            self._complete_agent_execution(execution, agent, input_text, session_id, result)
+            return execution.id
         
-        # Track user activation (first agent run)
-        if self.user_id:
-            self._track_activation_if_first_run(agent_id)
-        execution = Execution(
-            id=execution_id,
-            type="agent",
-            entity_id=agent_id,
-            status="running",
-            created_at=datetime.now(),
-            metadata={"input_text": input_text, "session_id": session_id, "context": context},
+        except Exception as e:
+            self._fail_execution(execution, e)
+            raise
+    
+    async def arun_agent(
+        self,
+        agent_id: str,
+        input_text: str,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Run an agent on the async path and return execution ID.
+        
+        The model call is awaited via ``Agent.arun``; the blocking prompt-log
+        and telemetry writes run in a worker thread. Cancelling the run
+        aborts the in-flight model call.
+        
+        Args:
+            agent_id: Agent ID to run
+            input_text: Input text
+            session_id: Optional session ID
+            context: Optional context
+            cancel_token: Optional token whose cancellation stops the run
+            timeout: Optional deadline for the whole run, in seconds
+        
+        Returns:
+            Execution ID
+        
+        Raises:
+            ExecutionCancelledError: If the run was cancelled
+        """
+        execution = await self._arun_agent_execution(
+            agent_id, input_text, session_id, context, cancel_token, timeout
+        )
+        return execution.id
+    
+    async def _arun_agent_execution(
+        self,
+        agent_id: str,
+        input_text: str,
+        session_id: Optional[str],
+        context: Optional[Dict[str, Any]],
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Execution:
+        """Run an agent on the async path and return its completed execution."""
+        agent, execution = await asyncio.to_thread(
+            self._start_agent_execution, agent_id, input_text, session_id, context
         )
-        self.executions[execution_id] = execution
         
         try:
-            result = agent.run(input_text, session_id=session_id, context=context)
-            
-            execution.status = "completed"
-            execution.completed_at = datetime.now()
-            execution.result = result
-            
-            # Log to prompt log (agent already logs internally, but we log execution too)
-            self._log_execution(execution_id, agent_id, input_text, result)
-            
-            # Record telemetry
-            self.telemetry_collector.record_agent_run(
-                agent_id=agent_id,
-                tenant_id=self.tenant_id,
-                user_id=self.user_id,
-                project_id=self.project_id,
-                agent_name=getattr(agent, "name", None),
-                session_id=session_id,
-                status="completed" if execution.status == "completed" else "failed",
-                execution_time=result.execution_time if result else 0.0,
-                tokens_used=result.tokens_used if result else 0,
-                cost_estimate=result.cost_estimate if result else 0.0,
-                input_length=len(input_text),
-                output_length=len(result.output) if result and result.output else 0,
+            with self._cancellable(execution, cancel_token, timeout) as token:
+                result = await await_cancellable(
+                    agent.arun(input_text, session_id=session_id, context=context), token
+                )
+            await asyncio.to_thread(
+                self._complete_agent_execution,
+                execution, agent, input_text, session_id, result,
             )
-            
-            return execution_id
-            
+            return execution
+        
         except Exception as e:
-            execution.status = "error"
-            execution.completed_at = datetime.now()
-            execution.error = str(e)
+            self._fail_execution(execution, e)
             raise
     
+    def run_agent_batch(
+        self,
+        agent_id: str,
+        inputs: Sequence[str],
+        concurrency: int = 8,
+        ordered: bool = False,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        on_result: Optional[Callable[[BatchItem], None]] = None,
+    ) -> BatchResult:
+        """
+        Run an agent over many inputs and wait for all of them.
+        
+        Drives ``arun_agent_batch`` on a fresh event loop, so it must not be
+        called from a running loop.
+        
+        Args:
+            agent_id: Agent ID to run
+            inputs: Input texts
+            concurrency: Maximum runs in flight
+            ordered: Return items in input order instead of completion order
+            session_id: Optional session ID shared by all runs
+            context: Optional context shared by all runs
+            on_result: Called with each item as it completes
+        
+        Returns:
+            Batch items and aggregate statistics
+        """
+        async def collect() -> BatchResult:
+            stats = BatchStats(total=len(inputs))
+            items = []
+            try:
+                async for item in self.arun_agent_batch(
+                    agent_id, inputs, concurrency=concurrency, ordered=ordered,
+                    session_id=session_id, context=context,
+                ):
+                    stats.add(item)
+                    items.append(item)
+                    if on_result:
+                        on_result(item)
+            finally:
+                # Provider clients are bound to this loop, which ends here
+                await get_client_pool().aclose_async_clients()
+            return BatchResult(items=items, stats=stats)
+        
+        return asyncio.run(collect())
+    
+    async def arun_agent_batch(
+        self,
+        agent_id: str,
+        inputs: Sequence[str],
+        concurrency: int = 8,
+        ordered: bool = False,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Run an agent over many inputs, yielding items as they complete.
+        
+        Each input is a normal ``arun_agent`` execution. Failures are captured
+        per item rather than raised. In-flight runs are bounded by an
+        adaptive limit that starts at ``concurrency``, halves when the
+        provider rate limits (429) and recovers as runs succeed.
+        
+        Args:
+            agent_id: Agent ID to run
+            inputs: Input texts
+            concurrency: Maximum runs in flight
+            ordered: Yield items in input order instead of completion order
+            session_id: Optional session ID shared by all runs
+            context: Optional context shared by all runs
+        
+        Yields:
+            Batch items
+        """
+        if agent_id not in self.agents_registry:
+            raise ValueError(f"Agent not found: {agent_id}")
+        
+        inputs = list(inputs)
+        limiter = AdaptiveConcurrencyLimiter(concurrency)
+        completed: asyncio.Queue = asyncio.Queue()
+        tasks = set()
+        
+        async def run_item(index: int, input_text: str) -> None:
+            try:
+                item = await self._run_batch_item(agent_id, index, input_text, session_id, context)
+            except BaseException as e:
+                # e.g. CancelledError: still report the item so the consumer never waits on it
+                item = BatchItem(
+                    index=index,
+                    input_text=input_text,
+                    status="error",
+                    error=str(e) or type(e).__name__,
+                )
+                raise
+            finally:
+                limiter.release(success=item.status == "completed")
+                item.concurrency = int(limiter.limit)
+                # The queue is unbounded, so this never waits
+                completed.put_nowait(item)
+        
+        async def produce() -> None:
+            # Tasks copy the context, so every run reports 429s to the limiter
+            token = retry_observer.set(limiter.observe)
+            try:
+                for index, input_text in enumerate(inputs):
+                    await limiter.acquire()
+                    task = asyncio.create_task(run_item(index, input_text))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            finally:
+                retry_observer.reset(token)
+        
+        async def next_item() -> BatchItem:
+            getter = asyncio.ensure_future(completed.get())
+            try:
+                if not producer.done():
+                    await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done() and (producer.cancelled() or producer.exception()):
+                    # Inputs after the failure were never started
+                    producer.result()
+                return await getter
+            finally:
+                getter.cancel()
+        
+        producer = asyncio.create_task(produce())
+        pending: Dict[int, BatchItem] = {}
+        next_index = 0
+        try:
+            for _ in range(len(inputs)):
+                item = await next_item()
+                if not ordered:
+                    yield item
+                    continue
+                pending[item.index] = item
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
+    
+    async def _run_batch_item(
+        self,
+        agent_id: str,
+        index: int,
+        input_text: str,
+        session_id: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> BatchItem:
+        """Run one batch input, capturing any failure in the item."""
+        start_time = time.time()
+        try:
+            execution = await self._arun_agent_execution(agent_id, input_text, session_id, context)
+        except Exception as e:
+            return BatchItem(
+                index=index,
+                input_text=input_text,
+                status="error",
+                error=str(e),
+                execution_time=time.time() - start_time,
+            )
+        
+        result = execution.result
+        failed = result.status.value == "error"
+        return BatchItem(
+            index=index,
+            input_text=input_text,
+            status="error" if failed else "completed",
+            output=result.output,
+            error=result.error,
+            execution_id=execution.id,
+            execution_time=result.execution_time,
+            tokens_used=result.tokens_used,
+        )
+    
     def run_workflow(
         self,
         workflow_id: str,
         context: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
     ) -> str:
         """
         Run a workflow and return execution ID.
         
+        Cancelling the run stops its current step and skips the rest.
+        
         Args:
             workflow_id: Workflow ID to run
             context: Initial context
-            
+            cancel_token: Optional token whose cancellation stops the run
+            timeout: Optional deadline for the whole run, in seconds
+        
         Returns:
             Execution ID
+        
+        Raises:
+            ExecutionCancelledError: If the run was cancelled
         """
+        workflow, execution = self._start_workflow_execution(workflow_id, context)
+        
+        try:
+            with self._cancellable(execution, cancel_token, timeout):
+                result = workflow.execute(context)
+            self._complete_workflow_execution(execution, workflow, context, result)
+            return execution.id
+        
+        except Exception as e:
+            self._fail_execution(execution, e)
+            raise
+    
+    async def arun_workflow(
+        self,
+        workflow_id: str,
+        context: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Run a workflow on the async path and return execution ID.
+        
+        Args:
+            workflow_id: Workflow ID to run
+            context: Initial context
+            cancel_token: Optional token whose cancellation stops the run
+            timeout: Optional deadline for the whole run, in seconds
+        
+        Returns:
+            Execution ID
+        
+        Raises:
+            ExecutionCancelledError: If the run was cancelled
+        """
+        workflow, execution = self._start_workflow_execution(workflow_id, context)
+        
+        try:
+            with self._cancellable(execution, cancel_token, timeout) as token:
+                result = await await_cancellable(workflow.aexecute(context), token)
+            await asyncio.to_thread(
+                self._complete_workflow_execution, execution, workflow, context, result
+            )
+            return execution.id
+        
+        except Exception as e:
+            self._fail_execution(execution, e)
+            raise
+    
+    def _start_agent_execution(
+        self,
+        agent_id: str,
+        input_text: str,
+        session_id: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Tuple[Agent, Execution]:
+        """Resolve the agent and register a running execution for it."""
+        agent = self.agents_registry.get(agent_id)
+        if not agent:
+            raise ValueError(f"Agent not found: {agent_id}")
+        
+        execution_id = str(uuid.uuid4())
+        
+        # Track user activation (first agent run)
+        if self.user_id:
+            self._track_activation_if_first_run(agent_id)
+        execution = Execution(
+            id=execution_id,
+            type="agent",
+            entity_id=agent_id,
+            status="running",
+            created_at=datetime.now(),
+            metadata={"input_text": input_text, "session_id": session_id, "context": context},
+        )
+        self.executions.put(execution)
+        return agent, execution
+    
+    def _complete_agent_execution(
+        self,
+        execution: Execution,
+        agent: Agent,
+        input_text: str,
+        session_id: Optional[str],
+        result: AgentResult,
+    ) -> None:
+        """Mark an agent execution completed, then queue its prompt log and telemetry."""
+        execution.status = "completed"
+        execution.completed_at = datetime.now()
+        execution.result = result
+        self.executions.put(execution)
+        
+        # Log to prompt log (agent already logs internally, but we log execution too)
+        self._log_execution(execution.id, execution.entity_id, input_text, result)
+        
+        # Record telemetry in the background
+        get_write_behind().submit(
+            "telemetry",
+            self.telemetry_collector.record_agent_run,
+            agent_id=execution.entity_id,
+            tenant_id=self.tenant_id,
+            user_id=self.user_id,
+            project_id=self.project_id,
+            agent_name=getattr(agent, "name", None),
+            session_id=session_id,
+            status="completed" if execution.status == "completed" else "failed",
+            execution_time=result.execution_time if result else 0.0,
+            tokens_used=result.tokens_used if result else 0,
+            cost_estimate=getattr(result, "cost_estimate", 0.0) if result else 0.0,
+            input_length=len(input_text),
+            output_length=len(result.output) if result and result.output else 0,
+        )
+    
+    def _start_workflow_execution(
+        self,
+        workflow_id: str,
+        context: Dict[str, Any],
+    ) -> Tuple[Workflow, Execution]:
+        """Resolve the workflow and register a running execution for it."""
         workflow = self.workflows_registry.get(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow not found: {workflow_id}")
@@ -176,41 +542,115 @@ class RuntimeEngine:
             created_at=datetime.now(),
             metadata={"context": context},
         )
-        self.executions[execution_id] = execution
+        self.executions.put(execution)
+        return workflow, execution
+    
+    def _complete_workflow_execution(
+        self,
+        execution: Execution,
+        workflow: Workflow,
+        context: Dict[str, Any],
+        result: WorkflowResult,
+    ) -> None:
+        """Mark a workflow execution completed, then queue its prompt log and telemetry."""
+        execution.status = "completed"
+        execution.completed_at = datetime.now()
+        execution.result = result
+        self.executions.put(execution)
         
-        try:
-            result = workflow.execute(context)
-            
-            execution.status = "completed"
-            execution.completed_at = datetime.now()
-            execution.result = result
-            
-            # Log workflow execution
-            self._log_workflow_execution(execution_id, workflow_id, context, result)
-            
-            # Record telemetry
-            workflow = self.workflows_registry.get(workflow_id)
-            self.telemetry_collector.record_workflow_run(
-                workflow_id=workflow_id,
-                tenant_id=self.tenant_id,
-                user_id=self.user_id,
-                project_id=self.project_id,
-                workflow_name=getattr(workflow, "name", None) if workflow else None,
-                status="completed" if execution.status == "completed" else "failed",
-                execution_time=result.execution_time if result else 0.0,
-                steps_completed=getattr(result, "steps_completed", 0) if result else 0,
-                steps_total=getattr(result, "steps_total", 0) if result else 0,
-                tokens_used=getattr(result, "tokens_used", 0) if result else 0,
-                cost_estimate=getattr(result, "cost_estimate", 0.0) if result else 0.0,
+        # Log workflow execution
+        self._log_workflow_execution(execution.id, execution.entity_id, context, result)
+        
+        # Record telemetry in the background
+        get_write_behind().submit(
+            "telemetry",
+            self.telemetry_collector.record_workflow_run,
+            workflow_id=execution.entity_id,
+            tenant_id=self.tenant_id,
+            user_id=self.user_id,
+            project_id=self.project_id,
+            workflow_name=getattr(workflow, "name", None) if workflow else None,
+            status="completed" if execution.status == "completed" else "failed",
+            execution_time=result.execution_time if result else 0.0,
+            steps_completed=getattr(result, "steps_completed", 0) if result else 0,
+            steps_total=getattr(result, "steps_total", 0) if result else 0,
+            tokens_used=getattr(result, "tokens_used", 0) if result else 0,
+            cost_estimate=getattr(result, "cost_estimate", 0.0) if result else 0.0,
+        )
+    
+    @contextmanager
+    def _cancellable(
+        self,
+        execution: Execution,
+        cancel_token: Optional[CancellationToken],
+        timeout: Optional[float],
+    ) -> Iterator[CancellationToken]:
+        """
+        Make a cancellable token current for an execution's run.
+        
+        Nested runs inherit the enclosing run's token. A run cancelled while
+        its last blocking call was in flight raises on exit, so its result is
+        discarded rather than recorded as completed. The same applies to a
+        run another worker cancelled through a shared execution store; that
+        cancel is also polled whenever the run checks its token, so the run
+        stops at its next workflow step or completion.
+        """
+        token = CancellationToken(timeout=timeout, parent=cancel_token or current_token())
+        if self.executions.shared:
+            # Checks between workflow steps and completions notice another worker's cancel
+            token.set_probe(
+                lambda: (
+                    "Cancelled by another worker"
+                    if self.executions.cancel_requested(execution.id) else None
+                ),
+                interval=self.executions.cancel_poll_interval,
             )
-            
-            return execution_id
-            
-        except Exception as e:
-            execution.status = "error"
-            execution.completed_at = datetime.now()
-            execution.error = str(e)
-            raise
+        registry = get_cancellation_registry()
+        registry.register(execution.id, token)
+        try:
+            with use_token(token):
+                yield token
+            if not token.cancelled and self.executions.cancel_requested(execution.id):
+                token.cancel("Cancelled by another worker")
+            if token.cancelled:
+                token.check()
+        finally:
+            registry.unregister(execution.id)
+            token.close()
+    
+    def cancel_execution(self, execution_id: str, reason: str = "Cancelled by user") -> bool:
+        """
+        Cancel a running execution.
+        
+        The run's token is cancelled, which aborts its in-flight async calls,
+        stops tool calls and skips remaining workflow steps. The execution is
+        marked cancelled immediately. With a shared execution store, a run
+        owned by another worker is marked cancelled and that worker stops at
+        its next check; a run that finished first keeps its result.
+        
+        Args:
+            execution_id: Execution ID
+            reason: Why the run was cancelled
+        
+        Returns:
+            True if a running or pending execution was cancelled
+        """
+        signalled = get_cancellation_registry().cancel(execution_id, reason)
+        execution = self.executions.get(execution_id)
+        if execution is None or execution.status not in ACTIVE_STATUSES:
+            return signalled
+        
+        execution.status = "cancelled"
+        execution.completed_at = datetime.now()
+        execution.error = reason
+        return self.executions.put_if_active(execution) or signalled
+    
+    def _fail_execution(self, execution: Execution, error: Exception) -> None:
+        """Mark an execution as errored (or cancelled)."""
+        execution.status = "cancelled" if isinstance(error, ExecutionCancelledError) else "error"
+        execution.completed_at = datetime.now()
+        execution.error = str(error)
+        self.executions.put(execution)
     
     def _log_execution(
         self,
@@ -219,7 +659,7 @@ class RuntimeEngine:
         input_text: str,
         result: AgentResult,
     ) -> None:
-        """Log agent execution to prompt log."""
+        """Queue the agent execution for the prompt log."""
         try:
             run = RunModel(
                 run_id=execution_id,
@@ -231,7 +671,7 @@ class RuntimeEngine:
                 tokens_used=result.tokens_used,
                 cost_estimate=0.0,
             )
-            self.prompt_log_storage.save_run(run)
+            get_write_behind().submit("prompt_log", self.prompt_log_storage.save_run, run)
         except Exception:
             pass
     
@@ -242,7 +682,7 @@ class RuntimeEngine:
         context: Dict[str, Any],
         result: WorkflowResult,
     ) -> None:
-        """Log workflow execution to prompt log."""
+        """Queue the workflow execution for the prompt log."""
         try:
             run = RunModel(
                 run_id=execution_id,
@@ -253,8 +693,11 @@ class RuntimeEngine:
                 execution_time=result.execution_time,
                 tokens_used=0,
                 cost_estimate=0.0,
+                metadata=(
+                    {"stages": result.metadata["stages"]} if "stages" in result.metadata else {}
+                ),
             )
-            self.prompt_log_storage.save_run(run)
+            get_write_behind().submit("prompt_log", self.prompt_log_storage.save_run, run)
         except Exception:
             pass
     
@@ -269,49 +712,19 @@ class RuntimeEngine:
             return
         
         try:
-            # Check if user has run any agent before
-            events = self.telemetry_collector.query_events(
+            registry = self.activation_registry or get_activation_registry()
+            registry.track_first_run(
+                self.telemetry_collector,
                 user_id=self.user_id,
-                limit=1000,
-            )
-            
-            # Check if user has activated before
-            has_activated = any(
-                isinstance(e, UserActivatedEvent) for e in events
+                tenant_id=self.tenant_id,
+                project_id=self.project_id,
             )
-            
-            if not has_activated:
-                # This is first agent run - track activation
-                # Get signup date to calculate days to activation
-                signup_events = [
-                    e for e in events
-                    if isinstance(e, UserSignupEvent) or (
-                        hasattr(e, 'event_type') and 
-                        e.event_type.value in ['tenant_created', 'user_signup']
-                    )
-                ]
-                
-                days_to_activation = None
-                if signup_events:
-                    signup_date = signup_events[0].timestamp
-                    days_to_activation = (datetime.utcnow() - signup_date).days
-                
-                activation_event = UserActivatedEvent(
-                    event_id=str(uuid.uuid4()),
-                    activation_criteria="first_agent_run",
-                    days_to_activation=days_to_activation,
-                    tenant_id=self.tenant_id,
-                    user_id=self.user_id,
-                    project_id=self.project_id,
-                )
-                
-                self.telemetry_collector.record_event(activation_event)
         except Exception:
             # Don't fail execution if activation tracking fails
             pass
     
     def get_execution(self, execution_id: str) -> Optional[Execution]:
-        """Get execution by ID."""
+        """Get execution by ID from memory or the store's backend."""
         return self.executions.get(execution_id)
     
     def list_executions(
@@ -319,26 +732,42 @@ class RuntimeEngine:
         entity_id: Optional[str] = None,
         status: Optional[str] = None,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Execution]:
         """
-        List executions with optional filters.
+        List executions with optional filters, newest first.
         
         Args:
             entity_id: Filter by entity ID
             status: Filter by status
             limit: Maximum number of results
+            cursor: Cursor from ``list_executions_page`` to continue after
             
         Returns:
             List of executions
         """
-        results = list(self.executions.values())
-        
-        if entity_id:
-            results = [e for e in results if e.entity_id == entity_id]
+        return self.executions.query(entity_id=entity_id, status=status, limit=limit, cursor=cursor)
+    
+    def list_executions_page(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Execution], Optional[str]]:
+        """
+        List one page of executions and the cursor for the next page.
         
-        if status:
-            results = [e for e in results if e.status == status]
+        Args:
+            entity_id: Filter by entity ID
+            status: Filter by status
+            limit: Maximum number of results
+            cursor: Cursor returned with the previous page
         
-        results.sort(key=lambda e: e.created_at, reverse=True)
+        Returns:
+            Executions and the next cursor (None on the last page)
         
-        return results[:limit]
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self.executions.page(entity_id=entity_id, status=status, limit=limit, cursor=cursor)
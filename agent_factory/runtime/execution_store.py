@@ -0,0 +1,945 @@
+"""
+Bounded storage for runtime executions.
+
+``ExecutionStore`` keeps a window of recent executions in memory, bounded by
+entry count, serialized size and an idle TTL. Finished executions that fall
+out of the window are spilled to a backend (SQLite or Redis) and are loaded
+back transparently on lookup; without a backend they are dropped. Running
+executions are never evicted.
+
+Both tiers keep indexes by entity and status ordered by ``created_at``, and
+listing pages with keyset cursors, so a page costs O(limit) rather than a
+scan of every execution.
+
+With ``shared=True`` the backend is the source of truth for several
+processes (API workers): every status change is written through to it and
+lookups of other processes' executions and listings are served from it, so
+any worker can report status and results for any run. Use SQLite (WAL) on
+a single node and Redis across nodes.
+"""
+
+import base64
+import binascii
+import bisect
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
+
+# Statuses that may still change; executions in them stay in memory
+ACTIVE_STATUSES = {"pending", "running"}
+
+# Keyset position: (created_at ISO timestamp, execution ID)
+Keyset = Tuple[str, str]
+
+
+class ExecutionBackend(ABC):
+    """Second tier for executions evicted from memory."""
+    
+    name: str = "backend"
+    
+    @abstractmethod
+    def save(self, record: Dict[str, Any]) -> None:
+        """Store a serialized execution."""
+        pass
+    
+    def save_if_active(self, record: Dict[str, Any]) -> bool:
+        """
+        Store a serialized execution unless the stored one has finished.
+        
+        Backends override this with an atomic check; this fallback is not.
+        
+        Args:
+            record: Serialized execution
+        
+        Returns:
+            True if the record was written
+        """
+        previous = self.load(record["id"])
+        if previous is not None and previous["status"] not in ACTIVE_STATUSES:
+            return False
+        self.save(record)
+        return True
+    
+    @abstractmethod
+    def load(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Load a serialized execution, or None if missing."""
+        pass
+    
+    @abstractmethod
+    def delete(self, execution_id: str) -> None:
+        """Remove an execution."""
+        pass
+    
+    @abstractmethod
+    def query(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Keyset] = None,
+    ) -> List[Dict[str, Any]]:
+        """Serialized executions matching the filters, newest first, strictly before a keyset."""
+        pass
+    
+    @abstractmethod
+    def ids(self) -> List[str]:
+        """IDs of all stored executions."""
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all executions."""
+        pass
+
+
+class SQLiteExecutionBackend(ExecutionBackend):
+    """
+    SQLite backend, bounded by row count (oldest finished executions are dropped).
+    
+    The cap is enforced every ``trim_every`` saves rather than on each one,
+    so the table may briefly hold up to ``trim_every`` extra rows.
+    """
+    
+    name = "sqlite"
+    
+    def __init__(
+        self,
+        db_path: str = "./executions.db",
+        max_entries: int = 100000,
+        trim_every: int = 1000,
+    ):
+        """
+        Initialize SQLite backend.
+        
+        Args:
+            db_path: Path to SQLite database file
+            max_entries: Maximum number of stored executions
+            trim_every: Saves between trims of rows beyond ``max_entries``
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.trim_every = max(trim_every, 1)
+        self._saves = 0
+        self._saves_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # WAL (set by the manager) lets readers in other processes run alongside a writer
+        self._db = SQLiteConnectionManager(self.db_path)
+        self._init_db()
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS executions (
+                    id TEXT PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    entity_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    data TEXT NOT NULL
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_executions_created ON executions(created_at, id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_executions_entity "
+                "ON executions(entity_id, created_at, id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_executions_status "
+                "ON executions(status, created_at, id)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_executions_entity_status "
+                "ON executions(entity_id, status, created_at, id)"
+            )
+    
+    def save(self, record: Dict[str, Any]) -> None:
+        """Store a serialized execution, periodically dropping the oldest beyond the row cap."""
+        with self._db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO executions (id, type, entity_id, status, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (record["id"], record["type"], record["entity_id"], record["status"],
+                 record["created_at"], json.dumps(record)),
+            )
+        self._saved()
+    
+    def save_if_active(self, record: Dict[str, Any]) -> bool:
+        """Store a serialized execution unless the stored one has finished (atomic)."""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE executions "
+                "SET type = ?, entity_id = ?, status = ?, created_at = ?, data = ? "
+                "WHERE id = ? AND status IN ('pending', 'running')",
+                (record["type"], record["entity_id"], record["status"], record["created_at"],
+                 json.dumps(record), record["id"]),
+            )
+            if cursor.rowcount == 0:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO executions "
+                    "(id, type, entity_id, status, created_at, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    (record["id"], record["type"], record["entity_id"], record["status"],
+                     record["created_at"], json.dumps(record)),
+                )
+            written = cursor.rowcount > 0
+        if written:
+            self._saved()
+        return written
+    
+    def trim(self) -> int:
+        """
+        Drop the oldest finished executions beyond ``max_entries``.
+        
+        Pending and running executions are kept whatever their age, since
+        other workers read them from here.
+        
+        Returns:
+            Number of executions dropped
+        """
+        with self._db.transaction() as conn:
+            # One indexed seek to the cap's boundary, then a range delete below it
+            row = conn.execute(
+                "SELECT created_at FROM executions ORDER BY created_at DESC LIMIT 1 OFFSET ?",
+                (self.max_entries,),
+            ).fetchone()
+            if row is None:
+                return 0
+            cursor = conn.execute(
+                "DELETE FROM executions "
+                "WHERE created_at <= ? AND status NOT IN ('pending', 'running')",
+                (row[0],),
+            )
+            return cursor.rowcount
+    
+    def load(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Load a serialized execution, or None if missing."""
+        with self._db.connection() as conn:
+            row = conn.execute(
+                "SELECT data FROM executions WHERE id = ?", (execution_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def delete(self, execution_id: str) -> None:
+        """Remove an execution."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM executions WHERE id = ?", (execution_id,))
+    
+    def query(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Keyset] = None,
+    ) -> List[Dict[str, Any]]:
+        """Serialized executions matching the filters, newest first, strictly before a keyset."""
+        sql = "SELECT data FROM executions WHERE 1=1"
+        params: List[Any] = []
+        if entity_id:
+            sql += " AND entity_id = ?"
+            params.append(entity_id)
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
+        if before:
+            sql += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+            params.extend([before[0], before[0], before[1]])
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit)
+        
+        with self._db.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def ids(self) -> List[str]:
+        """IDs of all stored executions."""
+        with self._db.connection() as conn:
+            rows = conn.execute("SELECT id FROM executions").fetchall()
+        return [row[0] for row in rows]
+    
+    def clear(self) -> None:
+        """Remove all executions."""
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM executions")
+    
+    def _saved(self) -> None:
+        """Count a save and trim once every ``trim_every`` saves."""
+        with self._saves_lock:
+            self._saves += 1
+            due = self._saves % self.trim_every == 0
+        if due:
+            self.trim()
+
+
+class RedisExecutionBackend(ExecutionBackend):
+    """
+    Redis backend shared across processes.
+    
+    Each execution is a JSON string expiring after ``retention`` seconds.
+    Sorted sets scored by creation time index all executions and each
+    entity, status and entity/status pair; members whose execution has
+    expired are pruned lazily.
+    """
+    
+    name = "redis"
+    
+    def __init__(
+        self,
+        cache: Optional[Any] = None,
+        key_prefix: str = "executions",
+        retention: int = 7 * 24 * 3600,
+    ):
+        """
+        Initialize Redis backend.
+        
+        Args:
+            cache: RedisCache instance (defaults to the global cache)
+            key_prefix: Prefix for Redis keys
+            retention: Seconds to keep each execution
+        """
+        if cache is None:
+            from agent_factory.cache.redis_cache import get_cache
+            cache = get_cache()
+        self.cache = cache
+        self.key_prefix = key_prefix
+        self.retention = retention
+    
+    def _index(self, entity_id: Optional[str] = None, status: Optional[str] = None) -> str:
+        return f"{self.key_prefix}:index:{entity_id or ''}:{status or ''}"
+    
+    def _key(self, execution_id: str) -> str:
+        return f"{self.key_prefix}:{execution_id}"
+    
+    def save(self, record: Dict[str, Any]) -> None:
+        """Store a serialized execution."""
+        client = self.cache.client
+        if not client:
+            return
+        pipe = client.pipeline()
+        self._write(pipe, record, self.load(record["id"]))
+        pipe.execute()
+    
+    def save_if_active(self, record: Dict[str, Any]) -> bool:
+        """Store a serialized execution unless the stored one has finished (atomic)."""
+        from redis.exceptions import WatchError
+        
+        client = self.cache.client
+        if not client:
+            return False
+        key = self._key(record["id"])
+        with client.pipeline() as pipe:
+            while True:
+                try:
+                    # Aborts the write if another process changes the record first
+                    pipe.watch(key)
+                    value = pipe.get(key)
+                    previous = json.loads(value) if value else None
+                    if previous is not None and previous["status"] not in ACTIVE_STATUSES:
+                        pipe.unwatch()
+                        return False
+                    pipe.multi()
+                    self._write(pipe, record, previous)
+                    pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+    
+    def _write(self, pipe: Any, record: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+        """Queue a record's value and index updates on a pipeline."""
+        score = datetime.fromisoformat(record["created_at"]).timestamp()
+        if previous is not None and previous["status"] != record["status"]:
+            # Written-through status changes leave the old status indexes
+            for entity_id, status in index_keys(previous["entity_id"], previous["status"]):
+                if status is not None:
+                    pipe.zrem(self._index(entity_id, status), record["id"])
+        pipe.setex(self._key(record["id"]), self.retention, json.dumps(record))
+        for entity_id, status in index_keys(record["entity_id"], record["status"]):
+            index = self._index(entity_id, status)
+            pipe.zadd(index, {record["id"]: score})
+            # Index members older than the retention have expired
+            pipe.zremrangebyscore(index, "-inf", time.time() - self.retention)
+    
+    def load(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Load a serialized execution, or None if missing."""
+        client = self.cache.client
+        if not client:
+            return None
+        value = client.get(self._key(execution_id))
+        return json.loads(value) if value else None
+    
+    def delete(self, execution_id: str) -> None:
+        """Remove an execution."""
+        client = self.cache.client
+        if not client:
+            return
+        record = self.load(execution_id)
+        pipe = client.pipeline()
+        pipe.delete(self._key(execution_id))
+        if record is not None:
+            for entity_id, status in index_keys(record["entity_id"], record["status"]):
+                pipe.zrem(self._index(entity_id, status), execution_id)
+        pipe.execute()
+    
+    def query(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Keyset] = None,
+    ) -> List[Dict[str, Any]]:
+        """Serialized executions matching the filters, newest first, strictly before a keyset."""
+        client = self.cache.client
+        if not client:
+            return []
+        
+        index = self._index(entity_id, status)
+        high = datetime.fromisoformat(before[0]).timestamp() if before else "+inf"
+        results: List[Dict[str, Any]] = []
+        offset, batch = 0, limit + 16
+        while len(results) < limit:
+            members = client.zrevrangebyscore(
+                index, high, "-inf", start=offset, num=batch, withscores=True
+            )
+            if not members:
+                break
+            offset += len(members)
+            # Ties on the cursor's timestamp are ordered by ID, like the other tiers
+            execution_ids = [
+                execution_id for execution_id, score in members
+                if not (before and score == high and execution_id >= before[1])
+            ]
+            if not execution_ids:
+                continue
+            values = client.mget([self._key(execution_id) for execution_id in execution_ids])
+            for execution_id, value in zip(execution_ids, values):
+                if value is None:
+                    client.zrem(index, execution_id)
+                    continue
+                record = json.loads(value)
+                if status and record["status"] != status:
+                    # Status changed while this page was read
+                    continue
+                results.append(record)
+        return results[:limit]
+    
+    def ids(self) -> List[str]:
+        """IDs of all stored executions."""
+        client = self.cache.client
+        if not client:
+            return []
+        return list(client.zrange(self._index(), 0, -1))
+    
+    def clear(self) -> None:
+        """Remove all executions."""
+        self.cache.clear(f"{self.key_prefix}:*")
+
+
+def execution_to_record(execution: Any) -> Dict[str, Any]:
+    """
+    Serialize an execution to a JSON-compatible dict.
+    
+    Args:
+        execution: Execution to serialize
+    
+    Returns:
+        Record with ISO timestamps and a tagged result
+    """
+    result = execution.result
+    if result is not None and hasattr(result, "__dataclass_fields__"):
+        result = {"kind": type(result).__name__, "data": asdict(result)}
+    record = {
+        "id": execution.id,
+        "type": execution.type,
+        "entity_id": execution.entity_id,
+        "status": execution.status,
+        # Fixed-width timestamps sort correctly as text in the backends
+        "created_at": execution.created_at.isoformat(timespec="microseconds"),
+        "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
+        "result": result,
+        "error": execution.error,
+        "metadata": execution.metadata,
+    }
+    # Round-trip so non-JSON values (e.g. in context) become strings
+    return json.loads(json.dumps(record, default=str))
+
+
+def record_to_execution(record: Dict[str, Any]) -> Any:
+    """
+    Rebuild an execution from ``execution_to_record`` output.
+    
+    Args:
+        record: Serialized execution
+    
+    Returns:
+        Execution
+    """
+    from agent_factory.runtime.engine import Execution
+    
+    result = record.get("result")
+    if isinstance(result, dict) and "kind" in result:
+        result = _result_from_dict(result["kind"], result["data"])
+    return Execution(
+        id=record["id"],
+        type=record["type"],
+        entity_id=record["entity_id"],
+        status=record["status"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+        completed_at=(
+            datetime.fromisoformat(record["completed_at"]) if record.get("completed_at") else None
+        ),
+        result=result,
+        error=record.get("error"),
+        metadata=record.get("metadata"),
+    )
+
+
+def _result_from_dict(kind: str, data: Dict[str, Any]) -> Any:
+    """Rebuild an AgentResult or WorkflowResult."""
+    if kind == "AgentResult":
+        from agent_factory.agents.agent import AgentResult, AgentStatus
+        data = dict(data, status=AgentStatus(data["status"]))
+        result_class = AgentResult
+    elif kind == "WorkflowResult":
+        from agent_factory.workflows.model import WorkflowResult
+        result_class = WorkflowResult
+    else:
+        return data
+    known = {f.name for f in fields(result_class)}
+    return result_class(**{k: v for k, v in data.items() if k in known})
+
+
+def index_keys(entity_id: str, status: str) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Index keys an execution belongs to: all, by entity, by status, by both."""
+    return [(None, None), (entity_id, None), (None, status), (entity_id, status)]
+
+
+def encode_cursor(execution: Any) -> str:
+    """
+    Opaque keyset cursor positioned just after an execution.
+    
+    Args:
+        execution: Last execution of a page
+    
+    Returns:
+        URL-safe cursor string
+    """
+    position = [execution.created_at.isoformat(timespec="microseconds"), execution.id]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Keyset:
+    """
+    Decode a cursor from ``encode_cursor``.
+    
+    Args:
+        cursor: Cursor string
+    
+    Returns:
+        Keyset position
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, execution_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        datetime.fromisoformat(created_at)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    return created_at, execution_id
+
+
+class ExecutionStore(MutableMapping):
+    """
+    Dict-like execution store with a bounded in-memory window.
+    
+    Lookups check memory first, then the backend. The engine calls ``put``
+    on every status change so size accounting, indexes and spilling stay
+    current. A shared store also writes every ``put`` through to the
+    backend and serves listings and running executions from it.
+    
+    Example:
+        >>> backend = SQLiteExecutionBackend("./executions.db")
+        >>> store = ExecutionStore(backend, max_bytes=64 * 1024 * 1024)
+        >>> store.put(execution)
+        >>> store.get(execution.id)
+    """
+    
+    def __init__(
+        self,
+        backend: Optional[ExecutionBackend] = None,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float = 3600.0,
+        shared: bool = False,
+        cancel_poll_interval: float = 1.0,
+    ):
+        """
+        Initialize execution store.
+        
+        Args:
+            backend: Where evicted executions go (None drops them)
+            max_entries: Maximum executions held in memory
+            max_bytes: Maximum serialized size of executions held in memory
+            ttl: Seconds a finished execution stays in memory after last access
+            shared: Share executions with other processes through the backend
+            cancel_poll_interval: Seconds between a running execution's checks
+                for a cancel from another process (shared stores only)
+        
+        Raises:
+            ValueError: If ``shared`` is set without a backend
+        """
+        if shared and backend is None:
+            raise ValueError("A shared execution store needs a sqlite or redis backend")
+        self.backend = backend
+        self.shared = shared
+        self.cancel_poll_interval = cancel_poll_interval
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._touched: Dict[str, float] = {}
+        self._bytes = 0
+        # Sorted (created_at, id) lists per index key, see index_keys()
+        self._indexes: Dict[Tuple[Optional[str], Optional[str]], List[Tuple[datetime, str]]] = {}
+        self._indexed: Dict[str, Tuple[Tuple[datetime, str], str, str]] = {}
+        self._spilled = 0
+        self._dropped = 0
+        self._lock = threading.RLock()
+    
+    @classmethod
+    def from_env(cls) -> "ExecutionStore":
+        """
+        Build a store from ``EXECUTION_STORE_BACKEND`` (memory, sqlite or redis),
+        ``EXECUTION_STORE_MAX_ENTRIES``, ``EXECUTION_STORE_MAX_BYTES``,
+        ``EXECUTION_STORE_TTL``, ``EXECUTION_STORE_PATH``,
+        ``EXECUTION_STORE_RETENTION``, ``EXECUTION_STORE_SHARED`` and
+        ``EXECUTION_STORE_CANCEL_POLL_INTERVAL``.
+        """
+        backend: Optional[ExecutionBackend] = None
+        name = os.getenv("EXECUTION_STORE_BACKEND", "memory").strip().lower()
+        if name == "sqlite":
+            backend = SQLiteExecutionBackend(os.getenv("EXECUTION_STORE_PATH", "./executions.db"))
+        elif name == "redis":
+            retention = int(os.getenv("EXECUTION_STORE_RETENTION", str(7 * 24 * 3600)))
+            backend = RedisExecutionBackend(retention=retention)
+        elif name != "memory":
+            raise ValueError(f"Unknown execution store backend: {name}")
+        return cls(
+            backend=backend,
+            max_entries=int(os.getenv("EXECUTION_STORE_MAX_ENTRIES", "10000")),
+            max_bytes=int(os.getenv("EXECUTION_STORE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl=float(os.getenv("EXECUTION_STORE_TTL", "3600")),
+            shared=os.getenv("EXECUTION_STORE_SHARED", "false").strip().lower() == "true",
+            cancel_poll_interval=float(os.getenv("EXECUTION_STORE_CANCEL_POLL_INTERVAL", "1.0")),
+        )
+    
+    def put(self, execution: Any) -> None:
+        """
+        Insert or refresh an execution, then evict what no longer fits.
+        
+        Args:
+            execution: Execution to store
+        """
+        record = execution_to_record(execution)
+        size = len(json.dumps(record))
+        if self.shared:
+            # Other processes read the backend, so it must see every change
+            self.backend.save(record)
+        self._hold(execution, size)
+    
+    def put_if_active(self, execution: Any) -> bool:
+        """
+        Store an execution unless its shared record has already finished.
+        
+        Used for cancels, so a cancel racing another worker's completion
+        cannot overwrite the finished result.
+        
+        Args:
+            execution: Execution to store
+        
+        Returns:
+            True if the execution was stored (always, unless shared)
+        """
+        if not self.shared:
+            self.put(execution)
+            return True
+        record = execution_to_record(execution)
+        if not self.backend.save_if_active(record):
+            return False
+        self._hold(execution, len(json.dumps(record)))
+        return True
+    
+    def query(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Executions matching the filters across both tiers, newest first.
+        
+        Args:
+            entity_id: Filter by entity ID
+            status: Filter by status
+            limit: Maximum number of results
+            cursor: Cursor from a previous ``page`` call
+        
+        Returns:
+            List of executions
+        """
+        return self.page(entity_id=entity_id, status=status, limit=limit, cursor=cursor)[0]
+    
+    def page(
+        self,
+        entity_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        One page of executions, newest first, and the cursor for the next.
+        
+        Each tier reads at most ``limit`` entries from the index matching the
+        filters, starting just after the cursor.
+        
+        Args:
+            entity_id: Filter by entity ID
+            status: Filter by status
+            limit: Maximum number of results
+            cursor: Cursor from a previous page
+        
+        Returns:
+            Executions and the next cursor (None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        before = decode_cursor(cursor) if cursor else None
+        if limit <= 0:
+            return [], None
+        
+        if self.shared:
+            # The backend holds every process's executions, including this one's
+            results = [
+                record_to_execution(record)
+                for record in self.backend.query(
+                    entity_id=entity_id, status=status, limit=limit, before=before
+                )
+            ]
+            next_cursor = encode_cursor(results[-1]) if len(results) == limit else None
+            return results, next_cursor
+        
+        with self._lock:
+            index = self._indexes.get((entity_id or None, status or None), [])
+            end = len(index)
+            if before:
+                end = bisect.bisect_left(index, (datetime.fromisoformat(before[0]), before[1]))
+            results = [
+                self._entries[execution_id]
+                for _, execution_id in reversed(index[max(0, end - limit):end])
+            ]
+        
+        if self.backend:
+            in_memory = {e.id for e in results}
+            results.extend(
+                record_to_execution(record)
+                for record in self.backend.query(
+                    entity_id=entity_id, status=status, limit=limit, before=before
+                )
+                if record["id"] not in in_memory
+            )
+            results.sort(key=lambda e: (e.created_at, e.id), reverse=True)
+            results = results[:limit]
+        
+        next_cursor = encode_cursor(results[-1]) if len(results) == limit else None
+        return results, next_cursor
+    
+    def stats(self) -> Dict[str, Any]:
+        """Memory-tier usage and eviction counts."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "spilled": self._spilled,
+                "dropped": self._dropped,
+                "backend": self.backend.name if self.backend else None,
+                "shared": self.shared,
+            }
+    
+    def cancel_requested(self, execution_id: str) -> bool:
+        """
+        Whether another process marked a shared execution cancelled.
+        
+        Args:
+            execution_id: Execution ID
+        
+        Returns:
+            True if the shared record is cancelled (always False unless shared)
+        """
+        if not self.shared:
+            return False
+        record = self.backend.load(execution_id)
+        return record is not None and record["status"] == "cancelled"
+    
+    def clear(self) -> None:
+        """Remove all executions from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._touched.clear()
+            self._indexes.clear()
+            self._indexed.clear()
+            self._bytes = 0
+        if self.backend:
+            self.backend.clear()
+    
+    def __getitem__(self, execution_id: str) -> Any:
+        with self._lock:
+            execution = self._entries.get(execution_id)
+            # A shared running execution may have been cancelled by another process
+            if execution is not None and not (self.shared and execution.status in ACTIVE_STATUSES):
+                self._entries.move_to_end(execution_id)
+                self._touched[execution_id] = time.monotonic()
+                return execution
+        # Spilled executions are served from the backend without re-entering
+        # memory, so reads of old history cannot push out recent work
+        record = self.backend.load(execution_id) if self.backend else None
+        if record is None:
+            raise KeyError(execution_id)
+        return record_to_execution(record)
+    
+    def __setitem__(self, execution_id: str, execution: Any) -> None:
+        if execution_id != execution.id:
+            raise ValueError(f"Execution stored under wrong key: {execution_id} != {execution.id}")
+        self.put(execution)
+    
+    def __delitem__(self, execution_id: str) -> None:
+        with self._lock:
+            found = self._remove(execution_id) is not None
+        if self.backend and self.backend.load(execution_id) is not None:
+            self.backend.delete(execution_id)
+            found = True
+        if not found:
+            raise KeyError(execution_id)
+    
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            in_memory = list(self._entries)
+        yield from in_memory
+        if self.backend:
+            seen = set(in_memory)
+            yield from (
+                execution_id for execution_id in self.backend.ids() if execution_id not in seen
+            )
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, execution_id: object) -> bool:
+        with self._lock:
+            if execution_id in self._entries:
+                return True
+        return bool(
+            self.backend and isinstance(execution_id, str) and self.backend.load(execution_id)
+        )
+    
+    def _hold(self, execution: Any, size: int) -> None:
+        """Keep an execution in the memory tier, then evict what no longer fits."""
+        with self._lock:
+            if (
+                execution.id not in self._entries
+                and execution.status not in ACTIVE_STATUSES
+                and self.backend
+                and not self.shared
+            ):
+                # Re-saving an execution that may already have been spilled
+                self.backend.delete(execution.id)
+            self._bytes += size - self._sizes.get(execution.id, 0)
+            self._entries[execution.id] = execution
+            self._entries.move_to_end(execution.id)
+            self._sizes[execution.id] = size
+            self._touched[execution.id] = time.monotonic()
+            self._index(execution)
+            self._evict()
+    
+    def _evict(self) -> None:
+        """Spill finished executions that are idle past the TTL or over the caps."""
+        now = time.monotonic()
+        for execution_id in list(self._entries):
+            over = len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            expired = now - self._touched[execution_id] > self.ttl
+            if not over and not expired:
+                # Entries are in access order, so the rest are newer
+                break
+            if self._entries[execution_id].status in ACTIVE_STATUSES:
+                continue
+            self._spill(self._remove(execution_id))
+    
+    def _remove(self, execution_id: str) -> Optional[Any]:
+        """Drop an execution from memory and release its size."""
+        execution = self._entries.pop(execution_id, None)
+        if execution is not None:
+            self._bytes -= self._sizes.pop(execution_id, 0)
+            self._touched.pop(execution_id, None)
+            self._unindex(execution_id)
+        return execution
+    
+    def _index(self, execution: Any) -> None:
+        """Add an execution to the memory indexes, moving it if its status changed."""
+        key = (execution.created_at, execution.id)
+        if self._indexed.get(execution.id) == (key, execution.entity_id, execution.status):
+            return
+        self._unindex(execution.id)
+        for index_key in index_keys(execution.entity_id, execution.status):
+            bisect.insort(self._indexes.setdefault(index_key, []), key)
+        self._indexed[execution.id] = (key, execution.entity_id, execution.status)
+    
+    def _unindex(self, execution_id: str) -> None:
+        """Remove an execution from the memory indexes."""
+        indexed = self._indexed.pop(execution_id, None)
+        if indexed is None:
+            return
+        key, entity_id, status = indexed
+        for index_key in index_keys(entity_id, status):
+            index = self._indexes[index_key]
+            position = bisect.bisect_left(index, key)
+            if position < len(index) and index[position] == key:
+                del index[position]
+            if not index:
+                del self._indexes[index_key]
+    
+    def _spill(self, execution: Any) -> None:
+        """Hand an evicted execution to the backend."""
+        if self.shared:
+            # Already written through
+            self._spilled += 1
+            return
+        if self.backend is None:
+            self._dropped += 1
+            return
+        try:
+            self.backend.save(execution_to_record(execution))
+            self._spilled += 1
+        except Exception as e:
+            self._dropped += 1
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Failed to spill execution {execution.id}: {e}",
+                extra={"backend": self.backend.name},
+            )
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, Optional, Any, List
 from abc import ABC, abstractmethod
 
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
+
 
 class JobStatus(str, Enum):
     """Job status."""
@@ -25,7 +27,7 @@ class JobType(str, Enum):
     WORKFLOW_RUN = "workflow_run"
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """
     Job for async execution.
@@ -213,65 +215,59 @@ class SQLiteJobQueue(JobQueue):
         Args:
             db_path: Path to SQLite database
         """
-        import sqlite3
         import json
         from pathlib import Path
         
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = SQLiteConnectionManager(self.db_path)
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize database tables."""
-        import sqlite3
         import json
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS jobs (
-                job_id TEXT PRIMARY KEY,
-                job_type TEXT NOT NULL,
-                resource_id TEXT NOT NULL,
-                input_data TEXT NOT NULL,
-                tenant_id TEXT,
-                user_id TEXT,
-                project_id TEXT,
-                status TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                started_at TEXT,
-                completed_at TEXT,
-                result TEXT,
-                error TEXT,
-                retry_count INTEGER DEFAULT 0,
-                max_retries INTEGER DEFAULT 3,
-                metadata TEXT
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_status 
-            ON jobs(status)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_jobs_tenant 
-            ON jobs(tenant_id)
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    resource_id TEXT NOT NULL,
+                    input_data TEXT NOT NULL,
+                    tenant_id TEXT,
+                    user_id TEXT,
+                    project_id TEXT,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    result TEXT,
+                    error TEXT,
+                    retry_count INTEGER DEFAULT 0,
+                    max_retries INTEGER DEFAULT 3,
+                    metadata TEXT
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_status 
+                ON jobs(status)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_jobs_tenant 
+                ON jobs(tenant_id)
+            """)
     
     def enqueue(self, job: Job) -> None:
         """Enqueue a job."""
-        import sqlite3
         import json
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute("""
                 INSERT OR REPLACE INTO jobs 
                 (job_id, job_type, resource_id, input_data, tenant_id, user_id, project_id,
@@ -296,20 +292,14 @@ class SQLiteJobQueue(JobQueue):
                 job.max_retries,
                 json.dumps(job.metadata),
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
     
     def dequeue(self, job_type: Optional[JobType] = None) -> Optional[Job]:
         """Dequeue a job."""
-        import sqlite3
         import json
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.connection() as conn:
+            cursor = conn.cursor()
+            
             query = """
                 SELECT * FROM jobs 
                 WHERE status = ? 
@@ -335,18 +325,14 @@ class SQLiteJobQueue(JobQueue):
             self.update_job(job)
             
             return job
-        finally:
-            conn.close()
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
-        import sqlite3
         import json
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.connection() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
             row = cursor.fetchone()
             
@@ -354,8 +340,6 @@ class SQLiteJobQueue(JobQueue):
                 return None
             
             return self._row_to_job(row)
-        finally:
-            conn.close()
     
     def update_job(self, job: Job) -> None:
         """Update job."""
@@ -368,13 +352,11 @@ class SQLiteJobQueue(JobQueue):
         limit: int = 100,
     ) -> List[Job]:
         """List jobs."""
-        import sqlite3
         import json
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.connection() as conn:
+            cursor = conn.cursor()
+            
             query = "SELECT * FROM jobs WHERE 1=1"
             params = []
             
@@ -393,8 +375,6 @@ class SQLiteJobQueue(JobQueue):
             rows = cursor.fetchall()
             
             return [self._row_to_job(row) for row in rows]
-        finally:
-            conn.close()
     
     def _row_to_job(self, row: tuple) -> Job:
         """Convert database row to Job."""
@@ -3,15 +3,20 @@ Memory and session management for agents.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+import asyncio
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
-import sqlite3
 import json
 import os
+import threading
+import time
 from datetime import datetime
 
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
 
-@dataclass
+
+@dataclass(slots=True)
 class Interaction:
     """Represents a single interaction in a session."""
     session_id: str
@@ -36,8 +41,18 @@ class MemoryStore(ABC):
         pass
     
     @abstractmethod
-    def get_context(self, session_id: str, limit: int = 10) -> Dict[str, Any]:
-        """Get conversation context for a session."""
+    def get_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get conversation context for a session.
+        
+        ``query`` (usually the new user input) is used by stores with
+        semantic recall (``SemanticMemoryStore``); others ignore it.
+        """
         pass
     
     @abstractmethod
@@ -49,6 +64,75 @@ class MemoryStore(ABC):
     def clear_session(self, session_id: str) -> None:
         """Clear all interactions for a session."""
         pass
+    
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """Get the running summary of a session's compacted turns (None without one)."""
+        return None
+    
+    def list_sessions(self) -> List[str]:
+        """
+        List the ids of sessions with stored interactions.
+        
+        Used to build per-user semantic indexes across a user's sessions;
+        this visits every session, so callers should cache what they build.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing sessions")
+    
+    def get_oldest_history(self, session_id: str, limit: int) -> List[Interaction]:
+        """
+        Get a session's oldest ``limit`` interactions, in chronological order.
+        
+        Compaction folds these first, so they are exactly the interactions a
+        following ``compact_session(..., limit)`` removes.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support compaction")
+    
+    def compact_session(self, session_id: str, summary: str, folded_turns: int) -> None:
+        """
+        Replace a session's oldest interactions with a running summary.
+        
+        Args:
+            session_id: Session identifier
+            summary: Summary covering the previous summary and the folded turns
+            folded_turns: Number of oldest interactions the summary now covers
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support compaction")
+    
+    def get_version(self, session_id: str) -> Optional[int]:
+        """
+        Get a session's version stamp.
+        
+        The stamp increases by one with every save, compaction and clear, so
+        caches can tell whether another process changed the session. Stores
+        without stamps return None.
+        """
+        return None
+    
+    async def asave_interaction(
+        self,
+        session_id: str,
+        input_text: str,
+        output_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Async variant of ``save_interaction``.
+        
+        Runs the blocking implementation in a worker thread by default;
+        stores with a native async driver can override it.
+        """
+        await asyncio.to_thread(
+            self.save_interaction, session_id, input_text, output_text, metadata
+        )
+    
+    async def aget_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_context`` (worker thread by default)."""
+        return await asyncio.to_thread(self.get_context, session_id, limit, query)
 
 
 class SQLiteMemoryStore(MemoryStore):
@@ -62,27 +146,41 @@ class SQLiteMemoryStore(MemoryStore):
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._db = SQLiteConnectionManager(db_path)
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize database tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS interactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id TEXT NOT NULL,
-                input_text TEXT NOT NULL,
-                output_text TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                metadata TEXT,
-                INDEX idx_session_id (session_id)
-            )
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS interactions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT NOT NULL,
+                    input_text TEXT NOT NULL,
+                    output_text TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    metadata TEXT
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_id ON interactions(session_id)")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_summaries (
+                    session_id TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    folded_turns INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_versions (
+                    session_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL
+                )
+            """)
     
     def save_interaction(
         self,
@@ -92,26 +190,28 @@ class SQLiteMemoryStore(MemoryStore):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Save an interaction to memory."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO interactions (session_id, input_text, output_text, timestamp, metadata)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            session_id,
-            input_text,
-            output_text,
-            datetime.now().isoformat(),
-            json.dumps(metadata or {}),
-        ))
-        
-        conn.commit()
-        conn.close()
-    
-    def get_context(self, session_id: str, limit: int = 10) -> Dict[str, Any]:
-        """Get conversation context for a session."""
+        with self._db.transaction() as conn:
+            conn.execute("""
+                INSERT INTO interactions (session_id, input_text, output_text, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                session_id,
+                input_text,
+                output_text,
+                datetime.now().isoformat(),
+                json.dumps(metadata or {}),
+            ))
+            self._bump_version(conn, session_id)
+    
+    def get_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get conversation context for a session, led by its summary if compacted."""
         history = self.get_history(session_id, limit)
+        summary = self.get_summary(session_id)
         
         context = {
             "recent_interactions": [
@@ -122,24 +222,21 @@ class SQLiteMemoryStore(MemoryStore):
                 for interaction in history
             ],
         }
+        if summary:
+            context["summary"] = summary
         
         return context
     
     def get_history(self, session_id: str, limit: int = 50) -> List[Interaction]:
         """Get interaction history for a session."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT input_text, output_text, timestamp, metadata
-            FROM interactions
-            WHERE session_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-        """, (session_id, limit))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self._db.connection() as conn:
+            rows = conn.execute("""
+                SELECT input_text, output_text, timestamp, metadata
+                FROM interactions
+                WHERE session_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+            """, (session_id, limit)).fetchall()
         
         interactions = []
         for row in rows:
@@ -153,29 +250,127 @@ class SQLiteMemoryStore(MemoryStore):
         
         return list(reversed(interactions))  # Return in chronological order
     
+    def list_sessions(self) -> List[str]:
+        """List the ids of sessions with stored interactions."""
+        with self._db.connection() as conn:
+            rows = conn.execute("SELECT DISTINCT session_id FROM interactions").fetchall()
+        return [row[0] for row in rows]
+    
+    def get_oldest_history(self, session_id: str, limit: int) -> List[Interaction]:
+        """Get a session's oldest interactions, in the order compaction removes them."""
+        with self._db.connection() as conn:
+            rows = conn.execute("""
+                SELECT input_text, output_text, timestamp, metadata
+                FROM interactions
+                WHERE session_id = ?
+                ORDER BY timestamp, id
+                LIMIT ?
+            """, (session_id, limit)).fetchall()
+        
+        return [
+            Interaction(
+                session_id=session_id,
+                input_text=row[0],
+                output_text=row[1],
+                timestamp=datetime.fromisoformat(row[2]),
+                metadata=json.loads(row[3]) if row[3] else {},
+            )
+            for row in rows
+        ]
+    
     def clear_session(self, session_id: str) -> None:
         """Clear all interactions for a session."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM interactions WHERE session_id = ?", (session_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM interactions WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM session_summaries WHERE session_id = ?", (session_id,))
+            self._bump_version(conn, session_id)
+    
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """Get the running summary of a session's compacted turns."""
+        with self._db.connection() as conn:
+            row = conn.execute(
+                "SELECT summary FROM session_summaries WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def compact_session(self, session_id: str, summary: str, folded_turns: int) -> None:
+        """Replace a session's oldest interactions with a running summary."""
+        with self._db.transaction() as conn:
+            conn.execute("""
+                DELETE FROM interactions WHERE id IN (
+                    SELECT id FROM interactions
+                    WHERE session_id = ?
+                    ORDER BY timestamp, id
+                    LIMIT ?
+                )
+            """, (session_id, folded_turns))
+            conn.execute("""
+                INSERT INTO session_summaries (session_id, summary, folded_turns, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    summary = excluded.summary,
+                    folded_turns = session_summaries.folded_turns + excluded.folded_turns,
+                    updated_at = excluded.updated_at
+            """, (session_id, summary, folded_turns, datetime.now().isoformat()))
+            self._bump_version(conn, session_id)
+    
+    def get_version(self, session_id: str) -> Optional[int]:
+        """Get a session's version stamp."""
+        with self._db.connection() as conn:
+            row = conn.execute(
+                "SELECT version FROM session_versions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else 0
+    
+    @staticmethod
+    def _bump_version(conn: Any, session_id: str) -> None:
+        """Increment a session's version stamp within the caller's transaction."""
+        conn.execute("""
+            INSERT INTO session_versions (session_id, version) VALUES (?, 1)
+            ON CONFLICT(session_id) DO UPDATE SET version = version + 1
+        """, (session_id,))
 
 
 class RedisMemoryStore(MemoryStore):
-    """Redis implementation of memory store."""
+    """
+    Redis implementation of memory store.
+    
+    Each session is one capped list of JSON-serialized interactions in
+    chronological order (``<prefix>history:<session_id>``):
+    
+    - ``save_interaction`` appends, trims the list to ``max_interactions``
+      on the server and refreshes the expiry in one MULTI/EXEC round trip;
+    - ``get_history`` reads the newest ``limit`` entries with one ``LRANGE``
+      (``get_context`` fetches the session summary in the same round trip);
+    - ``clear_session`` deletes the session's keys in one call.
+    
+    Sessions written in the previous layout (a sorted set of interaction
+    ids plus one hash per interaction) are migrated the first time they are
+    read, or all at once with ``migrate_legacy_sessions``.
+    """
     
-    def __init__(self, redis_client=None, key_prefix: str = "agent_memory:"):
+    def __init__(
+        self,
+        redis_client=None,
+        key_prefix: str = "agent_memory:",
+        max_interactions: Optional[int] = None,
+        ttl: int = 30 * 24 * 60 * 60,
+    ):
         """
         Initialize Redis memory store.
         
         Args:
             redis_client: Redis client instance (optional, will create if not provided)
             key_prefix: Prefix for Redis keys
+            max_interactions: Interactions kept per session
+                (default: REDIS_MEMORY_MAX_INTERACTIONS or 1000)
+            ttl: Seconds a session is kept after its last write
         """
         self.key_prefix = key_prefix
+        self.max_interactions = max_interactions or int(
+            os.getenv("REDIS_MEMORY_MAX_INTERACTIONS", "1000")
+        )
+        self.ttl = ttl
         
         if redis_client:
             self.redis = redis_client
@@ -189,12 +384,24 @@ class RedisMemoryStore(MemoryStore):
             except Exception as e:
                 raise ValueError(f"Failed to connect to Redis: {e}")
     
+    def _get_history_key(self, session_id: str) -> str:
+        """Get Redis key for a session's interaction list."""
+        return f"{self.key_prefix}history:{session_id}"
+    
+    def _get_summary_key(self, session_id: str) -> str:
+        """Get Redis key for a session's running summary."""
+        return f"{self.key_prefix}summary:{session_id}"
+    
+    def _get_version_key(self, session_id: str) -> str:
+        """Get Redis key for a session's version stamp."""
+        return f"{self.key_prefix}version:{session_id}"
+    
     def _get_session_key(self, session_id: str) -> str:
-        """Get Redis key for session."""
+        """Get Redis key for a session's interaction ids (legacy layout)."""
         return f"{self.key_prefix}session:{session_id}"
     
     def _get_interaction_key(self, session_id: str, interaction_id: str) -> str:
-        """Get Redis key for interaction."""
+        """Get Redis key for an interaction hash (legacy layout)."""
         return f"{self.key_prefix}interaction:{session_id}:{interaction_id}"
     
     def save_interaction(
@@ -205,35 +412,29 @@ class RedisMemoryStore(MemoryStore):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Save an interaction to memory."""
-        import uuid
-        import time
-        
-        interaction_id = str(uuid.uuid4())
-        interaction_key = self._get_interaction_key(session_id, interaction_id)
-        session_key = self._get_session_key(session_id)
-        
-        interaction_data = {
-            "id": interaction_id,
+        history_key = self._get_history_key(session_id)
+        entry = json.dumps({
             "input_text": input_text,
             "output_text": output_text,
             "timestamp": datetime.now().isoformat(),
-            "metadata": json.dumps(metadata or {}),
-        }
-        
-        # Store interaction
-        self.redis.hset(interaction_key, mapping=interaction_data)
+            "metadata": metadata or {},
+        })
         
-        # Add to session list (sorted set by timestamp)
-        timestamp = time.time()
-        self.redis.zadd(session_key, {interaction_id: timestamp})
-        
-        # Set expiration (30 days default)
-        self.redis.expire(session_key, 30 * 24 * 60 * 60)
-        self.redis.expire(interaction_key, 30 * 24 * 60 * 60)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.rpush(history_key, entry)
+        pipe.ltrim(history_key, -self.max_interactions, -1)
+        pipe.expire(history_key, self.ttl)
+        self._bump_version(pipe, session_id)
+        pipe.execute()
     
-    def get_context(self, session_id: str, limit: int = 10) -> Dict[str, Any]:
-        """Get conversation context for a session."""
-        history = self.get_history(session_id, limit)
+    def get_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get conversation context for a session, led by its summary if compacted."""
+        history, summary = self._read(session_id, limit, with_summary=True)
         
         context = {
             "recent_interactions": [
@@ -244,46 +445,438 @@ class RedisMemoryStore(MemoryStore):
                 for interaction in history
             ],
         }
+        if summary:
+            context["summary"] = summary
         
         return context
     
     def get_history(self, session_id: str, limit: int = 50) -> List[Interaction]:
         """Get interaction history for a session."""
+        return self._read(session_id, limit)[0]
+    
+    def list_sessions(self) -> List[str]:
+        """List the ids of sessions with stored interactions (legacy layout included)."""
+        sessions = set()
+        for prefix in (self._get_history_key(""), self._get_session_key("")):
+            for key in self.redis.scan_iter(match=f"{prefix}*", count=500):
+                sessions.add(key[len(prefix):].removesuffix(":migrating"))
+        return sorted(sessions)
+    
+    def get_oldest_history(self, session_id: str, limit: int) -> List[Interaction]:
+        """Get a session's oldest interactions, in the order compaction removes them."""
+        if limit <= 0:
+            return []
+        history_key = self._get_history_key(session_id)
+        if self.redis.exists(self._get_session_key(session_id)):
+            self.migrate_session(session_id)
+        entries = self.redis.lrange(history_key, 0, limit - 1)
+        return [self._to_interaction(session_id, entry) for entry in entries]
+    
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """Get the running summary of a session's compacted turns."""
+        data = self.redis.get(self._get_summary_key(session_id))
+        return json.loads(data)["summary"] if data else None
+    
+    def compact_session(self, session_id: str, summary: str, folded_turns: int) -> None:
+        """Replace a session's oldest interactions with a running summary."""
+        summary_key = self._get_summary_key(session_id)
+        history_key = self._get_history_key(session_id)
+        previous = self.redis.get(summary_key)
+        previous_turns = json.loads(previous)["folded_turns"] if previous else 0
+        
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.ltrim(history_key, folded_turns, -1)
+        pipe.set(summary_key, json.dumps({
+            "summary": summary,
+            "folded_turns": previous_turns + folded_turns,
+            "updated_at": datetime.now().isoformat(),
+        }), ex=self.ttl)
+        self._bump_version(pipe, session_id)
+        pipe.execute()
+    
+    def get_version(self, session_id: str) -> Optional[int]:
+        """Get a session's version stamp."""
+        return int(self.redis.get(self._get_version_key(session_id)) or 0)
+    
+    def _bump_version(self, pipe: Any, session_id: str) -> None:
+        """Queue an increment of a session's version stamp on a pipeline."""
+        version_key = self._get_version_key(session_id)
+        pipe.incr(version_key)
+        pipe.expire(version_key, self.ttl)
+    
+    def clear_session(self, session_id: str) -> None:
+        """Clear all interactions for a session."""
         session_key = self._get_session_key(session_id)
         
-        # Get interaction IDs from sorted set (most recent first)
-        interaction_ids = self.redis.zrevrange(session_key, 0, limit - 1)
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrange(session_key, 0, -1)
+        pipe.delete(
+            self._get_history_key(session_id), self._get_summary_key(session_id), session_key
+        )
+        self._bump_version(pipe, session_id)
+        interaction_ids = pipe.execute()[0]
         
-        interactions = []
-        for interaction_id in interaction_ids:
-            interaction_key = self._get_interaction_key(session_id, interaction_id)
-            data = self.redis.hgetall(interaction_key)
-            
-            if data:
-                interactions.append(Interaction(
+        # Sessions never migrated still have one hash per interaction
+        if interaction_ids:
+            self.redis.delete(*(
+                self._get_interaction_key(session_id, interaction_id)
+                for interaction_id in interaction_ids
+            ))
+    
+    def migrate_session(self, session_id: str) -> bool:
+        """
+        Move a session from the legacy layout into its interaction list.
+        
+        The legacy sorted set is claimed with an atomic ``RENAME``, so
+        concurrent callers migrate a session once. Interactions already in
+        the list (written after the upgrade) stay after the migrated ones.
+        
+        Args:
+            session_id: Session identifier
+        
+        Returns:
+            True if legacy interactions were migrated
+        """
+        session_key = self._get_session_key(session_id)
+        claimed_key = f"{session_key}:migrating"
+        try:
+            self.redis.rename(session_key, claimed_key)
+        except Exception as e:
+            # "no such key": nothing to migrate, or another caller claimed it
+            if "no such key" not in str(e).lower():
+                raise
+            return False
+        return self._migrate_claimed(session_id, claimed_key)
+    
+    def migrate_legacy_sessions(self) -> int:
+        """
+        Migrate every session still in the legacy layout.
+        
+        Also finishes migrations interrupted after their claim.
+        
+        Returns:
+            Number of sessions migrated
+        """
+        prefix = self._get_session_key("")
+        migrated = 0
+        for key in self.redis.scan_iter(match=f"{prefix}*", count=500):
+            if key.endswith(":migrating"):
+                session_id = key[len(prefix):-len(":migrating")]
+                migrated += self._migrate_claimed(session_id, key)
+            else:
+                migrated += self.migrate_session(key[len(prefix):])
+        return migrated
+    
+    def _migrate_claimed(self, session_id: str, claimed_key: str) -> bool:
+        """Copy a claimed legacy session into its list and delete the old keys."""
+        interaction_ids = self.redis.zrange(claimed_key, 0, -1)
+        interaction_keys = [
+            self._get_interaction_key(session_id, interaction_id)
+            for interaction_id in interaction_ids
+        ]
+        
+        pipe = self.redis.pipeline(transaction=False)
+        for interaction_key in interaction_keys:
+            pipe.hgetall(interaction_key)
+        rows = pipe.execute() if interaction_keys else []
+        
+        entries = [
+            json.dumps({
+                "input_text": data.get("input_text", ""),
+                "output_text": data.get("output_text", ""),
+                "timestamp": data.get("timestamp", datetime.now().isoformat()),
+                "metadata": json.loads(data.get("metadata", "{}")),
+            })
+            for data in rows
+            if data  # Expired interactions
+        ]
+        
+        history_key = self._get_history_key(session_id)
+        pipe = self.redis.pipeline(transaction=True)
+        if entries:
+            # LPUSH reverses its arguments; older interactions go first
+            pipe.lpush(history_key, *reversed(entries))
+            pipe.ltrim(history_key, -self.max_interactions, -1)
+            pipe.expire(history_key, self.ttl)
+        pipe.delete(claimed_key, *interaction_keys)
+        pipe.execute()
+        return bool(entries)
+    
+    def _read(
+        self,
+        session_id: str,
+        limit: int,
+        with_summary: bool = False,
+    ) -> Tuple[List[Interaction], Optional[str]]:
+        """Newest ``limit`` interactions (and the summary) in one round trip."""
+        history_key = self._get_history_key(session_id)
+        
+        # The summary and legacy-layout check ride along with the read
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.lrange(history_key, -max(limit, 1), -1)
+        pipe.exists(self._get_session_key(session_id))
+        if with_summary:
+            pipe.get(self._get_summary_key(session_id))
+        results = pipe.execute()
+        entries = results[0] if limit > 0 else []
+        summary = json.loads(results[2])["summary"] if with_summary and results[2] else None
+        
+        if results[1] and self.migrate_session(session_id) and limit > 0:
+            entries = self.redis.lrange(history_key, -limit, -1)
+        
+        return [self._to_interaction(session_id, entry) for entry in entries], summary
+    
+    @staticmethod
+    def _to_interaction(session_id: str, entry: str) -> Interaction:
+        """Deserialize a list entry."""
+        data = json.loads(entry)
+        return Interaction(
+            session_id=session_id,
+            input_text=data["input_text"],
+            output_text=data["output_text"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            metadata=data.get("metadata") or {},
+        )
+
+
+@dataclass
+class _CachedSession:
+    """A cached session's recent interactions and version bookkeeping."""
+    interactions: Deque[Interaction]
+    summary: Optional[str]
+    version: Optional[int]  # Store stamp at the last check
+    complete: bool  # True if the store held no more interactions than the cache keeps
+    checked_at: float
+    local_writes: int = 0  # Saves made through this cache since the last check
+
+
+class CachedMemoryStore(MemoryStore):
+    """
+    Write-through, in-process LRU cache in front of any memory store.
+    
+    Keeps the recent interactions and summary of up to ``max_sessions`` hot
+    sessions. ``save_interaction`` writes to the store and appends to the
+    cached session, so the next context read of an active chat costs no I/O.
+    
+    Other processes may write to the same session. At most every
+    ``validate_interval`` seconds a read compares the store's version stamp
+    with the stamp last seen plus the saves made through this cache; any
+    difference reloads the session. Stores without version stamps are
+    reloaded on every check instead.
+    
+    The cache does no semantic recall and ignores ``query``; put a
+    ``SemanticMemoryStore`` in front of it, not behind it.
+    
+    Example:
+        >>> memory = CachedMemoryStore(RedisMemoryStore())
+        >>> memory.save_interaction("session-1", "Hello", "Hi!")
+        >>> memory.get_context("session-1")  # served from the cache
+    """
+    
+    def __init__(
+        self,
+        store: MemoryStore,
+        max_sessions: int = 1000,
+        max_turns: int = 50,
+        validate_interval: float = 1.0,
+    ):
+        """
+        Initialize cached memory store.
+        
+        Args:
+            store: Memory store to cache
+            max_sessions: Sessions kept in the cache
+            max_turns: Recent interactions kept per session
+            validate_interval: Seconds a cached session is served before its
+                version stamp is checked again
+        """
+        self.store = store
+        self.max_sessions = max_sessions
+        self.max_turns = max_turns
+        self.validate_interval = validate_interval
+        self._sessions: "OrderedDict[str, _CachedSession]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+    
+    def save_interaction(
+        self,
+        session_id: str,
+        input_text: str,
+        output_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Save an interaction to the store and the cached session."""
+        with self._lock:
+            cached = self._sessions.get(session_id)
+        self.store.save_interaction(session_id, input_text, output_text, metadata)
+        with self._lock:
+            # A reload during the write already has the interaction (or a stale stamp)
+            if cached is not None and self._sessions.get(session_id) is cached:
+                if len(cached.interactions) == self.max_turns:
+                    cached.complete = False  # The oldest cached turn drops out
+                cached.interactions.append(Interaction(
                     session_id=session_id,
-                    input_text=data.get("input_text", ""),
-                    output_text=data.get("output_text", ""),
-                    timestamp=datetime.fromisoformat(data.get("timestamp", datetime.now().isoformat())),
-                    metadata=json.loads(data.get("metadata", "{}")),
+                    input_text=input_text,
+                    output_text=output_text,
+                    timestamp=datetime.now(),
+                    metadata=metadata or {},
                 ))
-        
-        return list(reversed(interactions))  # Return in chronological order
+                cached.local_writes += 1
+    
+    def get_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Get conversation context for a session, led by its summary if compacted."""
+        cached = self._cached(session_id, limit)
+        if cached is None:
+            return self.store.get_context(session_id, limit)
+        return self._context(cached, limit)
+    
+    def get_history(self, session_id: str, limit: int = 50) -> List[Interaction]:
+        """Get interaction history for a session."""
+        cached = self._cached(session_id, limit)
+        if cached is None:
+            return self.store.get_history(session_id, limit)
+        with self._lock:
+            return list(cached.interactions)[-limit:] if limit > 0 else []
+    
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """Get the running summary of a session's compacted turns."""
+        cached = self._cached(session_id, 0)
+        return cached.summary if cached is not None else self.store.get_summary(session_id)
+    
+    def get_version(self, session_id: str) -> Optional[int]:
+        """Get the store's version stamp for a session."""
+        return self.store.get_version(session_id)
+    
+    def get_oldest_history(self, session_id: str, limit: int) -> List[Interaction]:
+        """Get a session's oldest interactions from the store."""
+        return self.store.get_oldest_history(session_id, limit)
+    
+    def list_sessions(self) -> List[str]:
+        """List the ids of sessions in the store."""
+        return self.store.list_sessions()
+    
+    def compact_session(self, session_id: str, summary: str, folded_turns: int) -> None:
+        """Compact the session in the store and drop its cached copy."""
+        self.store.compact_session(session_id, summary, folded_turns)
+        self.invalidate(session_id)
     
     def clear_session(self, session_id: str) -> None:
-        """Clear all interactions for a session."""
-        session_key = self._get_session_key(session_id)
-        
-        # Get all interaction IDs
-        interaction_ids = self.redis.zrange(session_key, 0, -1)
+        """Clear the session in the store and drop its cached copy."""
+        self.store.clear_session(session_id)
+        self.invalidate(session_id)
+    
+    async def aget_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async ``get_context``; fresh cached sessions are served without a thread hop."""
+        with self._lock:
+            cached = self._sessions.get(session_id)
+            if cached is not None and self._fresh(cached) and self._covers(cached, limit):
+                self._sessions.move_to_end(session_id)
+                self.hits += 1
+                return self._context(cached, limit)
+        return await asyncio.to_thread(self.get_context, session_id, limit)
+    
+    def invalidate(self, session_id: str) -> None:
+        """Drop a session from the cache."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit counts."""
+        with self._lock:
+            return {"sessions": len(self._sessions), "hits": self.hits, "misses": self.misses}
+    
+    def _cached(self, session_id: str, limit: int) -> Optional[_CachedSession]:
+        """The session's validated cache entry, loading it if needed (None if too small)."""
+        with self._lock:
+            cached = self._sessions.get(session_id)
+            if cached is not None and not self._covers(cached, limit):
+                cached = None
+            current = cached is not None and self._fresh(cached)
+        if cached is None and limit > self.max_turns:
+            # More turns than the cache keeps: only the store can answer
+            return None
         
-        # Delete all interactions
-        for interaction_id in interaction_ids:
-            interaction_key = self._get_interaction_key(session_id, interaction_id)
-            self.redis.delete(interaction_key)
+        # Store I/O happens outside the lock so other sessions stay served
+        if cached is not None and not current:
+            current = self._validate(session_id, cached)
+        if current:
+            with self._lock:
+                if session_id in self._sessions:
+                    self._sessions.move_to_end(session_id)
+                self.hits += 1
+            return cached
         
-        # Delete session key
-        self.redis.delete(session_key)
+        loaded = self._load(session_id)
+        with self._lock:
+            self.misses += 1
+            self._sessions[session_id] = loaded
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return loaded
+    
+    def _covers(self, cached: _CachedSession, limit: int) -> bool:
+        """Whether the cached interactions can answer a read of ``limit`` turns."""
+        return cached.complete or len(cached.interactions) >= limit
+    
+    def _fresh(self, cached: _CachedSession) -> bool:
+        """Whether the entry was checked within ``validate_interval``."""
+        return time.monotonic() - cached.checked_at < self.validate_interval
+    
+    def _validate(self, session_id: str, cached: _CachedSession) -> bool:
+        """Check the entry against the store's version stamp; True if still current."""
+        version = self.store.get_version(session_id)
+        with self._lock:
+            if version is None or cached.version is None:
+                return False
+            if version != cached.version + cached.local_writes:
+                return False
+            cached.version = version
+            cached.local_writes = 0
+            cached.checked_at = time.monotonic()
+            return True
+    
+    def _load(self, session_id: str) -> _CachedSession:
+        """Read a session from the store."""
+        # Stamp first: a write landing during the load shows up as a mismatch later
+        version = self.store.get_version(session_id)
+        history = self.store.get_history(session_id, self.max_turns)
+        return _CachedSession(
+            interactions=deque(history, maxlen=self.max_turns),
+            summary=self.store.get_summary(session_id),
+            version=version,
+            complete=len(history) < self.max_turns,
+            checked_at=time.monotonic(),
+        )
+    
+    def _context(self, cached: _CachedSession, limit: int) -> Dict[str, Any]:
+        """Build a store-shaped context from a cached session."""
+        with self._lock:
+            history = list(cached.interactions)[-limit:] if limit > 0 else []
+            summary = cached.summary
+        context: Dict[str, Any] = {
+            "recent_interactions": [
+                {
+                    "input": interaction.input_text,
+                    "output": interaction.output_text,
+                }
+                for interaction in history
+            ],
+        }
+        if summary:
+            context["summary"] = summary
+        return context
 
 
 def get_memory_store(store_type: str = "sqlite", **kwargs) -> MemoryStore:
@@ -292,17 +885,49 @@ def get_memory_store(store_type: str = "sqlite", **kwargs) -> MemoryStore:
     
     Args:
         store_type: Type of store ("sqlite" or "redis")
-        **kwargs: Additional arguments for store initialization
+        **kwargs: Additional arguments for store initialization; ``cache``
+            wraps the store in a ``CachedMemoryStore`` (default:
+            ``MEMORY_CACHE_ENABLED``), and ``semantic`` adds semantic recall
+            with a ``SemanticMemoryStore`` and optional ``embedder``
+            (default: ``MEMORY_SEMANTIC_ENABLED``)
         
     Returns:
         MemoryStore instance
     """
     if store_type == "sqlite":
         db_path = kwargs.get("db_path", "./agent_factory/memory.db")
-        return SQLiteMemoryStore(db_path=db_path)
+        store: MemoryStore = SQLiteMemoryStore(db_path=db_path)
     elif store_type == "redis":
         redis_client = kwargs.get("redis_client")
         key_prefix = kwargs.get("key_prefix", "agent_memory:")
-        return RedisMemoryStore(redis_client=redis_client, key_prefix=key_prefix)
+        store = RedisMemoryStore(
+            redis_client=redis_client,
+            key_prefix=key_prefix,
+            max_interactions=kwargs.get("max_interactions"),
+        )
     else:
         raise ValueError(f"Unknown memory store type: {store_type}")
+    
+    cache = kwargs.get("cache")
+    if cache is None:
+        cache = os.getenv("MEMORY_CACHE_ENABLED", "false").strip().lower() == "true"
+    if cache:
+        store = CachedMemoryStore(
+            store,
+            max_sessions=int(os.getenv("MEMORY_CACHE_MAX_SESSIONS", "1000")),
+            max_turns=int(os.getenv("MEMORY_CACHE_MAX_TURNS", "50")),
+            validate_interval=float(os.getenv("MEMORY_CACHE_VALIDATE_INTERVAL", "1.0")),
+        )
+    
+    semantic = kwargs.get("semantic")
+    if semantic is None:
+        semantic = os.getenv("MEMORY_SEMANTIC_ENABLED", "false").strip().lower() == "true"
+    if semantic:
+        from agent_factory.runtime.semantic_memory import SemanticMemoryStore
+        store = SemanticMemoryStore(
+            store,
+            embedder=kwargs.get("embedder"),
+            top_k=int(os.getenv("MEMORY_SEMANTIC_TOP_K", "3")),
+            min_score=float(os.getenv("MEMORY_SEMANTIC_MIN_SCORE", "0.2")),
+        )
+    return store
@@ -0,0 +1,196 @@
+"""
+Concurrent pre-LLM preparation for agent runs.
+
+Memory load and knowledge retrieval are independent I/O, so ``Agent.run``
+starts them together on a small thread pool (``Agent.arun`` as asyncio
+tasks) while the input guardrails run on the caller. Pre-LLM latency is
+then roughly the slowest stage rather than the sum. If the guardrails
+block the input, the loads are cancelled and their results discarded.
+
+With fewer than two independent stages nothing is gained from a thread
+hop, so loads run inline and lazily, as they did before.
+"""
+
+import asyncio
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from agent_factory.runtime.profiling import stage
+
+
+class PreparationLoads:
+    """
+    Loads for one run, started together and collected by key.
+    
+    Example:
+        >>> loads = PreparationLoads(concurrent=True)
+        >>> loads.start("memory", "memory_load", memory.get_context, session_id, 10)
+        >>> loads.start("pack-1", "knowledge_retrieval", retrieve, pack, query)
+        >>> if blocked:
+        ...     loads.cancel()
+        >>> history = loads.result("memory")
+    """
+    
+    def __init__(self, concurrent: bool = True):
+        """
+        Initialize loads.
+        
+        Args:
+            concurrent: Run loads on the preparation pool (else inline when collected)
+        """
+        self.concurrent = concurrent
+        self._loads: Dict[str, Any] = {}
+    
+    def start(self, key: str, stage_name: str, func: Callable[..., Any], *args: Any) -> None:
+        """
+        Start a load.
+        
+        Args:
+            key: Key to collect the result by
+            stage_name: Timing stage for the load
+            func: Blocking function to call
+            *args: Arguments for ``func``
+        """
+        if self.concurrent:
+            # Workers see the run's context (timer, cancellation token)
+            run = contextvars.copy_context().run
+            self._loads[key] = get_preparation_executor().submit(
+                run, _timed, stage_name, func, *args
+            )
+        else:
+            self._loads[key] = (stage_name, func, args)
+    
+    def keys(self) -> Any:
+        """Keys of started loads, in start order."""
+        return self._loads.keys()
+    
+    def result(self, key: str, default: Any = None) -> Any:
+        """
+        Wait for a load and return its result.
+        
+        Args:
+            key: Load key
+            default: Returned if no load was started under ``key``
+        
+        Raises:
+            Exception: Whatever the load raised
+        """
+        load = self._loads.get(key)
+        if load is None:
+            return default
+        if isinstance(load, Future):
+            return load.result()
+        return _timed(load[0], load[1], *load[2])
+    
+    def cancel(self) -> None:
+        """Cancel loads that have not started; results of running ones are dropped."""
+        for load in self._loads.values():
+            if isinstance(load, Future):
+                load.cancel()
+        self._loads.clear()
+
+
+class AsyncPreparationLoads:
+    """Async counterpart of ``PreparationLoads`` backed by asyncio tasks."""
+    
+    def __init__(self, concurrent: bool = True):
+        """
+        Initialize loads.
+        
+        Args:
+            concurrent: Start loads as tasks right away (else await them when collected)
+        """
+        self.concurrent = concurrent
+        self._loads: Dict[str, Any] = {}
+    
+    def start(
+        self,
+        key: str,
+        stage_name: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+    ) -> None:
+        """
+        Start a load.
+        
+        Args:
+            key: Key to collect the result by
+            stage_name: Timing stage for the load
+            func: Coroutine function to call
+            *args: Arguments for ``func``
+        """
+        if self.concurrent:
+            self._loads[key] = asyncio.ensure_future(_atimed(stage_name, func, *args))
+        else:
+            self._loads[key] = (stage_name, func, args)
+    
+    def keys(self) -> Any:
+        """Keys of started loads, in start order."""
+        return self._loads.keys()
+    
+    async def result(self, key: str, default: Any = None) -> Any:
+        """
+        Await a load and return its result.
+        
+        Args:
+            key: Load key
+            default: Returned if no load was started under ``key``
+        
+        Raises:
+            Exception: Whatever the load raised
+        """
+        load = self._loads.get(key)
+        if load is None:
+            return default
+        if isinstance(load, asyncio.Future):
+            return await load
+        return await _atimed(load[0], load[1], *load[2])
+    
+    def cancel(self) -> None:
+        """Cancel the load tasks and drop their results."""
+        for load in self._loads.values():
+            if isinstance(load, asyncio.Future):
+                if load.done() and not load.cancelled():
+                    load.exception()  # Mark retrieved so a failed load is not logged
+                load.cancel()
+        self._loads.clear()
+
+
+def _timed(stage_name: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Call a blocking load inside its timing stage."""
+    with stage(stage_name):
+        return func(*args)
+
+
+async def _atimed(stage_name: str, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+    """Await a load inside its timing stage."""
+    with stage(stage_name):
+        return await func(*args)
+
+
+# Global preparation pool
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_preparation_executor() -> ThreadPoolExecutor:
+    """
+    Get the thread pool used for concurrent preparation.
+    
+    Sized by ``AGENT_PREPARE_MAX_WORKERS``.
+    
+    Returns:
+        Thread pool executor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("AGENT_PREPARE_MAX_WORKERS", "8")),
+                    thread_name_prefix="agent-prepare",
+                )
+    return _executor
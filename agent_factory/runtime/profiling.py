@@ -0,0 +1,150 @@
+"""
+Per-stage timing spans for agent runs and workflows.
+
+``Agent.run`` and ``Workflow.execute`` time each stage of a run (guardrails,
+memory, knowledge retrieval, the LLM call, prompt-log write, workflow
+steps) with a ``StageTimer``. Spans are added to the result metadata and
+the prompt log, observed in the ``agent_stage_duration_seconds`` Prometheus
+histogram and handed to ``agent_factory.monitoring.tracing``.
+
+Timing is enabled with ``STAGE_TIMING_ENABLED=true``. When disabled, each
+stage costs one context-variable lookup and a shared no-op context manager.
+"""
+
+import contextvars
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+_NULL_SPAN = nullcontext()
+
+
+def stage_timing_enabled() -> bool:
+    """Whether stage timing is enabled (``STAGE_TIMING_ENABLED``)."""
+    return os.getenv("STAGE_TIMING_ENABLED", "false").strip().lower() in ("1", "true", "yes")
+
+
+class _Span:
+    """Context manager timing one stage into its timer."""
+    
+    __slots__ = ("timer", "name", "detail", "start")
+    
+    def __init__(self, timer: "StageTimer", name: str, detail: Optional[str] = None):
+        self.timer = timer
+        self.name = name
+        self.detail = detail
+        self.start = 0.0
+    
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        span = {
+            "stage": self.name,
+            "start": self.start - self.timer.origin,
+            "duration": time.perf_counter() - self.start,
+            "error": exc_type is not None,
+        }
+        if self.detail is not None:
+            span["detail"] = self.detail
+        self.timer.spans.append(span)
+        return False
+
+
+class StageTimer:
+    """
+    Collects stage spans for one run.
+    
+    Spans are dicts with ``stage``, ``start`` (seconds since the run
+    started), ``duration``, ``error`` and an optional ``detail`` (such as
+    the workflow step ID), in completion order.
+    
+    Example:
+        >>> timer = StageTimer("agent", agent.id)
+        >>> with use_timer(timer):
+        ...     with stage("llm_call"):
+        ...         call_model()
+        >>> timer.export()
+    """
+    
+    def __init__(self, kind: str, entity_id: Optional[str] = None, enabled: Optional[bool] = None):
+        """
+        Initialize timer.
+        
+        Args:
+            kind: What is being timed ("agent" or "workflow")
+            entity_id: Agent or workflow ID
+            enabled: Record spans (default: ``STAGE_TIMING_ENABLED``)
+        """
+        self.kind = kind
+        self.entity_id = entity_id
+        self.enabled = stage_timing_enabled() if enabled is None else enabled
+        self.spans: List[Dict[str, Any]] = []
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+    
+    def stage(self, name: str, detail: Optional[str] = None) -> Any:
+        """
+        Context manager timing a stage.
+        
+        Args:
+            name: Stage name (used as the metric label)
+            detail: Optional span detail kept out of metric labels
+        """
+        return _Span(self, name, detail) if self.enabled else _NULL_SPAN
+    
+    def totals(self) -> Dict[str, float]:
+        """Total seconds per stage."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span["stage"]] = totals.get(span["stage"], 0.0) + span["duration"]
+        return totals
+    
+    def export(self) -> None:
+        """Observe spans in the stage histogram and pass them to tracing."""
+        if not self.enabled or not self.spans:
+            return
+        
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            from agent_factory.monitoring.tracing import record_stage_spans
+        except ImportError:
+            return
+        
+        for span in self.spans:
+            MetricsCollector.record_stage_duration(self.kind, span["stage"], span["duration"])
+        record_stage_spans(self.kind, self.entity_id, self.started_at, self.spans)
+
+
+_current_timer: contextvars.ContextVar[Optional[StageTimer]] = contextvars.ContextVar(
+    "stage_timer", default=None
+)
+
+
+@contextmanager
+def use_timer(timer: StageTimer) -> Iterator[StageTimer]:
+    """
+    Make a timer current, so ``stage`` calls in nested code record into it.
+    
+    Args:
+        timer: Timer for the run
+    """
+    reset = _current_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _current_timer.reset(reset)
+
+
+def stage(name: str, detail: Optional[str] = None) -> Any:
+    """
+    Time a stage of the current run (no-op outside a timed run).
+    
+    Args:
+        name: Stage name
+        detail: Optional span detail kept out of metric labels
+    """
+    timer = _current_timer.get()
+    return timer.stage(name, detail) if timer is not None else _NULL_SPAN
@@ -0,0 +1,441 @@
+"""
+Retries and deadlines for provider and tool calls.
+
+Classifies errors as transient (rate limits, 5xx, timeouts, dropped
+connections) or permanent, retries transient ones with capped exponential
+backoff and full jitter, honours ``Retry-After`` hints, stops at an overall
+deadline and draws every retry from a process-wide retry budget so retries
+cannot multiply load on a provider that is already failing.
+
+The current run's cancellation token (see ``agent_factory.runtime.cancellation``)
+is honoured too: its deadline caps the call's, and cancelling it stops
+retries and aborts in-flight async attempts.
+"""
+
+import asyncio
+import contextvars
+import email.utils
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from agent_factory.core.exceptions import (
+    CircuitBreakerOpenError,
+    DeadlineExceededError,
+    ExecutionCancelledError,
+)
+from agent_factory.runtime.cancellation import CancellationToken, await_cancellable, current_token
+
+# HTTP statuses worth retrying (529 is Anthropic's "overloaded")
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# Called with the classification of every transient error seen by
+# call_with_retry/acall_with_retry in the current context, e.g. so a batch
+# can lower its concurrency when providers answer 429
+RetryObserver = Callable[["ErrorClassification"], None]
+retry_observer: contextvars.ContextVar[Optional[RetryObserver]] = contextvars.ContextVar(
+    "retry_observer", default=None
+)
+
+
+@dataclass
+class RetryPolicy:
+    """How often and how patiently to retry a call."""
+    max_retries: int = 3  # Retries after the first attempt
+    base_delay: float = 0.5  # seconds
+    max_delay: float = 30.0  # seconds, cap for a single backoff
+    multiplier: float = 2.0
+    jitter: bool = True  # Full jitter: sleep a random time up to the backoff
+    timeout: Optional[float] = None  # seconds, overall deadline across attempts
+    
+    def deadline(self) -> Optional[float]:
+        """Absolute ``time.monotonic()`` deadline for calls starting now, if ``timeout`` is set."""
+        return time.monotonic() + self.timeout if self.timeout else None
+    
+    def backoff(self, retry: int, rng: Optional[random.Random] = None) -> float:
+        """
+        Delay before a retry.
+        
+        Args:
+            retry: Zero-based retry number
+            rng: Random source for jitter
+        
+        Returns:
+            Seconds to wait
+        """
+        delay = min(self.max_delay, self.base_delay * (self.multiplier ** retry))
+        if self.jitter:
+            delay = (rng or random).uniform(0, delay)
+        return delay
+
+
+@dataclass
+class ErrorClassification:
+    """Whether an error is worth retrying, and why."""
+    retryable: bool
+    reason: str  # e.g. rate_limited, server_error, timeout, connection, circuit_open, permanent
+    retry_after: Optional[float] = None  # seconds requested by the server
+
+
+def classify_error(error: BaseException) -> ErrorClassification:
+    """
+    Classify an error for retrying.
+    
+    Follows the ``__cause__`` chain, so provider errors wrapped by clients or
+    agents are still recognised. Errors can opt in by setting a ``retryable``
+    attribute to True. Unknown errors are treated as permanent.
+    
+    Args:
+        error: Raised exception
+    
+    Returns:
+        Error classification
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        
+        if isinstance(current, CircuitBreakerOpenError):
+            return ErrorClassification(False, "circuit_open")
+        if isinstance(current, ExecutionCancelledError):
+            return ErrorClassification(False, "cancelled")
+        if isinstance(current, DeadlineExceededError):
+            return ErrorClassification(False, "deadline_exceeded")
+        if getattr(current, "retryable", None) is True:
+            return ErrorClassification(True, "transient")
+        
+        status = _status_code(current)
+        if status is not None:
+            if status in RETRYABLE_STATUS_CODES:
+                reason = "rate_limited" if status == 429 else "server_error"
+                if status == 408:
+                    reason = "timeout"
+                return ErrorClassification(True, reason, _retry_after(current))
+            return ErrorClassification(False, "permanent")
+        
+        name = type(current).__name__
+        if isinstance(current, (TimeoutError, asyncio.TimeoutError)) or "Timeout" in name:
+            return ErrorClassification(True, "timeout")
+        if isinstance(current, ConnectionError) or "Connection" in name:
+            return ErrorClassification(True, "connection")
+        
+        current = current.__cause__
+    return ErrorClassification(False, "permanent")
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an error is transient and worth retrying."""
+    return classify_error(error).retryable
+
+
+class RetryBudget:
+    """
+    Caps retries as a fraction of recent calls.
+    
+    Over a sliding window, retries are allowed while they stay below
+    ``min_retries_per_second * window + ratio * calls``. When a provider
+    fails for everyone, retries beyond that share are refused, so load on it
+    grows by at most ``ratio`` instead of by the retry count.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window: float = 10.0,
+    ):
+        """
+        Initialize retry budget.
+        
+        Args:
+            ratio: Retries allowed per call in the window
+            min_retries_per_second: Retries always allowed, for low traffic
+            window: Sliding window in seconds
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+        self._calls: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+    
+    def record_call(self) -> None:
+        """Record a first attempt."""
+        with self._lock:
+            self._calls.append(time.monotonic())
+    
+    def try_acquire(self) -> bool:
+        """
+        Take one retry from the budget.
+        
+        Returns:
+            True if the retry may proceed
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            allowed = self.min_retries_per_second * self.window + self.ratio * len(self._calls)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+    
+    def stats(self) -> dict:
+        """Calls and retries in the current window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return {"calls": len(self._calls), "retries": len(self._retries)}
+    
+    def _expire(self, now: float) -> None:
+        """Drop events older than the window."""
+        cutoff = now - self.window
+        for events in (self._calls, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+
+def call_with_retry(
+    func: Callable[[], Any],
+    policy: Optional[RetryPolicy] = None,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[Any] = None,
+    operation: str = "call",
+    deadline: Optional[float] = None,
+) -> Any:
+    """
+    Call a function, retrying transient errors.
+    
+    A blocking attempt cannot be interrupted, so the deadline and the
+    current cancellation token are checked before each attempt, and backoffs
+    never sleep past the deadline.
+    
+    Args:
+        func: Zero-argument callable
+        policy: Retry policy (default: ``RetryPolicy()``)
+        budget: Retry budget (default: global budget)
+        breaker: Optional circuit breaker each attempt is made through
+        operation: Label for metrics
+        deadline: Absolute ``time.monotonic()`` deadline, overriding ``policy.timeout``
+    
+    Returns:
+        The function's result
+    
+    Raises:
+        DeadlineExceededError: If the deadline passes before a successful attempt
+        Exception: The last error if it is permanent or retries are exhausted
+    """
+    policy = policy or RetryPolicy()
+    budget = budget or get_retry_budget()
+    token = current_token()
+    deadline = _deadline(policy, deadline, token)
+    budget.record_call()
+    
+    retry = 0
+    while True:
+        _check_deadline(deadline, operation, token)
+        try:
+            return breaker.call(func) if breaker is not None else func()
+        except Exception as e:
+            delay = _next_delay(e, retry, policy, budget, deadline, operation)
+            if delay is None:
+                raise
+        if token is not None:
+            token.sleep(delay)
+        else:
+            time.sleep(delay)
+        retry += 1
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[Any]],
+    policy: Optional[RetryPolicy] = None,
+    budget: Optional[RetryBudget] = None,
+    breaker: Optional[Any] = None,
+    operation: str = "call",
+    deadline: Optional[float] = None,
+) -> Any:
+    """
+    Await a coroutine function, retrying transient errors.
+    
+    Each attempt is cancelled when the overall deadline passes or the
+    current cancellation token is cancelled.
+    
+    Args:
+        func: Zero-argument coroutine function
+        policy: Retry policy (default: ``RetryPolicy()``)
+        budget: Retry budget (default: global budget)
+        breaker: Optional circuit breaker each attempt is made through
+        operation: Label for metrics
+        deadline: Absolute ``time.monotonic()`` deadline, overriding ``policy.timeout``
+    
+    Returns:
+        The awaited result
+    
+    Raises:
+        DeadlineExceededError: If the deadline passes before a successful attempt
+        ExecutionCancelledError: If the current run is cancelled
+        Exception: The last error if it is permanent or retries are exhausted
+    """
+    policy = policy or RetryPolicy()
+    budget = budget or get_retry_budget()
+    token = current_token()
+    deadline = _deadline(policy, deadline, token)
+    budget.record_call()
+    
+    retry = 0
+    while True:
+        _check_deadline(deadline, operation, token)
+        attempt = breaker.acall(func) if breaker is not None else func()
+        try:
+            timeout = deadline - time.monotonic() if deadline is not None else None
+            return await await_cancellable(attempt, token, timeout=timeout)
+        except asyncio.TimeoutError as e:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise DeadlineExceededError(f"{operation} exceeded its deadline") from e
+            delay = _next_delay(e, retry, policy, budget, deadline, operation)
+            if delay is None:
+                raise
+        except Exception as e:
+            delay = _next_delay(e, retry, policy, budget, deadline, operation)
+            if delay is None:
+                raise
+        await await_cancellable(asyncio.sleep(delay), token)
+        retry += 1
+
+
+def _deadline(
+    policy: RetryPolicy,
+    deadline: Optional[float],
+    token: Optional[CancellationToken] = None,
+) -> Optional[float]:
+    """Absolute deadline from an explicit value or the policy timeout, capped by the token's."""
+    if deadline is None and policy.timeout:
+        deadline = time.monotonic() + policy.timeout
+    if token is not None and token.deadline is not None:
+        deadline = token.deadline if deadline is None else min(deadline, token.deadline)
+    return deadline
+
+
+def _check_deadline(
+    deadline: Optional[float],
+    operation: str,
+    token: Optional[CancellationToken] = None,
+) -> None:
+    """Raise if the run was cancelled or the deadline has passed."""
+    if token is not None and token.cancelled:
+        raise ExecutionCancelledError(token.reason or "Cancelled")
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceededError(f"{operation} exceeded its deadline")
+
+
+def _next_delay(
+    error: Exception,
+    retry: int,
+    policy: RetryPolicy,
+    budget: RetryBudget,
+    deadline: Optional[float],
+    operation: str,
+) -> Optional[float]:
+    """Seconds to wait before retrying, or None to give up."""
+    classification = classify_error(error)
+    observer = retry_observer.get()
+    if observer is not None and classification.retryable:
+        observer(classification)
+    if not classification.retryable or retry >= policy.max_retries:
+        return None
+    
+    delay = policy.backoff(retry)
+    if classification.retry_after is not None:
+        delay = max(delay, classification.retry_after)
+    # A retry that could only start after the deadline is not worth taking
+    if deadline is not None and time.monotonic() + delay >= deadline:
+        return None
+    
+    if not budget.try_acquire():
+        _report(operation, "budget_exhausted")
+        return None
+    _report(operation, classification.reason)
+    return delay
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """HTTP status carried by an SDK or httpx error, if any."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Seconds from a ``Retry-After`` (or ``retry-after-ms``) response header."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # HTTP-date form
+            when = email.utils.parsedate_to_datetime(value)
+            return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _report(operation: str, reason: str) -> None:
+    """Report a retry decision to metrics."""
+    try:
+        from agent_factory.monitoring.metrics import MetricsCollector
+        MetricsCollector.record_retry(operation, reason)
+    except ImportError:
+        pass
+
+
+# Global retry budget
+_budget: Optional[RetryBudget] = None
+_budget_lock = threading.Lock()
+
+
+def get_retry_budget() -> RetryBudget:
+    """
+    Get global retry budget.
+    
+    Configured from ``RETRY_BUDGET_RATIO``, ``RETRY_BUDGET_MIN_PER_SECOND``
+    and ``RETRY_BUDGET_WINDOW``.
+    
+    Returns:
+        Retry budget
+    """
+    global _budget
+    if _budget is None:
+        with _budget_lock:
+            if _budget is None:
+                _budget = RetryBudget(
+                    ratio=float(os.getenv("RETRY_BUDGET_RATIO", "0.2")),
+                    min_retries_per_second=float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "1")),
+                    window=float(os.getenv("RETRY_BUDGET_WINDOW", "10")),
+                )
+    return _budget
+
+
+def set_retry_budget(budget: Optional[RetryBudget]) -> None:
+    """
+    Replace the global retry budget (``None`` resets it).
+    
+    Args:
+        budget: Retry budget to use
+    """
+    global _budget
+    with _budget_lock:
+        _budget = budget
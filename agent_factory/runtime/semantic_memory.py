@@ -0,0 +1,461 @@
+"""
+Semantic recall over past interactions.
+
+Recent-turn memory forgets anything older than the last N turns. In
+semantic mode every interaction is also embedded into an in-process vector
+index, and ``get_context(session_id, query=...)`` adds the past turns most
+similar to the query (``relevant_interactions``) to the recent ones:
+
+- embedders are pluggable (``Embedder``); ``HashingEmbedder`` is local,
+  deterministic and needs no network or model download;
+- ``VectorIndex`` keeps normalized vectors in a NumPy matrix and ranks
+  them with one matrix-vector product (cosine similarity). Without NumPy
+  it falls back to pure Python, which is correct but slow;
+- indexes are per session, or per user when ``user_of`` maps sessions to
+  users, so a returning user's new session recalls earlier sessions. They
+  are rebuilt from the store's history on first use (a user's from all of
+  their sessions, found with ``MemoryStore.list_sessions``), and keep turns
+  that compaction has since folded into the summary.
+"""
+
+import asyncio
+import hashlib
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from agent_factory.runtime.memory import Interaction, MemoryStore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Pure-Python fallback; install agent-factory[semantic] for vectorized search
+
+_TOKEN = re.compile(r"\w+")
+
+# Function words carry no topic, yet would dominate short texts' similarity
+_STOPWORDS = frozenset(
+    "a about an and are as at be but by can could did do does for from had has have he her "
+    "his how i in is it its me my no not of on or our she so that the their them they this "
+    "to was we were what when where which who why will with would you your".split()
+)
+
+
+class Embedder(ABC):
+    """Turns texts into L2-normalized vectors of ``dimension`` floats."""
+    
+    dimension: int
+    
+    @abstractmethod
+    def embed(self, texts: List[str]) -> Any:
+        """
+        Embed texts.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            One normalized vector per text (a 2-D array, or list of lists
+            without NumPy)
+        """
+        pass
+
+
+class HashingEmbedder(Embedder):
+    """
+    Local embedder using the hashing trick.
+    
+    Words (minus common function words) and word bigrams are hashed into
+    ``dimension`` signed buckets weighted by sublinear term frequency. Texts
+    sharing vocabulary land close together, and no vocabulary or network
+    access is needed.
+    
+    Example:
+        >>> embedder = HashingEmbedder()
+        >>> vectors = embedder.embed(["photosynthesis in plants", "how plants make food"])
+    """
+    
+    def __init__(self, dimension: int = 1024, bigrams: bool = True):
+        """
+        Initialize hashing embedder.
+        
+        Args:
+            dimension: Vector size
+            bigrams: Also hash adjacent word pairs
+        """
+        self.dimension = dimension
+        self.bigrams = bigrams
+    
+    def embed(self, texts: List[str]) -> Any:
+        """Embed texts into normalized hashed term-frequency vectors."""
+        rows = [self._embed_one(text) for text in texts]
+        if np is not None:
+            return np.asarray(rows, dtype=np.float32).reshape(len(rows), self.dimension)
+        return rows
+    
+    def _embed_one(self, text: str) -> List[float]:
+        """Embed one text."""
+        tokens = [token for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+        features = list(tokens)
+        if self.bigrams:
+            features.extend(f"{first} {second}" for first, second in zip(tokens, tokens[1:]))
+        
+        vector = [0.0] * self.dimension
+        for feature, count in Counter(features).items():
+            slot, sign = _feature_slot(feature, self.dimension)
+            vector[slot] += sign * (1.0 + math.log(count))
+        
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dimension: int) -> Tuple[int, float]:
+    """Stable bucket and sign for a feature (``hash()`` varies per process)."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimension, 1.0 if value >> 63 else -1.0
+
+
+class VectorIndex:
+    """
+    Cosine-similarity index over normalized vectors, oldest first.
+    
+    Example:
+        >>> index = VectorIndex(dimension=1024)
+        >>> index.add(embedder.embed(["hello"]), [{"input": "hello"}])
+        >>> index.search(embedder.embed(["hi"])[0], top_k=3)
+    """
+    
+    def __init__(self, dimension: int, max_items: int = 10000):
+        """
+        Initialize index.
+        
+        Args:
+            dimension: Vector size
+            max_items: Rows kept; the oldest are dropped beyond this
+        """
+        self.dimension = dimension
+        self.max_items = max_items
+        self._payloads: List[Any] = []
+        if np is not None:
+            self._vectors = np.zeros((16, dimension), dtype=np.float32)
+        else:
+            self._rows: List[Sequence[float]] = []
+    
+    def __len__(self) -> int:
+        return len(self._payloads)
+    
+    def add(self, vectors: Any, payloads: List[Any]) -> None:
+        """
+        Append vectors with their payloads.
+        
+        Args:
+            vectors: Normalized vectors (as returned by ``Embedder.embed``)
+            payloads: One payload per vector
+        """
+        if not payloads:
+            return
+        if np is None:
+            self._rows.extend(vectors)
+        else:
+            vectors = np.asarray(vectors, dtype=np.float32).reshape(len(payloads), self.dimension)
+            count, needed = len(self._payloads), len(self._payloads) + len(payloads)
+            if needed > len(self._vectors):
+                # Grow geometrically so appends stay amortized O(1)
+                rows = max(needed, 2 * len(self._vectors))
+                grown = np.zeros((rows, self.dimension), dtype=np.float32)
+                grown[:count] = self._vectors[:count]
+                self._vectors = grown
+            self._vectors[count:needed] = vectors
+        self._payloads.extend(payloads)
+        
+        overflow = len(self._payloads) - self.max_items
+        if overflow > 0:
+            self._drop_oldest(overflow)
+    
+    def search(
+        self,
+        vector: Any,
+        top_k: int = 5,
+        exclude_last: int = 0,
+        min_score: float = 0.0,
+    ) -> List[Tuple[float, Any]]:
+        """
+        Most similar rows to a query vector.
+        
+        Args:
+            vector: Normalized query vector
+            top_k: Maximum results
+            exclude_last: Ignore the newest rows (e.g. turns already in context)
+            min_score: Minimum cosine similarity
+        
+        Returns:
+            ``(score, payload)`` pairs, oldest first
+        """
+        count = len(self._payloads) - max(exclude_last, 0)
+        if count <= 0 or top_k <= 0:
+            return []
+        
+        if np is not None:
+            scores = self._vectors[:count] @ np.asarray(vector, dtype=np.float32)
+            k = min(top_k, count)
+            best = np.argpartition(-scores, k - 1)[:k]
+            hits = [(float(scores[i]), int(i)) for i in best]
+        else:
+            scored = [
+                (sum(a * b for a, b in zip(row, vector)), i)
+                for i, row in enumerate(self._rows[:count])
+            ]
+            hits = sorted(scored, reverse=True)[:top_k]
+        
+        return [
+            (score, self._payloads[i])
+            for score, i in sorted(hits, key=lambda hit: hit[1])
+            if score >= min_score
+        ]
+    
+    def discard(self, predicate: Callable[[Any], bool]) -> None:
+        """Remove rows whose payload matches ``predicate``."""
+        keep = [i for i, payload in enumerate(self._payloads) if not predicate(payload)]
+        if len(keep) == len(self._payloads):
+            return
+        if np is not None:
+            vectors = self._vectors[keep]
+            self._vectors = np.zeros((max(16, len(keep)), self.dimension), dtype=np.float32)
+            self._vectors[:len(keep)] = vectors
+        else:
+            self._rows = [self._rows[i] for i in keep]
+        self._payloads = [self._payloads[i] for i in keep]
+    
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the ``count`` oldest rows."""
+        remaining = len(self._payloads) - count
+        if np is not None:
+            self._vectors[:remaining] = self._vectors[count:count + remaining]
+        else:
+            del self._rows[:count]
+        del self._payloads[:count]
+
+
+class SemanticMemoryStore(MemoryStore):
+    """
+    Memory store decorator adding semantic recall of past turns.
+    
+    Example:
+        >>> memory = SemanticMemoryStore(SQLiteMemoryStore(), top_k=3)
+        >>> memory.save_interaction("s1", "My dog is called Biscuit", "Lovely name!")
+        >>> memory.get_context("s1", limit=10, query="What's my dog's name?")
+        {"recent_interactions": [...], "relevant_interactions": [...]}
+    """
+    
+    def __init__(
+        self,
+        store: MemoryStore,
+        embedder: Optional[Embedder] = None,
+        top_k: int = 3,
+        min_score: float = 0.2,
+        user_of: Optional[Callable[[str], Optional[str]]] = None,
+        max_items: int = 2000,
+        max_indexes: int = 100,
+    ):
+        """
+        Initialize semantic memory store.
+        
+        Args:
+            store: Memory store holding the interactions
+            embedder: Embedder (default: ``HashingEmbedder``)
+            top_k: Past turns recalled per query
+            min_score: Minimum cosine similarity for a recalled turn
+            user_of: Maps a session to its user for per-user indexes (default: per session)
+            max_items: Turns kept per index
+            max_indexes: Indexes kept in process (least recently used are dropped)
+        """
+        self.store = store
+        self.embedder = embedder or HashingEmbedder()
+        self.top_k = top_k
+        self.min_score = min_score
+        self.user_of = user_of
+        self.max_items = max_items
+        self.max_indexes = max_indexes
+        self._indexes: "OrderedDict[str, VectorIndex]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def save_interaction(
+        self,
+        session_id: str,
+        input_text: str,
+        output_text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Save an interaction to the store and index it."""
+        self.store.save_interaction(session_id, input_text, output_text, metadata)
+        with self._lock:
+            index = self._indexes.get(self._index_key(session_id))
+        if index is None:
+            return  # Built from the store, including this turn, on first search
+        vectors = self.embedder.embed([_document(input_text, output_text)])
+        with self._lock:
+            index.add(
+                vectors, [{"session_id": session_id, "input": input_text, "output": output_text}]
+            )
+    
+    def get_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get conversation context, with past turns relevant to ``query``.
+        
+        Args:
+            session_id: Session identifier
+            limit: Recent turns
+            query: Text to recall past turns for (usually the new user input)
+        
+        Returns:
+            Store context plus ``relevant_interactions`` (``input``,
+            ``output``, ``score``; oldest first) when a query is given
+        """
+        context = self.store.get_context(session_id, limit)
+        if query and self.top_k > 0:
+            context["relevant_interactions"] = self.recall(
+                session_id, query, exclude=context.get("recent_interactions", []),
+            )
+        return context
+    
+    async def aget_context(
+        self,
+        session_id: str,
+        limit: int = 10,
+        query: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_context`` (worker thread)."""
+        return await asyncio.to_thread(self.get_context, session_id, limit, query)
+    
+    def recall(
+        self,
+        session_id: str,
+        query: str,
+        exclude: Sequence[Dict[str, Any]] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Past turns most similar to a query.
+        
+        Args:
+            session_id: Session identifier
+            query: Query text
+            exclude: This session's turns already in context (``input``/``output``)
+        
+        Returns:
+            Turns with ``input``, ``output`` and ``score``, oldest first
+        """
+        index = self._index(session_id)
+        vector = self.embedder.embed([query])[0]
+        in_context = {(turn["input"], turn["output"]) for turn in exclude}
+        with self._lock:
+            # Over-fetch by the excluded turns so top_k remain after dropping them
+            hits = index.search(vector, self.top_k + len(in_context), min_score=self.min_score)
+        hits = [
+            (score, payload) for score, payload in hits
+            if payload["session_id"] != session_id
+            or (payload["input"], payload["output"]) not in in_context
+        ]
+        if len(hits) > self.top_k:
+            best = sorted(range(len(hits)), key=lambda i: hits[i][0], reverse=True)[: self.top_k]
+            hits = [hits[i] for i in sorted(best)]
+        return [
+            {"input": payload["input"], "output": payload["output"], "score": round(score, 4)}
+            for score, payload in hits
+        ]
+    
+    def get_history(self, session_id: str, limit: int = 50) -> List[Interaction]:
+        """Get interaction history for a session."""
+        return self.store.get_history(session_id, limit)
+    
+    def get_summary(self, session_id: str) -> Optional[str]:
+        """Get the running summary of a session's compacted turns."""
+        return self.store.get_summary(session_id)
+    
+    def get_version(self, session_id: str) -> Optional[int]:
+        """Get the store's version stamp for a session."""
+        return self.store.get_version(session_id)
+    
+    def get_oldest_history(self, session_id: str, limit: int) -> List[Interaction]:
+        """Get a session's oldest interactions from the wrapped store."""
+        return self.store.get_oldest_history(session_id, limit)
+    
+    def compact_session(self, session_id: str, summary: str, folded_turns: int) -> None:
+        """Compact the session in the store; its indexed turns stay recallable."""
+        self.store.compact_session(session_id, summary, folded_turns)
+    
+    def clear_session(self, session_id: str) -> None:
+        """Clear the session in the store and forget its indexed turns."""
+        self.store.clear_session(session_id)
+        key = self._index_key(session_id)
+        with self._lock:
+            if key == session_id:
+                self._indexes.pop(key, None)
+            elif key in self._indexes:
+                self._indexes[key].discard(lambda payload: payload["session_id"] == session_id)
+    
+    def _user(self, session_id: str) -> Optional[str]:
+        """User owning a session, if ``user_of`` is configured."""
+        return self.user_of(session_id) if self.user_of else None
+    
+    def _index_key(self, session_id: str) -> str:
+        """Index of a session: its user's, or its own."""
+        user_id = self._user(session_id)
+        return f"user:{user_id}" if user_id else session_id
+    
+    def _index(self, session_id: str) -> VectorIndex:
+        """The session's index, built from the store's history on first use."""
+        key = self._index_key(session_id)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        
+        history = self._indexed_history(session_id)
+        index = VectorIndex(self.embedder.dimension, max_items=self.max_items)
+        documents = [_document(i.input_text, i.output_text) for i in history]
+        index.add(
+            self.embedder.embed(documents) if history else [],
+            [
+                {"session_id": i.session_id, "input": i.input_text, "output": i.output_text}
+                for i in history
+            ],
+        )
+        with self._lock:
+            # Another thread may have built it meanwhile; keep the first
+            index = self._indexes.setdefault(key, index)
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return index
+    
+    def _indexed_history(self, session_id: str) -> List[Interaction]:
+        """Newest ``max_items`` turns of the session, or of all its user's sessions."""
+        user_id = self._user(session_id)
+        if not user_id:
+            return self.store.get_history(session_id, self.max_items)
+        
+        sessions = {s for s in self.store.list_sessions() if self._user(s) == user_id}
+        history = [
+            interaction
+            for user_session in sessions | {session_id}
+            for interaction in self.store.get_history(user_session, self.max_items)
+        ]
+        history.sort(key=lambda interaction: interaction.timestamp)
+        return history[-self.max_items:]
+
+
+def _document(input_text: str, output_text: str) -> str:
+    """Text embedded for a turn."""
+    return f"{input_text}\n{output_text}"
@@ -0,0 +1,175 @@
+"""
+Tuned, persistent SQLite connections for the local stores.
+
+The SQLite-backed stores (session memory, prompt log, telemetry, jobs,
+executions, response cache, activations) open their database through a
+``SQLiteConnectionManager`` instead of connecting and closing on every
+operation. A manager keeps:
+
+- one persistent connection per thread, opened on first use (a
+  ``:memory:`` database has a single connection shared under a lock, so
+  every thread sees the same data);
+- WAL journaling, so readers in any thread or process do not block the
+  writer;
+- tuned ``synchronous``, ``cache_size``, ``mmap_size`` and ``temp_store``
+  pragmas, and a busy timeout instead of immediate "database is locked"
+  errors;
+- sqlite3's prepared-statement cache, sized for the stores' queries.
+
+Settings come from ``SQLITE_*`` environment variables (``SQLiteSettings.from_env``).
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+
+@dataclass
+class SQLiteSettings:
+    """Connection pragmas and limits."""
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"  # Durable across crashes in WAL mode; FULL also survives power loss
+    busy_timeout: float = 5.0  # seconds
+    cache_size_kib: int = 8192  # Page cache per connection
+    mmap_size: int = 64 * 1024 * 1024  # bytes
+    statement_cache: int = 256  # Prepared statements kept per connection
+    
+    @classmethod
+    def from_env(cls) -> "SQLiteSettings":
+        """
+        Load settings from ``SQLITE_JOURNAL_MODE``, ``SQLITE_SYNCHRONOUS``,
+        ``SQLITE_BUSY_TIMEOUT``, ``SQLITE_CACHE_SIZE_KIB``, ``SQLITE_MMAP_SIZE``
+        and ``SQLITE_STATEMENT_CACHE`` environment variables.
+        """
+        defaults = cls()
+        return cls(
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", defaults.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", defaults.synchronous),
+            busy_timeout=float(os.getenv("SQLITE_BUSY_TIMEOUT", defaults.busy_timeout)),
+            cache_size_kib=int(os.getenv("SQLITE_CACHE_SIZE_KIB", defaults.cache_size_kib)),
+            mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", defaults.mmap_size)),
+            statement_cache=int(os.getenv("SQLITE_STATEMENT_CACHE", defaults.statement_cache)),
+        )
+
+
+class SQLiteConnectionManager:
+    """
+    Per-thread persistent connections to one SQLite database.
+    
+    Example:
+        >>> db = SQLiteConnectionManager("./agent_factory/promptlog.db")
+        >>> with db.transaction() as conn:
+        ...     conn.execute("INSERT INTO runs (run_id) VALUES (?)", ("run-1",))
+        >>> with db.connection() as conn:
+        ...     rows = conn.execute("SELECT run_id FROM runs").fetchall()
+    """
+    
+    def __init__(self, db_path: Union[str, Path], settings: Optional[SQLiteSettings] = None):
+        """
+        Initialize connection manager.
+        
+        Args:
+            db_path: Path to SQLite database file (or ":memory:")
+            settings: Connection settings (default: from environment)
+        """
+        self.db_path = str(db_path)
+        self.settings = settings or SQLiteSettings.from_env()
+        self.in_memory = self.db_path == ":memory:"
+        self._local = threading.local()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._shared: Optional[sqlite3.Connection] = None
+        # Guards the connection registry, and serializes use of a shared :memory: connection
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+    
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection for reads; statements outside a transaction see committed data."""
+        with self._lock if self.in_memory else nullcontext():
+            yield self._connection()
+    
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection for writes, committed on success and rolled back on error."""
+        with self._lock if self.in_memory else nullcontext():
+            conn = self._connection()
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+    
+    def close(self) -> None:
+        """Close every connection; later calls reconnect."""
+        with self._lock:
+            connections = list(self._connections.values())
+            if self._shared is not None:
+                connections.append(self._shared)
+            self._connections.clear()
+            self._shared = None
+            self._local = threading.local()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """Open connections and settings."""
+        with self._lock:
+            open_connections = len(self._connections) + (self._shared is not None)
+        return {
+            "db_path": self.db_path,
+            "connections": open_connections,
+            "journal_mode": self.settings.journal_mode,
+        }
+    
+    def _connection(self) -> sqlite3.Connection:
+        """The calling thread's connection, opened on first use."""
+        if self._pid != os.getpid():
+            # Connections must not cross a fork; the child opens its own
+            with self._lock:
+                self._connections = {}
+                self._shared = None
+                self._local = threading.local()
+                self._pid = os.getpid()
+        
+        if self.in_memory:
+            if self._shared is None:
+                self._shared = self._connect()
+            return self._shared
+        
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                # Drop connections of threads that have exited
+                alive = {thread.ident for thread in threading.enumerate()}
+                for ident in [ident for ident in self._connections if ident not in alive]:
+                    self._connections.pop(ident).close()
+                self._connections[threading.get_ident()] = conn
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a connection."""
+        settings = self.settings
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=settings.busy_timeout,
+            cached_statements=settings.statement_cache,
+            # Closed from other threads by close(); each is otherwise used by one thread
+            check_same_thread=False,
+        )
+        if not self.in_memory:
+            conn.execute(f"PRAGMA journal_mode={settings.journal_mode}")
+            conn.execute(f"PRAGMA mmap_size={int(settings.mmap_size)}")
+        conn.execute(f"PRAGMA synchronous={settings.synchronous}")
+        conn.execute(f"PRAGMA cache_size=-{int(settings.cache_size_kib)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
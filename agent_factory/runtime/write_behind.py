@@ -0,0 +1,290 @@
+"""
+Write-behind persistence for post-run writes.
+
+Memory saves, prompt-log records and telemetry events are durable writes
+that the caller of a run does not need to wait for. ``WriteBehindWriter``
+queues them to a background thread so a run returns as soon as the model
+answers:
+
+- Writes are applied in submission order by a single writer thread.
+- The queue is bounded. When full, ``submit`` blocks briefly, then waits
+  for the queued writes of the same key (or sink) and writes inline, so
+  nothing is dropped or reordered (backpressure rather than loss).
+- Reads that must see earlier writes wait for the pending writes of their
+  sink or key (``wait``). Examples are loading a session's memory and
+  reading the prompt log.
+- Pending writes are flushed on shutdown (``atexit`` and the API shutdown hook).
+- Outcomes are counted per sink in ``write_behind_writes_total``.
+
+``WRITE_BEHIND_ENABLED=false`` makes every write synchronous again.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queue item that stops the writer thread
+_STOP = object()
+
+
+class WriteBehindWriter:
+    """
+    Background writer for durable post-run writes.
+    
+    Example:
+        >>> writer = WriteBehindWriter()
+        >>> writer.submit("prompt_log", storage.save_run, run)
+        >>> writer.wait(sink="prompt_log")  # before reading the prompt log
+        >>> writer.shutdown()
+    """
+    
+    def __init__(
+        self,
+        max_pending: int = 10000,
+        block_timeout: float = 1.0,
+        enabled: bool = True,
+    ):
+        """
+        Initialize writer.
+        
+        Args:
+            max_pending: Queue capacity before backpressure applies
+            block_timeout: Seconds ``submit`` waits for space before writing inline
+                (after the queued writes of the same key or sink)
+            enabled: Queue writes (False writes every submission inline)
+        """
+        self.enabled = enabled
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending)
+        self._pending: Dict[str, int] = defaultdict(int)
+        self._condition = threading.Condition()
+        self._counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+    
+    def submit(
+        self,
+        sink: str,
+        func: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Queue a write.
+        
+        Args:
+            sink: Sink name for metrics and ``wait`` (e.g. "prompt_log")
+            func: Function performing the write
+            *args: Arguments for ``func``
+            key: Optional finer key to ``wait`` on (e.g. "memory:<session>")
+            **kwargs: Keyword arguments for ``func``
+        """
+        if not self.enabled or self._closed:
+            self._write(sink, func, args, kwargs, outcome="inline")
+            return
+        
+        self._ensure_thread()
+        item = (sink, key, func, args, kwargs)
+        self._track(sink, key, 1)
+        try:
+            self._queue.put(item, timeout=self.block_timeout)
+        except queue.Full:
+            # Backpressure: the caller pays for the write instead of losing it,
+            # after the writes queued ahead of it for the same key or sink
+            self._track(sink, key, -1)
+            self.wait(sink=sink if key is None else None, key=key)
+            self._write(sink, func, args, kwargs, outcome="inline")
+            return
+        self._report_depth()
+    
+    def pending(self, sink: Optional[str] = None, key: Optional[str] = None) -> int:
+        """
+        Number of queued writes.
+        
+        Args:
+            sink: Count only this sink
+            key: Count only this key
+        """
+        with self._condition:
+            if key is not None:
+                return self._pending.get(f"key:{key}", 0)
+            if sink is not None:
+                return self._pending.get(f"sink:{sink}", 0)
+            return self._pending.get("all", 0)
+    
+    def wait(
+        self,
+        sink: Optional[str] = None,
+        key: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Wait until queued writes (of a sink or key) are applied.
+        
+        Args:
+            sink: Wait only for this sink
+            key: Wait only for this key
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            True if no matching writes remain
+        """
+        if threading.current_thread() is self._thread:
+            # A write waiting on its own queue would never finish
+            return True
+        counter = f"key:{key}" if key is not None else f"sink:{sink}" if sink is not None else "all"
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._condition:
+            while self._pending.get(counter, 0) > 0:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every queued write; True if the queue drained."""
+        return self.wait(timeout=timeout)
+    
+    def shutdown(self, timeout: Optional[float] = 10.0) -> bool:
+        """
+        Flush pending writes and stop the writer thread.
+        
+        Later submissions are written inline.
+        
+        Args:
+            timeout: Maximum seconds to wait for the flush
+        
+        Returns:
+            True if every write was applied
+        """
+        self._closed = True
+        drained = self.flush(timeout)
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        self._thread = None
+        return drained
+    
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and per-sink outcome counts."""
+        with self._condition:
+            counts: Dict[str, Dict[str, int]] = defaultdict(dict)
+            for (sink, outcome), count in self._counts.items():
+                counts[sink][outcome] = count
+            return {"pending": self._pending.get("all", 0), "sinks": dict(counts)}
+    
+    def _ensure_thread(self) -> None:
+        """Start the writer thread on first use."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        """Writer thread: apply queued writes in order."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            sink, key, func, args, kwargs = item
+            try:
+                self._write(sink, func, args, kwargs, outcome="written")
+            finally:
+                self._track(sink, key, -1)
+                self._report_depth()
+    
+    def _write(
+        self,
+        sink: str,
+        func: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        outcome: str,
+    ) -> None:
+        """Apply one write, counting its outcome; failures are logged, not raised."""
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            outcome = "failed"
+            logger.warning(f"Write-behind write to {sink} failed: {e}")
+        with self._condition:
+            self._counts[(sink, outcome)] += 1
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            MetricsCollector.record_write_behind(sink, outcome)
+        except ImportError:
+            pass
+    
+    def _track(self, sink: str, key: Optional[str], delta: int) -> None:
+        """Adjust pending counters and wake waiters when they drain."""
+        with self._condition:
+            for counter in ("all", f"sink:{sink}", f"key:{key}" if key is not None else None):
+                if counter is None:
+                    continue
+                self._pending[counter] += delta
+                if self._pending[counter] <= 0:
+                    del self._pending[counter]
+            if delta < 0:
+                self._condition.notify_all()
+    
+    def _report_depth(self) -> None:
+        """Publish the queue depth gauge."""
+        try:
+            from agent_factory.monitoring.metrics import MetricsCollector
+            MetricsCollector.set_write_behind_depth(self.pending())
+        except ImportError:
+            pass
+
+
+# Global write-behind writer
+_writer: Optional[WriteBehindWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_write_behind() -> WriteBehindWriter:
+    """
+    Get global write-behind writer.
+    
+    Configured by ``WRITE_BEHIND_ENABLED``, ``WRITE_BEHIND_MAX_PENDING`` and
+    ``WRITE_BEHIND_BLOCK_TIMEOUT``. Pending writes are flushed at exit.
+    
+    Returns:
+        Write-behind writer
+    """
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = WriteBehindWriter(
+                    max_pending=int(os.getenv("WRITE_BEHIND_MAX_PENDING", "10000")),
+                    block_timeout=float(os.getenv("WRITE_BEHIND_BLOCK_TIMEOUT", "1.0")),
+                    enabled=os.getenv("WRITE_BEHIND_ENABLED", "true").strip().lower() == "true",
+                )
+                atexit.register(_writer.shutdown)
+    return _writer
+
+
+def set_write_behind(writer: Optional[WriteBehindWriter]) -> None:
+    """
+    Replace the global writer (``None`` resets it), flushing the old one.
+    
+    Args:
+        writer: Writer to use
+    """
+    global _writer
+    with _writer_lock:
+        previous, _writer = _writer, writer
+    if previous is not None and previous is not writer:
+        previous.shutdown()
@@ -2,8 +2,9 @@
 Python SDK client for Agent Factory Platform API.
 """
 
+import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import httpx
 
 
@@ -162,6 +163,54 @@ class Client:
             },
         )
     
+    def stream_agent(
+        self,
+        agent_id: str,
+        input_text: str,
+        session_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Run an agent and iterate over its output as it is generated.
+        
+        Args:
+            agent_id: Agent ID
+            input_text: Input text
+            session_id: Optional session ID
+            context: Optional context
+        
+        Yields:
+            Output text deltas
+        
+        Raises:
+            httpx.HTTPError: On HTTP errors
+            RuntimeError: If the agent run fails mid-stream
+        """
+        with self.client.stream(
+            "POST",
+            f"/api/v1/agents/{agent_id}/run/stream",
+            json={
+                "input_text": input_text,
+                "session_id": session_id,
+                "context": context,
+            },
+            # Generation can pause longer than a normal request between deltas
+            timeout=httpx.Timeout(self.timeout, read=None),
+        ) as response:
+            response.raise_for_status()
+            event = "message"
+            for line in response.iter_lines():
+                if line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data = json.loads(line[len("data:"):].strip())
+                    if event == "delta":
+                        yield data["text"]
+                    elif event == "error":
+                        raise RuntimeError(f"Agent run failed: {data.get('error')}")
+                elif not line:
+                    event = "message"
+    
     def delete_agent(self, agent_id: str) -> Dict[str, Any]:
         """
         Delete an agent.
@@ -82,14 +82,7 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open
             Exception: Original exception if call fails
         """
-        with self._lock:
-            self._update_state()
-            
-            if self.stats.state == CircuitState.OPEN:
-                from agent_factory.core.exceptions import AgentFactoryError
-                raise AgentFactoryError(
-                    f"Circuit breaker '{self.name}' is OPEN. Service unavailable."
-                )
+        self._check_open()
         
         # Attempt call
         try:
@@ -100,6 +93,46 @@ class CircuitBreaker:
             self._on_failure()
             raise
     
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+        
+        Shares state with ``call``, so sync and async callers of the same
+        service trip the same breaker.
+        
+        Args:
+            func: Coroutine function to await
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+        
+        Returns:
+            Awaited result
+        
+        Raises:
+            CircuitBreakerOpenError: If circuit is open
+            Exception: Original exception if call fails
+        """
+        self._check_open()
+        
+        try:
+            result = await func(*args, **kwargs)
+            self._on_success()
+            return result
+        except self.config.expected_exception:
+            self._on_failure()
+            raise
+    
+    def _check_open(self) -> None:
+        """Raise if the circuit is currently open."""
+        with self._lock:
+            self._update_state()
+            
+            if self.stats.state == CircuitState.OPEN:
+                from agent_factory.core.exceptions import CircuitBreakerOpenError
+                raise CircuitBreakerOpenError(
+                    f"Circuit breaker '{self.name}' is OPEN. Service unavailable."
+                )
+    
     def _update_state(self) -> None:
         """Update circuit breaker state based on current conditions."""
         current_time = time.time()
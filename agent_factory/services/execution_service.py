@@ -51,7 +51,7 @@ class ExecutionService:
     
     def cancel_execution(self, execution_id: str) -> bool:
         """
-        Cancel an execution.
+        Cancel an execution, stopping its run.
         
         Args:
             execution_id: Execution ID
@@ -59,12 +59,4 @@ class ExecutionService:
         Returns:
             True if cancelled, False if not found or cannot be cancelled
         """
-        execution = self.get_execution(execution_id)
-        if not execution:
-            return False
-        
-        if execution.status == "running":
-            execution.status = "cancelled"
-            return True
-        
-        return False
+        return self.runtime.cancel_execution(execution_id)
@@ -30,6 +30,7 @@ from agent_factory.telemetry.backends.base import TelemetryBackend
 from agent_factory.telemetry.backends.sqlite import SQLiteTelemetryBackend
 # PostgresTelemetryBackend imported lazily via backends.__getattr__
 from agent_factory.telemetry.analytics import AnalyticsEngine, get_analytics
+from agent_factory.telemetry.activation import ActivationRegistry, get_activation_registry
 
 try:
     from agent_factory.telemetry.revenue import RevenueTracker, get_revenue_tracker
@@ -66,6 +67,8 @@ __all__ = [
     "PostgresTelemetryBackend",
     "AnalyticsEngine",
     "get_analytics",
+    "ActivationRegistry",
+    "get_activation_registry",
     "RevenueTracker",
     "get_revenue_tracker",
 ]
@@ -0,0 +1,222 @@
+"""
+Activation registry for tracking each user's first agent run.
+
+Activated users are kept in an in-process set backed by a small SQLite
+table or a Redis set, so checking a run costs a set lookup instead of a
+telemetry query. The signup lookup for ``days_to_activation`` happens only
+when a user activates.
+"""
+
+import os
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Set
+
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
+from agent_factory.telemetry.model import EventType, UserActivatedEvent
+
+
+class ActivationBackend(ABC):
+    """Persistent record of activated users."""
+    
+    @abstractmethod
+    def claim(self, user_id: str, criteria: str) -> bool:
+        """
+        Mark a user activated.
+        
+        Args:
+            user_id: User ID
+            criteria: Activation criteria
+        
+        Returns:
+            True if this call activated the user, False if already activated
+        """
+        pass
+
+
+class SQLiteActivationBackend(ActivationBackend):
+    """Activations in a SQLite table (by default alongside telemetry)."""
+    
+    def __init__(self, db_path: str = "./agent_factory/telemetry.db"):
+        """
+        Initialize SQLite activation backend.
+        
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = SQLiteConnectionManager(self.db_path)
+        self._init_db()
+    
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with self._db.transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_activations (
+                    user_id TEXT PRIMARY KEY,
+                    criteria TEXT NOT NULL,
+                    activated_at TEXT NOT NULL
+                )
+            """)
+    
+    def claim(self, user_id: str, criteria: str) -> bool:
+        """Mark a user activated; True only for the first claim."""
+        with self._db.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO user_activations (user_id, criteria, activated_at) "
+                "VALUES (?, ?, ?)",
+                (user_id, criteria, datetime.utcnow().isoformat()),
+            )
+        return cursor.rowcount == 1
+
+
+class RedisActivationBackend(ActivationBackend):
+    """Activations in a Redis set shared across processes."""
+    
+    def __init__(self, cache: Optional[Any] = None, key: str = "telemetry:activated_users"):
+        """
+        Initialize Redis activation backend.
+        
+        Args:
+            cache: RedisCache instance (defaults to the global cache)
+            key: Redis set key
+        """
+        if cache is None:
+            from agent_factory.cache.redis_cache import get_cache
+            cache = get_cache()
+        self.cache = cache
+        self.key = key
+    
+    def claim(self, user_id: str, criteria: str) -> bool:
+        """Mark a user activated; True only for the first claim."""
+        if not self.cache.client:
+            raise ConnectionError("Redis is unavailable")
+        return self.cache.client.sadd(self.key, user_id) == 1
+
+
+class ActivationRegistry:
+    """
+    Records a ``UserActivatedEvent`` the first time each user runs an agent.
+    
+    Example:
+        >>> registry = ActivationRegistry(SQLiteActivationBackend())
+        >>> registry.track_first_run(collector, user_id="user-1", tenant_id="tenant-1")
+    """
+    
+    def __init__(self, backend: Optional[ActivationBackend] = None):
+        """
+        Initialize activation registry.
+        
+        Args:
+            backend: Persistent activation record (defaults to SQLite)
+        """
+        self.backend = backend or SQLiteActivationBackend()
+        self._activated: Set[str] = set()
+        self._lock = threading.Lock()
+    
+    def is_activated(self, user_id: str) -> bool:
+        """Whether this process has seen the user activated."""
+        return user_id in self._activated
+    
+    def track_first_run(
+        self,
+        collector: Any,
+        user_id: str,
+        tenant_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        criteria: str = "first_agent_run",
+    ) -> bool:
+        """
+        Record activation if this is the user's first run.
+        
+        Args:
+            collector: Telemetry collector to record the event with
+            user_id: User ID
+            tenant_id: Tenant ID for the event
+            project_id: Project ID for the event
+            criteria: Activation criteria
+        
+        Returns:
+            True if an activation event was recorded
+        """
+        if user_id in self._activated:
+            return False
+        
+        with self._lock:
+            if user_id in self._activated:
+                return False
+            first = self.backend.claim(user_id, criteria)
+            self._activated.add(user_id)
+        
+        # Users activated before the registry existed only have the event
+        if not first or self._has_activation_event(collector, user_id):
+            return False
+        
+        collector.record_event(UserActivatedEvent(
+            event_id=str(uuid.uuid4()),
+            activation_criteria=criteria,
+            days_to_activation=self._days_since_signup(collector, user_id),
+            tenant_id=tenant_id,
+            user_id=user_id,
+            project_id=project_id,
+        ))
+        return True
+    
+    def _has_activation_event(self, collector: Any, user_id: str) -> bool:
+        """Whether telemetry already holds an activation for the user."""
+        return bool(collector.query_events(
+            event_type=EventType.USER_ACTIVATED.value, user_id=user_id, limit=1
+        ))
+    
+    def _days_since_signup(self, collector: Any, user_id: str) -> Optional[int]:
+        """Days from the user's signup (or tenant creation) event to now."""
+        for event_type in (EventType.USER_SIGNUP, EventType.TENANT_CREATED):
+            events = collector.query_events(event_type=event_type.value, user_id=user_id, limit=1)
+            if events:
+                return (datetime.utcnow() - events[0].timestamp).days
+        return None
+
+
+# Global activation registry
+_registry: Optional[ActivationRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_activation_registry() -> ActivationRegistry:
+    """
+    Get global activation registry.
+    
+    The backend comes from ``ACTIVATION_BACKEND`` (sqlite or redis) and
+    ``ACTIVATION_DB_PATH``.
+    
+    Returns:
+        Activation registry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                if os.getenv("ACTIVATION_BACKEND", "sqlite").strip().lower() == "redis":
+                    backend: ActivationBackend = RedisActivationBackend()
+                else:
+                    backend = SQLiteActivationBackend(
+                        os.getenv("ACTIVATION_DB_PATH", "./agent_factory/telemetry.db")
+                    )
+                _registry = ActivationRegistry(backend)
+    return _registry
+
+
+def set_activation_registry(registry: Optional[ActivationRegistry]) -> None:
+    """
+    Replace the global activation registry (``None`` resets it).
+    
+    Args:
+        registry: Activation registry to use
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
@@ -3,11 +3,11 @@ SQLite backend for telemetry storage.
 """
 
 import json
-import sqlite3
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 
+from agent_factory.runtime.sqlite import SQLiteConnectionManager
 from agent_factory.telemetry.backends.base import TelemetryBackend
 from agent_factory.telemetry.model import TelemetryEvent, EventType
 
@@ -28,57 +28,54 @@ class SQLiteTelemetryBackend(TelemetryBackend):
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = SQLiteConnectionManager(self.db_path)
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize database tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Main events table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS telemetry_events (
-                event_id TEXT PRIMARY KEY,
-                event_type TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                tenant_id TEXT,
-                user_id TEXT,
-                project_id TEXT,
-                event_data TEXT NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Indexes for common queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_tenant 
-            ON telemetry_events(tenant_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_type 
-            ON telemetry_events(event_type)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp 
-            ON telemetry_events(timestamp)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_telemetry_user 
-            ON telemetry_events(user_id)
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
+            # Main events table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS telemetry_events (
+                    event_id TEXT PRIMARY KEY,
+                    event_type TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    tenant_id TEXT,
+                    user_id TEXT,
+                    project_id TEXT,
+                    event_data TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            
+            # Indexes for common queries
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_telemetry_tenant 
+                ON telemetry_events(tenant_id)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_telemetry_type 
+                ON telemetry_events(event_type)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp 
+                ON telemetry_events(timestamp)
+            """)
+            
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_telemetry_user 
+                ON telemetry_events(user_id)
+            """)
     
     def store_event(self, event: TelemetryEvent) -> None:
         """Store a telemetry event."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.transaction() as conn:
+            cursor = conn.cursor()
+            
             event_data = json.dumps(event.to_dict())
             
             cursor.execute("""
@@ -94,10 +91,6 @@ class SQLiteTelemetryBackend(TelemetryBackend):
                 event.project_id,
                 event_data,
             ))
-            
-            conn.commit()
-        finally:
-            conn.close()
     
     def query_events(
         self,
@@ -110,10 +103,9 @@ class SQLiteTelemetryBackend(TelemetryBackend):
         limit: int = 100,
     ) -> List[TelemetryEvent]:
         """Query telemetry events."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        try:
+        with self._db.connection() as conn:
+            cursor = conn.cursor()
+            
             query = "SELECT event_data FROM telemetry_events WHERE 1=1"
             params = []
             
@@ -156,8 +148,6 @@ class SQLiteTelemetryBackend(TelemetryBackend):
                     events.append(event)
             
             return events
-        finally:
-            conn.close()
     
     def _deserialize_event(self, event_dict: dict) -> Optional[TelemetryEvent]:
         """Deserialize event from dictionary."""
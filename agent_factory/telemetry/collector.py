@@ -323,6 +323,10 @@ class TelemetryCollector:
         Returns:
             List of telemetry events
         """
+        # Include events still queued by the write-behind writer
+        from agent_factory.runtime.write_behind import get_write_behind
+        get_write_behind().wait(sink="telemetry")
+        
         return self.backend.query_events(
             event_type=event_type,
             tenant_id=tenant_id,
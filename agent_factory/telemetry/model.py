@@ -31,21 +31,29 @@ class EventType(str, Enum):
     USER_LOGIN = "user_login"
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryEvent:
     """
     Base telemetry event.
     
-    All telemetry events inherit from this base class.
+    All telemetry events inherit from this base class. Events are slotted
+    (no per-instance ``__dict__``), so subclasses call
+    ``TelemetryEvent.to_dict(self)``: zero-argument ``super()`` does not
+    work in slotted dataclasses.
     """
     event_id: str
-    event_type: EventType
+    event_type: Optional[EventType] = None  # Set by subclasses in __post_init__
     timestamp: datetime = field(default_factory=datetime.utcnow)
     tenant_id: Optional[str] = None
     user_id: Optional[str] = None
     project_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        """Require an event type on base events (subclasses set their own)."""
+        if self.event_type is None:
+            raise ValueError("TelemetryEvent requires an event_type")
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary."""
         return {
@@ -59,7 +67,7 @@ class TelemetryEvent:
         }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class AgentRunEvent(TelemetryEvent):
     """Telemetry event for agent execution."""
     agent_id: str  # Required field
@@ -78,7 +86,7 @@ class AgentRunEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "agent_id": self.agent_id,
             "agent_name": self.agent_name,
@@ -93,7 +101,7 @@ class AgentRunEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class WorkflowRunEvent(TelemetryEvent):
     """Telemetry event for workflow execution."""
     workflow_id: str  # Required field
@@ -111,7 +119,7 @@ class WorkflowRunEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "workflow_id": self.workflow_id,
             "workflow_name": self.workflow_name,
@@ -125,7 +133,7 @@ class WorkflowRunEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BlueprintInstallEvent(TelemetryEvent):
     """Telemetry event for blueprint installation."""
     blueprint_id: str  # Required field
@@ -139,7 +147,7 @@ class BlueprintInstallEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "blueprint_id": self.blueprint_id,
             "blueprint_name": self.blueprint_name,
@@ -149,7 +157,7 @@ class BlueprintInstallEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ErrorEvent(TelemetryEvent):
     """Telemetry event for errors."""
     error_type: str  # Required field
@@ -164,7 +172,7 @@ class ErrorEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "error_type": self.error_type,
             "error_message": self.error_message,
@@ -175,7 +183,7 @@ class ErrorEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BillingUsageEvent(TelemetryEvent):
     """Telemetry event for billing usage tracking."""
     billing_unit: str  # Required field
@@ -194,7 +202,7 @@ class BillingUsageEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "billing_unit": self.billing_unit,
             "quantity": self.quantity,
@@ -207,7 +215,7 @@ class BillingUsageEvent(TelemetryEvent):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class TenantEvent(TelemetryEvent):
     """Telemetry event for tenant lifecycle."""
     tenant_name: Optional[str] = None
@@ -230,7 +238,7 @@ class TenantEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "tenant_name": self.tenant_name,
             "tenant_slug": self.tenant_slug,
@@ -245,7 +253,7 @@ class TenantEvent(TelemetryEvent):
         return base
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectEvent(TelemetryEvent):
     """Telemetry event for project/app lifecycle."""
     project_name: Optional[str] = None
@@ -261,7 +269,7 @@ class ProjectEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "project_name": self.project_name,
             "project_type": self.project_type,
@@ -270,7 +278,7 @@ class ProjectEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserActivatedEvent(TelemetryEvent):
     """Telemetry event for user activation."""
     activation_criteria: str  # first_agent_run, first_blueprint_install, etc.
@@ -282,7 +290,7 @@ class UserActivatedEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "activation_criteria": self.activation_criteria,
             "days_to_activation": self.days_to_activation,
@@ -290,7 +298,7 @@ class UserActivatedEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ReferralEvent(TelemetryEvent):
     """Telemetry event for referrals."""
     referral_code: str  # Required field
@@ -307,7 +315,7 @@ class ReferralEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "referral_code": self.referral_code,
             "referral_type": self.referral_type,
@@ -317,7 +325,7 @@ class ReferralEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RevenueEvent(TelemetryEvent):
     """Telemetry event for revenue tracking."""
     amount: float  # Required field
@@ -334,7 +342,7 @@ class RevenueEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "amount": self.amount,
             "currency": self.currency,
@@ -347,7 +355,7 @@ class RevenueEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserSignupEvent(TelemetryEvent):
     """Telemetry event for user signup."""
     email: Optional[str] = None
@@ -363,7 +371,7 @@ class UserSignupEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "email": self.email,
             "signup_source": self.signup_source,
@@ -375,7 +383,7 @@ class UserSignupEvent(TelemetryEvent):
         return base
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UserLoginEvent(TelemetryEvent):
     """Telemetry event for user login."""
     login_method: Optional[str] = None  # email, oauth, api_key, etc.
@@ -386,7 +394,7 @@ class UserLoginEvent(TelemetryEvent):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        base = super().to_dict()
+        base = TelemetryEvent.to_dict(self)
         base.update({
             "login_method": self.login_method,
         })
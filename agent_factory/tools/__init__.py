@@ -4,10 +4,14 @@ Tool interface, registry, and decorators.
 
 from agent_factory.tools.base import Tool, ToolMetadata, ParameterSchema
 from agent_factory.tools.decorator import function_tool
+from agent_factory.tools.executor import ToolExecutor, ToolCallResult, get_tool_executor
 
 __all__ = [
     "Tool",
     "ToolMetadata",
     "ParameterSchema",
     "function_tool",
+    "ToolExecutor",
+    "ToolCallResult",
+    "get_tool_executor",
 ]
@@ -5,6 +5,7 @@ Tool base class - Core primitive for tools that agents can use.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Callable
+import asyncio
 import inspect
 
 from agent_factory.core.exceptions import ToolExecutionError, ToolValidationError
@@ -136,7 +137,29 @@ class Tool(ABC):
         try:
             return self._implementation(**kwargs)
         except Exception as e:
-            raise ToolExecutionError(f"Tool {self.id} execution failed: {str(e)}")
+            raise ToolExecutionError(f"Tool {self.id} execution failed: {str(e)}") from e
+    
+    async def aexecute(self, **kwargs) -> Any:
+        """
+        Execute the tool without blocking the event loop.
+        
+        Coroutine implementations are awaited directly; blocking ones run in
+        a worker thread.
+        
+        Args:
+            **kwargs: Tool parameters
+        
+        Returns:
+            Tool execution result
+        """
+        if not inspect.iscoroutinefunction(self._implementation):
+            return await asyncio.to_thread(self.execute, **kwargs)
+        
+        self.validate(**kwargs)
+        try:
+            return await self._implementation(**kwargs)
+        except Exception as e:
+            raise ToolExecutionError(f"Tool {self.id} execution failed: {str(e)}") from e
     
     def __call__(self, *args, **kwargs) -> Any:
         """
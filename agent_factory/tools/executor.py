@@ -0,0 +1,290 @@
+"""
+Concurrent tool-call execution.
+
+Runs the tool calls requested in one model turn side by side on a bounded
+thread pool (sync) or event loop (async), with a timeout per call and errors
+isolated per call, so one slow or failing tool does not hold up or break the
+others. Transient tool errors are retried within the call's timeout.
+Calls run in the caller's context, so a cancelled run stops its tool calls.
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from agent_factory.core.exceptions import ExecutionCancelledError
+from agent_factory.runtime.cancellation import await_cancellable, current_token
+from agent_factory.runtime.retry import RetryPolicy, acall_with_retry, call_with_retry
+from agent_factory.tools.base import Tool
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of a single tool call."""
+    id: str
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    output: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    duration: float = 0.0
+    
+    @property
+    def success(self) -> bool:
+        """Whether the call returned a result."""
+        return self.error is None
+    
+    def content(self) -> str:
+        """Result text to feed back to the model."""
+        if self.error is not None:
+            return f"Error: {self.error}"
+        if isinstance(self.output, str):
+            return self.output
+        try:
+            return json.dumps(self.output, default=str)
+        except (TypeError, ValueError):
+            return str(self.output)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize result to dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "arguments": self.arguments,
+            "output": self.content(),
+            "error": self.error,
+            "timed_out": self.timed_out,
+            "duration": self.duration,
+        }
+
+
+class ToolExecutor:
+    """
+    Executes batches of tool calls concurrently.
+    
+    Sync and async callers share one bounded thread pool, so the total number
+    of blocking tool calls in flight stays capped. A timed-out call is reported
+    as an error immediately; a blocking implementation cannot be interrupted and
+    finishes in the background.
+    
+    Example:
+        >>> executor = get_tool_executor()
+        >>> results = executor.execute(
+        ...     [{"id": "1", "name": "web_search", "arguments": '{"query": "a"}'},
+        ...      {"id": "2", "name": "web_search", "arguments": '{"query": "b"}'}],
+        ...     tools=[web_search],
+        ...     timeout=10,
+        ... )
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 8,
+        default_timeout: float = 30.0,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        Initialize tool executor.
+        
+        Args:
+            max_workers: Maximum tool calls running at once
+            default_timeout: Per-call timeout in seconds, including retries
+            retry_policy: Retries for transient tool errors
+        """
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=2, base_delay=0.2)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tool-call")
+    
+    def execute(
+        self,
+        calls: List[Dict[str, Any]],
+        tools: List[Tool],
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallResult]:
+        """
+        Execute tool calls concurrently on the thread pool.
+        
+        Args:
+            calls: Tool calls with ``id``, ``name`` and ``arguments`` (dict or JSON string)
+            tools: Tools available to the agent
+            timeout: Per-call timeout in seconds (default: executor default)
+        
+        Returns:
+            Results in the same order as ``calls``
+        
+        Raises:
+            ExecutionCancelledError: If the current run is cancelled while waiting
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        tool_map = {tool.id: tool for tool in tools}
+        
+        prepared = [self._prepare(call, tool_map) for call in calls]
+        futures = {}
+        for index, (result, tool) in enumerate(prepared):
+            if tool is not None:
+                deadline = time.monotonic() + timeout
+                run = functools.partial(
+                    contextvars.copy_context().run, self._run, tool, result.arguments, deadline
+                )
+                futures[index] = (self._pool.submit(run), time.time())
+        
+        # Resolved when the run is cancelled, to stop waiting on the calls
+        token = current_token()
+        cancelled: Future = Future()
+        remove = token.add_callback(lambda: cancelled.set_result(None)) if token else None
+        
+        results = []
+        try:
+            for index, (result, tool) in enumerate(prepared):
+                if index in futures:
+                    future, started = futures[index]
+                    # Each call gets its own deadline measured from submission
+                    remaining = max(0.0, started + timeout - time.time())
+                    wait([future, cancelled], timeout=remaining, return_when=FIRST_COMPLETED)
+                    if cancelled.done():
+                        raise ExecutionCancelledError(token.reason or "Cancelled")
+                    if not future.done():
+                        result.error = f"Tool {tool.id} timed out after {timeout}s"
+                        result.timed_out = True
+                    elif future.exception() is not None:
+                        result.error = str(future.exception())
+                    else:
+                        result.output = future.result()
+                    result.duration = time.time() - started
+                results.append(result)
+        finally:
+            if remove:
+                remove()
+        return results
+    
+    async def aexecute(
+        self,
+        calls: List[Dict[str, Any]],
+        tools: List[Tool],
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallResult]:
+        """
+        Execute tool calls concurrently on the event loop.
+        
+        Coroutine tools are awaited directly (and cancelled on timeout);
+        blocking tools run on the shared thread pool.
+        
+        Args:
+            calls: Tool calls with ``id``, ``name`` and ``arguments`` (dict or JSON string)
+            tools: Tools available to the agent
+            timeout: Per-call timeout in seconds (default: executor default)
+        
+        Returns:
+            Results in the same order as ``calls``
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        tool_map = {tool.id: tool for tool in tools}
+        loop = asyncio.get_running_loop()
+        
+        async def run_one(result: ToolCallResult, tool: Optional[Tool]) -> ToolCallResult:
+            if tool is None:
+                return result
+            started = time.time()
+            deadline = time.monotonic() + timeout
+            try:
+                if asyncio.iscoroutinefunction(getattr(tool, "_implementation", None)):
+                    awaitable = acall_with_retry(
+                        lambda: tool.aexecute(**result.arguments),
+                        self.retry_policy,
+                        operation="tool",
+                        deadline=deadline,
+                    )
+                else:
+                    run = functools.partial(
+                        contextvars.copy_context().run, self._run, tool, result.arguments, deadline
+                    )
+                    awaitable = loop.run_in_executor(self._pool, run)
+                result.output = await await_cancellable(awaitable, timeout=timeout)
+            except asyncio.TimeoutError:
+                result.error = f"Tool {tool.id} timed out after {timeout}s"
+                result.timed_out = True
+            except ExecutionCancelledError:
+                raise
+            except Exception as e:
+                result.error = str(e)
+            result.duration = time.time() - started
+            return result
+        
+        prepared = (self._prepare(call, tool_map) for call in calls)
+        return list(await asyncio.gather(*(run_one(result, tool) for result, tool in prepared)))
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool."""
+        self._pool.shutdown(wait=wait)
+    
+    def _run(self, tool: Tool, arguments: Dict[str, Any], deadline: float) -> Any:
+        """Run a tool in a worker thread, retrying transient errors until the deadline."""
+        return call_with_retry(
+            lambda: tool.execute(**arguments),
+            self.retry_policy,
+            operation="tool",
+            deadline=deadline,
+        )
+    
+    @staticmethod
+    def _prepare(
+        call: Dict[str, Any],
+        tool_map: Dict[str, Tool],
+    ) -> Tuple[ToolCallResult, Optional[Tool]]:
+        """Parse a tool call; unknown tools and bad arguments fail just that call."""
+        result = ToolCallResult(id=call.get("id", ""), name=call.get("name", ""))
+        
+        arguments = call.get("arguments", call.get("input", {})) or {}
+        if isinstance(arguments, str):
+            try:
+                arguments = json.loads(arguments) if arguments.strip() else {}
+            except json.JSONDecodeError as e:
+                result.error = f"Invalid arguments for tool {result.name}: {e}"
+                return result, None
+        if not isinstance(arguments, dict):
+            result.error = f"Invalid arguments for tool {result.name}: expected an object"
+            return result, None
+        result.arguments = arguments
+        
+        tool = tool_map.get(result.name)
+        if tool is None:
+            result.error = f"Unknown tool: {result.name}"
+        return result, tool
+
+
+# Global tool executor
+_executor: Optional[ToolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """
+    Get global tool executor.
+    
+    Pool size, default timeout and retries come from
+    ``TOOL_EXECUTOR_MAX_WORKERS``, ``TOOL_CALL_TIMEOUT`` and ``TOOL_CALL_RETRIES``.
+    
+    Returns:
+        Tool executor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ToolExecutor(
+                    max_workers=int(os.getenv("TOOL_EXECUTOR_MAX_WORKERS", "8")),
+                    default_timeout=float(os.getenv("TOOL_CALL_TIMEOUT", "30")),
+                    retry_policy=RetryPolicy(
+                        max_retries=int(os.getenv("TOOL_CALL_RETRIES", "2")),
+                        base_delay=0.2,
+                    ),
+                )
+    return _executor
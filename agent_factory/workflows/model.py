@@ -6,6 +6,20 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
 
+from agent_factory.core.exceptions import (
+    DeadlineExceededError,
+    ExecutionCancelledError,
+    WorkflowExecutionError,
+)
+from agent_factory.runtime.cancellation import (
+    CancellationToken,
+    check_cancelled,
+    current_token,
+    use_token,
+)
+from agent_factory.runtime.profiling import StageTimer, stage, use_timer
+from agent_factory.runtime.retry import RetryPolicy, acall_with_retry, call_with_retry
+
 
 class TriggerType(str, Enum):
     """Types of workflow triggers."""
@@ -38,8 +52,8 @@ class WorkflowStep:
     input_mapping: Dict[str, str] = field(default_factory=dict)  # Maps workflow vars to agent inputs
     output_mapping: Dict[str, str] = field(default_factory=dict)  # Maps agent outputs to workflow vars
     condition: Optional[Condition] = None
-    timeout: int = 30  # seconds
-    retry_attempts: int = 3
+    timeout: int = 30  # seconds, deadline for the step including retries
+    retry_attempts: int = 3  # Retries when the agent fails with a transient error
 
 
 @dataclass
@@ -118,7 +132,18 @@ class Workflow:
             
         Returns:
             WorkflowResult with execution results
+        
+        Raises:
+            ExecutionCancelledError: If the current run is cancelled; remaining
+                steps are not started
         """
+        timer = StageTimer("workflow", self.id)
+        with use_timer(timer):
+            result = self._execute(context, start_step)
+        return self._finish_timing(result, timer)
+    
+    def _execute(self, context: Dict[str, Any], start_step: Optional[str]) -> WorkflowResult:
+        """Run the steps of ``execute``."""
         import time
         start_time = time.time()
         
@@ -126,16 +151,10 @@ class Workflow:
             workflow_context = context.copy()
             steps_executed = []
             
-            # Determine starting step
-            start_index = 0
-            if start_step:
-                for i, step in enumerate(self.steps):
-                    if step.id == start_step:
-                        start_index = i
-                        break
-            
             # Execute steps sequentially
-            for i, step in enumerate(self.steps[start_index:], start=start_index):
+            for step in self.steps[self._start_index(start_step):]:
+                check_cancelled()
+                
                 # Check condition if present
                 if step.condition:
                     if not self._evaluate_condition(step.condition, workflow_context):
@@ -153,21 +172,14 @@ class Workflow:
                 agent_input = self._map_inputs(step.input_mapping, workflow_context)
                 
                 # Execute agent
-                agent_result = agent.run(agent_input)
-                
-                if agent_result.status.value == "error":
-                    return WorkflowResult(
-                        success=False,
-                        error=f"Step {step.id} failed: {agent_result.error}",
-                        steps_executed=steps_executed,
-                    )
-                
-                # Map outputs
-                step_output = self._map_outputs(step.output_mapping, agent_result.output)
-                workflow_context.update(step_output)
-                workflow_context[f"steps.{step.id}.output"] = agent_result.output
+                with stage("step", detail=step.id):
+                    agent_result = self._run_step(step, agent, agent_input)
                 
-                steps_executed.append(step.id)
+                failure = self._apply_step_result(
+                    step, agent_result, workflow_context, steps_executed
+                )
+                if failure:
+                    return failure
                 
                 # Check branching
                 if step.id in self.branching:
@@ -184,6 +196,8 @@ class Workflow:
                 execution_time=execution_time,
             )
             
+        except ExecutionCancelledError:
+            raise
         except Exception as e:
             return WorkflowResult(
                 success=False,
@@ -191,6 +205,195 @@ class Workflow:
                 steps_executed=steps_executed if 'steps_executed' in locals() else [],
             )
     
+    async def aexecute(
+        self,
+        context: Dict[str, Any],
+        start_step: Optional[str] = None,
+    ) -> WorkflowResult:
+        """
+        Execute the workflow asynchronously.
+        
+        Same semantics as ``execute``, but each step awaits ``Agent.arun`` so
+        the workflow does not hold a thread while steps wait on the model.
+        
+        Args:
+            context: Initial context dictionary
+            start_step: Optional step ID to start from
+        
+        Returns:
+            WorkflowResult with execution results
+        
+        Raises:
+            ExecutionCancelledError: If the current run is cancelled
+        """
+        timer = StageTimer("workflow", self.id)
+        with use_timer(timer):
+            result = await self._aexecute(context, start_step)
+        return self._finish_timing(result, timer)
+    
+    async def _aexecute(self, context: Dict[str, Any], start_step: Optional[str]) -> WorkflowResult:
+        """Run the steps of ``aexecute``."""
+        import time
+        start_time = time.time()
+        workflow_context = context.copy()
+        steps_executed: List[str] = []
+        
+        try:
+            for step in self.steps[self._start_index(start_step):]:
+                check_cancelled()
+                
+                if step.condition:
+                    if not self._evaluate_condition(step.condition, workflow_context):
+                        continue
+                
+                agent = self.agents_registry.get(step.agent_id)
+                if not agent:
+                    return WorkflowResult(
+                        success=False,
+                        error=f"Agent not found: {step.agent_id}",
+                    )
+                
+                agent_input = self._map_inputs(step.input_mapping, workflow_context)
+                
+                with stage("step", detail=step.id):
+                    agent_result = await self._arun_step(step, agent, agent_input)
+                
+                failure = self._apply_step_result(
+                    step, agent_result, workflow_context, steps_executed
+                )
+                if failure:
+                    return failure
+                
+                if step.id in self.branching:
+                    condition = self.branching[step.id]
+                    if not self._evaluate_condition(condition, workflow_context):
+                        break
+            
+            return WorkflowResult(
+                success=True,
+                output=workflow_context,
+                steps_executed=steps_executed,
+                execution_time=time.time() - start_time,
+            )
+        
+        except ExecutionCancelledError:
+            raise
+        except Exception as e:
+            return WorkflowResult(
+                success=False,
+                error=str(e),
+                steps_executed=steps_executed,
+            )
+    
+    @staticmethod
+    def _finish_timing(result: WorkflowResult, timer: StageTimer) -> WorkflowResult:
+        """Add a timed run's step spans to the result and export them."""
+        if timer.enabled:
+            result.metadata["stages"] = timer.spans
+            timer.export()
+        return result
+    
+    def _run_step(self, step: WorkflowStep, agent: Any, agent_input: str) -> Any:
+        """
+        Run a step's agent, retrying transient failures within the step timeout.
+        
+        The step's token bounds the agent's blocking completion calls by the
+        step deadline, and an attempt that returns after it counts as timed
+        out, like a cancelled attempt on the async path.
+        
+        Returns:
+            The agent result of the last attempt
+        
+        Raises:
+            WorkflowExecutionError: If the step timed out
+        """
+        token = CancellationToken(timeout=step.timeout or None, parent=current_token())
+        
+        def attempt() -> Any:
+            agent_result = agent.run(agent_input)
+            token.check()
+            return _check_retryable(agent_result)
+        
+        try:
+            with token, use_token(token):
+                return call_with_retry(attempt, self._step_policy(step), operation="workflow_step")
+        except _RetryableStepFailure as e:
+            return e.agent_result
+        except DeadlineExceededError as e:
+            _raise_if_run_expired()
+            raise WorkflowExecutionError(f"Step {step.id} timed out after {step.timeout}s") from e
+    
+    async def _arun_step(self, step: WorkflowStep, agent: Any, agent_input: str) -> Any:
+        """
+        Run a step's agent asynchronously; the step timeout cancels the attempt.
+        
+        Returns:
+            The agent result of the last attempt
+        
+        Raises:
+            WorkflowExecutionError: If the step timed out
+        """
+        import asyncio
+        
+        async def attempt() -> Any:
+            # Registries may hold agent-like objects without an async path
+            if hasattr(agent, "arun"):
+                agent_result = await agent.arun(agent_input)
+            else:
+                agent_result = await asyncio.to_thread(agent.run, agent_input)
+            return _check_retryable(agent_result)
+        
+        try:
+            return await acall_with_retry(
+                attempt, self._step_policy(step), operation="workflow_step"
+            )
+        except _RetryableStepFailure as e:
+            return e.agent_result
+        except DeadlineExceededError as e:
+            _raise_if_run_expired()
+            raise WorkflowExecutionError(f"Step {step.id} timed out after {step.timeout}s") from e
+    
+    @staticmethod
+    def _step_policy(step: WorkflowStep) -> RetryPolicy:
+        """Retry policy from a step's timeout and retry settings."""
+        return RetryPolicy(max_retries=step.retry_attempts, timeout=step.timeout or None)
+    
+    def _start_index(self, start_step: Optional[str]) -> int:
+        """Index of the step to start from (0 if not given or not found)."""
+        if start_step:
+            for i, step in enumerate(self.steps):
+                if step.id == start_step:
+                    return i
+        return 0
+    
+    def _apply_step_result(
+        self,
+        step: WorkflowStep,
+        agent_result: Any,
+        workflow_context: Dict[str, Any],
+        steps_executed: List[str],
+    ) -> Optional[WorkflowResult]:
+        """
+        Fold a step's agent result into the workflow context.
+        
+        Returns:
+            A failed WorkflowResult if the step errored, otherwise None
+        """
+        if agent_result.status.value == "error":
+            return WorkflowResult(
+                success=False,
+                error=f"Step {step.id} failed: {agent_result.error}",
+                steps_executed=steps_executed,
+            )
+        
+        # Map outputs
+        step_output = self._map_outputs(step.output_mapping, agent_result.output)
+        workflow_context.update(step_output)
+        workflow_context[f"steps.{step.id}.output"] = agent_result.output
+        
+        steps_executed.append(step.id)
+        return None
+    
     def _map_inputs(self, mapping: Dict[str, str], context: Dict[str, Any]) -> str:
         """Map workflow context to agent input."""
         if not mapping:
@@ -362,3 +565,28 @@ class Workflow:
                 for k, v in self.branching.items()
             },
         }
+
+
+class _RetryableStepFailure(Exception):
+    """Carries an agent result that failed with a transient error."""
+    retryable = True
+    
+    def __init__(self, agent_result: Any):
+        super().__init__(agent_result.error)
+        self.agent_result = agent_result
+
+
+def _raise_if_run_expired() -> None:
+    """Report the run's own deadline rather than a step timeout."""
+    token = current_token()
+    if token is not None and token.expired:
+        token.check()
+
+
+def _check_retryable(agent_result: Any) -> Any:
+    """Raise for failed agent results flagged as retryable, else return the result."""
+    metadata = getattr(agent_result, "metadata", None)
+    retryable = isinstance(metadata, dict) and metadata.get("retryable")
+    if agent_result.status.value == "error" and retryable:
+        raise _RetryableStepFailure(agent_result)
+    return agent_result
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Record memory benchmark.
+
+Measures bytes per record for the high-volume record types, comparing the
+slotted dataclasses with the plain dataclasses they replaced (rebuilt here
+with the same fields), and SLA measurements held as objects with the
+columnar ``SLIMeasurementSeries``.
+
+Field values are shared between records, so the numbers are the per-record
+overhead of the representation itself (plus per-record default factories
+such as ``metadata`` dicts, which both versions create).
+
+Usage:
+    python scripts/benchmark_record_memory.py [--count 100000]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_factory.financial.cost_tracker import CostRecord, CostType  # noqa: E402
+from agent_factory.operations.sla_monitor import SLIMeasurement, SLIMeasurementSeries  # noqa: E402
+from agent_factory.promptlog.model import Run  # noqa: E402
+from agent_factory.runtime.engine import Execution  # noqa: E402
+from agent_factory.runtime.jobs import Job, JobType  # noqa: E402
+from agent_factory.runtime.memory import Interaction  # noqa: E402
+from agent_factory.telemetry.model import AgentRunEvent  # noqa: E402
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Record type and the keyword arguments of a representative record
+RECORDS = [
+    (Execution, {
+        "id": "0b7d9c1e-3f1a-4c55-9a57-0d5f0f3f2a11", "type": "agent", "entity_id": "support-agent",
+        "status": "completed", "created_at": NOW, "completed_at": NOW, "metadata": {},
+    }),
+    (Job, {
+        "job_id": "job-123", "job_type": JobType.AGENT_RUN, "resource_id": "support-agent",
+        "input_data": {}, "tenant_id": "tenant-1", "created_at": NOW,
+    }),
+    (AgentRunEvent, {
+        "event_id": "evt-123", "agent_id": "support-agent", "tenant_id": "tenant-1",
+        "timestamp": NOW, "execution_time": 1.25, "tokens_used": 512,
+    }),
+    (Interaction, {
+        "session_id": "session-1", "input_text": "hello", "output_text": "hi", "timestamp": NOW,
+        "metadata": {},
+    }),
+    (CostRecord, {
+        "id": "cost-123", "timestamp": NOW, "cost_type": CostType.LLM_API,
+        "amount": Decimal("0.05"), "entity_type": "agent", "entity_id": "support-agent",
+    }),
+    (SLIMeasurement, {"sli_id": "api_latency", "timestamp": NOW, "value": 0.25}),
+    (Run, {"run_id": "run-123", "agent_id": "support-agent", "timestamp": NOW}),
+]
+
+
+def plain_clone(cls):
+    """The same dataclass without slots, as it was before."""
+    specs = [
+        (f.name, f.type, field(default=f.default, default_factory=f.default_factory))
+        for f in fields(cls)
+    ]
+    return make_dataclass(f"Plain{cls.__name__}", specs, kw_only=True)
+
+
+def bytes_per_record(build, count):
+    """Traced allocation per record for ``count`` records made by ``build``."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [build() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Exclude the list holding the records
+    per_record = (after - before - sys.getsizeof(records)) / count
+    del records
+    return per_record
+
+
+def series_bytes_per_record(count):
+    """Traced allocation per measurement in a columnar series."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    series = SLIMeasurementSeries("api_latency")
+    for _ in range(count):
+        series.append(NOW, 0.25)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del series
+    return (after - before) / count
+
+
+def main():
+    """Print bytes per record before and after."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=100000, help="Records per measurement")
+    args = parser.parse_args()
+    
+    print(f"{'Record':<32}{'before':>10}{'after':>10}{'saved':>8}")
+    print("-" * 60)
+    for cls, kwargs in RECORDS:
+        plain = plain_clone(cls)
+        before = bytes_per_record(lambda: plain(**kwargs), args.count)
+        after = bytes_per_record(lambda: cls(**kwargs), args.count)
+        print(f"{cls.__name__:<32}{before:>10.0f}{after:>10.0f}{1 - after / before:>8.0%}")
+    
+    plain = plain_clone(SLIMeasurement)
+    kwargs = dict(RECORDS[-2][1])
+    before = bytes_per_record(lambda: plain(**kwargs), args.count)
+    after = series_bytes_per_record(args.count)
+    name = "SLIMeasurementSeries (columnar)"
+    print(f"{name:<32}{before:>10.0f}{after:>10.0f}{1 - after / before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
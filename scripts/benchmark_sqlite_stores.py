@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+SQLite store benchmark.
+
+Measures operations per second for the SQLite-backed stores with their
+``SQLiteConnectionManager`` (persistent per-thread connections, WAL, tuned
+pragmas, statement cache) against the previous behaviour of opening a
+default connection for every operation and closing it afterwards.
+
+Usage:
+    python scripts/benchmark_sqlite_stores.py [--ops 2000] [--dir /tmp]
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent_factory.promptlog.model import Run  # noqa: E402
+from agent_factory.promptlog.storage import SQLiteStorage  # noqa: E402
+from agent_factory.runtime.jobs import Job, JobType, SQLiteJobQueue  # noqa: E402
+from agent_factory.runtime.memory import SQLiteMemoryStore  # noqa: E402
+from agent_factory.runtime.sqlite import SQLiteConnectionManager  # noqa: E402
+from agent_factory.telemetry.backends.sqlite import SQLiteTelemetryBackend  # noqa: E402
+from agent_factory.telemetry.model import AgentRunEvent  # noqa: E402
+
+
+class ConnectPerOperation(SQLiteConnectionManager):
+    """The previous behaviour: a fresh, untuned connection for every operation."""
+    
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        # Back to the default rollback journal the stores used to run in
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+    
+    @contextmanager
+    def connection(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def workloads(directory):
+    """(name, store factory, operation) for each benchmarked store operation."""
+    run_ids = []
+    
+    def save_run(storage, i):
+        run_ids.append(f"run-{i}")
+        storage.save_run(
+            Run(run_id=run_ids[-1], agent_id="bench", inputs={"q": "hi"}, outputs={"a": "ok"})
+        )
+    
+    return [
+        ("promptlog save_run", lambda: SQLiteStorage(str(directory / "promptlog.db")), save_run),
+        ("promptlog get_run", lambda: SQLiteStorage(str(directory / "promptlog.db")),
+         lambda storage, i: storage.get_run(run_ids[i % len(run_ids)])),
+        ("memory save_interaction", lambda: SQLiteMemoryStore(str(directory / "memory.db")),
+         lambda memory, i: memory.save_interaction(f"s{i % 50}", "question", "answer")),
+        ("memory get_history", lambda: SQLiteMemoryStore(str(directory / "memory.db")),
+         lambda memory, i: memory.get_history(f"s{i % 50}", limit=10)),
+        ("telemetry store_event", lambda: SQLiteTelemetryBackend(str(directory / "telemetry.db")),
+         lambda backend, i: backend.store_event(
+             AgentRunEvent(event_id=str(uuid.uuid4()), agent_id="bench")
+         )),
+        ("jobs enqueue", lambda: SQLiteJobQueue(str(directory / "jobs.db")),
+         lambda queue, i: queue.enqueue(Job(job_id=str(uuid.uuid4()), job_type=JobType.AGENT_RUN,
+                                            resource_id="bench", input_data={}))),
+    ]
+
+
+def ops_per_second(store, operation, ops):
+    """Run ``operation`` ``ops`` times and return the rate."""
+    start = time.perf_counter()
+    for i in range(ops):
+        operation(store, i)
+    return ops / (time.perf_counter() - start)
+
+
+def main():
+    """Print ops/sec before and after for each store operation."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ops", type=int, default=2000, help="Operations per measurement")
+    parser.add_argument(
+        "--dir", default=None, help="Directory for the benchmark databases (default: temp)"
+    )
+    args = parser.parse_args()
+    
+    print(f"{'Operation':<28}{'before':>12}{'after':>12}{'speedup':>10}")
+    print("-" * 62)
+    with tempfile.TemporaryDirectory(dir=args.dir) as before_dir, \
+            tempfile.TemporaryDirectory(dir=args.dir) as after_dir:
+        pairs = zip(workloads(Path(before_dir)), workloads(Path(after_dir)))
+        for (name, factory, operation), (_, after_factory, after_operation) in pairs:
+            store = factory()
+            store._db.close()
+            store._db = ConnectPerOperation(store._db.db_path)
+            before = ops_per_second(store, operation, args.ops)
+            after = ops_per_second(after_factory(), after_operation, args.ops)
+            print(f"{name:<28}{before:>12,.0f}{after:>12,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -136,3 +136,55 @@ def test_agent_run_with_mocked_client(mock_client_class):
     assert result.output == "Mocked response"
     assert result.tokens_used == 0  # Not set in current implementation
     mock_client.run_agent.assert_called_once()
+
+
+@pytest.mark.unit
+@patch('agent_factory.integrations.openai_client.OpenAIAgentClient')
+def test_agent_arun_with_mocked_client(mock_client_class):
+    """Test agent.arun() awaits the async client path."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    
+    mock_client = Mock()
+    mock_client.arun_agent = AsyncMock(return_value={
+        "output": "Async response",
+        "tool_calls": [],
+        "tokens_used": 100,
+        "model": "gpt-4o",
+    })
+    mock_client_class.return_value = mock_client
+    
+    agent = Agent(
+        id="test-agent",
+        name="Test Agent",
+        instructions="You are a test agent.",
+    )
+    
+    result = asyncio.run(agent.arun("Test input"))
+    
+    assert result.status == AgentStatus.COMPLETED
+    assert result.output == "Async response"
+    mock_client.arun_agent.assert_awaited_once()
+    mock_client.run_agent.assert_not_called()
+
+
+@pytest.mark.unit
+def test_agent_arun_blocked_by_guardrails():
+    """Test agent.arun() applies async input guardrails."""
+    import asyncio
+    from agent_factory.core.guardrails import Guardrails, LengthGuardrail
+    
+    guardrails = Guardrails()
+    guardrails.add_input_guardrail(LengthGuardrail(max_length=5))
+    
+    agent = Agent(
+        id="test-agent",
+        name="Test Agent",
+        instructions="Test",
+        guardrails=guardrails,
+    )
+    
+    result = asyncio.run(agent.arun("This input is too long"))
+    
+    assert result.status == AgentStatus.ERROR
+    assert "Input blocked by guardrails" in result.error
@@ -0,0 +1,149 @@
+"""Tests for batch agent execution."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import AgentResult, AgentStatus
+from agent_factory.api.routes import agents as agent_routes
+from agent_factory.runtime.batch import AdaptiveConcurrencyLimiter
+from agent_factory.runtime.engine import RuntimeEngine
+from agent_factory.runtime.execution_store import ExecutionStore
+from agent_factory.runtime.retry import ErrorClassification, retry_observer
+
+
+def _agent(rate_limit_inputs=(), fail_inputs=()):
+    async def arun(input_text, session_id=None, context=None):
+        # Later inputs finish first, so completion order differs from input order
+        await asyncio.sleep(0.001 * (10 - int(input_text)))
+        if input_text in rate_limit_inputs:
+            retry_observer.get()(ErrorClassification(True, "rate_limited"))
+        if input_text in fail_inputs:
+            return AgentResult(output="", status=AgentStatus.ERROR, error="bad input")
+        return AgentResult(output=f"out-{input_text}", status=AgentStatus.COMPLETED, tokens_used=2)
+    
+    agent = Mock(id="batch", prompt_log_storage=None)
+    agent.name = "Batch"
+    agent.arun.side_effect = arun
+    return agent
+
+
+def _engine(agent):
+    engine = RuntimeEngine(prompt_log_storage=Mock(), execution_store=ExecutionStore())
+    engine.telemetry_collector = Mock()
+    engine.register_agent(agent)
+    return engine
+
+
+@pytest.mark.unit
+def test_limiter_halves_on_rate_limit_and_recovers():
+    """Test AIMD: multiplicative decrease once per cooldown, additive increase."""
+    limiter = AdaptiveConcurrencyLimiter(8, cooldown=60)
+    
+    limiter.on_rate_limited()
+    limiter.on_rate_limited()  # same burst, ignored
+    assert limiter.limit == 4
+    
+    async def cycle():
+        for _ in range(4):
+            await limiter.acquire()
+            limiter.release(success=True)
+    
+    asyncio.run(cycle())
+    assert 4 < limiter.limit <= 5
+
+
+@pytest.mark.unit
+def test_run_agent_batch_orders_and_captures_errors():
+    """Test ordered batches preserve input order and failures stay per item."""
+    engine = _engine(_agent(fail_inputs={"3"}))
+    seen = []
+    
+    result = engine.run_agent_batch("batch", [str(i) for i in range(6)], concurrency=3,
+                                    ordered=True, on_result=seen.append)
+    
+    assert [item.index for item in result.items] == list(range(6))
+    assert result.items[3].status == "error"
+    assert result.items[3].error == "bad input"
+    assert result.items[0].output == "out-0"
+    assert result.stats.completed == 5
+    assert result.stats.failed == 1
+    assert result.stats.tokens_used == 10
+    assert len(seen) == 6
+
+
+@pytest.mark.unit
+def test_batch_concurrency_adapts_to_rate_limits():
+    """Test 429s reported by runs lower the in-flight limit."""
+    agent = _agent(rate_limit_inputs={"0"})
+    engine = _engine(agent)
+    
+    result = engine.run_agent_batch("batch", [str(i) for i in range(8)], concurrency=4)
+    
+    assert result.stats.min_concurrency < 4
+    assert {item.index for item in result.items} == set(range(8))
+
+
+@pytest.mark.unit
+def test_run_batch_endpoint_streams_results():
+    """Test the run-batch endpoint emits a result per input then stats."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    
+    app = FastAPI()
+    app.include_router(agent_routes.router, prefix="/api/v1/agents")
+    agent = _agent(fail_inputs={"1"})
+    engine = _engine(agent)
+    
+    with patch.object(agent_routes.registry, "get_agent", return_value=agent), \
+            patch.object(agent_routes, "runtime", engine):
+        response = TestClient(app).post(
+            "/api/v1/agents/batch/run-batch",
+            json={"inputs": ["0", "1", "2"], "ordered": True},
+        )
+    
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    names = [lines[0].split(": ", 1)[1] for lines in events]
+    payloads = [json.loads(lines[1].split(": ", 1)[1]) for lines in events]
+    assert names == ["result", "result", "result", "done"]
+    assert [p["index"] for p in payloads[:3]] == [0, 1, 2]
+    assert payloads[1]["error"] == "bad input"
+    assert payloads[-1]["completed"] == 2
+    assert payloads[-1]["failed"] == 1
+
+
+@pytest.mark.unit
+def test_batch_reports_cancelled_items():
+    """Test an item whose run is cancelled is still reported instead of hanging the batch."""
+    agent = _agent()
+    arun = agent.arun.side_effect
+    
+    async def cancelled_on_two(input_text, session_id=None, context=None):
+        if input_text == "2":
+            raise asyncio.CancelledError()
+        return await arun(input_text, session_id, context)
+    
+    agent.arun.side_effect = cancelled_on_two
+    engine = _engine(agent)
+    
+    async def collect():
+        return [item async for item in engine.arun_agent_batch("batch", ["0", "1", "2", "3"])]
+    
+    items = asyncio.run(asyncio.wait_for(collect(), 2))
+    
+    assert {item.index for item in items} == {0, 1, 2, 3}
+    assert next(item for item in items if item.index == 2).status == "error"
+
+
+@pytest.mark.unit
+def test_batch_surfaces_producer_failure():
+    """Test a failure while scheduling inputs is raised to the consumer."""
+    engine = _engine(_agent())
+    
+    async def collect():
+        return [item async for item in engine.arun_agent_batch("batch", ["0", "1"])]
+    
+    with patch.object(AdaptiveConcurrencyLimiter, "acquire", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(asyncio.wait_for(collect(), 2))
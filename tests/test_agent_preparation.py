@@ -0,0 +1,91 @@
+"""Tests for concurrent pre-LLM preparation in agent runs."""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentStatus
+
+
+def _pack(pack_id, retrieve):
+    pack = Mock(id=pack_id, retriever_config=Mock(top_k=2))
+    pack.retriever.retrieve.side_effect = retrieve
+    return pack
+
+
+def _guardrails(allowed=True):
+    guardrails = Mock()
+    guardrails.validate_input.return_value = Mock(allowed=allowed, reason="blocked")
+    guardrails.validate_output.return_value = Mock(allowed=True)
+    return guardrails
+
+
+@pytest.mark.unit
+def test_memory_and_packs_load_concurrently():
+    """Test memory and every pack are in flight at once, with results in pack order."""
+    barrier = threading.Barrier(3, timeout=2)
+    
+    def retrieve(text):
+        return lambda query, top_k: (barrier.wait(), [{"text": text, "score": 1.0}])[1]
+    
+    memory = Mock()
+    memory.get_context.side_effect = lambda session_id, turns: (barrier.wait(), {"history": []})[1]
+    agent = Agent(id="rag", name="RAG", instructions="Test", memory=memory,
+                  knowledge_packs=[_pack("a", retrieve("alpha")), _pack("b", retrieve("beta"))])
+    
+    def build_context(context, memory_context, knowledge):
+        return {"knowledge": knowledge}
+    
+    with patch.object(Agent, "_build_context", side_effect=build_context) as build, \
+            patch.object(Agent, "_execute_agent", return_value="done"):
+        result = agent.run("question", session_id="s1")
+    
+    assert result.status == AgentStatus.COMPLETED
+    memory_context, knowledge = build.call_args[0][1:]
+    assert memory_context == {"history": []}
+    assert [chunk["source"] for chunk in knowledge] == ["a", "b"]
+
+
+@pytest.mark.unit
+def test_blocked_input_discards_loads():
+    """Test loads started beside the guardrails are dropped when input is blocked."""
+    memory = Mock()
+    memory.get_context.return_value = {}
+    agent = Agent(id="guarded", name="Guarded", instructions="Test", memory=memory,
+                  guardrails=_guardrails(allowed=False))
+    
+    with patch.object(Agent, "_execute_agent") as execute:
+        result = agent.run("bad input", session_id="s1")
+    
+    assert result.status == AgentStatus.ERROR
+    assert "blocked" in result.error
+    execute.assert_not_called()
+    memory.save_interaction.assert_not_called()
+
+
+@pytest.mark.unit
+def test_async_preparation_overlaps_stages():
+    """Test async runs await memory and retrieval together."""
+    memory = Mock()
+    
+    async def aget_context(session_id, turns):
+        await asyncio.sleep(0.3)
+        return {}
+    
+    memory.aget_context.side_effect = aget_context
+    memory.asave_interaction = AsyncMock()
+    pack = _pack("a", lambda query, top_k: (time.sleep(0.3), ["chunk"])[1])
+    agent = Agent(id="rag", name="RAG", instructions="Test", memory=memory, knowledge_packs=[pack])
+    
+    async def run():
+        with patch.object(Agent, "_aexecute_agent", return_value="done"):
+            start = time.monotonic()
+            result = await agent.arun("question", session_id="s1")
+            return result, time.monotonic() - start
+    
+    result, elapsed = asyncio.run(run())
+    
+    assert result.status == AgentStatus.COMPLETED
+    assert elapsed < 0.55
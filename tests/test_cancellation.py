@@ -0,0 +1,194 @@
+"""Tests for cooperative cancellation and run deadlines."""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from agent_factory.agents.agent import AgentResult, AgentStatus
+from agent_factory.core.exceptions import ExecutionCancelledError
+from agent_factory.runtime.cancellation import (
+    CancellationToken,
+    await_cancellable,
+    current_token,
+    use_token,
+)
+from agent_factory.runtime.engine import RuntimeEngine
+from agent_factory.runtime.execution_store import ExecutionStore
+from agent_factory.runtime.retry import RetryPolicy, call_with_retry
+from agent_factory.services.execution_service import ExecutionService
+from agent_factory.workflows.model import Workflow, WorkflowStep
+
+
+def _engine():
+    engine = RuntimeEngine(prompt_log_storage=Mock(), execution_store=ExecutionStore())
+    engine.telemetry_collector = Mock()
+    return engine
+
+
+def _agent(agent_id="agent"):
+    agent = Mock(id=agent_id, prompt_log_storage=None)
+    agent.name = agent_id
+    return agent
+
+
+@pytest.mark.unit
+def test_await_cancellable_aborts_from_another_thread():
+    """Test cancelling a token interrupts the awaited call immediately."""
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel, args=("stop",)).start()
+    
+    start = time.monotonic()
+    with pytest.raises(ExecutionCancelledError, match="stop"):
+        asyncio.run(await_cancellable(asyncio.sleep(10), token))
+    assert time.monotonic() - start < 2
+
+
+@pytest.mark.unit
+def test_call_with_retry_stops_retrying_when_cancelled():
+    """Test a cancelled run does not retry or sleep through its backoff."""
+    token = CancellationToken()
+    calls = []
+    
+    def flaky():
+        calls.append(1)
+        token.cancel()
+        raise ConnectionError("reset")
+    
+    with use_token(token), pytest.raises(ExecutionCancelledError):
+        call_with_retry(flaky, RetryPolicy(max_retries=5, base_delay=10))
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_async_completion_passes_run_deadline():
+    """Test async provider calls get the run's remaining time as their HTTP timeout."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    create = AsyncMock(return_value=Mock(
+        choices=[Mock(message=Mock(content="ok", tool_calls=None))],
+        usage=Mock(total_tokens=1),
+    ))
+    
+    async def run():
+        with use_token(CancellationToken(timeout=5)):
+            await client.arun_agent("Assist", "hi")
+    
+    breaker = Mock(acall=lambda func, **kwargs: func(**kwargs))
+    async_client = Mock(chat=Mock(completions=Mock(create=create)))
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(OpenAIAgentClient, "async_client", async_client):
+        asyncio.run(run())
+    
+    assert 0 < create.call_args[1]["timeout"] <= 5
+
+
+@pytest.mark.unit
+def test_cancelled_workflow_skips_remaining_steps():
+    """Test cancelling mid-workflow stops before the next step."""
+    engine = _engine()
+    first, second = _agent("first"), _agent("second")
+    
+    def cancel_run(input_text):
+        current_token().cancel("Cancelled by user")
+        return AgentResult(output="one", status=AgentStatus.COMPLETED)
+    
+    first.run.side_effect = cancel_run
+    engine.register_agent(first)
+    engine.register_agent(second)
+    workflow = Workflow(id="wf", name="Workflow", steps=[
+        WorkflowStep(id="s1", agent_id="first"),
+        WorkflowStep(id="s2", agent_id="second"),
+    ])
+    engine.register_workflow(workflow)
+    
+    with pytest.raises(ExecutionCancelledError):
+        engine.run_workflow("wf", {})
+    
+    second.run.assert_not_called()
+    execution = engine.list_executions()[0]
+    assert execution.status == "cancelled"
+
+
+@pytest.mark.unit
+def test_cancel_execution_aborts_async_run():
+    """Test the service cancels an in-flight run and frees it right away."""
+    engine = _engine()
+    agent = _agent()
+    
+    async def slow(input_text, session_id=None, context=None):
+        await asyncio.sleep(10)
+    
+    agent.arun.side_effect = slow
+    engine.register_agent(agent)
+    service = ExecutionService(engine)
+    
+    async def run_and_cancel():
+        task = asyncio.create_task(engine.arun_agent("agent", "hi"))
+        while not engine.list_executions(status="running"):
+            await asyncio.sleep(0.01)
+        execution_id = engine.list_executions()[0].id
+        # Cancel from another thread, as an API request would
+        assert await asyncio.to_thread(service.cancel_execution, execution_id)
+        with pytest.raises(ExecutionCancelledError):
+            await asyncio.wait_for(task, timeout=2)
+        return execution_id
+    
+    execution_id = asyncio.run(run_and_cancel())
+    
+    assert engine.get_execution(execution_id).status == "cancelled"
+    assert service.cancel_execution(execution_id) is False
+    assert service.cancel_execution("missing") is False
+
+
+@pytest.mark.unit
+def test_run_timeout_bounds_workflow():
+    """Test the run deadline is reported instead of a step timeout."""
+    engine = _engine()
+    agent = _agent()
+    
+    def slow(input_text):
+        time.sleep(0.2)
+        return AgentResult(output="late", status=AgentStatus.COMPLETED)
+    
+    agent.run.side_effect = slow
+    engine.register_agent(agent)
+    workflow = Workflow(id="wf", name="Workflow", steps=[
+        WorkflowStep(id="s1", agent_id="agent"),
+        WorkflowStep(id="s2", agent_id="agent"),
+    ])
+    engine.register_workflow(workflow)
+    
+    execution = engine.get_execution(engine.run_workflow("wf", {}, timeout=0.1))
+    
+    assert agent.run.call_count == 1
+    assert execution.result.success is False
+    assert "deadline" in execution.result.error
+
+
+@pytest.mark.unit
+def test_finished_child_tokens_detach_from_parent():
+    """Test child tokens stop being held by a long-lived parent once their run ends."""
+    parent = CancellationToken()
+    with CancellationToken(timeout=5, parent=parent) as child:
+        assert len(parent._callbacks) == 1
+    assert parent._callbacks == []
+    
+    engine = _engine()
+    agent = _agent("agent")
+    agent.run.return_value = AgentResult(output="ok", status=AgentStatus.COMPLETED)
+    engine.register_agent(agent)
+    engine.register_workflow(Workflow(id="wf", name="Workflow", steps=[
+        WorkflowStep(id="s1", agent_id="agent", timeout=5),
+    ]))
+    
+    with use_token(parent):
+        for _ in range(3):
+            engine.run_agent("agent", "hi")
+            engine.run_workflow("wf", {})
+    
+    assert parent._callbacks == []
+    parent.cancel()
+    assert not child.cancelled
@@ -0,0 +1,97 @@
+"""Tests for the shared provider client pool."""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import patch
+
+from agent_factory.integrations.client_pool import ProviderClientPool, ProviderPoolConfig
+
+
+@pytest.mark.unit
+def test_pool_reuses_sync_client():
+    """Test the same provider and key share one client."""
+    pool = ProviderClientPool()
+    
+    first = pool.get_client("openai", "test-key")
+    second = pool.get_client("openai", "test-key")
+    other = pool.get_client("openai", "other-key")
+    
+    assert first is second
+    assert first is not other
+    assert pool.stats()["sync_clients"] == 2
+    pool.close()
+    assert pool.stats()["sync_clients"] == 0
+
+
+@pytest.mark.unit
+def test_pool_applies_connection_limits():
+    """Test configured limits reach the underlying HTTP client."""
+    pool = ProviderClientPool({
+        "anthropic": ProviderPoolConfig(max_connections=7, max_keepalive_connections=3),
+    })
+    
+    pool.get_client("anthropic", "test-key")
+    
+    assert pool.stats()["providers"]["anthropic"]["max_connections"] == 7
+
+
+@pytest.mark.unit
+def test_pool_config_from_env():
+    """Test per-provider settings are read from the environment."""
+    with patch.dict(os.environ, {"OPENAI_MAX_CONNECTIONS": "42", "OPENAI_HTTP2": "false"}):
+        config = ProviderPoolConfig.from_env("openai")
+    
+    assert config.max_connections == 42
+    assert config.http2 is False
+
+
+@pytest.mark.unit
+def test_pool_async_client_per_loop():
+    """Test async clients are shared within a loop but not across loops."""
+    pool = ProviderClientPool()
+    
+    async def get_twice():
+        first = pool.get_async_client("openai", "test-key")
+        return first, pool.get_async_client("openai", "test-key")
+    
+    first, second = asyncio.run(get_twice())
+    third, _ = asyncio.run(get_twice())
+    
+    assert first is second
+    assert first is not third
+
+
+@pytest.mark.unit
+def test_pool_closes_async_clients_of_loop():
+    """Test a loop's async clients are closed and dropped, and off-loop use is rejected."""
+    pool = ProviderClientPool()
+    
+    async def use_and_close():
+        client = pool.get_async_client("openai", "test-key")
+        await pool.aclose_async_clients()
+        return client
+    
+    client = asyncio.run(use_and_close())
+    
+    assert client.is_closed()
+    assert pool.stats()["async_clients"] == 0
+    with pytest.raises(RuntimeError, match="running event loop"):
+        pool.get_async_client("openai", "test-key")
+
+
+@pytest.mark.unit
+def test_pool_unknown_provider():
+    """Test unknown providers are rejected."""
+    with pytest.raises(ValueError, match="Unknown LLM provider"):
+        ProviderClientPool().get_client("nope", "test-key")
+
+
+@pytest.mark.unit
+def test_agent_clients_share_pool():
+    """Test agent clients built with the same key reuse the pooled SDK client."""
+    from agent_factory.integrations.anthropic_client import AnthropicAgentClient
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    
+    for client_class in (OpenAIAgentClient, AnthropicAgentClient):
+        assert client_class(api_key="pool-key").client is client_class(api_key="pool-key").client
@@ -0,0 +1,143 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+
+from agent_factory.integrations.coalescing import RequestCoalescer
+
+
+@pytest.mark.unit
+def test_sync_requests_are_coalesced():
+    """Test concurrent identical sync calls share one provider call."""
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    calls = []
+    
+    def call():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return {"output": "shared"}
+    
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(coalescer.run, "openai", "key", call)
+        started.wait()
+        followers = [pool.submit(coalescer.run, "openai", "key", call) for _ in range(4)]
+        results = [leader.result()] + [f.result() for f in followers]
+    
+    assert len(calls) == 1
+    assert all(r["output"] == "shared" for r in results)
+    assert sum(1 for r in results if r.get("coalesced")) == 4
+    assert coalescer.stats() == {"leaders": 1, "coalesced": 4, "in_flight": 0}
+
+
+@pytest.mark.unit
+def test_sync_errors_propagate_to_followers():
+    """Test followers see the leader's exception and the key is released."""
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("provider down")
+    
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(coalescer.run, "openai", "key", failing)
+        started.wait()
+        follower = pool.submit(coalescer.run, "openai", "key", failing)
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="provider down"):
+                future.result()
+    
+    assert coalescer.run("openai", "key", lambda: {"output": "ok"}) == {"output": "ok"}
+
+
+@pytest.mark.unit
+def test_async_requests_are_coalesced():
+    """Test concurrent identical async calls share one provider call."""
+    coalescer = RequestCoalescer()
+    calls = []
+    
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"output": "shared"}
+    
+    async def run():
+        return await asyncio.gather(*(coalescer.arun("anthropic", "key", call) for _ in range(5)))
+    
+    results = asyncio.run(run())
+    
+    assert len(calls) == 1
+    assert [r.get("coalesced", False) for r in results].count(True) == 4
+    assert coalescer.stats()["in_flight"] == 0
+
+
+@pytest.mark.unit
+def test_coalesced_requests_record_metrics():
+    """Test collapsed calls are counted per provider."""
+    coalescer = RequestCoalescer()
+    
+    async def call():
+        await asyncio.sleep(0.01)
+        return {"output": "x"}
+    
+    async def run():
+        await asyncio.gather(
+            coalescer.arun("openai", "key", call), coalescer.arun("openai", "key", call)
+        )
+    
+    with patch("agent_factory.monitoring.metrics.MetricsCollector") as metrics:
+        asyncio.run(run())
+    
+    metrics.record_coalesced_request.assert_called_once_with("openai")
+
+
+@pytest.mark.unit
+def test_client_coalesces_when_enabled():
+    """Test provider clients route through the coalescer with coalesce=True."""
+    from agent_factory.integrations.anthropic_client import AnthropicAgentClient
+    
+    client = AnthropicAgentClient(api_key="test-key")
+    coalescer = Mock()
+    coalescer.run.return_value = {"output": "from flight"}
+    
+    with patch(
+        "agent_factory.integrations.coalescing.get_request_coalescer", return_value=coalescer
+    ):
+        result = client.run_agent("instructions", "hello", coalesce=True)
+    
+    assert result == {"output": "from flight"}
+    assert coalescer.run.call_args[0][0] == "anthropic"
+
+
+@pytest.mark.unit
+def test_follower_flag_is_not_cached():
+    """Test a coalesced follower's answer is cached without its ``coalesced`` flag."""
+    from agent_factory.cache.response_cache import ResponseCache, set_response_cache
+    from agent_factory.integrations.coalescing import aexecute_request, execute_request
+    
+    coalescer = Mock()
+    coalescer.run.return_value = {"output": "shared", "coalesced": True}
+    coalescer.arun = AsyncMock(return_value={"output": "shared", "coalesced": True})
+    set_response_cache(ResponseCache())
+    try:
+        with patch(
+            "agent_factory.integrations.coalescing.get_request_coalescer", return_value=coalescer,
+        ):
+            follower = execute_request("openai", {"n": 1}, Mock(), use_cache=True, coalesce=True)
+            replayed = execute_request("openai", {"n": 1}, Mock(), use_cache=True, coalesce=True)
+            afollower = asyncio.run(
+                aexecute_request("openai", {"n": 2}, Mock(), use_cache=True, coalesce=True)
+            )
+    finally:
+        set_response_cache(None)
+    
+    assert follower == {"output": "shared", "coalesced": True}
+    assert replayed == {"output": "shared", "cached": True}
+    assert afollower == {"output": "shared", "coalesced": True}
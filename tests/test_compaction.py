@@ -0,0 +1,112 @@
+"""Tests for rolling summarization of long sessions."""
+
+import pytest
+from unittest.mock import Mock
+
+from agent_factory.agents.agent import Agent, AgentConfig
+from agent_factory.runtime.compaction import CompactionPolicy, SessionCompactor, get_compactor
+from agent_factory.runtime.context import ContextBuilder, format_context_sections
+from agent_factory.runtime.memory import SQLiteMemoryStore
+from agent_factory.runtime.write_behind import get_write_behind
+
+
+@pytest.fixture
+def memory(tmp_path):
+    return SQLiteMemoryStore(str(tmp_path / "memory.db"))
+
+
+def _fill(memory, session_id, turns):
+    for i in range(turns):
+        memory.save_interaction(session_id, f"question {i}", f"answer {i}")
+
+
+@pytest.mark.unit
+def test_compaction_folds_old_turns_into_summary(memory):
+    """Test old turns become a summary and the context keeps only recent turns."""
+    _fill(memory, "s1", 12)
+    summarize = Mock(return_value="The user asked twelve questions.")
+    policy = CompactionPolicy(max_turns=10, keep_turns=4)
+    
+    assert SessionCompactor().compact(memory, "s1", policy, summarize)
+    
+    previous, folded = summarize.call_args[0]
+    assert previous is None
+    assert [i.input_text for i in folded] == [f"question {i}" for i in range(8)]
+    context = memory.get_context("s1", limit=20)
+    assert context["summary"] == "The user asked twelve questions."
+    recent = [t["input"] for t in context["recent_interactions"]]
+    assert recent == [f"question {i}" for i in range(8, 12)]
+    
+    built = ContextBuilder().build(memory_context=context)
+    assert built["summary"] == context["summary"]
+    assert format_context_sections(built).startswith("Summary of the earlier conversation")
+    
+    # Under the thresholds nothing happens; clearing drops the summary
+    assert not SessionCompactor().compact(memory, "s1", policy, summarize)
+    memory.clear_session("s1")
+    assert memory.get_summary("s1") is None
+
+
+@pytest.mark.unit
+def test_compaction_folds_long_existing_session_oldest_first(memory):
+    """Test a session far past the thresholds is summarized from its start, losing no turns."""
+    _fill(memory, "s1", 100)
+    folded_batches = []
+    
+    def summarize(previous, interactions):
+        folded_batches.append([i.input_text for i in interactions])
+        return f"summary of {sum(len(batch) for batch in folded_batches)} turns"
+    
+    policy = CompactionPolicy(max_turns=40, keep_turns=10)
+    assert SessionCompactor().compact(memory, "s1", policy, summarize)
+    
+    folded = [text for batch in folded_batches for text in batch]
+    remaining = [i.input_text for i in memory.get_history("s1", limit=200)]
+    assert folded + remaining == [f"question {i}" for i in range(100)]
+    assert len(remaining) <= 40
+    assert memory.get_summary("s1") == f"summary of {len(folded)} turns"
+
+
+@pytest.mark.unit
+def test_agent_compacts_session_in_background(memory):
+    """Test a long simulated session stays bounded with a running summary."""
+    config = AgentConfig(
+        enable_memory_compaction=True,
+        compaction_max_turns=6,
+        compaction_keep_turns=2,
+        compaction_summary_tokens=50,
+    )
+    agent = Agent(
+        id="tutor",
+        name="Tutor",
+        instructions="Teach",
+        model="simulated",
+        memory=memory,
+        config=config,
+    )
+    
+    for i in range(20):
+        agent.run(f"lesson {i} " + "detail " * 20, session_id="s1")
+        get_write_behind().flush()
+        get_compactor().flush()
+    
+    history = memory.get_history("s1", limit=100)
+    assert len(history) <= 6
+    assert history[-1].input_text.startswith("lesson 19")
+    summary = memory.get_summary("s1")
+    assert summary and len(summary) <= 50 * 4
+
+
+@pytest.mark.unit
+def test_failed_summary_keeps_history(memory):
+    """Test a summarizer error leaves the session untouched."""
+    _fill(memory, "s1", 12)
+    compactor = SessionCompactor()
+    
+    policy = CompactionPolicy(max_turns=10, keep_turns=4)
+    assert compactor.schedule(memory, "s1", policy, Mock(side_effect=RuntimeError))
+    compactor.flush()
+    
+    assert compactor.failed == 1
+    assert len(memory.get_history("s1", limit=100)) == 12
+    assert memory.get_summary("s1") is None
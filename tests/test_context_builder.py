@@ -0,0 +1,112 @@
+"""Tests for token-budgeted context assembly."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentConfig
+from agent_factory.runtime.context import (
+    ContextBudget,
+    ContextBuilder,
+    count_tokens,
+    format_context_sections,
+)
+
+
+def _memory_context(turns):
+    return {
+        "recent_interactions": [
+            {"input": f"question {i} " + "x" * 200, "output": f"answer {i} " + "y" * 200}
+            for i in range(turns)
+        ]
+    }
+
+
+@pytest.mark.unit
+def test_count_tokens_estimates():
+    """Test token counts are positive and scale with text length."""
+    assert count_tokens("") == 0
+    assert count_tokens("hello world", "claude-3-5-sonnet-20241022") > 0
+    assert count_tokens("word " * 400) > count_tokens("word " * 40)
+
+
+@pytest.mark.unit
+def test_history_keeps_most_recent_turns_in_order():
+    """Test older turns are dropped first and order is chronological."""
+    builder = ContextBuilder(ContextBudget(max_tokens=600, quotas={"history": 1.0}))
+    
+    context = builder.build(memory_context=_memory_context(10))
+    
+    user_messages = [m["content"] for m in context["messages"] if m["role"] == "user"]
+    assert 0 < len(user_messages) < 10
+    assert user_messages[-1].startswith("question 9")
+    numbers = [int(m.split()[1]) for m in user_messages]
+    assert numbers == sorted(numbers)
+    assert context["context_tokens"] <= 600
+    assert context["context_dropped"] == 10 - len(user_messages)
+
+
+@pytest.mark.unit
+def test_knowledge_ranked_by_score_within_quota():
+    """Test the highest-scoring chunks win the knowledge quota."""
+    builder = ContextBuilder(ContextBudget(max_tokens=80, quotas={"knowledge": 1.0}))
+    chunks = [
+        {"text": "low " * 40, "score": 0.1},
+        {"text": "high " * 40, "score": 0.9},
+        {"text": "mid " * 40, "score": 0.5},
+    ]
+    
+    context = builder.build(knowledge=chunks)
+    
+    assert [k["score"] for k in context["knowledge"]] == [0.9]
+    assert "Relevant knowledge" in format_context_sections(context)
+
+
+@pytest.mark.unit
+def test_unused_quota_spills_to_other_sources():
+    """Test budget left by one source is used by another."""
+    budget = ContextBudget(max_tokens=2000, quotas={"history": 0.1, "knowledge": 0.1})
+    builder = ContextBuilder(budget)
+    
+    context = builder.build(memory_context=_memory_context(5))
+    
+    assert context["context_dropped"] == 0
+    assert len(context["messages"]) == 10
+
+
+@pytest.mark.unit
+def test_caller_messages_and_tool_results_are_candidates():
+    """Test caller context keys are packed and other keys pass through."""
+    builder = ContextBuilder()
+    
+    context = builder.build(context={
+        "messages": [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}],
+        "tool_results": ["42", {"content": "sunny", "tool": "weather"}],
+        "user_id": "u1",
+    })
+    
+    assert context["user_id"] == "u1"
+    assert context["messages"][0] == {"role": "user", "content": "hi"}
+    assert [t["content"] for t in context["tool_results"]] == ["42", "sunny"]
+
+
+@pytest.mark.unit
+def test_agent_sends_budgeted_context_to_client():
+    """Test Agent.run passes packed context within its configured budget."""
+    memory = Mock()
+    memory.get_context.return_value = _memory_context(30)
+    agent = Agent(
+        id="ctx",
+        name="Ctx",
+        instructions="Be helpful",
+        memory=memory,
+        config=AgentConfig(context_max_tokens=500),
+    )
+    
+    with patch("agent_factory.integrations.openai_client.OpenAIAgentClient") as client_class:
+        client_class.return_value.run_agent.return_value = {"output": "ok"}
+        agent.run("Hello", session_id="s1")
+    
+    memory.get_context.assert_called_once_with("s1", agent.config.context_history_turns)
+    sent = client_class.return_value.run_agent.call_args[1]["context"]
+    assert sent["context_tokens"] <= 500
+    assert 0 < len(sent["messages"]) < 60
@@ -0,0 +1,257 @@
+"""Tests for the bounded execution store."""
+
+import sqlite3
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import AgentResult, AgentStatus
+from agent_factory.core.exceptions import ExecutionCancelledError
+from agent_factory.runtime.engine import Execution, RuntimeEngine
+from agent_factory.runtime.execution_store import ExecutionStore, SQLiteExecutionBackend
+from agent_factory.workflows.model import Workflow, WorkflowStep
+
+
+def _execution(execution_id, status="completed", entity_id="agent", minutes=0, output="ok"):
+    return Execution(
+        id=execution_id,
+        type="agent",
+        entity_id=entity_id,
+        status=status,
+        created_at=datetime(2024, 1, 1) + timedelta(minutes=minutes),
+        completed_at=datetime(2024, 1, 1) + timedelta(minutes=minutes, seconds=5),
+        result=AgentResult(output=output, status=AgentStatus.COMPLETED, tokens_used=3),
+        metadata={"input_text": "hi", "context": {"obj": object()}},
+    )
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteExecutionBackend(str(tmp_path / "executions.db"))
+
+
+@pytest.mark.unit
+def test_evicted_executions_spill_and_load_back(backend):
+    """Test executions beyond the entry cap are served from the backend."""
+    store = ExecutionStore(backend, max_entries=2)
+    for i in range(4):
+        store.put(_execution(f"e{i}", minutes=i))
+    
+    assert store.stats()["entries"] == 2
+    assert store.stats()["spilled"] == 2
+    loaded = store["e0"]
+    assert isinstance(loaded.result, AgentResult)
+    assert loaded.result.status == AgentStatus.COMPLETED
+    assert loaded.result.tokens_used == 3
+    assert loaded.created_at == datetime(2024, 1, 1)
+    assert len(store) == 4
+
+
+@pytest.mark.unit
+def test_byte_cap_and_running_executions_are_pinned():
+    """Test the byte cap evicts finished executions but never running ones."""
+    store = ExecutionStore(max_bytes=2000)
+    store.put(_execution("running", status="running"))
+    for i in range(5):
+        store.put(_execution(f"done{i}", output="x" * 500))
+    
+    assert "running" in store
+    assert store.stats()["bytes"] <= 2000
+    assert store.stats()["dropped"] > 0
+    assert store.get("done0") is None
+
+
+@pytest.mark.unit
+def test_idle_ttl_evicts_finished_executions(backend):
+    """Test finished executions idle past the TTL leave memory."""
+    store = ExecutionStore(backend, ttl=60)
+    with patch("agent_factory.runtime.execution_store.time.monotonic", return_value=0.0):
+        store.put(_execution("old"))
+    with patch("agent_factory.runtime.execution_store.time.monotonic", return_value=120.0):
+        store.put(_execution("new", minutes=1))
+    
+    assert store.stats()["entries"] == 1
+    assert store.get("old").id == "old"
+
+
+@pytest.mark.unit
+def test_query_merges_tiers(backend):
+    """Test listing spans memory and backend, newest first, with filters."""
+    store = ExecutionStore(backend, max_entries=1)
+    store.put(_execution("a1", entity_id="a", minutes=1))
+    store.put(_execution("b1", entity_id="b", minutes=2))
+    store.put(_execution("a2", entity_id="a", minutes=3))
+    
+    assert [e.id for e in store.query()] == ["a2", "b1", "a1"]
+    assert [e.id for e in store.query(entity_id="a", limit=1)] == ["a2"]
+
+
+@pytest.mark.unit
+def test_engine_updates_store_on_transitions(backend):
+    """Test the engine persists final state and get_execution reads spilled runs."""
+    store = ExecutionStore(backend, max_entries=1)
+    engine = RuntimeEngine(prompt_log_storage=Mock(), execution_store=store)
+    engine.telemetry_collector = Mock()
+    agent = Mock(id="agent", prompt_log_storage=None)
+    agent.name = "Agent"
+    agent.run.return_value = AgentResult(output="done", status=AgentStatus.COMPLETED)
+    engine.register_agent(agent)
+    
+    first = engine.run_agent("agent", "one")
+    engine.run_agent("agent", "two")
+    
+    execution = engine.get_execution(first)
+    assert execution.status == "completed"
+    assert execution.result.output == "done"
+    assert execution.metadata["input_text"] == "one"
+
+
+@pytest.mark.unit
+def test_status_transition_moves_index_entry():
+    """Test status filters follow transitions without rescanning."""
+    store = ExecutionStore()
+    execution = _execution("e1", status="running")
+    store.put(execution)
+    assert [e.id for e in store.query(status="running")] == ["e1"]
+    
+    execution.status = "completed"
+    store.put(execution)
+    
+    assert store.query(status="running") == []
+    assert [e.id for e in store.query(entity_id="agent", status="completed")] == ["e1"]
+
+
+@pytest.mark.unit
+def test_keyset_pages_span_both_tiers(backend):
+    """Test cursors walk every execution exactly once across memory and backend."""
+    store = ExecutionStore(backend, max_entries=3)
+    for i in range(7):
+        # Pairs share a timestamp so ties are ordered by ID
+        store.put(_execution(f"e{i}", entity_id="a" if i % 2 else "b", minutes=i // 2))
+    
+    seen, cursor = [], None
+    while True:
+        page, cursor = store.page(limit=3, cursor=cursor)
+        seen.extend(e.id for e in page)
+        if cursor is None:
+            break
+    
+    assert seen == ["e6", "e5", "e4", "e3", "e2", "e1", "e0"]
+    page, cursor = store.page(entity_id="a", limit=2)
+    assert [e.id for e in page] == ["e5", "e3"]
+    assert [e.id for e in store.query(entity_id="a", cursor=cursor)] == ["e1"]
+    with pytest.raises(ValueError):
+        store.page(cursor="not-a-cursor")
+
+
+@pytest.mark.unit
+def test_shared_store_serves_other_workers(tmp_path):
+    """Test a run on one worker is visible, with its result, from another."""
+    def worker():
+        backend = SQLiteExecutionBackend(str(tmp_path / "shared.db"))
+        store = ExecutionStore(backend, shared=True)
+        return RuntimeEngine(prompt_log_storage=Mock(), execution_store=store)
+    
+    first, second = worker(), worker()
+    agent = Mock(id="agent")
+    agent.run.return_value = AgentResult(output="done", status=AgentStatus.COMPLETED)
+    first.register_agent(agent)
+    execution_id = first.run_agent("agent", "hi")
+    
+    execution = second.get_execution(execution_id)
+    assert execution.status == "completed"
+    assert execution.result.output == "done"
+    assert [e.id for e in second.list_executions(status="completed")] == [execution_id]
+    
+    with sqlite3.connect(tmp_path / "shared.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+@pytest.mark.unit
+def test_cancel_from_another_worker(tmp_path):
+    """Test a worker can cancel a run owned by another through the shared store."""
+    owner = ExecutionStore(SQLiteExecutionBackend(str(tmp_path / "shared.db")), shared=True)
+    other_store = ExecutionStore(SQLiteExecutionBackend(str(tmp_path / "shared.db")), shared=True)
+    other = RuntimeEngine(prompt_log_storage=Mock(), execution_store=other_store)
+    owner.put(_execution("e1", status="running"))
+    
+    assert other.cancel_execution("e1")
+    assert owner.cancel_requested("e1")
+    assert owner["e1"].status == "cancelled"
+    assert owner.query(status="running") == []
+    with pytest.raises(ValueError):
+        ExecutionStore(shared=True)
+
+
+@pytest.mark.unit
+def test_remote_cancel_stops_owner_at_next_step(tmp_path):
+    """Test the owning worker polls a shared cancel between workflow steps."""
+    def shared_engine():
+        backend = SQLiteExecutionBackend(str(tmp_path / "shared.db"))
+        store = ExecutionStore(backend, shared=True, cancel_poll_interval=0.0)
+        engine = RuntimeEngine(prompt_log_storage=Mock(), execution_store=store)
+        engine.telemetry_collector = Mock()
+        return engine
+    
+    owner, other = shared_engine(), shared_engine()
+    agents = {}
+    for agent_id in ("first", "second"):
+        agents[agent_id] = Mock(id=agent_id, prompt_log_storage=None)
+        agents[agent_id].name = agent_id
+        owner.register_agent(agents[agent_id])
+    
+    def cancel_elsewhere(input_text):
+        other.cancel_execution(other.executions.query(status="running")[0].id)
+        return AgentResult(output="one", status=AgentStatus.COMPLETED)
+    
+    agents["first"].run.side_effect = cancel_elsewhere
+    owner.register_workflow(Workflow(id="wf", name="Workflow", steps=[
+        WorkflowStep(id="s1", agent_id="first"),
+        WorkflowStep(id="s2", agent_id="second"),
+    ]))
+    
+    with pytest.raises(ExecutionCancelledError):
+        owner.run_workflow("wf", {})
+    agents["second"].run.assert_not_called()
+
+
+@pytest.mark.unit
+def test_cancel_does_not_overwrite_finished_run(tmp_path):
+    """Test a cancel racing another worker's completion keeps the result."""
+    owner = ExecutionStore(SQLiteExecutionBackend(str(tmp_path / "shared.db")), shared=True)
+    other_store = ExecutionStore(SQLiteExecutionBackend(str(tmp_path / "shared.db")), shared=True)
+    other = RuntimeEngine(prompt_log_storage=Mock(), execution_store=other_store)
+    stale = _execution("e1", status="running")
+    owner.put(_execution("e1", status="completed"))
+    
+    with patch.object(other.executions, "get", return_value=stale):
+        assert not other.cancel_execution("e1")
+    assert owner["e1"].status == "completed"
+    assert owner["e1"].result.output == "ok"
+
+
+@pytest.mark.unit
+def test_sqlite_backend_trims_rows_periodically(tmp_path):
+    """Test the row cap is enforced every trim_every saves, newest kept."""
+    backend = SQLiteExecutionBackend(str(tmp_path / "executions.db"), max_entries=3, trim_every=2)
+    store = ExecutionStore(backend, shared=True)
+    for i in range(5):
+        store.put(_execution(f"e{i}", minutes=i))
+    
+    # Trimmed at the fourth save; the fifth waits for the next trim
+    assert sorted(backend.ids()) == ["e1", "e2", "e3", "e4"]
+    assert backend.trim() == 1
+    assert sorted(backend.ids()) == ["e2", "e3", "e4"]
+
+
+@pytest.mark.unit
+def test_sqlite_trim_keeps_active_executions(tmp_path):
+    """Test a long-running shared execution survives trims past the row cap."""
+    backend = SQLiteExecutionBackend(str(tmp_path / "executions.db"), max_entries=2, trim_every=1)
+    store = ExecutionStore(backend, shared=True)
+    store.put(_execution("running", status="running"))
+    for i in range(1, 5):
+        store.put(_execution(f"e{i}", minutes=i))
+    
+    assert sorted(backend.ids()) == ["e3", "e4", "running"]
+    assert ExecutionStore(backend, shared=True)["running"].status == "running"
@@ -0,0 +1,66 @@
+"""Tests for the in-process session cache in front of memory stores."""
+
+import pytest
+from unittest.mock import Mock
+
+from agent_factory.runtime.memory import CachedMemoryStore, SQLiteMemoryStore, get_memory_store
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "memory.db")
+
+
+@pytest.mark.unit
+def test_hot_session_reads_without_store_io(db_path):
+    """Test saves append to the cached session and reads stay in process."""
+    store = Mock(wraps=SQLiteMemoryStore(db_path))
+    memory = CachedMemoryStore(store, validate_interval=60)
+    memory.save_interaction("s1", "Hello", "Hi!")
+    
+    memory.get_context("s1")
+    store.reset_mock()
+    memory.save_interaction("s1", "How are you?", "Good!")
+    context = memory.get_context("s1")
+    
+    assert [t["input"] for t in context["recent_interactions"]] == ["Hello", "How are you?"]
+    store.save_interaction.assert_called_once()
+    store.get_history.assert_not_called()
+    store.get_version.assert_not_called()
+    assert memory.stats()["hits"] == 1
+
+
+@pytest.mark.unit
+def test_other_process_writes_invalidate_by_version(db_path):
+    """Test a write through another store is picked up at the next version check."""
+    first = CachedMemoryStore(SQLiteMemoryStore(db_path), validate_interval=0)
+    second = CachedMemoryStore(SQLiteMemoryStore(db_path), validate_interval=0)
+    first.save_interaction("s1", "one", "1")
+    assert len(first.get_history("s1")) == 1
+    
+    first.save_interaction("s1", "two", "2")  # Own write: stamp still matches
+    assert [i.input_text for i in first.get_history("s1")] == ["one", "two"]
+    assert first.stats()["misses"] == 1
+    
+    second.save_interaction("s1", "three", "3")
+    assert [i.input_text for i in first.get_history("s1")] == ["one", "two", "three"]
+    assert first.stats()["misses"] == 2
+    
+    second.clear_session("s1")
+    assert first.get_history("s1") == []
+
+
+@pytest.mark.unit
+def test_cache_is_bounded(db_path):
+    """Test least recently used sessions are evicted and long reads go to the store."""
+    memory = CachedMemoryStore(SQLiteMemoryStore(db_path), max_sessions=2, max_turns=3)
+    for session_id in ("a", "b", "c"):
+        memory.save_interaction(session_id, "q", "a")
+        memory.get_context(session_id, limit=3)
+    for i in range(4):
+        memory.save_interaction("c", f"q{i}", "a")
+    
+    assert memory.stats()["sessions"] == 2
+    assert len(memory.get_history("c", limit=3)) == 3
+    assert len(memory.get_history("c", limit=10)) == 5
+    assert isinstance(get_memory_store("sqlite", db_path=db_path, cache=True), CachedMemoryStore)
@@ -2,9 +2,11 @@
 Tests for memory store implementations.
 """
 
+import json
 import pytest
 import tempfile
 import os
+from unittest.mock import MagicMock
 from agent_factory.runtime.memory import (
     SQLiteMemoryStore,
     RedisMemoryStore,
@@ -80,3 +82,61 @@ def test_get_memory_store_redis():
         assert isinstance(store, RedisMemoryStore)
     except (ImportError, ValueError):
         pytest.skip("Redis not available")
+
+
+def test_redis_memory_store_single_round_trips():
+    """Test Redis writes are one MULTI/EXEC and reads one pipelined LRANGE."""
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    store = RedisMemoryStore(redis_client=client, max_interactions=100)
+    
+    store.save_interaction("s1", "Hello", "Hi!", metadata={"turn": 1})
+    
+    client.pipeline.assert_called_with(transaction=True)
+    entry = pipe.rpush.call_args[0][1]
+    pipe.ltrim.assert_called_once_with("agent_memory:history:s1", -100, -1)
+    assert pipe.execute.call_count == 1
+    
+    pipe.execute.return_value = [[entry] * 50, 0]
+    history = store.get_history("s1", limit=50)
+    
+    pipe.lrange.assert_called_once_with("agent_memory:history:s1", -50, -1)
+    assert pipe.execute.call_count == 2
+    assert len(history) == 50
+    assert history[0].input_text == "Hello" and history[0].metadata == {"turn": 1}
+    client.hgetall.assert_not_called()
+
+
+def test_redis_memory_store_migrates_legacy_session():
+    """Test a legacy sorted-set session moves into the list ahead of newer entries."""
+    client = MagicMock()
+    pipe = client.pipeline.return_value
+    store = RedisMemoryStore(redis_client=client)
+    legacy = [
+        {
+            "input_text": f"q{i}",
+            "output_text": f"a{i}",
+            "timestamp": "2024-01-01T00:00:00",
+            "metadata": "{}",
+        }
+        for i in range(2)
+    ]
+    client.zrange.return_value = ["id0", "id1"]
+    pipe.execute.side_effect = [[[], 1], legacy, []]
+    client.lrange.return_value = [
+        '{"input_text": "q0", "output_text": "a0", "timestamp": "2024-01-01T00:00:00"}'
+    ]
+    
+    history = store.get_history("old")
+    
+    client.rename.assert_called_once_with(
+        "agent_memory:session:old", "agent_memory:session:old:migrating"
+    )
+    pushed = [json.loads(entry)["input_text"] for entry in pipe.lpush.call_args[0][1:]]
+    assert pushed == ["q1", "q0"]  # LPUSH reverses, leaving q0 first
+    pipe.delete.assert_called_with(
+        "agent_memory:session:old:migrating",
+        "agent_memory:interaction:old:id0",
+        "agent_memory:interaction:old:id1",
+    )
+    assert [i.input_text for i in history] == ["q0"]
@@ -0,0 +1,100 @@
+"""Tests for per-stage timing spans."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentResult, AgentStatus
+from agent_factory.monitoring.metrics import stage_duration_seconds
+from agent_factory.monitoring.tracing import TracingMiddleware, record_stage_spans
+from agent_factory.runtime.profiling import StageTimer, stage, use_timer
+from agent_factory.runtime.write_behind import get_write_behind
+from agent_factory.workflows.model import Workflow, WorkflowStep
+
+
+def _agent(storage=None):
+    agent = Agent(id="timed", name="Timed", instructions="Test", prompt_log_storage=storage)
+    agent.memory = Mock()
+    agent.memory.get_context.return_value = {}
+    return agent
+
+
+def _observed(kind, name):
+    return stage_duration_seconds.labels(kind=kind, stage=name)._sum.get()
+
+
+@pytest.mark.unit
+def test_agent_run_records_stages(monkeypatch):
+    """Test a timed run reports its stages in metadata, prompt log and metrics."""
+    monkeypatch.setenv("STAGE_TIMING_ENABLED", "true")
+    storage = Mock()
+    agent = _agent(storage)
+    before = _observed("agent", "llm_call")
+    
+    with patch.object(Agent, "_execute_agent", return_value="done"):
+        result = agent.run("hi", session_id="s1")
+    get_write_behind().flush()
+    
+    stages = [span["stage"] for span in result.metadata["stages"]]
+    assert stages == ["memory_load", "context_build", "llm_call", "memory_save", "prompt_log"]
+    assert all(span["duration"] >= 0 and not span["error"] for span in result.metadata["stages"])
+    logged = storage.save_run.call_args[0][0]
+    assert [span["stage"] for span in logged.metadata["stages"]] == stages[:-1]
+    assert _observed("agent", "llm_call") > before
+
+
+@pytest.mark.unit
+def test_timing_disabled_records_nothing(monkeypatch):
+    """Test disabled timing leaves results untouched and stages are no-ops."""
+    monkeypatch.delenv("STAGE_TIMING_ENABLED", raising=False)
+    agent = _agent()
+    
+    with patch.object(Agent, "_execute_agent", return_value="done"):
+        result = agent.run("hi")
+    
+    assert "stages" not in result.metadata
+    timer = StageTimer("agent")
+    with use_timer(timer), stage("llm_call"):
+        pass
+    assert timer.spans == []
+
+
+@pytest.mark.unit
+def test_workflow_records_step_spans(monkeypatch):
+    """Test workflow results carry one span per executed step."""
+    monkeypatch.setenv("STAGE_TIMING_ENABLED", "true")
+    agent = Mock()
+    agent.run.return_value = AgentResult(output="ok", status=AgentStatus.COMPLETED)
+    agent.arun.side_effect = lambda text: asyncio.sleep(0, agent.run.return_value)
+    workflow = Workflow(id="wf", name="Workflow", agents_registry={"a": agent}, steps=[
+        WorkflowStep(id="first", agent_id="a"),
+        WorkflowStep(id="second", agent_id="a"),
+    ])
+    
+    for result in (workflow.execute({}), asyncio.run(workflow.aexecute({}))):
+        assert [(s["stage"], s["detail"]) for s in result.metadata["stages"]] == [
+            ("step", "first"),
+            ("step", "second"),
+        ]
+
+
+@pytest.mark.unit
+def test_server_timing_header_reports_request_stages():
+    """Test stage spans recorded during a request reach the Server-Timing header."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+    
+    @app.get("/run")
+    def run():
+        record_stage_spans("agent", "timed", 0.0, [
+            {"stage": "llm_call", "start": 0.0, "duration": 0.25, "error": False},
+            {"stage": "llm_call", "start": 0.3, "duration": 0.25, "error": False},
+        ])
+        return {}
+    
+    response = TestClient(app).get("/run")
+    
+    assert response.headers["Server-Timing"] == "agent_llm_call;dur=500.0"
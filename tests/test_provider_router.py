@@ -0,0 +1,257 @@
+"""Tests for latency-aware provider routing."""
+
+import asyncio
+import os
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentConfig
+from agent_factory.core.exceptions import DeadlineExceededError, ExecutionCancelledError
+from agent_factory.integrations.router import (
+    LatencyWindow,
+    ProviderRouter,
+    RouterConfig,
+    set_provider_router,
+)
+from agent_factory.runtime.cancellation import CancellationToken, current_token, use_token
+
+
+class _Breaker:
+    """Minimal stand-in exposing the circuit breaker state the router reads."""
+    
+    def __init__(self, state="closed"):
+        self.stats = SimpleNamespace(state=state, last_failure_time=time.time())
+        self.config = SimpleNamespace(timeout=60.0)
+    
+    def call(self, func, **kwargs):
+        return func(**kwargs)
+    
+    async def acall(self, func, **kwargs):
+        return await func(**kwargs)
+
+
+def _client(name, delay=0.0, error=None):
+    def run_agent(**kwargs):
+        time.sleep(delay)
+        if error:
+            raise error
+        return {"output": name, "model": kwargs["model"]}
+    
+    async def arun_agent(**kwargs):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return {"output": name, "model": kwargs["model"]}
+    
+    return Mock(run_agent=Mock(side_effect=run_agent), arun_agent=Mock(side_effect=arun_agent))
+
+
+def _router(clients, breakers=None, **config):
+    breakers = breakers or {}
+    return ProviderRouter(
+        RouterConfig(**config),
+        client_factory=lambda provider: clients[provider],
+        breaker_factory=lambda name: breakers.setdefault(name, _Breaker()),
+    )
+
+
+@pytest.fixture
+def both_keys():
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test", "ANTHROPIC_API_KEY": "sk-ant-test"}):
+        yield
+
+
+@pytest.mark.unit
+def test_latency_window_percentiles():
+    """Test percentiles use successful calls and errors count toward the rate."""
+    window = LatencyWindow(size=100)
+    for latency in range(1, 101):
+        window.record(latency / 100, success=True)
+    window.record(5.0, success=False)
+    
+    assert window.percentile(50) == pytest.approx(0.51, abs=0.01)
+    assert window.percentile(95) == pytest.approx(0.95, abs=0.01)
+    assert window.error_rate == pytest.approx(0.01)
+
+
+@pytest.mark.unit
+def test_fallback_route_requires_api_key():
+    """Test cross-provider fallbacks are only offered when keyed."""
+    router = _router({})
+    with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}, clear=True):
+        assert [r.provider for r in router.routes_for("gpt-4o")] == ["openai"]
+    with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-ant-test"}):
+        routes = router.routes_for("gpt-4o")
+    assert [(r.provider, r.model) for r in routes] == [
+        ("openai", "gpt-4o"),
+        ("anthropic", "claude-3-5-sonnet-20241022"),
+    ]
+
+
+@pytest.mark.unit
+def test_routes_to_faster_provider(both_keys):
+    """Test the provider with lower observed latency wins once warmed up."""
+    clients = {"openai": _client("openai"), "anthropic": _client("anthropic")}
+    router = _router(clients, min_samples=3)
+    openai, anthropic = router.routes_for("gpt-4o")
+    for _ in range(3):
+        router._window(openai).record(2.0, success=True)
+        router._window(anthropic).record(0.5, success=True)
+    
+    result = router.run_agent(model="gpt-4o", instructions="", input_text="hi")
+    
+    assert result["provider"] == "anthropic"
+    assert result["model"] == "claude-3-5-sonnet-20241022"
+
+
+@pytest.mark.unit
+def test_unsampled_fallback_is_explored(both_keys):
+    """Test a fallback without samples is tried periodically while the primary is healthy."""
+    clients = {"openai": _client("openai"), "anthropic": _client("anthropic")}
+    router = _router(clients, min_samples=3, explore_every=4)
+    openai, _ = router.routes_for("gpt-4o")
+    for _ in range(3):
+        router._window(openai).record(0.5, success=True)
+    
+    providers = [
+        router.run_agent(model="gpt-4o", instructions="", input_text="hi")["provider"]
+        for _ in range(8)
+    ]
+    
+    assert providers.count("anthropic") == 2
+    assert providers[3] == "anthropic"
+
+
+@pytest.mark.unit
+def test_open_breaker_removes_provider(both_keys):
+    """Test a provider whose shared breaker is open is skipped."""
+    breakers = {"openai_api": _Breaker(state="open")}
+    clients = {"openai": _client("openai"), "anthropic": _client("anthropic")}
+    router = _router(clients, breakers)
+    
+    result = router.run_agent(model="gpt-4o", instructions="", input_text="hi")
+    
+    assert result["provider"] == "anthropic"
+    clients["openai"].run_agent.assert_not_called()
+
+
+@pytest.mark.unit
+def test_failover_on_error(both_keys):
+    """Test a transient failure is retried on the next route and recorded as an error."""
+    router = _router({
+        "openai": _client("openai", error=ConnectionError("connection reset")),
+        "anthropic": _client("anthropic"),
+    })
+    
+    result = router.run_agent(model="gpt-4o", instructions="", input_text="hi")
+    
+    assert result["output"] == "anthropic"
+    assert router.stats()["openai:gpt-4o"]["error_rate"] == 1.0
+
+
+@pytest.mark.unit
+def test_no_failover_on_permanent_or_cancelled_errors(both_keys):
+    """Test cancellation, deadlines and permanent errors reach the caller without a backup call."""
+    for error in (
+        ExecutionCancelledError("Cancelled by user"),
+        DeadlineExceededError("agent exceeded its deadline"),
+        ValueError("bad request"),
+    ):
+        clients = {"openai": _client("openai", error=error), "anthropic": _client("anthropic")}
+        router = _router(clients)
+        
+        with pytest.raises(type(error)):
+            router.run_agent(model="gpt-4o", instructions="", input_text="hi")
+        with pytest.raises(type(error)):
+            asyncio.run(router.arun_agent(model="gpt-4o", instructions="", input_text="hi"))
+        clients["anthropic"].run_agent.assert_not_called()
+        clients["anthropic"].arun_agent.assert_not_called()
+
+
+@pytest.mark.unit
+def test_hedged_calls_see_run_context(both_keys):
+    """Test hedged pool threads run with the caller's cancellation token."""
+    seen = []
+    
+    def client(name):
+        def run_agent(**kwargs):
+            seen.append(current_token())
+            time.sleep(0.05)
+            return {"output": name}
+        return Mock(run_agent=Mock(side_effect=run_agent))
+    
+    router = _router(
+        {"openai": client("openai"), "anthropic": client("anthropic")},
+        min_samples=1,
+        hedge_min_delay=0.01,
+    )
+    router._window(router.routes_for("gpt-4o")[0]).record(0.01, success=True)
+    token = CancellationToken()
+    with use_token(token):
+        router.run_agent(model="gpt-4o", hedge=True, instructions="", input_text="hi")
+    router.shutdown()
+    
+    assert seen == [token, token]
+
+
+@pytest.mark.unit
+def test_hedged_request_returns_first_response(both_keys):
+    """Test a slow primary is hedged after its p95 and the faster answer wins."""
+    router = _router(
+        {"openai": _client("openai", delay=0.5), "anthropic": _client("anthropic", delay=0.05)},
+        min_samples=3,
+        hedge_min_delay=0.01,
+    )
+    primary = router.routes_for("gpt-4o")[0]
+    for _ in range(3):
+        router._window(primary).record(0.1, success=True)
+    
+    start = time.time()
+    result = router.run_agent(model="gpt-4o", hedge=True, instructions="", input_text="hi")
+    
+    assert result["provider"] == "anthropic"
+    assert time.time() - start < 0.4
+    router.shutdown()
+
+
+@pytest.mark.unit
+def test_async_hedge_cancels_loser(both_keys):
+    """Test the async path hedges and cancels the slower request."""
+    router = _router(
+        {"openai": _client("openai", delay=1.0), "anthropic": _client("anthropic", delay=0.05)},
+        min_samples=1,
+        hedge_min_delay=0.01,
+    )
+    router._window(router.routes_for("gpt-4o")[0]).record(0.1, success=True)
+    
+    start = time.time()
+    result = asyncio.run(
+        router.arun_agent(model="gpt-4o", hedge=True, instructions="", input_text="hi")
+    )
+    
+    assert result["provider"] == "anthropic"
+    assert time.time() - start < 0.5
+    assert router.stats()["openai:gpt-4o"]["calls"] == 1  # cancelled call is not recorded
+
+
+@pytest.mark.unit
+def test_agent_uses_router_when_enabled():
+    """Test agents opt in to routing and pass their hedge setting."""
+    router = Mock()
+    router.run_agent.return_value = {"output": "routed"}
+    set_provider_router(router)
+    try:
+        agent = Agent(
+            id="routed",
+            name="Routed",
+            instructions="Be helpful",
+            config=AgentConfig(enable_provider_routing=True, hedge_requests=True),
+        )
+        result = agent.run("Hello")
+    finally:
+        set_provider_router(None)
+    
+    assert result.output == "routed"
+    assert router.run_agent.call_args[1]["hedge"] is True
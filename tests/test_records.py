@@ -0,0 +1,53 @@
+"""Tests for compact record representations."""
+
+import pickle
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from agent_factory.operations.sla_monitor import SLAMonitor, SLIType
+from agent_factory.promptlog.model import Run
+from agent_factory.runtime.engine import Execution
+from agent_factory.telemetry.model import AgentRunEvent, TenantEvent
+
+
+@pytest.mark.unit
+def test_records_are_slotted():
+    """Test hot records carry no instance dict and still serialize."""
+    execution = Execution(
+        id="e1", type="agent", entity_id="a", status="completed", created_at=datetime(2024, 1, 1)
+    )
+    event = AgentRunEvent(event_id="evt", agent_id="a", tokens_used=5)
+    
+    for record in (execution, event, Run(run_id="r1")):
+        assert not hasattr(record, "__dict__")
+        assert pickle.loads(pickle.dumps(record)) == record
+    assert event.to_dict()["event_type"] == "agent_run"
+    assert event.to_dict()["tokens_used"] == 5
+    assert TenantEvent(event_id="t").to_dict()["event_type"] == "tenant_created"
+
+
+@pytest.mark.unit
+def test_sla_measurements_are_columnar():
+    """Test SLI status reads windows from the columnar series and old data is pruned."""
+    monitor = SLAMonitor()
+    sli = monitor.create_sli("api_latency", SLIType.LATENCY, target=0.5, window_minutes=60)
+    start = datetime(2024, 1, 1)
+    
+    with patch("agent_factory.operations.sla_monitor.datetime") as clock:
+        for minutes, value in [(0, 9.0), (100, 0.2), (110, 0.4)]:
+            clock.utcnow.return_value = start + timedelta(minutes=minutes)
+            monitor.record_measurement(sli.id, value, metadata={"n": minutes} if minutes else None)
+        status = monitor.get_sli_status(sli.id)
+        
+        series = monitor.measurements[sli.id]
+        assert [m.value for m in series] == [9.0, 0.2, 0.4]
+        assert series[-1].metadata == {"n": 110}
+        assert status["measurement_count"] == 2
+        assert status["current_value"] == pytest.approx(0.3)
+        assert status["is_meeting_target"]
+        
+        clock.utcnow.return_value = start + timedelta(days=7, minutes=105)
+        monitor.record_measurement(sli.id, 0.1)
+        assert [m.value for m in series] == [0.4, 0.1]
+        assert series[0].metadata == {"n": 110}
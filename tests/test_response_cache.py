@@ -0,0 +1,117 @@
+"""Tests for the LLM response cache."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.cache.response_cache import (
+    DiskCacheTier,
+    MemoryCacheTier,
+    ResponseCache,
+    set_response_cache,
+)
+
+
+@pytest.mark.unit
+def test_make_key_is_stable():
+    """Test keys ignore dict ordering but include sampling params."""
+    messages = [{"role": "user", "content": "hi"}]
+    request = {"model": "gpt-4o", "messages": messages, "temperature": 0}
+    reordered = {"temperature": 0, "messages": messages, "model": "gpt-4o"}
+    
+    assert ResponseCache.make_key("openai", request) == ResponseCache.make_key("openai", reordered)
+    assert ResponseCache.make_key("openai", request) != ResponseCache.make_key("anthropic", request)
+    assert ResponseCache.make_key("openai", request) != ResponseCache.make_key(
+        "openai", {**request, "temperature": 0.7}
+    )
+
+
+@pytest.mark.unit
+def test_memory_tier_lru_and_ttl():
+    """Test LRU eviction and expiry in the memory tier."""
+    tier = MemoryCacheTier(max_entries=2)
+    tier.set("a", {"output": "a"}, ttl=60)
+    tier.set("b", {"output": "b"}, ttl=60)
+    tier.get("a")
+    tier.set("c", {"output": "c"}, ttl=60)
+    
+    assert tier.get("b") is None
+    assert tier.get("a") == {"output": "a"}
+    
+    tier.set("expired", {"output": "x"}, ttl=-1)
+    assert tier.get("expired") is None
+
+
+@pytest.mark.unit
+def test_disk_tier_promotes_to_memory(tmp_path):
+    """Test disk hits are promoted into the memory tier."""
+    disk = DiskCacheTier(str(tmp_path / "llm_cache.db"), max_entries=1)
+    disk.set("old", {"output": "old"}, ttl=60)
+    disk.set("key", {"output": "cached"}, ttl=60)
+    assert disk.get("old") is None
+    
+    memory = MemoryCacheTier()
+    cache = ResponseCache([memory, disk])
+    
+    assert cache.get("key") == {"output": "cached"}
+    assert memory.get("key") == {"output": "cached"}
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.unit
+def test_get_or_compute_records_metrics():
+    """Test compute runs once and hits and misses are reported under the tier's label."""
+    cache = ResponseCache()
+    compute = Mock(return_value={"output": "hello"})
+    
+    with patch("agent_factory.cache.response_cache.MetricsCollector") as metrics:
+        first = cache.get_or_compute("key", compute)
+        second = cache.get_or_compute("key", compute)
+    
+    assert compute.call_count == 1
+    assert first == {"output": "hello"}
+    assert second == {"output": "hello", "cached": True}
+    metrics.record_cache_hit.assert_called_once_with("llm_memory")
+    metrics.record_cache_miss.assert_called_once_with("llm_memory")
+
+
+@pytest.mark.unit
+def test_client_uses_cache_when_enabled():
+    """Test identical requests hit the API once with use_cache=True."""
+    from agent_factory.integrations.anthropic_client import AnthropicAgentClient
+    
+    set_response_cache(ResponseCache())
+    try:
+        client = AnthropicAgentClient(api_key="test-key")
+        mock_response = Mock()
+        mock_response.content = [Mock(type="text", text="cached answer")]
+        mock_response.usage = Mock(input_tokens=2, output_tokens=3)
+        
+        with patch.object(client.client.messages, "create", return_value=mock_response) as create:
+            for _ in range(3):
+                result = client.run_agent("instructions", "hello", temperature=0, use_cache=True)
+            client.run_agent("instructions", "hello", temperature=0)
+        
+        assert result["output"] == "cached answer"
+        assert result["cached"] is True
+        assert create.call_count == 2
+    finally:
+        set_response_cache(None)
+
+
+@pytest.mark.unit
+def test_aget_or_compute():
+    """Test async compute is awaited once."""
+    cache = ResponseCache()
+    calls = []
+    
+    async def compute():
+        calls.append(1)
+        return {"output": "async"}
+    
+    async def run():
+        await cache.aget_or_compute("key", compute)
+        return await cache.aget_or_compute("key", compute)
+    
+    assert asyncio.run(run())["cached"] is True
+    assert len(calls) == 1
@@ -0,0 +1,218 @@
+"""Tests for retries, deadlines and retry budgets."""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentConfig, AgentResult, AgentStatus
+from agent_factory.core.exceptions import CircuitBreakerOpenError, DeadlineExceededError
+from agent_factory.runtime.cancellation import deadline_kwargs
+from agent_factory.runtime.retry import (
+    RetryBudget,
+    RetryPolicy,
+    acall_with_retry,
+    call_with_retry,
+    classify_error,
+)
+from agent_factory.workflows.model import Workflow, WorkflowStep
+
+
+class _StatusError(Exception):
+    """Mimics an SDK error carrying an HTTP response."""
+    
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def _fast_policy(**kwargs):
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **kwargs)
+
+
+@pytest.mark.unit
+def test_classify_error():
+    """Test transient errors are retryable and others are not."""
+    assert classify_error(_StatusError(429, {"retry-after": "2"})).retry_after == 2.0
+    assert classify_error(_StatusError(503)).reason == "server_error"
+    assert not classify_error(_StatusError(400)).retryable
+    assert classify_error(TimeoutError()).reason == "timeout"
+    assert not classify_error(CircuitBreakerOpenError("open")).retryable
+    assert not classify_error(ValueError("bad")).retryable
+    
+    # Wrapped errors are classified by their cause
+    try:
+        try:
+            raise _StatusError(502)
+        except _StatusError as e:
+            raise RuntimeError("provider error") from e
+    except RuntimeError as wrapped:
+        assert classify_error(wrapped).retryable
+
+
+@pytest.mark.unit
+def test_retries_transient_errors_then_succeeds():
+    """Test transient errors are retried up to max_retries."""
+    func = Mock(side_effect=[_StatusError(503), _StatusError(429), "ok"])
+    
+    assert call_with_retry(func, _fast_policy(max_retries=2), budget=RetryBudget()) == "ok"
+    assert func.call_count == 3
+    
+    failing = Mock(side_effect=_StatusError(503))
+    with pytest.raises(_StatusError):
+        call_with_retry(failing, _fast_policy(max_retries=2), budget=RetryBudget())
+    assert failing.call_count == 3
+
+
+@pytest.mark.unit
+def test_permanent_errors_are_not_retried():
+    """Test permanent errors fail on the first attempt."""
+    func = Mock(side_effect=ValueError("bad request"))
+    
+    with pytest.raises(ValueError):
+        call_with_retry(func, _fast_policy(max_retries=3), budget=RetryBudget())
+    assert func.call_count == 1
+
+
+@pytest.mark.unit
+def test_retry_after_is_honoured():
+    """Test the server's Retry-After replaces a shorter backoff."""
+    func = Mock(side_effect=[_StatusError(429, {"retry-after-ms": "50"}), "ok"])
+    
+    with patch("agent_factory.runtime.retry.time.sleep") as sleep:
+        call_with_retry(func, _fast_policy(max_retries=1), budget=RetryBudget())
+    
+    assert sleep.call_args[0][0] == pytest.approx(0.05)
+
+
+@pytest.mark.unit
+def test_retry_budget_caps_retries():
+    """Test retries stop once the budget is spent."""
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=0.1, window=10.0)
+    func = Mock(side_effect=_StatusError(503))
+    
+    with pytest.raises(_StatusError):
+        call_with_retry(func, _fast_policy(max_retries=5), budget=budget)
+    
+    assert func.call_count == 2  # one retry allowed by the floor
+    assert budget.stats()["retries"] == 1
+
+
+@pytest.mark.unit
+def test_async_deadline_cancels_attempt():
+    """Test the overall deadline interrupts a slow async attempt."""
+    async def slow():
+        await asyncio.sleep(1)
+    
+    start = time.time()
+    with pytest.raises(DeadlineExceededError):
+        asyncio.run(acall_with_retry(slow, RetryPolicy(timeout=0.05), budget=RetryBudget()))
+    assert time.time() - start < 0.5
+
+
+@pytest.mark.unit
+def test_agent_passes_retry_policy_to_client():
+    """Test Agent.run hands its retry config to the client, which retries each completion."""
+    config = AgentConfig(retry_attempts=2)
+    agent = Agent(id="retry", name="Retry", instructions="Be helpful", config=config)
+    
+    with patch("agent_factory.integrations.openai_client.OpenAIAgentClient") as client_class:
+        client_class.return_value.run_agent.return_value = {"output": "ok"}
+        result = agent.run("Hello")
+    
+    assert result.output == "ok"
+    policy = client_class.return_value.run_agent.call_args[1]["retry_policy"]
+    assert policy.max_retries == 2
+    assert policy.timeout == agent.config.timeout
+
+
+@pytest.mark.unit
+def test_retried_completion_does_not_rerun_tools():
+    """Test a transient error on a follow-up completion retries that completion only."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    from agent_factory.tools.base import Tool
+    
+    sent = []
+    send_email = Tool(
+        id="send_email",
+        name="send_email",
+        description="Send an email",
+        implementation=lambda to: sent.append(to) or "sent",
+    )
+    function = Mock(arguments='{"to": "a@b"}')
+    function.name = "send_email"
+    tool_turn = Mock(content=None, tool_calls=[Mock(id="c1", function=function)])
+    final_turn = Mock(content="done", tool_calls=None)
+    responses = [
+        Mock(choices=[Mock(message=tool_turn)], usage=Mock(total_tokens=5)),
+        _StatusError(429),
+        Mock(choices=[Mock(message=final_turn)], usage=Mock(total_tokens=5)),
+    ]
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    breaker = Mock()
+    breaker.call.side_effect = lambda func, **kwargs: func(**kwargs)
+    completions = client.client.chat.completions
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(completions, "create", side_effect=responses) as create, \
+            patch("agent_factory.runtime.retry.time.sleep"):
+        result = client.run_agent(
+            "Assist", "email a@b", tools=[send_email], max_tool_iterations=2,
+            retry_policy=_fast_policy(max_retries=2),
+        )
+    
+    assert result["output"] == "done"
+    assert create.call_count == 3
+    assert sent == ["a@b"]
+
+
+@pytest.mark.unit
+def test_workflow_step_retries_transient_failures():
+    """Test workflow steps retry agent failures flagged as retryable."""
+    agent = Mock()
+    agent.run.side_effect = [
+        AgentResult(
+            output="", status=AgentStatus.ERROR, error="overloaded", metadata={"retryable": True}
+        ),
+        AgentResult(output="done", status=AgentStatus.COMPLETED),
+    ]
+    workflow = Workflow(
+        id="wf",
+        name="Workflow",
+        steps=[WorkflowStep(id="step", agent_id="agent", retry_attempts=1)],
+        agents_registry={"agent": agent},
+    )
+    
+    with patch("agent_factory.runtime.retry.time.sleep"):
+        result = workflow.execute({"input": "hi"})
+    
+    assert result.success
+    assert agent.run.call_count == 2
+
+
+@pytest.mark.unit
+def test_sync_workflow_step_times_out():
+    """Test a blocking step that outlives its timeout fails and saw the step deadline."""
+    seen = []
+    
+    def slow_run(agent_input):
+        seen.append(deadline_kwargs().get("timeout"))
+        time.sleep(0.2)
+        return AgentResult(output="late", status=AgentStatus.COMPLETED)
+    
+    agent = Mock()
+    agent.run.side_effect = slow_run
+    workflow = Workflow(
+        id="wf",
+        name="Workflow",
+        steps=[WorkflowStep(id="step", agent_id="agent", timeout=0.05)],
+        agents_registry={"agent": agent},
+    )
+    
+    result = workflow.execute({"input": "hi"})
+    
+    assert not result.success
+    assert "timed out" in result.error
+    assert seen and seen[0] <= 0.05
@@ -119,3 +119,59 @@ def test_list_executions():
         executions = engine.list_executions()
         assert len(executions) == 1
         assert executions[0].id == execution_id
+
+
+@pytest.mark.unit
+def test_arun_agent():
+    """Test running an agent on the async path."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    
+    engine = RuntimeEngine()
+    agent = Agent(
+        id="test-agent",
+        name="Test Agent",
+        instructions="Test",
+    )
+    engine.register_agent(agent)
+    
+    with patch('agent_factory.integrations.openai_client.OpenAIAgentClient') as mock_client_class:
+        mock_client_class.return_value.arun_agent = AsyncMock(return_value={
+            "output": "Async output",
+            "tool_calls": [],
+            "tokens_used": 10,
+        })
+        execution_id = asyncio.run(engine.arun_agent("test-agent", "Test input"))
+    
+    execution = engine.get_execution(execution_id)
+    assert execution.status == "completed"
+    assert execution.result.output == "Async output"
+
+
+@pytest.mark.unit
+def test_arun_workflow():
+    """Test running a workflow on the async path."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    
+    engine = RuntimeEngine()
+    agent = Agent(
+        id="test-agent",
+        name="Test Agent",
+        instructions="Test",
+    )
+    engine.register_agent(agent)
+    engine.register_workflow(Workflow(
+        id="test-workflow",
+        name="Test Workflow",
+        steps=[WorkflowStep(id="step1", agent_id="test-agent")],
+    ))
+    
+    with patch('agent_factory.integrations.openai_client.OpenAIAgentClient') as mock_client_class:
+        mock_client_class.return_value.arun_agent = AsyncMock(return_value={"output": "Done"})
+        execution_id = asyncio.run(engine.arun_workflow("test-workflow", {"input": "Go"}))
+    
+    execution = engine.get_execution(execution_id)
+    assert execution.status == "completed"
+    assert execution.result.success
+    assert execution.result.steps_executed == ["step1"]
@@ -0,0 +1,93 @@
+"""Tests for semantic recall over past interactions."""
+
+import pytest
+from unittest.mock import patch
+
+from agent_factory.agents.agent import Agent
+from agent_factory.runtime.memory import SQLiteMemoryStore
+from agent_factory.runtime.semantic_memory import HashingEmbedder, SemanticMemoryStore, VectorIndex
+from agent_factory.runtime.write_behind import get_write_behind
+
+DOG = ("My dog is called Biscuit and he loves the beach", "What a lovely name for a dog!")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteMemoryStore(str(tmp_path / "memory.db"))
+
+
+def _chat(memory, session_id, turns):
+    for i in range(turns):
+        memory.save_interaction(
+            session_id, f"Explain step {i} of the titration homework", f"Step {i} is ..."
+        )
+
+
+@pytest.mark.unit
+def test_recalls_relevant_turns_beyond_recent_window(store):
+    """Test a turn 200 turns back is recalled and recent turns are not repeated."""
+    store.save_interaction("s1", *DOG)
+    _chat(store, "s1", 200)
+    memory = SemanticMemoryStore(store, top_k=2)
+    
+    context = memory.get_context("s1", limit=10, query="What is my dog called?")
+    
+    assert len(context["recent_interactions"]) == 10
+    assert context["relevant_interactions"][0]["input"] == DOG[0]
+    assert all(r["score"] >= memory.min_score for r in context["relevant_interactions"])
+    
+    # Turns saved after the index was built are searchable; recent ones are skipped
+    memory.save_interaction("s1", "Biscuit chased a crab on the beach today", "Ha!")
+    context = memory.get_context("s1", limit=1, query="Where does Biscuit my dog play?")
+    recalled = context["relevant_interactions"]
+    assert recalled[0]["input"] == DOG[0]
+    assert all(r["input"] != "Biscuit chased a crab on the beach today" for r in recalled)
+    assert "relevant_interactions" not in memory.get_context("s1", limit=10)
+
+
+@pytest.mark.unit
+def test_agent_context_includes_recalled_turns(store):
+    """Test an agent run sends the recalled turn ahead of the recent ones."""
+    memory = SemanticMemoryStore(store)
+    memory.save_interaction("s1", *DOG)
+    _chat(memory, "s1", 30)
+    get_write_behind().flush()
+    agent = Agent(id="tutor", name="Tutor", instructions="Teach", memory=memory)
+    
+    with patch.object(Agent, "_execute_agent", return_value="Biscuit") as execute:
+        agent.run("Remind me what my dog is called", session_id="s1")
+    
+    messages = execute.call_args[0][1]["messages"]
+    assert messages[0] == {"role": "user", "content": DOG[0]}
+    assert messages[-2]["content"] == "Explain step 29 of the titration homework"
+
+
+@pytest.mark.unit
+def test_per_user_index_spans_sessions(store):
+    """Test a user's new session recalls an earlier session, until that session is cleared."""
+    # Stored before this process started; the other session's turn is the newest
+    _chat(store, "alice:2", 3)
+    store.save_interaction("alice:1", *DOG)
+    memory = SemanticMemoryStore(store, user_of=lambda session_id: session_id.split(":")[0])
+    
+    context = memory.get_context("alice:2", limit=3, query="What is my dog called?")
+    assert [r["input"] for r in context["relevant_interactions"]] == [DOG[0]]
+    query = "What is my dog called?"
+    assert memory.get_context("bob:1", query=query)["relevant_interactions"] == []
+    
+    memory.clear_session("alice:1")
+    assert memory.get_context("alice:2", query=query)["relevant_interactions"] == []
+
+
+@pytest.mark.unit
+def test_vector_index_ranks_by_cosine_and_drops_oldest():
+    """Test search returns the most similar rows oldest first within max_items."""
+    embedder = HashingEmbedder(dimension=256)
+    index = VectorIndex(embedder.dimension, max_items=3)
+    texts = ["apples and pears", "the french revolution", "pears in syrup", "baking apple pie"]
+    index.add(embedder.embed(texts), texts)
+    
+    hits = index.search(embedder.embed(["apples pears"])[0], top_k=2, min_score=0.1)
+    
+    assert len(index) == 3
+    assert [text for _, text in hits] == ["pears in syrup"]  # "apples and pears" was dropped
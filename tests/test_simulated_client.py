@@ -0,0 +1,133 @@
+"""Tests for the simulated LLM provider."""
+
+import asyncio
+import os
+import pytest
+from unittest.mock import patch
+
+from agent_factory.agents.agent import Agent, AgentStatus
+from agent_factory.integrations.simulated_client import (
+    SimulatedAgentClient,
+    SimulatedProviderConfig,
+    is_simulated_model,
+    set_simulated_client,
+)
+from agent_factory.promptlog import Run, SQLiteStorage
+
+
+@pytest.mark.unit
+def test_is_simulated_model():
+    """Test model names and the env var select the simulated provider."""
+    with patch.dict(os.environ, {}, clear=True):
+        assert is_simulated_model("simulated")
+        assert is_simulated_model("simulated:echo")
+        assert not is_simulated_model("gpt-4o")
+    
+    with patch.dict(os.environ, {"AGENT_FACTORY_LLM_PROVIDER": "simulated"}):
+        assert is_simulated_model("gpt-4o")
+
+
+@pytest.mark.unit
+def test_simulated_output_is_deterministic(sample_tool):
+    """Test identical requests produce identical outputs and tool calls."""
+    client = SimulatedAgentClient(SimulatedProviderConfig(tool_call_rate=1.0))
+    
+    first = client.run_agent("Be helpful", "Hello", model="simulated", tools=[sample_tool])
+    second = client.run_agent("Be helpful", "Hello", model="simulated", tools=[sample_tool])
+    
+    assert first == second
+    assert first["output"] == "[simulated] Response to: Hello"
+    assert first["tool_calls"][0]["name"] == sample_tool.id
+    assert first["tokens_used"] > 0
+    assert client.run_agent("Be helpful", "Hello", model="simulated:echo")["output"] == "Hello"
+
+
+@pytest.mark.unit
+def test_simulated_prompt_includes_packed_context():
+    """Test packed context counts toward the prompt like it does for real clients."""
+    client = SimulatedAgentClient(SimulatedProviderConfig(latency="fixed", latency_ms=0))
+    context = {
+        "context_tokens": 0,
+        "summary": "The user is planning a trip to Lisbon in May. " * 20,
+        "messages": [{"role": "user", "content": "Which neighbourhoods are quiet?"}],
+    }
+    
+    bare = client.run_agent("Be helpful", "Hello", model="simulated")
+    packed = client.run_agent("Be helpful", "Hello", model="simulated", context=context)
+    
+    assert packed["tokens_used"] > bare["tokens_used"] + 100
+    request = client._build_request("Be helpful", "Hello", "simulated", None, 0.7, 100, context)
+    assert "Lisbon" in request["context"]
+    assert "quiet" in request["context"]
+
+
+@pytest.mark.unit
+def test_simulated_latency_distributions():
+    """Test latency sampling honours the configured distribution."""
+    import random
+    
+    fixed = SimulatedAgentClient(SimulatedProviderConfig(latency="fixed", latency_ms=50))
+    assert fixed._sample_latency(random.Random(0)) == pytest.approx(0.05)
+    
+    uniform = SimulatedAgentClient(
+        SimulatedProviderConfig(latency="uniform", latency_ms=100, latency_jitter_ms=20)
+    )
+    samples = [uniform._sample_latency(random.Random(i)) for i in range(50)]
+    assert all(0.08 <= s <= 0.12 for s in samples)
+    
+    with pytest.raises(ValueError, match="Unknown latency distribution"):
+        SimulatedAgentClient(SimulatedProviderConfig(latency="bogus"))
+
+
+@pytest.mark.unit
+def test_simulated_config_from_env():
+    """Test latency settings are parsed from the environment."""
+    env = {"SIMULATED_LLM_LATENCY": "normal:200,50", "SIMULATED_LLM_MODE": "echo"}
+    with patch.dict(os.environ, env):
+        config = SimulatedProviderConfig.from_env()
+    
+    assert config.latency == "normal"
+    assert config.latency_ms == 200
+    assert config.latency_jitter_ms == 50
+    assert config.mode == "echo"
+
+
+@pytest.mark.unit
+def test_simulated_replay_from_promptlog(tmp_path):
+    """Test recorded responses are replayed from prompt log storage."""
+    storage = SQLiteStorage(str(tmp_path / "promptlog.db"))
+    storage.save_run(Run(
+        run_id="run-1",
+        agent_id="faq",
+        inputs={"input": "What are your hours?"},
+        outputs={"output": "9 to 5"},
+        tokens_used=12,
+        execution_time=0.01,
+    ))
+    
+    client = SimulatedAgentClient(SimulatedProviderConfig(
+        mode="replay",
+        latency="recorded",
+        replay_db_path=str(tmp_path / "promptlog.db"),
+    ))
+    
+    replayed = client.run_agent("Be helpful", "What are your hours?")
+    assert replayed["output"] == "9 to 5"
+    assert replayed["tokens_used"] == 12
+    # Unrecorded inputs fall back to the template
+    assert client.run_agent("Be helpful", "Unknown")["output"] == "[simulated] Response to: Unknown"
+
+
+@pytest.mark.unit
+def test_agent_runs_on_simulated_provider():
+    """Test agents run end to end without an API key on the simulated model."""
+    set_simulated_client(None)
+    agent = Agent(id="sim", name="Sim", instructions="Be helpful", model="simulated")
+    
+    with patch.dict(os.environ, {}, clear=True):
+        result = agent.run("Hello")
+        async_result = asyncio.run(agent.arun("Hello"))
+    
+    assert result.status == AgentStatus.COMPLETED
+    assert result.output == "[simulated] Response to: Hello"
+    assert async_result.output == result.output
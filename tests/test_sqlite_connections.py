@@ -0,0 +1,61 @@
+"""Tests for the shared SQLite connection manager."""
+
+import threading
+import pytest
+
+from agent_factory.runtime.memory import SQLiteMemoryStore
+from agent_factory.runtime.sqlite import SQLiteConnectionManager, SQLiteSettings
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLiteConnectionManager(tmp_path / "test.db", SQLiteSettings(busy_timeout=2.0))
+    with db.transaction() as conn:
+        conn.execute("CREATE TABLE items (value TEXT)")
+    yield db
+    db.close()
+
+
+@pytest.mark.unit
+def test_connections_persist_per_thread(db):
+    """Test each thread reuses one tuned connection and sees other threads' commits."""
+    with db.connection() as first, db.connection() as second:
+        assert first is second
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    
+    def write():
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('from thread')")
+    
+    thread = threading.Thread(target=write)
+    thread.start()
+    thread.join()
+    
+    with db.connection() as conn:
+        assert conn.execute("SELECT value FROM items").fetchall() == [("from thread",)]
+    assert db.stats()["connections"] == 2
+
+
+@pytest.mark.unit
+def test_transaction_rolls_back_on_error(db):
+    """Test a failed unit of writes leaves nothing behind."""
+    with pytest.raises(ValueError):
+        with db.transaction() as conn:
+            conn.execute("INSERT INTO items VALUES ('partial')")
+            raise ValueError("boom")
+    
+    with db.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+
+@pytest.mark.unit
+def test_in_memory_store_is_shared_across_operations():
+    """Test a :memory: store keeps its data between operations and threads."""
+    memory = SQLiteMemoryStore(":memory:")
+    thread = threading.Thread(target=memory.save_interaction, args=("s1", "hi", "hello"))
+    thread.start()
+    thread.join()
+    
+    history = memory.get_history("s1")
+    assert [(i.input_text, i.output_text) for i in history] == [("hi", "hello")]
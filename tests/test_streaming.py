@@ -0,0 +1,197 @@
+"""Tests for streaming agent output."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent
+from agent_factory.api.routes import agents as agent_routes
+from agent_factory.core.exceptions import AgentExecutionError
+from agent_factory.core.guardrails import Guardrail, GuardrailResult, Guardrails
+from agent_factory.integrations.simulated_client import (
+    SimulatedAgentClient,
+    SimulatedProviderConfig,
+)
+
+
+def _chunk(content=None, tool_calls=None, usage=None):
+    delta = Mock(content=content, tool_calls=tool_calls)
+    choices = [Mock(delta=delta)] if content is not None or tool_calls else []
+    return Mock(choices=choices, usage=usage)
+
+
+def _tool_fragment(index, call_id=None, name=None, arguments=""):
+    function = Mock(arguments=arguments)
+    function.name = name
+    return Mock(index=index, id=call_id, function=function)
+
+
+class _BlockWord(Guardrail):
+    def check(self, text):
+        if "secret" in text:
+            return GuardrailResult(allowed=False, reason="secret")
+        return GuardrailResult(allowed=True)
+
+
+@pytest.fixture
+def simulated():
+    client = SimulatedAgentClient(SimulatedProviderConfig(mode="echo", latency="none"))
+    target = "agent_factory.integrations.simulated_client.get_simulated_client"
+    with patch(target, return_value=client):
+        yield client
+
+
+@pytest.mark.unit
+def test_openai_stream_runs_tools_between_turns(sample_tool):
+    """Test streamed tool call fragments are executed and the next turn streams."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    breaker = Mock()
+    breaker.call.side_effect = lambda func, **kwargs: func(**kwargs)
+    turns = [
+        [
+            _chunk(tool_calls=[_tool_fragment(0, "c1", sample_tool.id, '{"query"')]),
+            _chunk(tool_calls=[_tool_fragment(0, arguments=': "x"}')]),
+            _chunk(usage=Mock(total_tokens=5)),
+        ],
+        [_chunk("Hello"), _chunk(" world"), _chunk(usage=Mock(total_tokens=7))],
+    ]
+    
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(client.client.chat.completions, "create", side_effect=turns) as create:
+        deltas = list(client.stream_agent(
+            "Be helpful", "hi", tools=[sample_tool], max_tool_iterations=2
+        ))
+    
+    assert deltas == ["Hello", " world"]
+    assert create.call_args_list[0][1]["stream"] is True
+    sent = create.call_args_list[1][1]["messages"]
+    assert sent[-2]["tool_calls"][0]["function"]["arguments"] == '{"query": "x"}'
+    assert sent[-1]["role"] == "tool"
+
+
+@pytest.mark.unit
+def test_openai_stream_retries_opening_the_stream():
+    """Test a transient error before the first chunk is retried under the retry policy."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    from agent_factory.runtime.retry import RetryPolicy
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    breaker = Mock()
+    breaker.call.side_effect = lambda func, **kwargs: func(**kwargs)
+    opens = [ConnectionError("reset"), [_chunk("Hi"), _chunk(usage=Mock(total_tokens=3))]]
+    policy = RetryPolicy(max_retries=1, base_delay=0.001, timeout=30)
+    
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(client.client.chat.completions, "create", side_effect=opens) as create:
+        deltas = list(client.stream_agent("Be helpful", "hi", retry_policy=policy))
+    
+    assert deltas == ["Hi"]
+    assert create.call_count == 2
+
+
+@pytest.mark.unit
+def test_agent_stream_persists_after_completion(simulated):
+    """Test deltas join to the full output and memory is written at the end."""
+    memory = Mock()
+    memory.get_context.return_value = {}
+    agent = Agent(id="s", name="S", instructions="Echo", model="simulated", memory=memory)
+    
+    stream = agent.stream("one two three", session_id="s1")
+    first = next(stream)
+    memory.save_interaction.assert_not_called()
+    rest = list(stream)
+    
+    assert first + "".join(rest) == "one two three"
+    memory.save_interaction.assert_called_once_with("s1", "one two three", "one two three")
+
+
+@pytest.mark.unit
+def test_agent_stream_output_guardrail_stops_stream(simulated):
+    """Test output guardrails cut the stream before blocked text is released."""
+    guardrails = Guardrails()
+    guardrails.add_output_guardrail(_BlockWord())
+    agent = Agent(id="g", name="G", instructions="Echo", model="simulated", guardrails=guardrails)
+    
+    received = []
+    with pytest.raises(AgentExecutionError, match="Output blocked"):
+        for delta in agent.stream("Public first. Then the secret"):
+            received.append(delta)
+    
+    assert "".join(received) == "Public first."
+
+
+@pytest.mark.unit
+def test_agent_stream_validates_output_in_batches(simulated):
+    """Test output guardrails run per sentence or stride, not once per delta."""
+    guardrail = _BlockWord()
+    guardrails = Guardrails()
+    guardrails.add_output_guardrail(guardrail)
+    agent = Agent(id="g", name="G", instructions="Echo", model="simulated", guardrails=guardrails)
+    text = " ".join(["word"] * 500) + ". Done."
+    
+    with patch.object(guardrail, "check", wraps=guardrail.check) as check:
+        assert "".join(agent.stream(text)) == text
+    
+    assert check.call_count < 20
+
+
+@pytest.mark.unit
+def test_agent_astream(simulated):
+    """Test the async stream yields the same deltas."""
+    agent = Agent(id="a", name="A", instructions="Echo", model="simulated")
+    
+    async def collect():
+        return [delta async for delta in agent.astream("hello async world")]
+    
+    assert "".join(asyncio.run(collect())) == "hello async world"
+
+
+@pytest.mark.unit
+def test_sse_endpoint_streams_events(simulated):
+    """Test the run/stream endpoint emits delta events then done."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    
+    app = FastAPI()
+    app.include_router(agent_routes.router, prefix="/api/v1/agents")
+    agent = Agent(id="sse", name="SSE", instructions="Echo", model="simulated")
+    
+    with patch.object(agent_routes.registry, "get_agent", return_value=agent):
+        response = TestClient(app).post(
+            "/api/v1/agents/sse/run/stream", json={"input_text": "hi there"}
+        )
+    
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    names = [lines[0].split(": ", 1)[1] for lines in events]
+    payloads = [json.loads(lines[1].split(": ", 1)[1]) for lines in events]
+    assert names == ["delta", "delta", "done"]
+    assert payloads[-1]["output"] == "hi there"
+
+
+@pytest.mark.unit
+def test_sdk_stream_agent_parses_events():
+    """Test the SDK iterator yields delta text and raises on error events."""
+    from agent_factory.sdk.client import Client
+    
+    lines = [
+        "event: delta", 'data: {"text": "Hel"}', "",
+        "event: delta", 'data: {"text": "lo"}', "",
+        "event: error", 'data: {"error": "boom"}', "",
+    ]
+    response = Mock()
+    response.iter_lines.return_value = iter(lines)
+    
+    with patch("httpx.Client") as client_class:
+        client_class.return_value.stream.return_value.__enter__ = Mock(return_value=response)
+        client_class.return_value.stream.return_value.__exit__ = Mock(return_value=False)
+        sdk = Client(api_key="test-key")
+        received = []
+        with pytest.raises(RuntimeError, match="boom"):
+            for delta in sdk.stream_agent("agent", "hi"):
+                received.append(delta)
+    
+    assert received == ["Hel", "lo"]
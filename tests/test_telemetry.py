@@ -33,6 +33,16 @@ def test_telemetry_event_creation():
     assert event.metadata == {}
 
 
+@pytest.mark.unit
+def test_telemetry_event_requires_event_type():
+    """Test a base event without an event type fails at construction, not in to_dict."""
+    with pytest.raises(ValueError, match="event_type"):
+        TelemetryEvent(event_id=str(uuid.uuid4()))
+    
+    event = AgentRunEvent(event_id=str(uuid.uuid4()), agent_id="a")
+    assert event.to_dict()["event_type"] == "agent_run"
+
+
 @pytest.mark.unit
 def test_agent_run_event():
     """Test creating an agent run event."""
@@ -230,3 +240,46 @@ def test_collector_silent_failure():
     
     # Should not raise
     collector.record_agent_run(agent_id="test-agent")
+
+
+@pytest.mark.unit
+def test_activation_registry_records_first_run_once(tmp_path):
+    """Test activation is recorded once and later runs skip telemetry reads."""
+    from agent_factory.telemetry.activation import ActivationRegistry, SQLiteActivationBackend
+    from agent_factory.telemetry.model import UserActivatedEvent, UserSignupEvent
+    
+    collector = Mock()
+    signed_up = datetime.utcnow() - timedelta(days=3)
+    signup = UserSignupEvent(event_id="s", user_id="u1", timestamp=signed_up)
+    collector.query_events.side_effect = (
+        lambda event_type, **kwargs: [signup] if event_type == "user_signup" else []
+    )
+    registry = ActivationRegistry(SQLiteActivationBackend(str(tmp_path / "telemetry.db")))
+    
+    assert registry.track_first_run(collector, user_id="u1", tenant_id="t1")
+    queries = collector.query_events.call_count
+    assert not registry.track_first_run(collector, user_id="u1", tenant_id="t1")
+    
+    event = collector.record_event.call_args[0][0]
+    assert isinstance(event, UserActivatedEvent)
+    assert event.days_to_activation == 3
+    assert collector.query_events.call_count == queries
+    
+    # A fresh process sees the persisted activation without emitting again
+    restarted = ActivationRegistry(SQLiteActivationBackend(str(tmp_path / "telemetry.db")))
+    assert not restarted.track_first_run(collector, user_id="u1")
+    assert collector.record_event.call_count == 1
+
+
+@pytest.mark.unit
+def test_activation_registry_respects_existing_activation_events(tmp_path):
+    """Test users activated before the registry existed are not re-activated."""
+    from agent_factory.telemetry.activation import ActivationRegistry, SQLiteActivationBackend
+    
+    collector = Mock()
+    collector.query_events.return_value = [Mock()]
+    registry = ActivationRegistry(SQLiteActivationBackend(str(tmp_path / "telemetry.db")))
+    
+    assert not registry.track_first_run(collector, user_id="legacy")
+    collector.record_event.assert_not_called()
+    assert registry.is_activated("legacy")
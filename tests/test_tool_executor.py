@@ -0,0 +1,159 @@
+"""Tests for concurrent tool-call execution."""
+
+import asyncio
+import json
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.runtime.retry import RetryPolicy
+from agent_factory.tools.base import Tool
+from agent_factory.tools.executor import ToolExecutor
+
+
+def _slow_tool(delay: float = 0.2) -> Tool:
+    def search(query: str) -> str:
+        time.sleep(delay)
+        return f"results for {query}"
+    return Tool(id="web_search", name="Web Search", description="Search", implementation=search)
+
+
+def _calls(*queries):
+    return [
+        {"id": f"call_{i}", "name": "web_search", "arguments": json.dumps({"query": q})}
+        for i, q in enumerate(queries)
+    ]
+
+
+@pytest.mark.unit
+def test_tool_calls_run_in_parallel():
+    """Test calls from one turn overlap instead of adding up."""
+    executor = ToolExecutor(max_workers=4)
+    
+    start = time.time()
+    results = executor.execute(_calls("a", "b", "c", "d"), [_slow_tool(0.2)])
+    elapsed = time.time() - start
+    
+    assert [r.output for r in results] == [f"results for {q}" for q in "abcd"]
+    assert elapsed < 0.6
+    executor.shutdown()
+
+
+@pytest.mark.unit
+def test_tool_call_errors_are_isolated():
+    """Test timeouts, bad arguments and unknown tools fail only their own call."""
+    executor = ToolExecutor(max_workers=4)
+    calls = _calls("fast") + [
+        {"id": "bad", "name": "web_search", "arguments": "{not json"},
+        {"id": "missing", "name": "nope", "arguments": "{}"},
+    ]
+    
+    results = executor.execute(calls, [_slow_tool(0.01)], timeout=1)
+    assert results[0].success
+    assert "Invalid arguments" in results[1].error
+    assert results[2].error == "Unknown tool: nope"
+    
+    slow = executor.execute(_calls("slow"), [_slow_tool(0.5)], timeout=0.05)[0]
+    assert slow.timed_out
+    assert slow.content().startswith("Error:")
+    executor.shutdown()
+
+
+@pytest.mark.unit
+def test_async_tool_calls_run_concurrently():
+    """Test coroutine tools are awaited concurrently with per-call timeouts."""
+    async def search(query: str) -> str:
+        await asyncio.sleep(0.3 if query == "slow" else 0.1)
+        return query
+    
+    tool = Tool(id="web_search", name="Web Search", description="Search", implementation=search)
+    executor = ToolExecutor()
+    
+    start = time.time()
+    results = asyncio.run(executor.aexecute(_calls("a", "b", "slow"), [tool], timeout=0.2))
+    
+    assert [r.output for r in results[:2]] == ["a", "b"]
+    assert results[2].timed_out
+    assert time.time() - start < 0.3
+    executor.shutdown()
+
+
+@pytest.mark.unit
+def test_transient_tool_errors_are_retried():
+    """Test a tool failing with a dropped connection is retried, not failed outright."""
+    attempts = []
+    
+    def flaky(query: str) -> str:
+        attempts.append(query)
+        if len(attempts) == 1:
+            raise ConnectionError("connection reset")
+        return f"results for {query}"
+    
+    tool = Tool(id="web_search", name="Web Search", description="Search", implementation=flaky)
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.01)
+    executor = ToolExecutor(max_workers=2, retry_policy=policy)
+    
+    result = executor.execute(_calls("a"), [tool], timeout=1)[0]
+    assert result.success
+    assert result.output == "results for a"
+    assert attempts == ["a", "a"]
+    executor.shutdown()
+
+
+def _completion(content=None, tool_calls=None, tokens=10):
+    message = Mock(content=content, tool_calls=tool_calls)
+    return Mock(choices=[Mock(message=message)], usage=Mock(total_tokens=tokens))
+
+
+def _tool_call(call_id, query):
+    function = Mock(arguments=json.dumps({"query": query}))
+    function.name = "web_search"
+    return Mock(id=call_id, function=function)
+
+
+@pytest.mark.unit
+def test_openai_client_feeds_tool_results_back():
+    """Test the client executes tool calls and sends results in the next turn."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    breaker = Mock()
+    breaker.call.side_effect = lambda func, **kwargs: func(**kwargs)
+    responses = [
+        _completion(tool_calls=[_tool_call("c1", "a"), _tool_call("c2", "b")]),
+        _completion(content="final answer"),
+    ]
+    
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(client.client.chat.completions, "create", side_effect=responses) as create:
+        result = client.run_agent(
+            "Research", "question", tools=[_slow_tool(0.01)], max_tool_iterations=3
+        )
+    
+    assert result["output"] == "final answer"
+    assert result["tokens_used"] == 20
+    assert [r["output"] for r in result["tool_results"]] == ["results for a", "results for b"]
+    second_messages = create.call_args_list[1][1]["messages"]
+    assert [m["role"] for m in second_messages[-3:]] == ["assistant", "tool", "tool"]
+
+
+@pytest.mark.unit
+def test_openai_client_stops_at_max_iterations():
+    """Test the loop guard stops a model that keeps requesting tools."""
+    from agent_factory.integrations.openai_client import OpenAIAgentClient
+    
+    client = OpenAIAgentClient(api_key="test-key")
+    breaker = Mock()
+    breaker.call.side_effect = lambda func, **kwargs: func(**kwargs)
+    
+    with patch.object(client, "_get_breaker", return_value=breaker), \
+            patch.object(
+                client.client.chat.completions, "create",
+                side_effect=lambda **kwargs: _completion(tool_calls=[_tool_call("c", "again")]),
+            ) as create:
+        result = client.run_agent(
+            "Research", "question", tools=[_slow_tool(0.01)], max_tool_iterations=2
+        )
+    
+    assert create.call_count == 3
+    assert result["max_tool_iterations_reached"] is True
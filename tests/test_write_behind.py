@@ -0,0 +1,90 @@
+"""Tests for write-behind post-run persistence."""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from agent_factory.agents.agent import Agent, AgentStatus
+from agent_factory.runtime.write_behind import WriteBehindWriter, set_write_behind
+
+
+@pytest.fixture
+def writer():
+    writer = WriteBehindWriter(max_pending=2, block_timeout=0.05)
+    set_write_behind(writer)
+    yield writer
+    set_write_behind(None)
+
+
+@pytest.mark.unit
+def test_run_returns_before_durable_writes(writer):
+    """Test the prompt log write happens after the run returns, then flushes."""
+    release = threading.Event()
+    storage = Mock()
+    storage.save_run.side_effect = lambda run: release.wait(2)
+    agent = Agent(id="agent", name="Agent", instructions="Test", prompt_log_storage=storage)
+    
+    with patch.object(Agent, "_execute_agent", return_value="done"):
+        result = agent.run("hi")
+    
+    assert result.status == AgentStatus.COMPLETED
+    assert writer.pending(sink="prompt_log") == 1
+    release.set()
+    assert writer.shutdown(timeout=2)
+    assert writer.stats()["sinks"]["prompt_log"] == {"written": 1}
+
+
+@pytest.mark.unit
+def test_prompt_log_errors_do_not_fail_run(writer):
+    """Test a run record that cannot be built is skipped, sync and async."""
+    agent = Agent(id="agent", name="Agent", instructions="Test", prompt_log_storage=Mock())
+    
+    with patch.object(Agent, "_build_run_record", side_effect=TypeError("not serializable")), \
+            patch.object(Agent, "_execute_agent", return_value="done"), \
+            patch.object(Agent, "_aexecute_agent", return_value="done"):
+        assert agent.run("hi").status == AgentStatus.COMPLETED
+        assert asyncio.run(agent.arun("hi")).status == AgentStatus.COMPLETED
+
+
+@pytest.mark.unit
+def test_full_queue_applies_backpressure(writer):
+    """Test a full queue writes inline, in order, instead of dropping, and failures are counted."""
+    started, release = threading.Event(), threading.Event()
+    writes = []
+    writer.submit("slow", lambda: (started.set(), release.wait(2)))
+    assert started.wait(2)
+    writer.submit("sink", writes.append, 1)
+    writer.submit("sink", writes.append, 2)
+    # Queue full: the caller writes inline once the sink's queued writes are applied
+    caller = threading.Thread(target=writer.submit, args=("sink", writes.append, 3))
+    caller.start()
+    time.sleep(0.1)
+    
+    assert writes == []
+    release.set()
+    caller.join(2)
+    writer.submit("sink", Mock(side_effect=OSError("disk full")))
+    assert writer.flush(timeout=2)
+    assert writes == [1, 2, 3]
+    assert writer.stats()["sinks"]["sink"] == {"inline": 1, "failed": 1, "written": 2}
+
+
+@pytest.mark.unit
+def test_next_turn_sees_queued_memory_save(writer):
+    """Test loading session memory waits for that session's queued saves."""
+    history = []
+    memory = Mock()
+    memory.save_interaction.side_effect = lambda session_id, user, assistant: (
+        time.sleep(0.2), history.append(assistant))
+    memory.get_context.side_effect = lambda session_id, turns: {"history": list(history)}
+    agent = Agent(id="agent", name="Agent", instructions="Test", memory=memory)
+    
+    with patch.object(Agent, "_execute_agent", return_value="first answer"):
+        agent.run("first", session_id="s1")
+    with patch.object(Agent, "_build_context", side_effect=lambda c, m, k: m) as build, \
+            patch.object(Agent, "_execute_agent", return_value="second answer"):
+        agent.run("second", session_id="s1")
+    
+    assert build.call_args[0][1] == {"history": ["first answer"]}